@@ -0,0 +1,532 @@
+#!/usr/bin/env python3
+"""
+Concurrent MCP client load generator
+
+Runs the server over its HTTP transport against the local mock GitHub API
+and drives it with simulated MCP clients:
+- Stages of increasing concurrency (e.g. 1, 4, 16, 64 clients), each
+  client a separate MCP session calling tools back to back
+- A weighted mix of read-heavy, write-heavy and analytics calls
+- Per stage: throughput, latency percentiles, error rates by kind, and
+  the load generator's own CPU use (a busy generator caps throughput)
+- Over time: calls, errors and latency per interval, alongside upstream
+  GitHub requests, quota used and rate limiter waits
+- The saturation point: the stage after which more clients stop adding
+  throughput
+
+Usage:
+    python benchmarks/load.py                                  # 1, 4, 16, 64 clients
+    python benchmarks/load.py --clients 8 32 --duration 60 --mix read=50,write=50
+    python benchmarks/load.py --workers 4 --latency lognormal:40:250
+    python benchmarks/load.py --rate-limit 5000 --output load.json   # watch the quota run out
+    python benchmarks/load.py --url http://127.0.0.1:8000      # an already running server
+"""
+
+import argparse
+import asyncio
+import hashlib
+import itertools
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+BENCHMARKS = Path(__file__).resolve().parent
+sys.path.insert(0, str(PACKAGE_ROOT))
+sys.path.insert(0, str(BENCHMARKS))
+
+from tool_calls import OWNER, REPO, percentile, required_arguments, start_mock  # noqa: E402
+
+TOKEN = "load-test"
+# A stage whose throughput is within this fraction of the previous one has saturated
+SATURATION_GAIN = 0.10
+
+# Arguments for a call, from a per-client counter and random generator
+Arguments = Callable[[int, random.Random], Dict[str, Any]]
+
+
+def issue(i: int, rng: random.Random) -> Dict[str, Any]:
+    return {"issue_number": rng.randint(1, 120)}
+
+
+def pull(i: int, rng: random.Random) -> Dict[str, Any]:
+    return {"pull_number": rng.randint(1, 40)}
+
+
+def nothing(i: int, rng: random.Random) -> Dict[str, Any]:
+    return {}
+
+
+# Tools per workload, weighted; arguments are merged over the tool's required defaults
+WORKLOADS: Dict[str, List[Tuple[int, str, Arguments]]] = {
+    "read": [
+        (3, "get_repository", nothing),
+        (4, "list_issues", nothing),
+        (4, "get_issue", issue),
+        (2, "get_issue_comments", issue),
+        (3, "list_pull_requests", nothing),
+        (2, "get_pull_request", pull),
+        (2, "list_branches", nothing),
+        (2, "list_commits", nothing),
+        (2, "get_repository_contents", lambda i, rng: {"path": "README.md"}),
+        (1, "list_workflow_runs", nothing),
+    ],
+    "write": [
+        (4, "create_issue", lambda i, rng: {"title": f"Load {i}", "body": "Load test issue"}),
+        (4, "add_issue_comment", lambda i, rng: {**issue(i, rng), "body": f"Load comment {i}"}),
+        (2, "update_issue", lambda i, rng: {**issue(i, rng), "title": f"Load update {i}"}),
+        (2, "label_issue", lambda i, rng: {**issue(i, rng), "labels": ["load"]}),
+        (1, "create_branch", lambda i, rng: {"branch_name": f"load/{rng.getrandbits(48):x}"}),
+        (1, "create_or_update_file", lambda i, rng: {"path": f"load/{rng.getrandbits(48):x}.txt"}),
+        (1, "create_commit_status", lambda i, rng: {"sha": "main", "state": "success"}),
+    ],
+    "analytics": [
+        (2, "get_repository_analytics", nothing),
+        (1, "get_commit_analytics", nothing),
+        (1, "get_contributor_analytics", nothing),
+        (1, "get_project_health_metrics", nothing),
+        (2, "get_pr_files", pull),
+        (2, "get_code_scanning_alerts", nothing),
+        (2, "get_dependabot_alerts", nothing),
+        (2, "list_workflow_runs", lambda i, rng: {"status": "completed"}),
+    ],
+}
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """``read=70,write=20,analytics=10`` as weights per workload"""
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        if name not in WORKLOADS:
+            raise argparse.ArgumentTypeError(f"unknown workload {name!r} (choose from {', '.join(WORKLOADS)})")
+        try:
+            mix[name] = float(weight or 1)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid weight in {part!r}")
+    return mix
+
+
+class Mix:
+    """Picks the next call of a client"""
+
+    def __init__(self, weights: Dict[str, float], tools: Dict[str, Any]):
+        self.calls = []
+        self.weights = []
+        missing = sorted({tool for workload in weights for _, tool, _ in WORKLOADS[workload]} - set(tools))
+        for workload, share in weights.items():
+            entries = [entry for entry in WORKLOADS[workload] if entry[1] in tools]
+            total = sum(weight for weight, _, _ in entries)
+            for weight, tool, arguments in entries:
+                self.calls.append((workload, tool, arguments))
+                self.weights.append(share * weight / total)
+        if missing:
+            print(f"Tools not registered on the server, left out of the mix: {', '.join(missing)}",
+                  file=sys.stderr)
+        self.defaults = {tool: {"owner": OWNER, "repo": REPO, **required_arguments(tools[tool])}
+                         for _, tool, _ in self.calls}
+
+    def pick(self, i: int, rng: random.Random) -> Tuple[str, str, Dict[str, Any]]:
+        workload, tool, arguments = rng.choices(self.calls, self.weights)[0]
+        return workload, tool, {**self.defaults[tool], **arguments(i, rng)}
+
+
+class Recorder:
+    """Completed calls and periodic upstream samples of a run"""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        # (finished, seconds, workload, tool, error kind or None)
+        self.calls: List[Tuple[float, float, str, str, Optional[str]]] = []
+        self.samples: List[Dict[str, Any]] = []
+        self.error_examples: Dict[str, str] = {}
+
+    def now(self) -> float:
+        return time.monotonic() - self.started
+
+    def record(self, seconds: float, workload: str, tool: str, error: Optional[str] = None,
+               detail: str = ""):
+        self.calls.append((self.now(), seconds, workload, tool, error))
+        if error and error not in self.error_examples:
+            self.error_examples[error] = f"{tool}: {detail}"[:200]
+
+
+async def call(client, mix: Mix, recorder: Recorder, i: int, rng: random.Random, timeout: float):
+    workload, tool, arguments = mix.pick(i, rng)
+    started = time.perf_counter()
+    try:
+        result = await asyncio.wait_for(client.call_tool(tool, arguments, raise_on_error=False), timeout)
+    except asyncio.TimeoutError:
+        recorder.record(time.perf_counter() - started, workload, tool, "timeout", f"no result after {timeout}s")
+        return
+    except Exception as e:
+        recorder.record(time.perf_counter() - started, workload, tool, "transport", repr(e))
+        return
+    seconds = time.perf_counter() - started
+    payload = result.structured_content or {}
+    if result.is_error:
+        recorder.record(seconds, workload, tool, "tool_error", str(result.content)[:200])
+    elif payload.get("success", True) is False:
+        recorder.record(seconds, workload, tool, "failed",
+                        str(payload.get("error") or payload.get("message")))
+    else:
+        recorder.record(seconds, workload, tool)
+
+
+class Connected:
+    """Set once every client of a stage has its session open"""
+
+    def __init__(self, clients: int):
+        self.remaining = clients
+        self.all = asyncio.Event()
+
+    def add(self):
+        self.remaining -= 1
+        if self.remaining <= 0:
+            self.all.set()
+
+
+async def run_client(url: str, mix: Mix, recorder: Recorder, seed: int, connected: Connected,
+                     go: asyncio.Event, deadline: List[float], timeout: float, think: float):
+    from fastmcp import Client
+
+    rng = random.Random(seed)
+    async with Client(f"{url}/mcp") as client:
+        connected.add()
+        await go.wait()
+        for i in itertools.count():
+            if time.monotonic() >= deadline[0]:
+                break
+            await call(client, mix, recorder, i, rng, timeout)
+            if think:
+                await asyncio.sleep(rng.expovariate(1 / think))
+
+
+def parse_metrics(text: str) -> Dict[str, float]:
+    """Unlabelled samples of an OpenMetrics exposition (a worker label is ignored)"""
+    values = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, _, value = line.partition(" ")
+            name, _, labels = name.partition("{")
+            if labels and (not labels.startswith("worker=") or "," in labels):
+                continue
+            try:
+                values[name] = float(value)
+            except ValueError:
+                continue
+    return values
+
+
+async def sample_upstream(metrics_urls: List[str], github_url: Optional[str], recorder: Recorder,
+                          interval: float, stage: List[int]):
+    """Poll mock GitHub stats and server metrics (of every worker) for quota use over time"""
+    import httpx
+
+    quota_key = "core:" + hashlib.sha256(TOKEN.encode()).hexdigest()[:8]
+    async with httpx.AsyncClient(timeout=5) as http:
+        while True:
+            sample: Dict[str, Any] = {"t": round(recorder.now(), 3), "clients": stage[0]}
+            if github_url is not None:
+                try:
+                    stats = (await http.get(f"{github_url}/_mock/stats")).json()
+                    sample.update(upstream_requests=stats["requests"], rate_limited=stats["rate_limited"],
+                                  faults=stats["faults"], quota_used=stats["quotas"].get(quota_key, 0))
+                except (httpx.HTTPError, ValueError, KeyError):
+                    pass
+            try:
+                workers = [parse_metrics((await http.get(f"{url}/metrics")).text) for url in metrics_urls]
+                # Workers share one rate limit window; waits are counted per worker
+                sample.update(window_requests=max(m.get("rate_limiter_window_requests", 0) for m in workers),
+                              window_limit=max(m.get("rate_limiter_window_limit", 0) for m in workers),
+                              limiter_waits=sum(m.get("rate_limiter_waits_total", 0) for m in workers))
+            except httpx.HTTPError:
+                pass
+            recorder.samples.append(sample)
+            await asyncio.sleep(interval)
+
+
+def summarize(calls: List[Tuple[float, float, str, str, Optional[str]]], seconds: float) -> Dict[str, Any]:
+    latencies = [call[1] for call in calls]
+    errors: Dict[str, int] = {}
+    for call in calls:
+        if call[4]:
+            errors[call[4]] = errors.get(call[4], 0) + 1
+    summary: Dict[str, Any] = {
+        "calls": len(calls),
+        "throughput": round(len(calls) / seconds, 2) if seconds else 0,
+        "error_rate": round(sum(errors.values()) / len(calls), 4) if calls else 0,
+        "errors": errors,
+    }
+    if latencies:
+        summary.update({f"p{p}_ms": round(percentile(latencies, p) * 1000, 2) for p in (50, 90, 99)})
+        summary["max_ms"] = round(max(latencies) * 1000, 2)
+    return summary
+
+
+async def run_stage(url: str, mix: Mix, recorder: Recorder, clients: int, args,
+                    stage: List[int]) -> Dict[str, Any]:
+    stage[0] = clients
+    connected = Connected(clients)
+    go = asyncio.Event()
+    deadline = [float("inf")]
+    tasks = [asyncio.create_task(run_client(url, mix, recorder, args.seed * 100_003 + n, connected, go,
+                                            deadline, args.timeout, args.think))
+             for n in range(clients)]
+    # Client tasks only finish before the start signal when they fail to connect
+    ready = asyncio.create_task(connected.all.wait())
+    await asyncio.wait([ready, *tasks], return_when=asyncio.FIRST_COMPLETED, timeout=60)
+    if not ready.done():
+        ready.cancel()
+        for task in tasks:
+            task.cancel()
+        failed = [task.exception() for task in tasks if task.done() and not task.cancelled() and task.exception()]
+        raise RuntimeError(f"Clients could not connect: {failed[0] if failed else 'timed out'}")
+
+    go.set()
+    await asyncio.sleep(args.warmup)
+    measured_from = recorder.now()
+    started_cpu = time.process_time()
+    deadline[0] = time.monotonic() + args.duration
+    await asyncio.gather(*tasks, return_exceptions=True)
+    measured_to = recorder.now()
+    cpu = time.process_time() - started_cpu
+
+    calls = [call for call in recorder.calls if measured_from <= call[0] <= measured_to]
+    summary = summarize(calls, measured_to - measured_from)
+    summary.update({
+        "clients": clients,
+        "started": round(measured_from, 3),
+        "seconds": round(measured_to - measured_from, 3),
+        "generator_cpu": round(cpu / (measured_to - measured_from), 3),
+        "workloads": {workload: summarize([call for call in calls if call[2] == workload],
+                                          measured_to - measured_from)
+                      for workload in sorted({call[2] for call in calls})},
+    })
+    return summary
+
+
+def timeline(recorder: Recorder, interval: float) -> List[Dict[str, Any]]:
+    """Calls per interval joined with the upstream sample taken in it"""
+    rows = []
+    samples = iter(recorder.samples)
+    sample: Optional[Dict[str, Any]] = next(samples, None)
+    end = max([call[0] for call in recorder.calls] + [sample["t"] for sample in recorder.samples] + [0])
+    previous: Dict[str, Any] = {}
+    for index in range(int(end // interval) + 1):
+        start = index * interval
+        calls = [call for call in recorder.calls if start <= call[0] < start + interval]
+        row = {"t": round(start, 3), **summarize(calls, interval)}
+        current = None
+        while sample is not None and sample["t"] < start + interval:
+            current, sample = sample, next(samples, None)
+        if current is not None:
+            row["clients"] = current["clients"]
+            for key in ("upstream_requests", "rate_limited", "limiter_waits"):
+                if current.get(key) is not None:
+                    row[f"{key}_delta"] = current[key] - previous.get(key, current[key])
+            for key in ("quota_used", "window_requests", "window_limit"):
+                if current.get(key) is not None:
+                    row[key] = current[key]
+            previous = current
+        rows.append(row)
+    return rows
+
+
+def saturation(stages: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """The last stage before added clients stopped adding throughput"""
+    for before, after in zip(stages, stages[1:]):
+        if after["throughput"] < before["throughput"] * (1 + SATURATION_GAIN):
+            return {
+                "clients": before["clients"],
+                "throughput": before["throughput"],
+                "p99_ms": before.get("p99_ms"),
+                "next_clients": after["clients"],
+                "next_throughput": after["throughput"],
+                "next_p99_ms": after.get("p99_ms"),
+            }
+    return None
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(github_url: str, args) -> Tuple[subprocess.Popen, str]:
+    """Run the server over HTTP against the mock and wait until it is ready"""
+    import httpx
+
+    port = free_port()
+    # Each worker serves its metrics on its own port from METRICS_PORT up
+    metrics_port = free_port() if args.workers > 1 else None
+    args.metrics_urls = ([f"http://127.0.0.1:{metrics_port + index}" for index in range(args.workers)]
+                         if metrics_port else [f"http://127.0.0.1:{port}"])
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(PACKAGE_ROOT),
+        "AGENT_BUILDER_GITHUB_TRANSPORT": "http",
+        "AGENT_BUILDER_GITHUB_HTTP_HOST": "127.0.0.1",
+        "AGENT_BUILDER_GITHUB_HTTP_PORT": str(port),
+        "AGENT_BUILDER_GITHUB_WORKERS": str(args.workers),
+        "AGENT_BUILDER_GITHUB_GITHUB_TOKEN": TOKEN,
+        "AGENT_BUILDER_GITHUB_GITHUB_API_BASE_URL": github_url,
+        "AGENT_BUILDER_GITHUB_GITHUB_RATE_LIMIT": str(args.rate_limit),
+        "AGENT_BUILDER_GITHUB_ENABLE_RESPONSE_CACHE": str(args.cache).lower(),
+        "AGENT_BUILDER_GITHUB_LOG_LEVEL": "WARNING",
+    }
+    if metrics_port:
+        env.update(AGENT_BUILDER_GITHUB_METRICS_PORT=str(metrics_port), AGENT_BUILDER_GITHUB_METRICS_HOST="127.0.0.1")
+    # Server output (banner, access log) goes to a file, shown if the server fails to start
+    log = tempfile.NamedTemporaryFile(prefix="load-server-", suffix=".log", delete=False)
+    process = subprocess.Popen([sys.executable, str(PACKAGE_ROOT / "server.py")], cwd=PACKAGE_ROOT, env=env,
+                               stdout=log, stderr=subprocess.STDOUT)
+    log.close()
+    url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            output = Path(log.name).read_text(errors="replace")[-2000:]
+            raise RuntimeError(f"Server exited with code {process.returncode}:\n{output}")
+        try:
+            if httpx.get(f"{url}/ready", timeout=1).status_code == 200:
+                return process, url
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f"Server did not become ready; see {log.name}")
+
+
+async def run(args, url: str, github_url: Optional[str]) -> Dict[str, Any]:
+    from fastmcp import Client
+
+    async with Client(f"{url}/mcp") as client:
+        tools = {tool.name: tool for tool in await client.list_tools()}
+    mix = Mix(args.mix, tools)
+    recorder = Recorder()
+    stage = [0]
+    metrics_urls = getattr(args, "metrics_urls", None) or [url]
+    sampler = asyncio.create_task(sample_upstream(metrics_urls, github_url, recorder, args.interval, stage))
+    stages = []
+    try:
+        for clients in args.clients:
+            summary = await run_stage(url, mix, recorder, clients, args, stage)
+            stages.append(summary)
+            print(f"  {clients:>4} clients  {summary['throughput']:>8.1f} calls/s  "
+                  f"p50 {summary.get('p50_ms', 0):>8.1f} ms  p99 {summary.get('p99_ms', 0):>8.1f} ms  "
+                  f"errors {summary['error_rate']:>6.1%}  generator cpu {summary['generator_cpu']:>4.0%}",
+                  file=sys.stderr)
+    finally:
+        sampler.cancel()
+    return {
+        "stages": stages,
+        "saturation": saturation(stages),
+        "timeline": timeline(recorder, args.interval),
+        "error_examples": recorder.error_examples,
+    }
+
+
+def report(results: Dict[str, Any]):
+    print(f"{'clients':>7} {'calls/s':>9} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'errors':>7} {'gen cpu':>8}")
+    for row in results["stages"]:
+        print(f"{row['clients']:>7} {row['throughput']:>9.1f} {row.get('p50_ms', 0):>9.1f} "
+              f"{row.get('p90_ms', 0):>9.1f} {row.get('p99_ms', 0):>9.1f} {row['error_rate']:>7.1%} "
+              f"{row['generator_cpu']:>8.0%}")
+        for workload, summary in row["workloads"].items():
+            print(f"{'':>7}   {workload:<10} {summary['throughput']:>7.1f}/s p99 {summary.get('p99_ms', 0):>8.1f} ms "
+                  f"errors {summary['error_rate']:.1%} {summary['errors'] or ''}")
+    if any(row["generator_cpu"] > 0.9 for row in results["stages"]):
+        print("The load generator was CPU bound in some stages; their throughput is a lower bound")
+    point = results["saturation"]
+    if point:
+        print(f"Saturated at {point['clients']} clients: {point['throughput']:.1f} calls/s "
+              f"(p99 {point['p99_ms']} ms); {point['next_clients']} clients gave "
+              f"{point['next_throughput']:.1f} calls/s (p99 {point['next_p99_ms']} ms)")
+    elif len(results["stages"]) > 1:
+        print("Throughput still grew at the highest concurrency; add stages to find the saturation point")
+    for kind, example in results["error_examples"].items():
+        print(f"  {kind}: {example}")
+
+    samples = [row for row in results["timeline"] if "quota_used" in row]
+    if samples:
+        print(f"{'t':>6} {'clients':>7} {'calls':>6} {'errors':>6} {'p99 ms':>8} {'upstream':>8} {'quota used':>10} "
+              f"{'limited':>7} {'waits':>5}")
+        for row in samples:
+            print(f"{row['t']:>6.0f} {row.get('clients', 0):>7} {row['calls']:>6} "
+                  f"{sum(row['errors'].values()):>6} {row.get('p99_ms', 0):>8.1f} "
+                  f"{row.get('upstream_requests_delta', 0):>8} {row['quota_used']:>10} "
+                  f"{row.get('rate_limited_delta', 0):>7} {row.get('limiter_waits_delta', 0) or 0:>5.0f}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 4, 16, 64],
+                        help="concurrent clients per stage, run in order")
+    parser.add_argument("--duration", type=float, default=20.0, help="measured seconds per stage")
+    parser.add_argument("--warmup", type=float, default=2.0, help="unmeasured seconds at the start of each stage")
+    parser.add_argument("--mix", type=parse_mix, default="read=70,write=20,analytics=10",
+                        help="workload weights (default read=70,write=20,analytics=10)")
+    parser.add_argument("--think", type=float, default=0.0, help="mean seconds each client waits between calls")
+    parser.add_argument("--timeout", type=float, default=30.0, help="seconds before a call counts as timed out")
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds per timeline interval")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the call sequence")
+    parser.add_argument("--workers", type=int, default=1, help="server worker processes")
+    parser.add_argument("--cache", action="store_true", help="enable the GitHub response cache")
+    parser.add_argument("--latency", default="none", help="mock GitHub latency spec (see mock_github.py)")
+    parser.add_argument("--fault", action="append", default=[], metavar="[PATTERN=]RATE:ACTION",
+                        help="mock GitHub fault rule (see mock_github.py); repeatable")
+    parser.add_argument("--rate-limit", type=int, default=1_000_000,
+                        help="GitHub requests per hour, for both the mock and the server's limiter")
+    parser.add_argument("--url", help="load an already running server instead of starting one with the mock")
+    parser.add_argument("--output", type=Path, help="also write the results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    mock = server = None
+    github_url = None
+    try:
+        if args.url:
+            url = args.url.rstrip("/")
+        else:
+            options = ["--latency", args.latency, "--rate-limit", str(args.rate_limit)]
+            for rule in args.fault:
+                options += ["--fault", rule]
+            mock, github_url = start_mock(*options)
+            server, url = start_server(github_url, args)
+        results = asyncio.run(run(args, url, github_url))
+    finally:
+        for process in (server, mock):
+            if process is not None:
+                process.terminate()
+                process.wait()
+
+    results["environment"] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "workers": args.workers,
+        "cache": args.cache,
+        "latency": args.latency,
+        "faults": args.fault,
+        "rate_limit": args.rate_limit,
+        "mix": args.mix,
+        "duration": args.duration,
+        "think": args.think,
+    }
+    report(results)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,2203 @@
+#!/usr/bin/env python3
+"""
+Mock GitHub API
+
+A local stand-in for api.github.com serving the REST endpoints the tools
+use, so benchmarks and tests never reach GitHub:
+- Deterministic fixtures generated from a seed on first access, for any
+  owner and repository; writes are kept and visible to later reads
+- Identifiers (issue and pull numbers, workflow, run, deployment, hook and
+  alert ids) are sequential per repository starting at 1, so callers can
+  address fixtures without listing them first
+- Page-based pagination with GitHub's ``Link`` headers
+- Rate limit headers per token, and 403s once a window's quota is spent
+- ETags with ``If-None-Match`` revalidation; 304s are not charged
+- Latency distributions and fault injection, globally or per route
+- Admin endpoints under ``/_mock`` for stats, reset and reconfiguration
+
+Point the server at it with AGENT_BUILDER_GITHUB_GITHUB_API_BASE_URL, or
+start it in-process with ``MockGitHubServer``.
+
+Latency specs (milliseconds): ``none``, ``fixed:MS``, ``uniform:LO:HI``,
+``lognormal:P50:P99``. Fault specs: ``[PATTERN=]RATE:ACTION`` where
+PATTERN is matched against ``METHOD path`` (fnmatch) and ACTION is an HTTP
+status, ``timeout`` (hang, then 504) or ``secondary`` (secondary rate
+limit 403 with Retry-After).
+
+Usage:
+    python benchmarks/mock_github.py --port 8765
+    python benchmarks/mock_github.py --latency lognormal:40:250 --fault "GET repos/*/issues*=0.05:502"
+"""
+
+import argparse
+import asyncio
+import base64
+import fnmatch
+import hashlib
+import json
+import math
+import random
+import re
+import socket
+import sys
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+API_URL = "https://api.github.com"
+WEB_URL = "https://github.com"
+AUTHENTICATED_LOGIN = "mock-user"
+ANONYMOUS_RATE_LIMIT = 60
+JSON_MEDIA_TYPE = "application/json; charset=utf-8"
+DIFF_MEDIA_TYPE = "text/plain; charset=utf-8"
+DEFAULT_PER_PAGE = 30
+MAX_PER_PAGE = 100
+# Fixture timestamps fall in the year before this
+FIXTURE_EPOCH = 1735689600
+
+# Collection sizes per repository, organisation or user at scale 1
+DEFAULT_COUNTS = {
+    "issues": 120,
+    "pulls": 40,
+    "commits": 250,
+    "branches": 15,
+    "workflows": 5,
+    "runs": 80,
+    "deployments": 20,
+    "hooks": 3,
+    "code_scanning": 30,
+    "secret_scanning": 8,
+    "dependabot": 25,
+    "members": 60,
+    "org_repos": 45,
+    "user_repos": 35,
+    "gists": 20,
+}
+
+WORDS = (
+    "agent", "builder", "cache", "request", "token", "deploy", "workflow", "branch",
+    "merge", "review", "update", "config", "server", "client", "timeout", "retry",
+    "handle", "error", "missing", "support", "refactor", "test", "docs", "fix",
+    "add", "remove", "improve", "performance", "memory", "latency", "schema",
+    "validate", "endpoint", "response", "pagination", "webhook", "event", "queue",
+    "worker", "database", "query", "index", "migration", "release", "version",
+    "build", "pipeline", "artifact", "security", "scan", "alert", "dependency",
+    "upgrade", "logging", "metrics", "trace", "span", "limit", "quota", "window",
+)
+
+LABELS = (
+    ("bug", "d73a4a"), ("enhancement", "a2eeef"), ("documentation", "0075ca"),
+    ("performance", "fbca04"), ("good first issue", "7057ff"), ("question", "d876e3"),
+    ("security", "b60205"), ("dependencies", "0366d6"),
+)
+
+FILE_TREE = (
+    "README.md", "LICENSE", "pyproject.toml", ".gitignore",
+    ".github/workflows/ci.yml", ".github/workflows/release.yml",
+    "src/app/__init__.py", "src/app/main.py", "src/app/models.py", "src/app/utils.py",
+    "src/app/api/__init__.py", "src/app/api/routes.py", "src/app/api/schemas.py",
+    "tests/__init__.py", "tests/test_main.py", "tests/test_api.py",
+    "docs/index.md", "docs/usage.md", "docs/configuration.md",
+)
+
+ECOSYSTEMS = (("pip", "requests"), ("pip", "urllib3"), ("npm", "lodash"), ("npm", "axios"),
+              ("pip", "jinja2"), ("npm", "minimist"), ("pip", "cryptography"))
+
+
+def iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def numeric_id(*parts: Any) -> int:
+    return zlib.crc32(":".join(str(part) for part in parts).encode()) + 1
+
+
+def node_id(kind: str, identifier: Any) -> str:
+    return base64.b64encode(f"{kind}:{identifier}".encode()).decode().rstrip("=")
+
+
+def git_sha(*parts: Any) -> str:
+    return hashlib.sha1(":".join(str(part) for part in parts).encode()).hexdigest()
+
+
+def blob_sha(content: bytes) -> str:
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+
+def sentence(rng: random.Random, low: int, high: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(low, high))).capitalize()
+
+
+def paragraphs(rng: random.Random, low: int, high: int) -> str:
+    return "\n\n".join(sentence(rng, 8, 30) + "." for _ in range(rng.randint(low, high)))
+
+
+class LatencyModel:
+    """Response delay distribution parsed from a spec in milliseconds"""
+
+    def __init__(self, spec: str = "none", rng: Optional[random.Random] = None):
+        self.spec = spec or "none"
+        self.rng = rng or random.Random()
+        kind, _, args = self.spec.partition(":")
+        values = [float(value) / 1000 for value in args.split(":") if value]
+        if kind == "none":
+            self._sample = lambda: 0.0
+        elif kind == "fixed" and len(values) == 1:
+            self._sample = lambda: values[0]
+        elif kind == "uniform" and len(values) == 2:
+            self._sample = lambda: self.rng.uniform(*values)
+        elif kind == "lognormal" and len(values) == 2 and 0 < values[0] <= values[1]:
+            # p99 of a lognormal sits 2.326 standard deviations above the median
+            mu, sigma = math.log(values[0]), (math.log(values[1]) - math.log(values[0])) / 2.3263
+            self._sample = lambda: self.rng.lognormvariate(mu, sigma)
+        else:
+            raise ValueError(f"Invalid latency spec: {spec!r}")
+
+    def sample(self) -> float:
+        return self._sample()
+
+
+@dataclass
+class FaultRule:
+    """Fail a fraction of the requests matching a pattern"""
+    pattern: str
+    rate: float
+    action: str
+
+    @classmethod
+    def parse(cls, spec: str) -> "FaultRule":
+        pattern, _, rest = spec.rpartition("=")
+        rate, _, action = rest.partition(":")
+        action = action or "500"
+        if not (action.isdigit() or action in ("timeout", "secondary")):
+            raise ValueError(f"Invalid fault action in {spec!r}")
+        return cls(pattern or "*", float(rate), action)
+
+    def matches(self, method: str, path: str) -> bool:
+        return fnmatch.fnmatchcase(f"{method} {path}", self.pattern)
+
+
+@dataclass
+class MockConfig:
+    """Behaviour of the mock API"""
+    seed: int = 0
+    scale: float = 1.0
+    rate_limit: int = 5000
+    rate_window: int = 3600
+    latency: str = "none"
+    route_latency: List[str] = field(default_factory=list)
+    faults: List[str] = field(default_factory=list)
+    timeout_seconds: float = 30.0
+
+
+@dataclass
+class Reply:
+    """Handler result; list payloads of paginated routes are paged by the dispatcher"""
+    status: int = 200
+    payload: Any = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    media_type: str = JSON_MEDIA_TYPE
+    # Set on paginated replies: "" for a bare list, else the key wrapping the page
+    page_key: Optional[str] = None
+
+
+def error(status: int, message: str) -> Reply:
+    return Reply(status, {"message": message, "documentation_url": "https://docs.github.com/rest"})
+
+
+NOT_FOUND = error(404, "Not Found")
+
+
+@dataclass
+class Call:
+    """Parsed request handed to handlers"""
+    method: str
+    path: str
+    params: Dict[str, str]
+    body: Any
+    accept: str
+    token: Optional[str]
+    login: Optional[str]
+
+
+class NotFound(Exception):
+    pass
+
+
+class RepoState:
+    """One repository: metadata plus lazily generated collections"""
+
+    def __init__(self, world: "GitHubWorld", owner: str, name: str, meta: Optional[Dict[str, Any]] = None):
+        self.world = world
+        self.owner = owner
+        self.name = name
+        self.full_name = f"{owner}/{name}"
+        self.rng = world.rng("repo", self.full_name)
+        self.meta = meta or world.repository(owner, name, self.rng)
+        self.collections: Dict[str, Any] = {}
+        self.counters: Dict[str, int] = {}
+
+    def collection(self, kind: str, *key: Any) -> Any:
+        cache_key = (kind, *key)
+        if cache_key not in self.collections:
+            rng = self.world.rng(self.full_name, *cache_key)
+            self.collections[cache_key] = getattr(self.world, f"_generate_{kind}")(self, rng, *key)
+        return self.collections[cache_key]
+
+    def next_id(self, kind: str, existing: List[Dict[str, Any]], attr: str = "id") -> int:
+        if kind not in self.counters:
+            self.counters[kind] = max((item[attr] for item in existing), default=0)
+        self.counters[kind] += 1
+        return self.counters[kind]
+
+    def url(self, *parts: Any) -> str:
+        return "/".join([API_URL, "repos", self.full_name, *map(str, parts)])
+
+    def html_url(self, *parts: Any) -> str:
+        return "/".join([WEB_URL, self.full_name, *map(str, parts)])
+
+    def find(self, kind: str, value: Any, attr: str = "id") -> Dict[str, Any]:
+        for item in self.collection(kind):
+            if str(item[attr]) == str(value):
+                return item
+        raise NotFound()
+
+
+class GitHubWorld:
+    """Fixture data for every owner and repository, generated on first access"""
+
+    def __init__(self, seed: int = 0, scale: float = 1.0):
+        self.seed = seed
+        self.scale = scale
+        self.repos: Dict[Tuple[str, str], RepoState] = {}
+        self.deleted: set = set()
+        self.owner_collections: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        self.users: Dict[str, Dict[str, Any]] = {}
+
+    def rng(self, *key: Any) -> random.Random:
+        return random.Random(":".join(map(str, (self.seed, *key))))
+
+    def count(self, kind: str) -> int:
+        return max(1, int(DEFAULT_COUNTS[kind] * self.scale))
+
+    def timestamp(self, rng: random.Random) -> float:
+        return FIXTURE_EPOCH - rng.randint(0, 365 * 86400)
+
+    # Fixture objects
+
+    def simple_user(self, login: str, kind: str = "User") -> Dict[str, Any]:
+        base = f"{API_URL}/{'orgs' if kind == 'Organization' else 'users'}/{login}"
+        identifier = numeric_id("user", login)
+        return {
+            "login": login,
+            "id": identifier,
+            "node_id": node_id(kind, identifier),
+            "avatar_url": f"https://avatars.githubusercontent.com/u/{identifier}?v=4",
+            "gravatar_id": "",
+            "url": base,
+            "html_url": f"{WEB_URL}/{login}",
+            "followers_url": f"{base}/followers",
+            "following_url": f"{base}/following{{/other_user}}",
+            "gists_url": f"{base}/gists{{/gist_id}}",
+            "starred_url": f"{base}/starred{{/owner}}{{/repo}}",
+            "subscriptions_url": f"{base}/subscriptions",
+            "organizations_url": f"{base}/orgs",
+            "repos_url": f"{base}/repos",
+            "events_url": f"{base}/events{{/privacy}}",
+            "received_events_url": f"{base}/received_events",
+            "type": kind,
+            "site_admin": False,
+        }
+
+    def user(self, login: str) -> Dict[str, Any]:
+        if login not in self.users:
+            rng = self.rng("user", login)
+            created = self.timestamp(rng) - 4 * 365 * 86400
+            self.users[login] = {
+                **self.simple_user(login),
+                "name": sentence(rng, 2, 2),
+                "company": rng.choice([None, "@verridian-ai", "@acme"]),
+                "blog": f"https://{login}.dev",
+                "location": rng.choice(["Sydney", "Berlin", "Toronto", None]),
+                "email": None,
+                "hireable": None,
+                "bio": sentence(rng, 4, 12),
+                "twitter_username": None,
+                "public_repos": self.count("user_repos"),
+                "public_gists": self.count("gists"),
+                "followers": rng.randint(0, 2000),
+                "following": rng.randint(0, 200),
+                "created_at": iso(created),
+                "updated_at": iso(self.timestamp(rng)),
+            }
+        return self.users[login]
+
+    def organization(self, org: str) -> Dict[str, Any]:
+        rng = self.rng("org", org)
+        base = f"{API_URL}/orgs/{org}"
+        identifier = numeric_id("user", org)
+        return {
+            "login": org,
+            "id": identifier,
+            "node_id": node_id("Organization", identifier),
+            "url": base,
+            "repos_url": f"{base}/repos",
+            "events_url": f"{base}/events",
+            "hooks_url": f"{base}/hooks",
+            "issues_url": f"{base}/issues",
+            "members_url": f"{base}/members{{/member}}",
+            "public_members_url": f"{base}/public_members{{/member}}",
+            "avatar_url": f"https://avatars.githubusercontent.com/u/{identifier}?v=4",
+            "description": sentence(rng, 5, 12),
+            "name": org.capitalize(),
+            "company": None,
+            "blog": f"https://{org}.example",
+            "location": rng.choice(["Sydney", "Berlin", "Toronto"]),
+            "email": None,
+            "is_verified": rng.random() < 0.5,
+            "has_organization_projects": True,
+            "has_repository_projects": True,
+            "public_repos": self.count("org_repos"),
+            "public_gists": 0,
+            "followers": rng.randint(0, 5000),
+            "following": 0,
+            "html_url": f"{WEB_URL}/{org}",
+            "created_at": iso(self.timestamp(rng) - 3 * 365 * 86400),
+            "updated_at": iso(self.timestamp(rng)),
+            "type": "Organization",
+        }
+
+    def repository(self, owner: str, name: str, rng: random.Random) -> Dict[str, Any]:
+        full_name = f"{owner}/{name}"
+        identifier = numeric_id("repo", full_name)
+        url = f"{API_URL}/repos/{full_name}"
+        created = self.timestamp(rng) - 2 * 365 * 86400
+        return {
+            "id": identifier,
+            "node_id": node_id("Repository", identifier),
+            "name": name,
+            "full_name": full_name,
+            "private": False,
+            "owner": self.simple_user(owner),
+            "html_url": f"{WEB_URL}/{full_name}",
+            "description": sentence(rng, 4, 14),
+            "fork": False,
+            "url": url,
+            "forks_url": f"{url}/forks",
+            "keys_url": f"{url}/keys{{/key_id}}",
+            "collaborators_url": f"{url}/collaborators{{/collaborator}}",
+            "hooks_url": f"{url}/hooks",
+            "issue_events_url": f"{url}/issues/events{{/number}}",
+            "events_url": f"{url}/events",
+            "branches_url": f"{url}/branches{{/branch}}",
+            "tags_url": f"{url}/tags",
+            "statuses_url": f"{url}/statuses/{{sha}}",
+            "languages_url": f"{url}/languages",
+            "contributors_url": f"{url}/contributors",
+            "commits_url": f"{url}/commits{{/sha}}",
+            "contents_url": f"{url}/contents/{{+path}}",
+            "issues_url": f"{url}/issues{{/number}}",
+            "pulls_url": f"{url}/pulls{{/number}}",
+            "deployments_url": f"{url}/deployments",
+            "git_url": f"git://github.com/{full_name}.git",
+            "ssh_url": f"git@github.com:{full_name}.git",
+            "clone_url": f"{WEB_URL}/{full_name}.git",
+            "homepage": None,
+            "size": rng.randint(100, 50000),
+            "stargazers_count": rng.randint(0, 5000),
+            "watchers_count": rng.randint(0, 5000),
+            "language": rng.choice(["Python", "TypeScript", "Go", "Rust"]),
+            "has_issues": True,
+            "has_projects": True,
+            "has_downloads": True,
+            "has_wiki": True,
+            "has_pages": False,
+            "has_discussions": False,
+            "forks_count": rng.randint(0, 500),
+            "archived": False,
+            "disabled": False,
+            "open_issues_count": rng.randint(0, 200),
+            "license": {"key": "mit", "name": "MIT License", "spdx_id": "MIT"},
+            "allow_forking": True,
+            "is_template": False,
+            "topics": sorted({rng.choice(WORDS) for _ in range(rng.randint(0, 5))}),
+            "visibility": "public",
+            "forks": rng.randint(0, 500),
+            "open_issues": rng.randint(0, 200),
+            "watchers": rng.randint(0, 5000),
+            "default_branch": "main",
+            "permissions": {"admin": True, "maintain": True, "push": True, "triage": True, "pull": True},
+            "created_at": iso(created),
+            "updated_at": iso(self.timestamp(rng)),
+            "pushed_at": iso(self.timestamp(rng)),
+        }
+
+    def label(self, repo: RepoState, name: str, color: str) -> Dict[str, Any]:
+        identifier = numeric_id("label", repo.full_name, name)
+        return {
+            "id": identifier,
+            "node_id": node_id("Label", identifier),
+            "url": repo.url("labels", name.replace(" ", "%20")),
+            "name": name,
+            "color": color,
+            "default": name in ("bug", "enhancement", "documentation"),
+            "description": None,
+        }
+
+    def labels(self, repo: RepoState, names: List[str]) -> List[Dict[str, Any]]:
+        colors = dict(LABELS)
+        return [self.label(repo, name, colors.get(name, "ededed")) for name in names]
+
+    def comment(self, repo: RepoState, kind: str, identifier: int, rng: random.Random,
+                login: str, body: str, timestamp: float) -> Dict[str, Any]:
+        return {
+            "id": identifier,
+            "node_id": node_id("IssueComment", f"{repo.full_name}:{identifier}"),
+            "url": repo.url(kind, "comments", identifier),
+            "html_url": repo.html_url("issues", f"#issuecomment-{identifier}"),
+            "body": body,
+            "user": self.simple_user(login),
+            "created_at": iso(timestamp),
+            "updated_at": iso(timestamp),
+            "author_association": rng.choice(["OWNER", "MEMBER", "CONTRIBUTOR", "NONE"]),
+            "reactions": {"url": repo.url(kind, "comments", identifier, "reactions"), "total_count": 0,
+                          "+1": 0, "-1": 0, "laugh": 0, "hooray": 0, "confused": 0,
+                          "heart": 0, "rocket": 0, "eyes": 0},
+        }
+
+    def patch(self, rng: random.Random) -> Tuple[str, int, int]:
+        lines, additions, deletions = [], 0, 0
+        start = rng.randint(1, 400)
+        for _ in range(rng.randint(1, 4)):
+            body = []
+            for _ in range(rng.randint(3, 20)):
+                marker = rng.choice(" +-+ ")
+                additions += marker == "+"
+                deletions += marker == "-"
+                body.append(marker + "    " + sentence(rng, 2, 10).lower())
+            lines.append(f"@@ -{start},{len(body)} +{start},{len(body)} @@")
+            lines.extend(body)
+            start += rng.randint(20, 80)
+        return "\n".join(lines), additions, deletions
+
+    def commit(self, repo: RepoState, sha: str, parent: Optional[str], rng: random.Random,
+               timestamp: float, message: Optional[str] = None) -> Dict[str, Any]:
+        login = rng.choice([repo.owner, AUTHENTICATED_LOGIN, "octocat", "hubot"])
+        signature = {"name": login, "email": f"{login}@users.noreply.github.com", "date": iso(timestamp)}
+        return {
+            "sha": sha,
+            "node_id": node_id("Commit", sha),
+            "commit": {
+                "author": signature,
+                "committer": signature,
+                "message": message or sentence(rng, 3, 12),
+                "tree": {"sha": git_sha("tree", sha), "url": repo.url("git", "trees", git_sha("tree", sha))},
+                "url": repo.url("git", "commits", sha),
+                "comment_count": 0,
+                "verification": {"verified": False, "reason": "unsigned", "signature": None, "payload": None},
+            },
+            "url": repo.url("commits", sha),
+            "html_url": repo.html_url("commit", sha),
+            "comments_url": repo.url("commits", sha, "comments"),
+            "author": self.simple_user(login),
+            "committer": self.simple_user(login),
+            "parents": [{"sha": parent, "url": repo.url("commits", parent),
+                         "html_url": repo.html_url("commit", parent)}] if parent else [],
+        }
+
+    def commit_files(self, repo: RepoState, sha: str) -> List[Dict[str, Any]]:
+        rng = self.rng(repo.full_name, "commit_files", sha)
+        files = []
+        for filename in rng.sample(FILE_TREE, rng.randint(1, 6)):
+            patch, additions, deletions = self.patch(rng)
+            files.append({
+                "sha": git_sha("blob", sha, filename),
+                "filename": filename,
+                "status": rng.choice(["modified", "modified", "added", "removed"]),
+                "additions": additions,
+                "deletions": deletions,
+                "changes": additions + deletions,
+                "blob_url": repo.html_url("blob", sha, filename),
+                "raw_url": repo.html_url("raw", sha, filename),
+                "contents_url": repo.url("contents", f"{filename}?ref={sha}"),
+                "patch": patch,
+            })
+        return files
+
+    def file_content(self, repo: RepoState, path: str) -> bytes:
+        rng = self.rng(repo.full_name, "file", path)
+        if path.endswith(".md"):
+            text = f"# {sentence(rng, 2, 5)}\n\n{paragraphs(rng, 3, 12)}\n"
+        elif path.endswith(".py"):
+            text = "\n\n".join(
+                f"def {rng.choice(WORDS)}_{rng.choice(WORDS)}(value):\n"
+                f"    \"\"\"{sentence(rng, 4, 10)}\"\"\"\n    return value\n"
+                for _ in range(rng.randint(2, 25))
+            )
+        else:
+            text = "\n".join(f"{rng.choice(WORDS)} = \"{rng.choice(WORDS)}\"" for _ in range(rng.randint(5, 60)))
+        return text.encode()
+
+    def content_entry(self, repo: RepoState, path: str, content: Optional[bytes]) -> Dict[str, Any]:
+        name = path.rsplit("/", 1)[-1]
+        kind = "dir" if content is None else "file"
+        sha = git_sha("tree", repo.full_name, path) if content is None else blob_sha(content)
+        url = repo.url("contents", path) + "?ref=main"
+        html = repo.html_url("tree" if content is None else "blob", "main", path)
+        git = repo.url("git", "trees" if content is None else "blobs", sha)
+        return {
+            "name": name,
+            "path": path,
+            "sha": sha,
+            "size": 0 if content is None else len(content),
+            "url": url,
+            "html_url": html,
+            "git_url": git,
+            "download_url": None if content is None else f"https://raw.githubusercontent.com/{repo.full_name}/main/{path}",
+            "type": kind,
+            "_links": {"self": url, "git": git, "html": html},
+        }
+
+    def content_file(self, repo: RepoState, path: str, content: bytes) -> Dict[str, Any]:
+        encoded = base64.b64encode(content).decode()
+        # GitHub wraps base64 content at 60 characters
+        wrapped = "\n".join(encoded[i:i + 60] for i in range(0, len(encoded), 60))
+        return {**self.content_entry(repo, path, content), "content": wrapped + "\n", "encoding": "base64"}
+
+    # Collection generators, called once per repository and key
+
+    def _generate_commits(self, repo: RepoState, rng: random.Random) -> List[Dict[str, Any]]:
+        count = self.count("commits")
+        shas = [git_sha(repo.full_name, "commit", i) for i in range(count)]
+        timestamp = FIXTURE_EPOCH
+        commits = []
+        for i, sha in enumerate(shas):
+            timestamp -= rng.randint(600, 86400)
+            commits.append(self.commit(repo, sha, shas[i + 1] if i + 1 < count else None, rng, timestamp))
+        return commits
+
+    def _generate_files(self, repo: RepoState, rng: random.Random) -> Dict[str, bytes]:
+        return {path: self.file_content(repo, path) for path in FILE_TREE}
+
+    def _generate_branches(self, repo: RepoState, rng: random.Random) -> List[Dict[str, Any]]:
+        commits = repo.collection("commits")
+        names = ["main", "develop"] + [f"feature/{rng.choice(WORDS)}-{i}" for i in range(self.count("branches") - 2)]
+        return [{
+            "name": name,
+            "commit": {"sha": commits[min(i * 3, len(commits) - 1)]["sha"],
+                       "url": repo.url("commits", commits[min(i * 3, len(commits) - 1)]["sha"])},
+            "protected": name == "main",
+        } for i, name in enumerate(names)]
+
+    def issue(self, repo: RepoState, rng: random.Random, number: int, title: str, body: Optional[str],
+              login: str, created: float) -> Dict[str, Any]:
+        return {
+            "url": repo.url("issues", number),
+            "repository_url": repo.url(),
+            "labels_url": repo.url("issues", number, "labels{/name}"),
+            "comments_url": repo.url("issues", number, "comments"),
+            "events_url": repo.url("issues", number, "events"),
+            "html_url": repo.html_url("issues", number),
+            "id": numeric_id("issue", repo.full_name, number),
+            "node_id": node_id("Issue", f"{repo.full_name}#{number}"),
+            "number": number,
+            "title": title,
+            "user": self.simple_user(login),
+            "labels": [],
+            "state": "open",
+            "locked": False,
+            "assignee": None,
+            "assignees": [],
+            "milestone": None,
+            "comments": 0,
+            "created_at": iso(created),
+            "updated_at": iso(created),
+            "closed_at": None,
+            "author_association": "OWNER" if login == repo.owner else "CONTRIBUTOR",
+            "active_lock_reason": None,
+            "body": body,
+            "reactions": {"url": repo.url("issues", number, "reactions"), "total_count": 0,
+                          "+1": 0, "-1": 0, "laugh": 0, "hooray": 0, "confused": 0,
+                          "heart": 0, "rocket": 0, "eyes": 0},
+            "timeline_url": repo.url("issues", number, "timeline"),
+            "state_reason": None,
+        }
+
+    def _generate_issues(self, repo: RepoState, rng: random.Random) -> List[Dict[str, Any]]:
+        issues = []
+        for number in range(1, self.count("issues") + 1):
+            created = self.timestamp(rng)
+            issue = self.issue(repo, rng, number, sentence(rng, 3, 10), paragraphs(rng, 1, 6),
+                               rng.choice([repo.owner, "octocat", "hubot", AUTHENTICATED_LOGIN]), created)
+            assignees = [self.simple_user(rng.choice(["octocat", "hubot"]))] if rng.random() < 0.3 else []
+            issue.update({
+                "labels": self.labels(repo, sorted({rng.choice(LABELS)[0] for _ in range(rng.randint(0, 3))})),
+                "assignee": assignees[0] if assignees else None,
+                "assignees": assignees,
+                "comments": rng.randint(0, 12),
+                "updated_at": iso(created + rng.randint(0, 30 * 86400)),
+            })
+            if rng.random() < 0.4:
+                issue.update({"state": "closed", "state_reason": "completed",
+                              "closed_at": iso(created + rng.randint(3600, 60 * 86400))})
+            issues.append(issue)
+        return issues
+
+    def _generate_issue_comments(self, repo: RepoState, rng: random.Random, number: int) -> List[Dict[str, Any]]:
+        issue = repo.find("issues", number, "number")
+        base = number * 1000
+        created = datetime.strptime(issue["created_at"], "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc).timestamp()
+        return [self.comment(repo, "issues", base + i, rng, rng.choice(["octocat", "hubot", repo.owner]),
+                             paragraphs(rng, 1, 3), created + i * 3600)
+                for i in range(1, issue["comments"] + 1)]
+
+    def _generate_pulls(self, repo: RepoState, rng: random.Random) -> List[Dict[str, Any]]:
+        branches = repo.collection("branches")
+        pulls = []
+        for number in range(1, self.count("pulls") + 1):
+            head = branches[1 + (number % (len(branches) - 1))]
+            pulls.append(self.pull(repo, rng, number, sentence(rng, 3, 10), paragraphs(rng, 1, 5),
+                                   head["name"], "main", head["commit"]["sha"],
+                                   rng.choice(["octocat", "hubot", AUTHENTICATED_LOGIN]),
+                                   self.timestamp(rng), rng.choice(["open", "open", "closed", "merged"])))
+        return pulls
+
+    def pull(self, repo: RepoState, rng: random.Random, number: int, title: str, body: Optional[str],
+             head: str, base: str, head_sha: str, login: str, created: float, state: str = "open",
+             draft: bool = False) -> Dict[str, Any]:
+        merged = state == "merged"
+        closed_at = iso(created + rng.randint(3600, 20 * 86400)) if state != "open" else None
+        additions, deletions = rng.randint(1, 800), rng.randint(0, 400)
+
+        def ref(name: str, sha: str) -> Dict[str, Any]:
+            return {"label": f"{repo.owner}:{name}", "ref": name, "sha": sha,
+                    "user": self.simple_user(repo.owner), "repo": repo.meta}
+
+        return {
+            "url": repo.url("pulls", number),
+            "id": numeric_id("pull", repo.full_name, number),
+            "node_id": node_id("PullRequest", f"{repo.full_name}#{number}"),
+            "html_url": repo.html_url("pull", number),
+            "diff_url": repo.html_url("pull", f"{number}.diff"),
+            "patch_url": repo.html_url("pull", f"{number}.patch"),
+            "issue_url": repo.url("issues", number),
+            "commits_url": repo.url("pulls", number, "commits"),
+            "review_comments_url": repo.url("pulls", number, "comments"),
+            "comments_url": repo.url("issues", number, "comments"),
+            "statuses_url": repo.url("statuses", head_sha),
+            "number": number,
+            "state": "open" if state == "open" else "closed",
+            "locked": False,
+            "title": title,
+            "user": self.simple_user(login),
+            "body": body,
+            "labels": [],
+            "milestone": None,
+            "active_lock_reason": None,
+            "created_at": iso(created),
+            "updated_at": iso(created + rng.randint(0, 20 * 86400)),
+            "closed_at": closed_at,
+            "merged_at": closed_at if merged else None,
+            "merge_commit_sha": git_sha(repo.full_name, "merge", number),
+            "assignee": None,
+            "assignees": [],
+            "requested_reviewers": [],
+            "requested_teams": [],
+            "head": ref(head, head_sha),
+            "base": ref(base, repo.collection("commits")[0]["sha"]),
+            "author_association": "OWNER" if login == repo.owner else "CONTRIBUTOR",
+            "auto_merge": None,
+            "draft": draft,
+            "merged": merged,
+            "mergeable": None if state != "open" else True,
+            "rebaseable": True,
+            "mergeable_state": "clean",
+            "merged_by": self.simple_user(repo.owner) if merged else None,
+            "comments": rng.randint(0, 10),
+            "review_comments": rng.randint(0, 8),
+            "maintainer_can_modify": False,
+            "commits": rng.randint(1, 20),
+            "additions": additions,
+            "deletions": deletions,
+            "changed_files": rng.randint(1, 25),
+        }
+
+    def _generate_pull_files(self, repo: RepoState, rng: random.Random, number: int) -> List[Dict[str, Any]]:
+        pull = repo.find("pulls", number, "number")
+        files = []
+        for i in range(pull["changed_files"]):
+            filename = f"{rng.choice(FILE_TREE).rsplit('.', 1)[0]}_{i}.py"
+            patch, additions, deletions = self.patch(rng)
+            files.append({
+                "sha": git_sha("blob", repo.full_name, number, filename),
+                "filename": filename,
+                "status": rng.choice(["modified", "modified", "added", "removed", "renamed"]),
+                "additions": additions,
+                "deletions": deletions,
+                "changes": additions + deletions,
+                "blob_url": repo.html_url("blob", pull["head"]["sha"], filename),
+                "raw_url": repo.html_url("raw", pull["head"]["sha"], filename),
+                "contents_url": repo.url("contents", f"{filename}?ref={pull['head']['sha']}"),
+                "patch": patch,
+            })
+        return files
+
+    def _generate_pull_comments(self, repo: RepoState, rng: random.Random, number: int) -> List[Dict[str, Any]]:
+        pull = repo.find("pulls", number, "number")
+        files = repo.collection("pull_files", number)
+        comments = []
+        for i in range(1, pull["review_comments"] + 1):
+            comment = self.comment(repo, "pulls", number * 1000 + i, rng, rng.choice(["octocat", "hubot"]),
+                                   sentence(rng, 4, 20), self.timestamp(rng))
+            target = rng.choice(files)
+            comment.update({"path": target["filename"], "position": rng.randint(1, 20), "line": rng.randint(1, 200),
+                            "commit_id": pull["head"]["sha"], "original_commit_id": pull["head"]["sha"],
+                            "diff_hunk": target["patch"].split("\n", 4)[0],
+                            "pull_request_url": repo.url("pulls", number)})
+            comments.append(comment)
+        return comments
+
+    def _generate_workflows(self, repo: RepoState, rng: random.Random) -> List[Dict[str, Any]]:
+        names = ["CI", "Release", "CodeQL", "Deploy", "Nightly"] + [f"Job {i}" for i in range(6, 100)]
+        workflows = []
+        for identifier in range(1, self.count("workflows") + 1):
+            name = names[identifier - 1]
+            path = f".github/workflows/{name.lower().replace(' ', '-')}.yml"
+            workflows.append({
+                "id": identifier,
+                "node_id": node_id("Workflow", f"{repo.full_name}:{identifier}"),
+                "name": name,
+                "path": path,
+                "state": "active",
+                "created_at": iso(self.timestamp(rng)),
+                "updated_at": iso(self.timestamp(rng)),
+                "url": repo.url("actions", "workflows", identifier),
+                "html_url": repo.html_url("blob", "main", path),
+                "badge_url": repo.html_url("workflows", name, "badge.svg"),
+            })
+        return workflows
+
+    def _generate_runs(self, repo: RepoState, rng: random.Random) -> List[Dict[str, Any]]:
+        workflows = repo.collection("workflows")
+        commits = repo.collection("commits")
+        return [self.run(repo, rng, identifier, rng.choice(workflows), rng.choice(commits[:40]),
+                         rng.choice(["push", "pull_request", "schedule", "workflow_dispatch"]),
+                         self.timestamp(rng))
+                for identifier in range(1, self.count("runs") + 1)]
+
+    def run(self, repo: RepoState, rng: random.Random, identifier: int, workflow: Dict[str, Any],
+            commit: Dict[str, Any], event: str, created: float, status: Optional[str] = None) -> Dict[str, Any]:
+        status = status or rng.choice(["completed", "completed", "completed", "in_progress", "queued"])
+        return {
+            "id": identifier,
+            "name": workflow["name"],
+            "node_id": node_id("WorkflowRun", f"{repo.full_name}:{identifier}"),
+            "head_branch": "main",
+            "head_sha": commit["sha"],
+            "path": workflow["path"],
+            "run_number": identifier,
+            "event": event,
+            "status": status,
+            "conclusion": rng.choice(["success", "success", "failure", "cancelled"]) if status == "completed" else None,
+            "workflow_id": workflow["id"],
+            "url": repo.url("actions", "runs", identifier),
+            "html_url": repo.html_url("actions", "runs", identifier),
+            "created_at": iso(created),
+            "updated_at": iso(created + rng.randint(60, 3600)),
+            "run_attempt": 1,
+            "run_started_at": iso(created),
+            "actor": self.simple_user(commit["author"]["login"]),
+            "triggering_actor": self.simple_user(commit["author"]["login"]),
+            "jobs_url": repo.url("actions", "runs", identifier, "jobs"),
+            "logs_url": repo.url("actions", "runs", identifier, "logs"),
+            "artifacts_url": repo.url("actions", "runs", identifier, "artifacts"),
+            "cancel_url": repo.url("actions", "runs", identifier, "cancel"),
+            "workflow_url": workflow["url"],
+            "head_commit": {"id": commit["sha"], "tree_id": commit["commit"]["tree"]["sha"],
+                            "message": commit["commit"]["message"], "timestamp": commit["commit"]["author"]["date"],
+                            "author": {"name": commit["commit"]["author"]["name"],
+                                       "email": commit["commit"]["author"]["email"]}},
+            "repository": {key: repo.meta[key] for key in ("id", "node_id", "name", "full_name", "private",
+                                                           "owner", "html_url", "url")},
+        }
+
+    def _generate_deployments(self, repo: RepoState, rng: random.Random) -> List[Dict[str, Any]]:
+        commits = repo.collection("commits")
+        return [self.deployment(repo, identifier, rng.choice(commits[:30])["sha"], "main",
+                                rng.choice(["production", "staging", "preview"]), sentence(rng, 2, 6),
+                                rng.choice(["octocat", repo.owner]), self.timestamp(rng))
+                for identifier in range(1, self.count("deployments") + 1)]
+
+    def deployment(self, repo: RepoState, identifier: int, sha: str, ref: str, environment: str,
+                   description: Optional[str], login: str, created: float,
+                   payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return {
+            "url": repo.url("deployments", identifier),
+            "id": identifier,
+            "node_id": node_id("Deployment", f"{repo.full_name}:{identifier}"),
+            "sha": sha,
+            "ref": ref,
+            "task": "deploy",
+            "payload": payload or {},
+            "original_environment": environment,
+            "environment": environment,
+            "description": description,
+            "creator": self.simple_user(login),
+            "created_at": iso(created),
+            "updated_at": iso(created),
+            "statuses_url": repo.url("deployments", identifier, "statuses"),
+            "repository_url": repo.url(),
+            "transient_environment": False,
+            "production_environment": environment == "production",
+        }
+
+    def deployment_status(self, repo: RepoState, deployment: Dict[str, Any], identifier: int, state: str,
+                          description: str, created: float, target_url: str = "") -> Dict[str, Any]:
+        return {
+            "url": repo.url("deployments", deployment["id"], "statuses", identifier),
+            "id": identifier,
+            "node_id": node_id("DeploymentStatus", f"{repo.full_name}:{identifier}"),
+            "state": state,
+            "creator": deployment["creator"],
+            "description": description,
+            "environment": deployment["environment"],
+            "target_url": target_url,
+            "log_url": target_url,
+            "created_at": iso(created),
+            "updated_at": iso(created),
+            "deployment_url": deployment["url"],
+            "repository_url": repo.url(),
+        }
+
+    def _generate_deployment_statuses(self, repo: RepoState, rng: random.Random,
+                                      deployment_id: int) -> List[Dict[str, Any]]:
+        deployment = repo.find("deployments", deployment_id)
+        states = ["queued", "in_progress", rng.choice(["success", "failure", "inactive"])]
+        return [self.deployment_status(repo, deployment, deployment_id * 100 + i, state, sentence(rng, 2, 6),
+                                       self.timestamp(rng))
+                for i, state in enumerate(states[:rng.randint(1, 3)], 1)][::-1]
+
+    def hook(self, repo_url: str, identifier: int, config: Dict[str, Any], events: List[str],
+             active: bool, created: float) -> Dict[str, Any]:
+        url = f"{repo_url}/hooks/{identifier}"
+        return {
+            "type": "Repository",
+            "id": identifier,
+            "name": "web",
+            "active": active,
+            "events": events,
+            "config": {"content_type": "json", "insecure_ssl": "0", **config},
+            "updated_at": iso(created),
+            "created_at": iso(created),
+            "url": url,
+            "test_url": f"{url}/test",
+            "ping_url": f"{url}/pings",
+            "deliveries_url": f"{url}/deliveries",
+            "last_response": {"code": 200, "status": "active", "message": "OK"},
+        }
+
+    def _generate_hooks(self, repo: RepoState, rng: random.Random) -> List[Dict[str, Any]]:
+        return [self.hook(repo.url(), identifier, {"url": f"https://hooks.example.com/{rng.choice(WORDS)}"},
+                          rng.sample(["push", "pull_request", "issues", "release", "workflow_run"], 2),
+                          True, self.timestamp(rng))
+                for identifier in range(1, self.count("hooks") + 1)]
+
+    def _generate_hook_deliveries(self, repo: RepoState, rng: random.Random, hook_id: int) -> List[Dict[str, Any]]:
+        hook = repo.find("hooks", hook_id)
+        deliveries = []
+        for i in range(rng.randint(5, 30)):
+            status = rng.choice([200, 200, 200, 500, 404])
+            deliveries.append({
+                "id": hook_id * 100000 + i,
+                "guid": str(random.Random(f"{repo.full_name}:{hook_id}:{i}").getrandbits(128)),
+                "delivered_at": iso(self.timestamp(rng)),
+                "redelivery": False,
+                "duration": round(rng.uniform(0.05, 2.0), 2),
+                "status": "OK" if status == 200 else "Invalid HTTP Response: %d" % status,
+                "status_code": status,
+                "event": rng.choice(hook["events"]),
+                "action": rng.choice([None, "opened", "closed", "synchronize"]),
+                "installation_id": None,
+                "repository_id": repo.meta["id"],
+            })
+        return deliveries
+
+    def _generate_code_scanning(self, repo: RepoState, rng: random.Random) -> List[Dict[str, Any]]:
+        alerts = []
+        for number in range(1, self.count("code_scanning") + 1):
+            state = rng.choice(["open", "open", "dismissed", "fixed"])
+            rule = rng.choice(["py/sql-injection", "py/path-injection", "py/clear-text-logging",
+                               "js/xss", "py/weak-crypto"])
+            alerts.append({
+                "number": number,
+                "created_at": iso(self.timestamp(rng)),
+                "updated_at": iso(self.timestamp(rng)),
+                "url": repo.url("code-scanning", "alerts", number),
+                "html_url": repo.html_url("security", "code-scanning", number),
+                "state": state,
+                "fixed_at": None,
+                "dismissed_by": None,
+                "dismissed_at": None,
+                "dismissed_reason": "false positive" if state == "dismissed" else None,
+                "rule": {"id": rule, "severity": rng.choice(["error", "warning", "note"]),
+                         "security_severity_level": rng.choice(["critical", "high", "medium", "low"]),
+                         "description": sentence(rng, 4, 10), "tags": ["security"]},
+                "tool": {"name": "CodeQL", "guid": None, "version": "2.17.0"},
+                "most_recent_instance": {
+                    "ref": "refs/heads/main", "analysis_key": ".github/workflows/codeql.yml:analyze",
+                    "environment": "{}", "category": ".github/workflows/codeql.yml:analyze",
+                    "state": state, "commit_sha": repo.collection("commits")[0]["sha"],
+                    "message": {"text": sentence(rng, 5, 15)},
+                    "location": {"path": rng.choice(FILE_TREE[6:13]), "start_line": rng.randint(1, 300),
+                                 "end_line": rng.randint(1, 300), "start_column": 1, "end_column": 40},
+                    "classifications": [],
+                },
+                "instances_url": repo.url("code-scanning", "alerts", number, "instances"),
+            })
+        return alerts
+
+    def _generate_secret_scanning(self, repo: RepoState, rng: random.Random) -> List[Dict[str, Any]]:
+        alerts = []
+        for number in range(1, self.count("secret_scanning") + 1):
+            secret_type = rng.choice([("github_personal_access_token", "GitHub Personal Access Token"),
+                                      ("aws_access_key_id", "AWS Access Key ID"),
+                                      ("slack_webhook_url", "Slack Incoming Webhook URL")])
+            state = rng.choice(["open", "resolved"])
+            alerts.append({
+                "number": number,
+                "created_at": iso(self.timestamp(rng)),
+                "url": repo.url("secret-scanning", "alerts", number),
+                "html_url": repo.html_url("security", "secret-scanning", number),
+                "locations_url": repo.url("secret-scanning", "alerts", number, "locations"),
+                "state": state,
+                "resolution": "revoked" if state == "resolved" else None,
+                "resolved_at": None,
+                "resolved_by": None,
+                "secret_type": secret_type[0],
+                "secret_type_display_name": secret_type[1],
+                "secret": "*" * 20,
+                "push_protection_bypassed": False,
+                "validity": rng.choice(["active", "inactive", "unknown"]),
+            })
+        return alerts
+
+    def _generate_dependabot(self, repo: RepoState, rng: random.Random) -> List[Dict[str, Any]]:
+        alerts = []
+        for number in range(1, self.count("dependabot") + 1):
+            ecosystem, package = rng.choice(ECOSYSTEMS)
+            severity = rng.choice(["low", "medium", "high", "critical"])
+            ghsa = "GHSA-" + "-".join(git_sha(repo.full_name, number)[i:i + 4] for i in (0, 4, 8))
+            alerts.append({
+                "number": number,
+                "state": rng.choice(["open", "open", "dismissed", "fixed", "auto_dismissed"]),
+                "dependency": {"package": {"ecosystem": ecosystem, "name": package},
+                               "manifest_path": "requirements.txt" if ecosystem == "pip" else "package-lock.json",
+                               "scope": rng.choice(["runtime", "development"])},
+                "security_advisory": {
+                    "ghsa_id": ghsa, "cve_id": f"CVE-2024-{rng.randint(1000, 99999)}",
+                    "summary": sentence(rng, 5, 12), "description": paragraphs(rng, 1, 3),
+                    "severity": severity,
+                    "identifiers": [{"type": "GHSA", "value": ghsa}],
+                    "references": [{"url": f"https://github.com/advisories/{ghsa}"}],
+                    "published_at": iso(self.timestamp(rng)), "updated_at": iso(self.timestamp(rng)),
+                    "withdrawn_at": None,
+                    "vulnerabilities": [{"package": {"ecosystem": ecosystem, "name": package}, "severity": severity,
+                                         "vulnerable_version_range": "< 2.0.0",
+                                         "first_patched_version": {"identifier": "2.0.0"}}],
+                    "cvss": {"vector_string": None, "score": round(rng.uniform(1, 10), 1)},
+                    "cwes": [{"cwe_id": f"CWE-{rng.randint(20, 900)}", "name": sentence(rng, 2, 5)}],
+                },
+                "security_vulnerability": {"package": {"ecosystem": ecosystem, "name": package},
+                                           "severity": severity, "vulnerable_version_range": "< 2.0.0",
+                                           "first_patched_version": {"identifier": "2.0.0"}},
+                "url": repo.url("dependabot", "alerts", number),
+                "html_url": repo.html_url("security", "dependabot", number),
+                "created_at": iso(self.timestamp(rng)),
+                "updated_at": iso(self.timestamp(rng)),
+                "dismissed_at": None,
+                "dismissed_by": None,
+                "dismissed_reason": None,
+                "fixed_at": None,
+            })
+        return alerts
+
+    # Owner-level collections
+
+    def owner_collection(self, kind: str, owner: str) -> List[Dict[str, Any]]:
+        key = (kind, owner)
+        if key not in self.owner_collections:
+            rng = self.rng("owner", kind, owner)
+            if kind == "members":
+                items = [self.simple_user(f"{owner}-member-{i}") for i in range(1, self.count("members") + 1)]
+            elif kind in ("org_repos", "user_repos"):
+                items = [self.repo(owner, f"{rng.choice(WORDS)}-{rng.choice(WORDS)}-{i}").meta
+                         for i in range(1, self.count(kind) + 1)]
+            elif kind == "gists":
+                items = [self.gist(owner, rng) for _ in range(self.count("gists"))]
+            else:
+                items = []
+            self.owner_collections[key] = items
+        return self.owner_collections[key]
+
+    def gist(self, owner: str, rng: random.Random) -> Dict[str, Any]:
+        identifier = "%032x" % rng.getrandbits(128)
+        filename = f"{rng.choice(WORDS)}.{rng.choice(['py', 'md', 'json', 'sh'])}"
+        return {
+            "url": f"{API_URL}/gists/{identifier}",
+            "forks_url": f"{API_URL}/gists/{identifier}/forks",
+            "commits_url": f"{API_URL}/gists/{identifier}/commits",
+            "id": identifier,
+            "node_id": node_id("Gist", identifier),
+            "git_pull_url": f"https://gist.github.com/{identifier}.git",
+            "git_push_url": f"https://gist.github.com/{identifier}.git",
+            "html_url": f"https://gist.github.com/{owner}/{identifier}",
+            "files": {filename: {"filename": filename, "type": "text/plain", "language": None,
+                                 "raw_url": f"https://gist.githubusercontent.com/{owner}/{identifier}/raw/{filename}",
+                                 "size": rng.randint(50, 5000)}},
+            "public": True,
+            "created_at": iso(self.timestamp(rng)),
+            "updated_at": iso(self.timestamp(rng)),
+            "description": sentence(rng, 2, 8),
+            "comments": rng.randint(0, 5),
+            "user": None,
+            "comments_url": f"{API_URL}/gists/{identifier}/comments",
+            "owner": self.simple_user(owner),
+            "truncated": False,
+        }
+
+    def repo(self, owner: str, name: str) -> RepoState:
+        key = (owner.lower(), name.lower())
+        if key in self.deleted:
+            raise NotFound()
+        if key not in self.repos:
+            self.repos[key] = RepoState(self, owner, name)
+        return self.repos[key]
+
+
+def now() -> float:
+    return time.time()
+
+
+def filter_state(items: List[Dict[str, Any]], state: str) -> List[Dict[str, Any]]:
+    return items if state == "all" else [item for item in items if item["state"] == state]
+
+
+def require(body: Any, *names: str) -> Optional[Reply]:
+    missing = [name for name in names if not isinstance(body, dict) or not body.get(name)]
+    if missing:
+        return error(422, f"Invalid request.\n\n\"{missing[0]}\" wasn't supplied.")
+    return None
+
+
+class MockGitHubAPI:
+    """Request handling for the mock: routing, quota, ETags, latency and faults"""
+
+    def __init__(self, config: Optional[MockConfig] = None):
+        self.config = config or MockConfig()
+        self.routes: List[Tuple[str, "re.Pattern", str, Callable[..., Reply], bool]] = []
+        self._register_routes()
+        self.reset()
+
+    # State and configuration
+
+    def reset(self):
+        """Regenerate fixtures and clear quotas and stats"""
+        self.world = GitHubWorld(self.config.seed, self.config.scale)
+        self.quotas: Dict[Tuple[str, str], List[int]] = {}
+        self.fault_rng = random.Random(f"{self.config.seed}:faults")
+        self.configure()
+        self.stats: Dict[str, Any] = {"requests": 0, "charged": 0, "not_modified": 0, "faults": 0,
+                                      "rate_limited": 0, "bytes_out": 0, "routes": {}}
+
+    def configure(self, **changes: Any):
+        """Apply configuration changes (fields of MockConfig)"""
+        for name, value in changes.items():
+            if not hasattr(self.config, name):
+                raise ValueError(f"Unknown mock setting: {name}")
+            setattr(self.config, name, value)
+        rng = random.Random(f"{self.config.seed}:latency")
+        self.latency = LatencyModel(self.config.latency, rng)
+        self.route_latency = []
+        for spec in self.config.route_latency:
+            pattern, _, latency = spec.rpartition("=")
+            self.route_latency.append((pattern or "*", LatencyModel(latency, rng)))
+        self.faults = [FaultRule.parse(spec) for spec in self.config.faults]
+
+    def _route_stats(self, template: str) -> Dict[str, Any]:
+        return self.stats["routes"].setdefault(template, {"requests": 0, "bytes_out": 0, "statuses": {}})
+
+    # Routing
+
+    def _register_routes(self):
+        r = "repos/{owner}/{repo}"
+        table = [
+            ("GET", "rate_limit", self.get_rate_limit, False),
+            ("GET", "user", self.get_authenticated_user, False),
+            ("PATCH", "user", self.update_authenticated_user, False),
+            ("GET", "user/repos", self.list_own_repos, True),
+            ("POST", "user/repos", self.create_repo, False),
+            ("GET", "users/{login}", self.get_user, False),
+            ("GET", "users/{login}/repos", self.list_user_repos, True),
+            ("GET", "users/{login}/gists", self.list_user_gists, True),
+            ("GET", "gists", self.list_own_gists, True),
+            ("GET", "orgs/{org}", self.get_org, False),
+            ("GET", "orgs/{org}/repos", self.list_org_repos, True),
+            ("POST", "orgs/{org}/repos", self.create_repo, False),
+            ("GET", "orgs/{org}/members", self.list_org_members, True),
+            ("POST", "orgs/{org}/hooks", self.create_org_hook, False),
+            ("GET", r, self.get_repo, False),
+            ("PATCH", r, self.update_repo, False),
+            ("DELETE", r, self.delete_repo, False),
+            ("POST", r + "/forks", self.fork_repo, False),
+            ("GET", r + "/contents/{path*}", self.get_contents, False),
+            ("PUT", r + "/contents/{path*}", self.put_contents, False),
+            ("DELETE", r + "/contents/{path*}", self.delete_contents, False),
+            ("GET", r + "/branches", self.list_branches, True),
+            ("PUT", r + "/branches/{branch+}/protection", self.protect_branch, False),
+            ("GET", r + "/branches/{branch+}", self.get_branch, False),
+            ("POST", r + "/git/refs", self.create_ref, False),
+            ("GET", r + "/git/refs/heads/{branch+}", self.get_ref, False),
+            ("DELETE", r + "/git/refs/heads/{branch+}", self.delete_ref, False),
+            ("GET", r + "/commits", self.list_commits, True),
+            ("GET", r + "/commits/{ref+}", self.get_commit, False),
+            ("POST", r + "/statuses/{sha}", self.create_status, False),
+            ("GET", r + "/issues", self.list_issues, True),
+            ("POST", r + "/issues", self.create_issue, False),
+            ("GET", r + "/issues/{number}", self.get_issue, False),
+            ("PATCH", r + "/issues/{number}", self.update_issue, False),
+            ("GET", r + "/issues/{number}/comments", self.list_issue_comments, True),
+            ("POST", r + "/issues/{number}/comments", self.create_issue_comment, False),
+            ("GET", r + "/pulls", self.list_pulls, True),
+            ("POST", r + "/pulls", self.create_pull, False),
+            ("GET", r + "/pulls/{number}", self.get_pull, False),
+            ("PATCH", r + "/pulls/{number}", self.update_pull, False),
+            ("PUT", r + "/pulls/{number}/merge", self.merge_pull, False),
+            ("GET", r + "/pulls/{number}/files", self.list_pull_files, True),
+            ("GET", r + "/pulls/{number}/comments", self.list_pull_comments, True),
+            ("POST", r + "/pulls/{number}/comments", self.create_pull_comment, False),
+            ("POST", r + "/pulls/{number}/requested_reviewers", self.request_reviewers, False),
+            ("GET", r + "/actions/workflows", self.list_workflows, True),
+            ("GET", r + "/actions/workflows/{workflow}", self.get_workflow, False),
+            ("GET", r + "/actions/workflows/{workflow}/runs", self.list_workflow_runs, True),
+            ("POST", r + "/actions/workflows/{workflow}/dispatches", self.dispatch_workflow, False),
+            ("GET", r + "/actions/runs", self.list_runs, True),
+            ("GET", r + "/actions/runs/{run}", self.get_run, False),
+            ("POST", r + "/actions/runs/{run}/cancel", self.cancel_run, False),
+            ("GET", r + "/actions/runs/{run}/logs", self.get_run_logs, False),
+            ("GET", r + "/code-scanning/alerts", self.list_code_scanning_alerts, True),
+            ("GET", r + "/secret-scanning/alerts", self.list_secret_scanning_alerts, True),
+            ("GET", r + "/dependabot/alerts", self.list_dependabot_alerts, True),
+            ("GET", r + "/deployments", self.list_deployments, True),
+            ("POST", r + "/deployments", self.create_deployment, False),
+            ("GET", r + "/deployments/{deployment}", self.get_deployment, False),
+            ("DELETE", r + "/deployments/{deployment}", self.delete_deployment, False),
+            ("GET", r + "/deployments/{deployment}/statuses", self.list_deployment_statuses, True),
+            ("POST", r + "/deployments/{deployment}/statuses", self.create_deployment_status, False),
+            ("GET", r + "/hooks", self.list_hooks, True),
+            ("POST", r + "/hooks", self.create_hook, False),
+            ("GET", r + "/hooks/{hook}", self.get_hook, False),
+            ("PATCH", r + "/hooks/{hook}", self.update_hook, False),
+            ("DELETE", r + "/hooks/{hook}", self.delete_hook, False),
+            ("GET", r + "/hooks/{hook}/deliveries", self.list_hook_deliveries, True),
+        ]
+        for method, template, handler, paginated in table:
+            pattern = re.escape(template)
+            pattern = pattern.replace(re.escape("/{path*}"), "(?:/(?P<path>.*))?")
+            pattern = re.sub(r"\\\{(\w+)\\\+\\\}", r"(?P<\1>.+)", pattern)
+            pattern = re.sub(r"\\\{(\w+)\\\}", r"(?P<\1>[^/]+)", pattern)
+            self.routes.append((method, re.compile(pattern + "$"), template, handler, paginated))
+
+    def match(self, method: str, path: str):
+        allowed = False
+        for route_method, pattern, template, handler, paginated in self.routes:
+            found = pattern.match(path)
+            if found:
+                if route_method == method:
+                    return template, handler, paginated, found.groupdict()
+                allowed = True
+        return ("(method not allowed)" if allowed else "(unmatched)"), None, False, {}
+
+    # Request pipeline
+
+    async def handle(self, request: Request) -> Response:
+        path = request.url.path.strip("/")
+        if path.startswith("_mock"):
+            return await self.admin(request, path)
+
+        method = request.method
+        template, handler, paginated, params = self.match(method, path)
+        self.stats["requests"] += 1
+        route_stats = self._route_stats(f"{method} {template}")
+        route_stats["requests"] += 1
+
+        latency = next((model for pattern, model in self.route_latency
+                        if fnmatch.fnmatchcase(f"{method} {path}", pattern)), self.latency)
+        delay = latency.sample()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        token = self._token(request)
+        fault = next((rule for rule in self.faults if rule.matches(method, path)
+                      and self.fault_rng.random() < rule.rate), None)
+        limited = fault is None and not self._quota_available(token, path)
+        if fault is not None:
+            self.stats["faults"] += 1
+            reply = await self._fault(fault)
+        elif limited:
+            self.stats["rate_limited"] += 1
+            reply = error(403, "API rate limit exceeded for user ID 1. (But here's the good news: "
+                               "Authenticated requests get a higher rate limit.)")
+        elif handler is None:
+            reply = error(405, "Method Not Allowed") if template.startswith("(method") else NOT_FOUND
+        else:
+            reply = await self._handle(request, method, path, handler, params, token)
+
+        response = self._render(request, reply, paginated)
+        # GitHub does not charge conditional requests answered with 304
+        if response.status_code == 304:
+            self.stats["not_modified"] += 1
+        elif path != "rate_limit" and fault is None and not limited:
+            self._charge(token, path)
+        self._add_rate_limit_headers(response, token, path)
+        self.stats["bytes_out"] += len(response.body)
+        route_stats["bytes_out"] += len(response.body)
+        statuses = route_stats["statuses"]
+        statuses[str(response.status_code)] = statuses.get(str(response.status_code), 0) + 1
+        return response
+
+    async def _handle(self, request: Request, method: str, path: str, handler: Callable[..., Reply],
+                      params: Dict[str, str], token: Optional[str]) -> Reply:
+        body = None
+        raw = await request.body()
+        if raw:
+            try:
+                body = json.loads(raw)
+            except ValueError:
+                return error(400, "Problems parsing JSON")
+        login = AUTHENTICATED_LOGIN if token else None
+        if login is None and (method != "GET" or path == "user" or path.startswith("user/")):
+            return error(401, "Requires authentication")
+        call = Call(method, path, dict(request.query_params), body, request.headers.get("accept", ""), token, login)
+        try:
+            return handler(call, **params)
+        except NotFound:
+            return NOT_FOUND
+
+    async def _fault(self, fault: FaultRule) -> Reply:
+        if fault.action == "timeout":
+            await asyncio.sleep(self.config.timeout_seconds)
+            return error(504, "We couldn't respond to your request in time.")
+        if fault.action == "secondary":
+            reply = error(403, "You have exceeded a secondary rate limit. Please wait a few minutes before you try again.")
+            reply.headers["Retry-After"] = "60"
+            return reply
+        status = int(fault.action)
+        reply = error(status, "Server Error" if status >= 500 else "Injected fault")
+        if status == 429:
+            reply.headers["Retry-After"] = "1"
+        return reply
+
+    def _render(self, request: Request, reply: Reply, paginated: bool) -> Response:
+        headers = {"X-GitHub-Media-Type": "github.v3; format=json",
+                   "X-GitHub-Request-Id": "%08X" % self.stats["requests"], **reply.headers}
+        if reply.status == 204 or reply.payload is None:
+            return Response(status_code=reply.status, headers=headers)
+
+        payload = reply.payload
+        if paginated and reply.page_key is not None and reply.status == 200:
+            payload, link = self._paginate(request, payload, reply.page_key)
+            if link:
+                headers["Link"] = link
+        if reply.media_type == JSON_MEDIA_TYPE:
+            body = json.dumps(payload, separators=(",", ":")).encode()
+        else:
+            body = payload.encode()
+
+        if request.method == "GET" and reply.status == 200:
+            etag = f'"{hashlib.sha256(body).hexdigest()[:40]}"'
+            headers["ETag"] = etag
+            headers["Cache-Control"] = "private, max-age=60, s-maxage=60"
+            candidates = {value.strip().removeprefix("W/")
+                          for value in request.headers.get("if-none-match", "").split(",")}
+            if etag in candidates:
+                return Response(status_code=304, headers=headers)
+        return Response(body, status_code=reply.status, headers=headers, media_type=reply.media_type)
+
+    def _paginate(self, request: Request, items: List[Any], page_key: str) -> Tuple[Any, Optional[str]]:
+        try:
+            per_page = min(MAX_PER_PAGE, max(1, int(request.query_params.get("per_page", DEFAULT_PER_PAGE))))
+            page = max(1, int(request.query_params.get("page", 1)))
+        except ValueError:
+            per_page, page = DEFAULT_PER_PAGE, 1
+        last = max(1, math.ceil(len(items) / per_page))
+        page_items = items[(page - 1) * per_page:page * per_page]
+
+        links = []
+        query = dict(request.query_params)
+        base = f"{request.url.scheme}://{request.url.netloc}{request.url.path}"
+        for rel, target in (("prev", page - 1), ("next", page + 1), ("last", last), ("first", 1)):
+            if (rel in ("prev", "first") and page > 1) or (rel in ("next", "last") and page < last):
+                links.append(f'<{base}?{urlencode({**query, "page": target})}>; rel="{rel}"')
+        payload = page_items if not page_key else {"total_count": len(items), page_key: page_items}
+        return payload, ", ".join(links) or None
+
+    # Quota
+
+    @staticmethod
+    def _token(request: Request) -> Optional[str]:
+        authorization = request.headers.get("authorization", "")
+        _, _, token = authorization.partition(" ")
+        return token or None
+
+    @staticmethod
+    def _resource(path: str) -> str:
+        return "search" if path.startswith("search/") else "core"
+
+    def _quota(self, token: Optional[str], path: str) -> List[int]:
+        """[window_start, used] of a token's current window for the path's resource"""
+        key = (token or "", self._resource(path))
+        window_start = int(now() // self.config.rate_window) * self.config.rate_window
+        quota = self.quotas.get(key)
+        if quota is None or quota[0] != window_start:
+            quota = self.quotas[key] = [window_start, 0]
+        return quota
+
+    def _limit(self, token: Optional[str]) -> int:
+        return self.config.rate_limit if token else ANONYMOUS_RATE_LIMIT
+
+    def _quota_available(self, token: Optional[str], path: str) -> bool:
+        return path == "rate_limit" or self._quota(token, path)[1] < self._limit(token)
+
+    def _charge(self, token: Optional[str], path: str):
+        self._quota(token, path)[1] += 1
+        self.stats["charged"] += 1
+
+    def _add_rate_limit_headers(self, response: Response, token: Optional[str], path: str):
+        window_start, used = self._quota(token, path)
+        limit = self._limit(token)
+        response.headers["X-RateLimit-Limit"] = str(limit)
+        response.headers["X-RateLimit-Remaining"] = str(max(0, limit - used))
+        response.headers["X-RateLimit-Reset"] = str(window_start + self.config.rate_window)
+        response.headers["X-RateLimit-Used"] = str(used)
+        response.headers["X-RateLimit-Resource"] = self._resource(path)
+
+    # Admin endpoints
+
+    async def admin(self, request: Request, path: str) -> Response:
+        if path == "_mock/stats":
+            payload = {**self.stats, "quotas": {f"{resource}:{hashlib.sha256(token.encode()).hexdigest()[:8]}": used
+                                                for (token, resource), (_, used) in self.quotas.items()}}
+        elif path == "_mock/reset" and request.method == "POST":
+            self.reset()
+            payload = {"reset": True}
+        elif path == "_mock/config":
+            if request.method == "POST":
+                try:
+                    self.configure(**json.loads(await request.body() or b"{}"))
+                except (ValueError, TypeError) as e:
+                    return Response(json.dumps({"message": str(e)}), 400, media_type=JSON_MEDIA_TYPE)
+            payload = vars(self.config)
+        else:
+            return Response(json.dumps({"message": "Not Found"}), 404, media_type=JSON_MEDIA_TYPE)
+        return Response(json.dumps(payload), media_type=JSON_MEDIA_TYPE)
+
+    # Users and organisations
+
+    def get_rate_limit(self, call: Call) -> Reply:
+        limit = self._limit(call.token)
+        resources = {}
+        for resource, path in (("core", ""), ("search", "search/")):
+            window_start, used = self._quota(call.token, path)
+            resources[resource] = {"limit": limit, "used": used, "remaining": max(0, limit - used),
+                                   "reset": window_start + self.config.rate_window, "resource": resource}
+        return Reply(payload={"resources": resources, "rate": resources["core"]})
+
+    def get_authenticated_user(self, call: Call) -> Reply:
+        return Reply(payload=self.world.user(call.login))
+
+    def update_authenticated_user(self, call: Call) -> Reply:
+        user = self.world.user(call.login)
+        allowed = ("name", "email", "blog", "twitter_username", "company", "location", "hireable", "bio")
+        user.update({key: value for key, value in (call.body or {}).items() if key in allowed})
+        user["updated_at"] = iso(now())
+        return Reply(payload=user)
+
+    def get_user(self, call: Call, login: str) -> Reply:
+        return Reply(payload=self.world.user(login))
+
+    def list_own_repos(self, call: Call) -> Reply:
+        return self.list_user_repos(call, call.login)
+
+    def list_user_repos(self, call: Call, login: str) -> Reply:
+        repos = [repo for repo in self.world.owner_collection("user_repos", login)
+                 if (login.lower(), repo["name"].lower()) not in self.world.deleted]
+        return Reply(payload=repos, page_key="")
+
+    def list_own_gists(self, call: Call) -> Reply:
+        return self.list_user_gists(call, call.login)
+
+    def list_user_gists(self, call: Call, login: str) -> Reply:
+        return Reply(payload=self.world.owner_collection("gists", login), page_key="")
+
+    def get_org(self, call: Call, org: str) -> Reply:
+        return Reply(payload=self.world.organization(org))
+
+    def list_org_repos(self, call: Call, org: str) -> Reply:
+        repos = [repo for repo in self.world.owner_collection("org_repos", org)
+                 if (org.lower(), repo["name"].lower()) not in self.world.deleted]
+        return Reply(payload=repos, page_key="")
+
+    def list_org_members(self, call: Call, org: str) -> Reply:
+        return Reply(payload=self.world.owner_collection("members", org), page_key="")
+
+    def create_org_hook(self, call: Call, org: str) -> Reply:
+        invalid = require(call.body, "config")
+        if invalid:
+            return invalid
+        hooks = self.world.owner_collections.setdefault(("org_hooks", org), [])
+        hook = self.world.hook(f"{API_URL}/orgs/{org}", len(hooks) + 1, call.body["config"],
+                               call.body.get("events", ["push"]), call.body.get("active", True), now())
+        hook["type"] = "Organization"
+        hooks.append(hook)
+        return Reply(201, hook)
+
+    # Repositories and contents
+
+    def get_repo(self, call: Call, owner: str, repo: str) -> Reply:
+        return Reply(payload=self.world.repo(owner, repo).meta)
+
+    def create_repo(self, call: Call, org: Optional[str] = None) -> Reply:
+        invalid = require(call.body, "name")
+        if invalid:
+            return invalid
+        owner, name = org or call.login, call.body["name"]
+        key = (owner.lower(), name.lower())
+        if key in self.world.repos and key not in self.world.deleted:
+            return error(422, "Repository creation failed.\n\nname already exists on this account")
+        self.world.deleted.discard(key)
+        state = self.world.repo(owner, name)
+        state.meta.update({
+            "description": call.body.get("description"),
+            "private": bool(call.body.get("private", False)),
+            "visibility": "private" if call.body.get("private") else "public",
+            "homepage": call.body.get("homepage"),
+            "created_at": iso(now()),
+            "updated_at": iso(now()),
+            "pushed_at": iso(now()),
+        })
+        self.world.owner_collection("org_repos" if org else "user_repos", owner).insert(0, state.meta)
+        return Reply(201, state.meta)
+
+    def update_repo(self, call: Call, owner: str, repo: str) -> Reply:
+        state = self.world.repo(owner, repo)
+        allowed = ("description", "homepage", "private", "visibility", "has_issues", "has_projects",
+                   "has_wiki", "default_branch", "archived", "allow_forking", "is_template")
+        state.meta.update({key: value for key, value in (call.body or {}).items() if key in allowed})
+        state.meta["updated_at"] = iso(now())
+        return Reply(payload=state.meta)
+
+    def delete_repo(self, call: Call, owner: str, repo: str) -> Reply:
+        self.world.repo(owner, repo)
+        key = (owner.lower(), repo.lower())
+        self.world.repos.pop(key, None)
+        self.world.deleted.add(key)
+        return Reply(204)
+
+    def fork_repo(self, call: Call, owner: str, repo: str) -> Reply:
+        source = self.world.repo(owner, repo)
+        target_owner = (call.body or {}).get("organization") or call.login
+        name = (call.body or {}).get("name") or repo
+        fork = self.world.repo(target_owner, name)
+        fork.meta.update({"fork": True, "parent": source.meta, "source": source.meta,
+                          "description": source.meta["description"], "created_at": iso(now())})
+        return Reply(202, fork.meta)
+
+    def _ref_commit(self, state: RepoState, ref: str) -> Dict[str, Any]:
+        commits = state.collection("commits")
+        for branch in state.collection("branches"):
+            if branch["name"] == ref:
+                ref = branch["commit"]["sha"]
+                break
+        if len(ref) >= 7:
+            for commit in commits:
+                if commit["sha"].startswith(ref):
+                    return commit
+        raise NotFound()
+
+    def get_contents(self, call: Call, owner: str, repo: str, path: Optional[str] = None) -> Reply:
+        state = self.world.repo(owner, repo)
+        files = state.collection("files")
+        path = (path or "").strip("/")
+        if path in files:
+            return Reply(payload=self.world.content_file(state, path, files[path]))
+        prefix = f"{path}/" if path else ""
+        children = {}
+        for file_path, content in files.items():
+            if file_path.startswith(prefix):
+                name, _, rest = file_path[len(prefix):].partition("/")
+                children[name] = None if rest else content
+        if not children:
+            raise NotFound()
+        return Reply(payload=[self.world.content_entry(state, prefix + name, content)
+                              for name, content in sorted(children.items(),
+                                                          key=lambda item: (item[1] is not None, item[0]))])
+
+    def _commit_write(self, state: RepoState, message: str, branch: Optional[str]) -> Dict[str, Any]:
+        commits = state.collection("commits")
+        sha = git_sha(state.full_name, "write", len(commits), now())
+        commit = self.world.commit(state, sha, commits[0]["sha"], state.rng, now(), message)
+        commits.insert(0, commit)
+        for item in state.collection("branches"):
+            if item["name"] == (branch or state.meta["default_branch"]):
+                item["commit"] = {"sha": sha, "url": state.url("commits", sha)}
+        return commit
+
+    def _commit_summary(self, commit: Dict[str, Any]) -> Dict[str, Any]:
+        return {"sha": commit["sha"], "node_id": commit["node_id"], "url": commit["commit"]["url"],
+                "html_url": commit["html_url"], "author": commit["commit"]["author"],
+                "committer": commit["commit"]["committer"], "message": commit["commit"]["message"],
+                "tree": commit["commit"]["tree"], "parents": commit["parents"]}
+
+    def put_contents(self, call: Call, owner: str, repo: str, path: Optional[str] = None) -> Reply:
+        invalid = require(call.body, "message") or (None if "content" in (call.body or {}) else
+                                                    error(422, "Invalid request.\n\n\"content\" wasn't supplied."))
+        if invalid:
+            return invalid
+        state = self.world.repo(owner, repo)
+        files = state.collection("files")
+        path = (path or "").strip("/")
+        existing = files.get(path)
+        if existing is not None and call.body.get("sha") != blob_sha(existing):
+            if not call.body.get("sha"):
+                return error(422, "Invalid request.\n\n\"sha\" wasn't supplied.")
+            return error(409, f"{path} does not match {call.body['sha']}")
+        try:
+            content = base64.b64decode(call.body["content"], validate=True)
+        except ValueError:
+            return error(422, "content is not valid Base64")
+        files[path] = content
+        commit = self._commit_write(state, call.body["message"], call.body.get("branch"))
+        return Reply(200 if existing is not None else 201,
+                     {"content": self.world.content_entry(state, path, content),
+                      "commit": self._commit_summary(commit)})
+
+    def delete_contents(self, call: Call, owner: str, repo: str, path: Optional[str] = None) -> Reply:
+        invalid = require(call.body, "message", "sha")
+        if invalid:
+            return invalid
+        state = self.world.repo(owner, repo)
+        files = state.collection("files")
+        path = (path or "").strip("/")
+        if path not in files:
+            raise NotFound()
+        if call.body["sha"] != blob_sha(files[path]):
+            return error(409, f"{path} does not match {call.body['sha']}")
+        del files[path]
+        commit = self._commit_write(state, call.body["message"], call.body.get("branch"))
+        return Reply(payload={"content": None, "commit": self._commit_summary(commit)})
+
+    # Branches, refs and commits
+
+    def list_branches(self, call: Call, owner: str, repo: str) -> Reply:
+        branches = self.world.repo(owner, repo).collection("branches")
+        if call.params.get("protected") in ("true", "false"):
+            protected = call.params["protected"] == "true"
+            branches = [branch for branch in branches if branch["protected"] == protected]
+        return Reply(payload=branches, page_key="")
+
+    def get_branch(self, call: Call, owner: str, repo: str, branch: str) -> Reply:
+        state = self.world.repo(owner, repo)
+        item = state.find("branches", branch, "name")
+        return Reply(payload={
+            "name": item["name"],
+            "commit": self._ref_commit(state, item["commit"]["sha"]),
+            "_links": {"self": state.url("branches", branch), "html": state.html_url("tree", branch)},
+            "protected": item["protected"],
+            "protection": {"enabled": item["protected"],
+                           "required_status_checks": {"enforcement_level": "off", "contexts": [], "checks": []}},
+            "protection_url": state.url("branches", branch, "protection"),
+        })
+
+    def protect_branch(self, call: Call, owner: str, repo: str, branch: str) -> Reply:
+        state = self.world.repo(owner, repo)
+        item = state.find("branches", branch, "name")
+        item["protected"] = True
+        url = state.url("branches", branch, "protection")
+        body = call.body or {}
+        reviews = body.get("required_pull_request_reviews") or {}
+        return Reply(payload={
+            "url": url,
+            "required_status_checks": {"url": f"{url}/required_status_checks", "strict": True,
+                                       "contexts": (body.get("required_status_checks") or {}).get("contexts", [])},
+            "required_pull_request_reviews": {"url": f"{url}/required_pull_request_reviews",
+                                              "dismiss_stale_reviews": reviews.get("dismiss_stale_reviews", False),
+                                              "required_approving_review_count":
+                                                  reviews.get("required_approving_review_count", 1)},
+            "enforce_admins": {"url": f"{url}/enforce_admins", "enabled": bool(body.get("enforce_admins"))},
+            "required_linear_history": {"enabled": False},
+            "allow_force_pushes": {"enabled": False},
+            "allow_deletions": {"enabled": False},
+        })
+
+    def _ref(self, state: RepoState, branch: Dict[str, Any]) -> Dict[str, Any]:
+        sha = branch["commit"]["sha"]
+        return {"ref": f"refs/heads/{branch['name']}",
+                "node_id": node_id("Ref", f"{state.full_name}:{branch['name']}"),
+                "url": state.url("git", "refs", "heads", branch["name"]),
+                "object": {"sha": sha, "type": "commit", "url": state.url("git", "commits", sha)}}
+
+    def get_ref(self, call: Call, owner: str, repo: str, branch: str) -> Reply:
+        state = self.world.repo(owner, repo)
+        return Reply(payload=self._ref(state, state.find("branches", branch, "name")))
+
+    def create_ref(self, call: Call, owner: str, repo: str) -> Reply:
+        invalid = require(call.body, "ref", "sha")
+        if invalid:
+            return invalid
+        state = self.world.repo(owner, repo)
+        ref = call.body["ref"]
+        if not ref.startswith("refs/") or ref.count("/") < 2:
+            return error(422, "Reference name must start with 'refs/' and have at least two slashes.")
+        name = ref.split("/", 2)[2]
+        branches = state.collection("branches")
+        if any(branch["name"] == name for branch in branches):
+            return error(422, "Reference already exists")
+        commit = self._ref_commit(state, call.body["sha"])
+        branch = {"name": name, "commit": {"sha": commit["sha"], "url": commit["url"]}, "protected": False}
+        branches.append(branch)
+        return Reply(201, self._ref(state, branch))
+
+    def delete_ref(self, call: Call, owner: str, repo: str, branch: str) -> Reply:
+        state = self.world.repo(owner, repo)
+        branches = state.collection("branches")
+        branches.remove(state.find("branches", branch, "name"))
+        return Reply(204)
+
+    def list_commits(self, call: Call, owner: str, repo: str) -> Reply:
+        state = self.world.repo(owner, repo)
+        commits = state.collection("commits")
+        if call.params.get("sha"):
+            head = self._ref_commit(state, call.params["sha"])
+            commits = commits[commits.index(head):]
+        if call.params.get("path"):
+            path = call.params["path"].strip("/")
+            commits = [commit for commit in commits
+                       if any(item["filename"].startswith(path) for item in self.world.commit_files(state, commit["sha"]))]
+        return Reply(payload=commits, page_key="")
+
+    def get_commit(self, call: Call, owner: str, repo: str, ref: str) -> Reply:
+        state = self.world.repo(owner, repo)
+        commit = self._ref_commit(state, ref)
+        files = self.world.commit_files(state, commit["sha"])
+        if "diff" in call.accept or "patch" in call.accept:
+            return Reply(payload=self._diff(files), media_type=DIFF_MEDIA_TYPE)
+        additions = sum(item["additions"] for item in files)
+        deletions = sum(item["deletions"] for item in files)
+        return Reply(payload={**commit, "stats": {"total": additions + deletions, "additions": additions,
+                                                  "deletions": deletions}, "files": files})
+
+    @staticmethod
+    def _diff(files: List[Dict[str, Any]]) -> str:
+        return "".join(f"diff --git a/{item['filename']} b/{item['filename']}\n"
+                       f"index {item['sha'][:7]}..{item['sha'][-7:]} 100644\n"
+                       f"--- a/{item['filename']}\n+++ b/{item['filename']}\n{item['patch']}\n"
+                       for item in files)
+
+    def create_status(self, call: Call, owner: str, repo: str, sha: str) -> Reply:
+        invalid = require(call.body, "state")
+        if invalid:
+            return invalid
+        state = self.world.repo(owner, repo)
+        statuses = state.collections.setdefault(("statuses", sha), [])
+        identifier = len(statuses) + 1
+        status = {
+            "url": state.url("statuses", sha),
+            "avatar_url": "https://avatars.githubusercontent.com/oa/4808451?v=4",
+            "id": identifier,
+            "node_id": node_id("StatusContext", f"{state.full_name}:{identifier}"),
+            "state": call.body["state"],
+            "description": call.body.get("description"),
+            "target_url": call.body.get("target_url"),
+            "context": call.body.get("context", "default"),
+            "created_at": iso(now()),
+            "updated_at": iso(now()),
+            "creator": self.world.simple_user(call.login),
+        }
+        statuses.append(status)
+        return Reply(201, status)
+
+    # Issues
+
+    def list_issues(self, call: Call, owner: str, repo: str) -> Reply:
+        issues = filter_state(self.world.repo(owner, repo).collection("issues"), call.params.get("state", "open"))
+        if call.params.get("labels"):
+            wanted = set(call.params["labels"].split(","))
+            issues = [issue for issue in issues if wanted <= {label["name"] for label in issue["labels"]}]
+        if call.params.get("assignee") not in (None, "*"):
+            login = call.params["assignee"]
+            issues = [issue for issue in issues
+                      if (login == "none" and not issue["assignees"])
+                      or any(assignee["login"] == login for assignee in issue["assignees"])]
+        if call.params.get("direction") == "asc":
+            issues = issues[::-1]
+        return Reply(payload=issues, page_key="")
+
+    def get_issue(self, call: Call, owner: str, repo: str, number: str) -> Reply:
+        return Reply(payload=self.world.repo(owner, repo).find("issues", number, "number"))
+
+    def create_issue(self, call: Call, owner: str, repo: str) -> Reply:
+        invalid = require(call.body, "title")
+        if invalid:
+            return invalid
+        state = self.world.repo(owner, repo)
+        issues = state.collection("issues")
+        number = state.next_id("issues", issues, "number")
+        issue = self.world.issue(state, state.rng, number, call.body["title"], None, call.login, now())
+        self._apply_issue_changes(state, issue, call.body)
+        issues.insert(0, issue)
+        return Reply(201, issue)
+
+    def _apply_issue_changes(self, state: RepoState, issue: Dict[str, Any], changes: Dict[str, Any]):
+        for key in ("title", "body", "locked"):
+            if key in changes:
+                issue[key] = changes[key]
+        if "state" in changes and changes["state"] != issue["state"]:
+            issue["state"] = changes["state"]
+            issue["closed_at"] = iso(now()) if changes["state"] == "closed" else None
+            issue["state_reason"] = changes.get("state_reason", "completed" if changes["state"] == "closed" else "reopened")
+        if "labels" in changes:
+            issue["labels"] = self.world.labels(state, [label if isinstance(label, str) else label["name"]
+                                                        for label in changes["labels"] or []])
+        if "assignees" in changes or "assignee" in changes:
+            logins = changes.get("assignees") or ([changes["assignee"]] if changes.get("assignee") else [])
+            issue["assignees"] = [self.world.simple_user(login) for login in logins]
+            issue["assignee"] = issue["assignees"][0] if issue["assignees"] else None
+        issue["updated_at"] = iso(now())
+
+    def update_issue(self, call: Call, owner: str, repo: str, number: str) -> Reply:
+        state = self.world.repo(owner, repo)
+        issue = state.find("issues", number, "number")
+        self._apply_issue_changes(state, issue, call.body or {})
+        return Reply(payload=issue)
+
+    def list_issue_comments(self, call: Call, owner: str, repo: str, number: str) -> Reply:
+        return Reply(payload=self.world.repo(owner, repo).collection("issue_comments", int(number)), page_key="")
+
+    def create_issue_comment(self, call: Call, owner: str, repo: str, number: str) -> Reply:
+        invalid = require(call.body, "body")
+        if invalid:
+            return invalid
+        state = self.world.repo(owner, repo)
+        issue = state.find("issues", number, "number")
+        comments = state.collection("issue_comments", int(number))
+        identifier = int(number) * 1000 + len(comments) + 1
+        comment = self.world.comment(state, "issues", identifier, state.rng, call.login, call.body["body"], now())
+        comments.append(comment)
+        issue["comments"] = len(comments)
+        issue["updated_at"] = comment["created_at"]
+        return Reply(201, comment)
+
+    # Pull requests
+
+    def list_pulls(self, call: Call, owner: str, repo: str) -> Reply:
+        pulls = filter_state(self.world.repo(owner, repo).collection("pulls"), call.params.get("state", "open"))
+        if call.params.get("base"):
+            pulls = [pull for pull in pulls if pull["base"]["ref"] == call.params["base"]]
+        if call.params.get("head"):
+            head = call.params["head"].split(":")[-1]
+            pulls = [pull for pull in pulls if pull["head"]["ref"] == head]
+        return Reply(payload=pulls, page_key="")
+
+    def get_pull(self, call: Call, owner: str, repo: str, number: str) -> Reply:
+        state = self.world.repo(owner, repo)
+        pull = state.find("pulls", number, "number")
+        if "diff" in call.accept or "patch" in call.accept:
+            return Reply(payload=self._diff(state.collection("pull_files", int(number))), media_type=DIFF_MEDIA_TYPE)
+        return Reply(payload=pull)
+
+    def create_pull(self, call: Call, owner: str, repo: str) -> Reply:
+        invalid = require(call.body, "title", "head", "base")
+        if invalid:
+            return invalid
+        state = self.world.repo(owner, repo)
+        head = call.body["head"].split(":")[-1]
+        try:
+            head_branch = state.find("branches", head, "name")
+            state.find("branches", call.body["base"], "name")
+        except NotFound:
+            return error(422, "Validation Failed")
+        pulls = state.collection("pulls")
+        if any(pull["state"] == "open" and pull["head"]["ref"] == head and pull["base"]["ref"] == call.body["base"]
+               for pull in pulls):
+            return error(422, f"Validation Failed: A pull request already exists for {owner}:{head}.")
+        number = state.next_id("pulls", pulls, "number")
+        pull = self.world.pull(state, state.rng, number, call.body["title"], call.body.get("body"),
+                               head, call.body["base"], head_branch["commit"]["sha"], call.login, now(),
+                               draft=bool(call.body.get("draft")))
+        pulls.insert(0, pull)
+        return Reply(201, pull)
+
+    def update_pull(self, call: Call, owner: str, repo: str, number: str) -> Reply:
+        state = self.world.repo(owner, repo)
+        pull = state.find("pulls", number, "number")
+        body = call.body or {}
+        for key in ("title", "body", "maintainer_can_modify"):
+            if key in body:
+                pull[key] = body[key]
+        if body.get("state") in ("open", "closed") and not pull["merged"]:
+            pull["state"] = body["state"]
+            pull["closed_at"] = iso(now()) if body["state"] == "closed" else None
+        if body.get("base"):
+            pull["base"]["ref"] = body["base"]
+        pull["updated_at"] = iso(now())
+        return Reply(payload=pull)
+
+    def merge_pull(self, call: Call, owner: str, repo: str, number: str) -> Reply:
+        state = self.world.repo(owner, repo)
+        pull = state.find("pulls", number, "number")
+        if pull["state"] != "open":
+            return error(405, "Pull Request is not mergeable")
+        body = call.body or {}
+        if body.get("sha") and body["sha"] != pull["head"]["sha"]:
+            return error(409, "Head branch was modified. Review and try the merge again.")
+        commit = self._commit_write(state, body.get("commit_title") or f"Merge pull request #{number}",
+                                    pull["base"]["ref"])
+        pull.update({"state": "closed", "merged": True, "mergeable": None, "closed_at": iso(now()),
+                     "merged_at": iso(now()), "merge_commit_sha": commit["sha"],
+                     "merged_by": self.world.simple_user(call.login)})
+        return Reply(payload={"sha": commit["sha"], "merged": True, "message": "Pull Request successfully merged"})
+
+    def list_pull_files(self, call: Call, owner: str, repo: str, number: str) -> Reply:
+        return Reply(payload=self.world.repo(owner, repo).collection("pull_files", int(number)), page_key="")
+
+    def list_pull_comments(self, call: Call, owner: str, repo: str, number: str) -> Reply:
+        return Reply(payload=self.world.repo(owner, repo).collection("pull_comments", int(number)), page_key="")
+
+    def create_pull_comment(self, call: Call, owner: str, repo: str, number: str) -> Reply:
+        invalid = require(call.body, "body")
+        if invalid:
+            return invalid
+        state = self.world.repo(owner, repo)
+        pull = state.find("pulls", number, "number")
+        comments = state.collection("pull_comments", int(number))
+        identifier = int(number) * 1000 + len(comments) + 1
+        comment = self.world.comment(state, "pulls", identifier, state.rng, call.login, call.body["body"], now())
+        comment.update({"path": call.body.get("path"), "position": call.body.get("position"),
+                        "line": call.body.get("line"), "commit_id": call.body.get("commit_id", pull["head"]["sha"]),
+                        "original_commit_id": pull["head"]["sha"], "diff_hunk": "@@ -1 +1 @@",
+                        "pull_request_url": state.url("pulls", number)})
+        comments.append(comment)
+        pull["review_comments"] = len(comments)
+        return Reply(201, comment)
+
+    def request_reviewers(self, call: Call, owner: str, repo: str, number: str) -> Reply:
+        state = self.world.repo(owner, repo)
+        pull = state.find("pulls", number, "number")
+        reviewers = (call.body or {}).get("reviewers") or []
+        if pull["user"]["login"] in reviewers:
+            return error(422, "Review cannot be requested from pull request author.")
+        known = {user["login"] for user in pull["requested_reviewers"]}
+        pull["requested_reviewers"] += [self.world.simple_user(login) for login in reviewers if login not in known]
+        pull["requested_teams"] += [{"slug": slug, "name": slug} for slug in (call.body or {}).get("team_reviewers") or []]
+        return Reply(201, pull)
+
+    # Actions
+
+    def _workflow(self, state: RepoState, workflow: str) -> Dict[str, Any]:
+        for item in state.collection("workflows"):
+            if str(item["id"]) == workflow or item["path"].rsplit("/", 1)[-1] == workflow:
+                return item
+        raise NotFound()
+
+    def list_workflows(self, call: Call, owner: str, repo: str) -> Reply:
+        return Reply(payload=self.world.repo(owner, repo).collection("workflows"), page_key="workflows")
+
+    def get_workflow(self, call: Call, owner: str, repo: str, workflow: str) -> Reply:
+        return Reply(payload=self._workflow(self.world.repo(owner, repo), workflow))
+
+    def _filter_runs(self, call: Call, runs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        for param, attr in (("status", "status"), ("event", "event"), ("branch", "head_branch")):
+            if call.params.get(param):
+                wanted = call.params[param]
+                runs = [run for run in runs if run[attr] == wanted or (attr == "status" and run["conclusion"] == wanted)]
+        return runs
+
+    def list_workflow_runs(self, call: Call, owner: str, repo: str, workflow: str) -> Reply:
+        state = self.world.repo(owner, repo)
+        workflow_id = self._workflow(state, workflow)["id"]
+        runs = [run for run in state.collection("runs") if run["workflow_id"] == workflow_id]
+        return Reply(payload=self._filter_runs(call, runs), page_key="workflow_runs")
+
+    def list_runs(self, call: Call, owner: str, repo: str) -> Reply:
+        runs = self.world.repo(owner, repo).collection("runs")
+        return Reply(payload=self._filter_runs(call, runs), page_key="workflow_runs")
+
+    def dispatch_workflow(self, call: Call, owner: str, repo: str, workflow: str) -> Reply:
+        invalid = require(call.body, "ref")
+        if invalid:
+            return invalid
+        state = self.world.repo(owner, repo)
+        item = self._workflow(state, workflow)
+        commit = self._ref_commit(state, call.body["ref"])
+        runs = state.collection("runs")
+        run = self.world.run(state, state.rng, state.next_id("runs", runs), item, commit,
+                             "workflow_dispatch", now(), "queued")
+        runs.insert(0, run)
+        return Reply(204)
+
+    def get_run(self, call: Call, owner: str, repo: str, run: str) -> Reply:
+        return Reply(payload=self.world.repo(owner, repo).find("runs", run))
+
+    def cancel_run(self, call: Call, owner: str, repo: str, run: str) -> Reply:
+        item = self.world.repo(owner, repo).find("runs", run)
+        if item["status"] == "completed":
+            return error(409, "Cannot cancel a workflow run that is completed.")
+        item.update({"status": "completed", "conclusion": "cancelled", "updated_at": iso(now())})
+        return Reply(202, {})
+
+    def get_run_logs(self, call: Call, owner: str, repo: str, run: str) -> Reply:
+        self.world.repo(owner, repo).find("runs", run)
+        # GitHub redirects to a short-lived archive URL
+        location = f"https://pipelines.actions.githubusercontent.com/logs/{owner}/{repo}/{run}.zip"
+        return Reply(302, None, {"Location": location})
+
+    # Security
+
+    def list_code_scanning_alerts(self, call: Call, owner: str, repo: str) -> Reply:
+        alerts = self.world.repo(owner, repo).collection("code_scanning")
+        if call.params.get("state"):
+            alerts = filter_state(alerts, call.params["state"])
+        if call.params.get("severity"):
+            alerts = [alert for alert in alerts if alert["rule"]["security_severity_level"] == call.params["severity"]]
+        return Reply(payload=alerts, page_key="")
+
+    def list_secret_scanning_alerts(self, call: Call, owner: str, repo: str) -> Reply:
+        alerts = self.world.repo(owner, repo).collection("secret_scanning")
+        if call.params.get("state"):
+            alerts = filter_state(alerts, call.params["state"])
+        return Reply(payload=alerts, page_key="")
+
+    def list_dependabot_alerts(self, call: Call, owner: str, repo: str) -> Reply:
+        alerts = self.world.repo(owner, repo).collection("dependabot")
+        if call.params.get("state"):
+            states = call.params["state"].split(",")
+            alerts = [alert for alert in alerts if alert["state"] in states]
+        if call.params.get("severity"):
+            severities = call.params["severity"].split(",")
+            alerts = [alert for alert in alerts if alert["security_advisory"]["severity"] in severities]
+        return Reply(payload=alerts, page_key="")
+
+    # Deployments
+
+    def list_deployments(self, call: Call, owner: str, repo: str) -> Reply:
+        deployments = self.world.repo(owner, repo).collection("deployments")
+        for param in ("sha", "ref", "task", "environment"):
+            if call.params.get(param):
+                deployments = [item for item in deployments if item[param] == call.params[param]]
+        return Reply(payload=deployments, page_key="")
+
+    def create_deployment(self, call: Call, owner: str, repo: str) -> Reply:
+        invalid = require(call.body, "ref")
+        if invalid:
+            return invalid
+        state = self.world.repo(owner, repo)
+        try:
+            commit = self._ref_commit(state, call.body["ref"])
+        except NotFound:
+            return error(422, f"No ref found for: {call.body['ref']}")
+        deployments = state.collection("deployments")
+        deployment = self.world.deployment(state, state.next_id("deployments", deployments), commit["sha"],
+                                           call.body["ref"], call.body.get("environment", "production"),
+                                           call.body.get("description"), call.login, now(),
+                                           call.body.get("payload"))
+        deployments.insert(0, deployment)
+        return Reply(201, deployment)
+
+    def get_deployment(self, call: Call, owner: str, repo: str, deployment: str) -> Reply:
+        return Reply(payload=self.world.repo(owner, repo).find("deployments", deployment))
+
+    def delete_deployment(self, call: Call, owner: str, repo: str, deployment: str) -> Reply:
+        state = self.world.repo(owner, repo)
+        deployments = state.collection("deployments")
+        deployments.remove(state.find("deployments", deployment))
+        return Reply(204)
+
+    def list_deployment_statuses(self, call: Call, owner: str, repo: str, deployment: str) -> Reply:
+        state = self.world.repo(owner, repo)
+        return Reply(payload=state.collection("deployment_statuses", int(deployment)), page_key="")
+
+    def create_deployment_status(self, call: Call, owner: str, repo: str, deployment: str) -> Reply:
+        invalid = require(call.body, "state")
+        if invalid:
+            return invalid
+        state = self.world.repo(owner, repo)
+        item = state.find("deployments", deployment)
+        statuses = state.collection("deployment_statuses", int(deployment))
+        status = self.world.deployment_status(state, item, int(deployment) * 100 + len(statuses) + 1,
+                                              call.body["state"], call.body.get("description", ""), now(),
+                                              call.body.get("target_url") or call.body.get("log_url") or "")
+        statuses.insert(0, status)
+        return Reply(201, status)
+
+    # Webhooks
+
+    def list_hooks(self, call: Call, owner: str, repo: str) -> Reply:
+        return Reply(payload=self.world.repo(owner, repo).collection("hooks"), page_key="")
+
+    def create_hook(self, call: Call, owner: str, repo: str) -> Reply:
+        invalid = require(call.body, "config")
+        if invalid:
+            return invalid
+        state = self.world.repo(owner, repo)
+        hooks = state.collection("hooks")
+        if any(hook["config"].get("url") == call.body["config"].get("url") for hook in hooks):
+            return error(422, "Validation Failed: Hook already exists on this repository")
+        hook = self.world.hook(state.url(), state.next_id("hooks", hooks), call.body["config"],
+                               call.body.get("events", ["push"]), call.body.get("active", True), now())
+        hooks.append(hook)
+        return Reply(201, hook)
+
+    def get_hook(self, call: Call, owner: str, repo: str, hook: str) -> Reply:
+        return Reply(payload=self.world.repo(owner, repo).find("hooks", hook))
+
+    def update_hook(self, call: Call, owner: str, repo: str, hook: str) -> Reply:
+        item = self.world.repo(owner, repo).find("hooks", hook)
+        body = call.body or {}
+        if "config" in body:
+            item["config"].update(body["config"])
+        if "events" in body:
+            item["events"] = body["events"]
+        item["events"] = sorted(set(item["events"]) | set(body.get("add_events", [])) - set(body.get("remove_events", [])))
+        if "active" in body:
+            item["active"] = body["active"]
+        item["updated_at"] = iso(now())
+        return Reply(payload=item)
+
+    def delete_hook(self, call: Call, owner: str, repo: str, hook: str) -> Reply:
+        state = self.world.repo(owner, repo)
+        hooks = state.collection("hooks")
+        hooks.remove(state.find("hooks", hook))
+        return Reply(204)
+
+    def list_hook_deliveries(self, call: Call, owner: str, repo: str, hook: str) -> Reply:
+        return Reply(payload=self.world.repo(owner, repo).collection("hook_deliveries", int(hook)), page_key="")
+
+
+def listen_socket(host: str, port: int) -> socket.socket:
+    """Bind the listening socket
+
+    Nagle's algorithm is disabled (accepted sockets inherit it): responses
+    are written as separate header and body segments, which otherwise wait
+    out the client's delayed ACK on reused connections.
+    """
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    return sock
+
+
+def create_app(config: Optional[MockConfig] = None) -> Starlette:
+    """Starlette app serving the mock API; the handler is at ``app.state.mock``"""
+    mock = MockGitHubAPI(config)
+    methods = ["GET", "POST", "PUT", "PATCH", "DELETE"]
+    app = Starlette(routes=[Route("/", mock.handle, methods=methods), Route("/{path:path}", mock.handle, methods=methods)])
+    app.state.mock = mock
+    return app
+
+
+class MockGitHubServer:
+    """Serve the mock API from a background thread
+
+    Usage:
+        with MockGitHubServer(MockConfig(latency="fixed:20")) as github:
+            os.environ["AGENT_BUILDER_GITHUB_GITHUB_API_BASE_URL"] = github.url
+    """
+
+    def __init__(self, config: Optional[MockConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.app = create_app(config)
+        self.mock: MockGitHubAPI = self.app.state.mock
+        self.host = host
+        self.port = port
+        self._server = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self, timeout: float = 10.0) -> "MockGitHubServer":
+        import uvicorn
+
+        sock = listen_socket(self.host, self.port)
+        self.port = sock.getsockname()[1]
+        self._server = uvicorn.Server(uvicorn.Config(self.app, log_level="warning", access_log=False,
+                                                     lifespan="off"))
+        self._thread = threading.Thread(target=self._server.run, kwargs={"sockets": [sock]},
+                                        name="mock-github", daemon=True)
+        self._thread.start()
+        deadline = time.monotonic() + timeout
+        while not self._server.started:
+            if time.monotonic() > deadline or not self._thread.is_alive():
+                raise RuntimeError("Mock GitHub API did not start")
+            time.sleep(0.01)
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.should_exit = True
+            self._thread.join()
+            self._server = None
+
+    def __enter__(self) -> "MockGitHubServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="port to listen on")
+    parser.add_argument("--seed", type=int, default=0, help="fixture seed")
+    parser.add_argument("--scale", type=float, default=1.0, help="collection size multiplier")
+    parser.add_argument("--rate-limit", type=int, default=5000, help="requests per token per window")
+    parser.add_argument("--rate-window", type=int, default=3600, help="rate limit window in seconds")
+    parser.add_argument("--latency", default="none", help="latency spec applied to every request")
+    parser.add_argument("--route-latency", action="append", default=[], metavar="PATTERN=SPEC",
+                        help="latency spec for requests matching a pattern (repeatable)")
+    parser.add_argument("--fault", action="append", default=[], metavar="[PATTERN=]RATE:ACTION",
+                        help="fault injection rule (repeatable)")
+    parser.add_argument("--timeout-seconds", type=float, default=30.0, help="how long timeout faults hang")
+    args = parser.parse_args(argv)
+
+    config = MockConfig(seed=args.seed, scale=args.scale, rate_limit=args.rate_limit,
+                        rate_window=args.rate_window, latency=args.latency,
+                        route_latency=args.route_latency, faults=args.fault,
+                        timeout_seconds=args.timeout_seconds)
+    try:
+        app = create_app(config)
+    except ValueError as e:
+        parser.error(str(e))
+
+    import uvicorn
+
+    sock = listen_socket(args.host, args.port)
+    print(f"Mock GitHub API on http://{args.host}:{sock.getsockname()[1]}", flush=True)
+    uvicorn.Server(uvicorn.Config(app, log_level="warning", access_log=False, lifespan="off")).run(sockets=[sock])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
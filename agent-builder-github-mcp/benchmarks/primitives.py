@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Microbenchmarks for shared utils primitives
+
+Times the hot paths every GitHub call goes through, in isolation:
+- RateLimiter.acquire and wait_for_slot with 1, 1k and 5k requests in the
+  window (and SharedRateLimiter for comparison)
+- CacheManager get (hit and miss) and set with 1, 1k and 5k entries
+- ValidationHelper checks on 1, 1k and 5k character inputs
+- AuthManager.get_headers
+- Response JSON decoding of 1, 1k and 5k GitHub-shaped issues, through
+  GitHubAPIClient._decode and plain json.loads
+
+Operations run in batches sized to a few milliseconds; state is restored
+between batches (and after each rate limiter call, so the window keeps its
+size).
+Coroutines that complete without suspending are driven directly rather
+than through an event loop. Results are compared against a stored
+baseline.
+
+Usage:
+    python benchmarks/primitives.py                   # measure and compare
+    python benchmarks/primitives.py --only cache      # benchmarks whose name contains "cache"
+    python benchmarks/primitives.py --save-baseline
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+BENCHMARKS = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCHMARKS / "baselines" / "primitives.json"
+sys.path.insert(0, str(PACKAGE_ROOT))
+sys.path.insert(0, str(BENCHMARKS))
+
+from regression import Comparison, add_arguments, finish  # noqa: E402
+
+SIZES = (1, 1000, 5000)
+# Batches are grown until they take at least this long
+MIN_BATCH_SECONDS = 0.002
+# Changes smaller than this many nanoseconds per operation are noise
+MIN_DELTA_NS = 50
+
+
+def drive(coroutine) -> Any:
+    """Run a coroutine that completes without suspending"""
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coroutine.close()
+    raise RuntimeError("coroutine suspended")
+
+
+class Benchmark:
+    """One operation at one size
+
+    ``setup(size)`` builds the state, ``operation(state)`` is timed and the
+    optional ``reset(state)`` restores the state between batches.
+    """
+
+    def __init__(self, name: str, setup: Callable[[int], Any], operation: Callable[[Any], Any],
+                 reset: Optional[Callable[[Any], None]] = None, sizes=SIZES):
+        self.name = name
+        self.setup = setup
+        self.operation = operation
+        self.reset = reset
+        self.sizes = sizes
+
+    def _batch(self, state: Any, count: int) -> float:
+        if self.reset is not None:
+            self.reset(state)
+        operation = self.operation
+        started = time.perf_counter()
+        for _ in range(count):
+            operation(state)
+        return time.perf_counter() - started
+
+    def measure(self, size: int, repeats: int) -> Dict[str, float]:
+        state = self.setup(size)
+        count = 1
+        while self._batch(state, count) < MIN_BATCH_SECONDS and count < 1_000_000:
+            count *= 2
+        runs = [self._batch(state, count) / count for _ in range(repeats)]
+        return {
+            "ns_per_op": round(statistics.median(runs) * 1e9, 1),
+            "min_ns_per_op": round(min(runs) * 1e9, 1),
+            "batch": count,
+            "samples_ns": [round(run * 1e9, 1) for run in runs],
+        }
+
+
+# Rate limiters
+
+def rate_limiter(size: int):
+    from src.agent_builder_github_mcp.utils import RateLimiter
+
+    limiter = RateLimiter(max_requests=size + 1_000_000)
+    now = time.time()
+    limiter.prefill = [now - i * 0.001 for i in range(size)][::-1]
+    return limiter
+
+
+def shared_rate_limiter(size: int):
+    from src.agent_builder_github_mcp.utils.shared_state import SharedRateLimiter
+
+    limiter = SharedRateLimiter(max_requests=size + 100_000)
+    now = time.time()
+    for i in range(size):
+        limiter._times[i] = now - i * 0.001
+    limiter._head.value = size
+    limiter.prefill_head = size
+    return limiter
+
+
+def reset_rate_limiter(limiter):
+    limiter.requests = list(limiter.prefill)
+
+
+def acquire_once(limiter):
+    drive(limiter.acquire())
+    # Drop the request just recorded so the window stays at its measured size
+    limiter.requests.pop()
+
+
+def wait_once(limiter):
+    drive(limiter.wait_for_slot())
+    limiter.requests.pop()
+
+
+def reset_shared_rate_limiter(limiter):
+    limiter._head.value = limiter.prefill_head
+
+
+# Response cache
+
+def cache_key(i: int) -> str:
+    from src.agent_builder_github_mcp.utils import GitHubAPIClient
+
+    endpoint = f"repos/acme/widgets-{i % 50}/issues/{i}"
+    return GitHubAPIClient._cache_key(f"https://api.github.com/{endpoint}",
+                                      {"params": {"per_page": 30, "page": 1}})
+
+
+def cache(size: int):
+    from src.agent_builder_github_mcp.utils import CacheManager
+    from src.agent_builder_github_mcp.utils.cache_keys import resource_keys
+
+    manager = CacheManager(default_ttl=300)
+    for i in range(size):
+        endpoint = f"repos/acme/widgets-{i % 50}/issues/{i}"
+        manager.set(cache_key(i), {"number": i}, etag=f'"{i}"', resource_keys=resource_keys(endpoint),
+                    family="repos/{owner}/{repo}/issues/{number}", size=3000)
+    manager.hit_key = cache_key(size // 2)
+    manager.miss_key = cache_key(size + 1)
+    manager.set_keys = resource_keys(f"repos/acme/widgets-{size // 2 % 50}/issues/{size // 2}")
+    return manager
+
+
+# Validation inputs
+
+def name_of_length(size: int) -> str:
+    return ("agent-builder." * (size // 14 + 1))[:size]
+
+
+def path_of_length(size: int) -> str:
+    return ("src/agent_builder/" * (size // 18 + 1))[:size]
+
+
+# JSON decoding
+
+def issues_body(size: int) -> bytes:
+    from mock_github import GitHubWorld
+
+    world = GitHubWorld(seed=0, scale=size / 120 + 1)
+    issues = world.repo("acme", "widgets").collection("issues")[:size]
+    payload = issues[0] if size == 1 else issues
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def response_factory(size: int) -> Callable[[], Any]:
+    """A fresh response per decode, as in production, so httpx's decoded text is not reused"""
+    import httpx
+
+    body = issues_body(size)
+    headers = {"Content-Type": "application/json; charset=utf-8"}
+    return lambda: httpx.Response(200, content=body, headers=headers)
+
+
+def benchmarks() -> List[Benchmark]:
+    from src.agent_builder_github_mcp.utils import AuthManager, GitHubAPIClient, ValidationHelper
+
+    return [
+        Benchmark("rate_limiter.acquire", rate_limiter, acquire_once, reset_rate_limiter),
+        Benchmark("rate_limiter.wait_for_slot", rate_limiter, wait_once, reset_rate_limiter),
+        Benchmark("shared_rate_limiter.acquire", shared_rate_limiter, lambda limiter: drive(limiter.acquire()),
+                  reset_shared_rate_limiter),
+        Benchmark("cache.get_hit", cache, lambda manager: manager.get(manager.hit_key)),
+        Benchmark("cache.get_miss", cache, lambda manager: manager.get(manager.miss_key)),
+        Benchmark("cache.get_entry_expired_ok", cache,
+                  lambda manager: manager.get_entry(manager.hit_key, include_expired=True)),
+        Benchmark("cache.set", cache,
+                  lambda manager: manager.set(manager.hit_key, {"number": 1}, etag='"1"',
+                                              resource_keys=manager.set_keys, size=3000)),
+        Benchmark("validation.repo_name", name_of_length, ValidationHelper.validate_repo_name),
+        Benchmark("validation.branch_name", path_of_length, ValidationHelper.validate_branch_name),
+        Benchmark("validation.file_path", path_of_length, ValidationHelper.validate_file_path),
+        Benchmark("validation.owner_repo", name_of_length,
+                  lambda name: ValidationHelper.validate_owner_repo("acme", name)),
+        Benchmark("auth.get_headers", lambda size: AuthManager("ghp_" + "x" * 36), AuthManager.get_headers,
+                  sizes=(1,)),
+        Benchmark("json.decode_response", response_factory,
+                  lambda new_response: GitHubAPIClient._decode(new_response())),
+        Benchmark("json.loads", issues_body, json.loads),
+    ]
+
+
+def measure(selected: List[str], repeats: int) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for benchmark in benchmarks():
+        if selected and not any(part in benchmark.name for part in selected):
+            continue
+        results[benchmark.name] = {str(size): benchmark.measure(size, repeats) for size in benchmark.sizes}
+        print(f"  {benchmark.name}", file=sys.stderr)
+    return results
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], comparison: Comparison):
+    """Compare time per operation at every size against the baseline"""
+    for name, sizes in baseline.get("benchmarks", {}).items():
+        for size, before in sizes.items():
+            after = current["benchmarks"].get(name, {}).get(size)
+            if after is not None:
+                comparison.check(f"{name}[{size}] ns_per_op", before["ns_per_op"], after["ns_per_op"], MIN_DELTA_NS,
+                                 before.get("samples_ns"), after.get("samples_ns"))
+
+
+def report(results: Dict[str, Any]):
+    print(f"{'operation':<32} " + "".join(f"{size:>16}" for size in SIZES))
+    for name, sizes in results["benchmarks"].items():
+        cells = "".join(f"{sizes[str(size)]['ns_per_op']:>13.1f} ns" if str(size) in sizes else f"{'':>16}"
+                        for size in SIZES)
+        print(f"{name:<32} {cells}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--only", nargs="*", default=[], help="run benchmarks whose name contains any of these")
+    parser.add_argument("--repeats", type=int, default=7, help="timed batches per measurement (median is kept)")
+    add_arguments(parser, DEFAULT_BASELINE)
+    args = parser.parse_args(argv)
+
+    from src.agent_builder_github_mcp.utils import Logger
+
+    # The decode benchmark opens tracing spans; keep exporters and log output out of the timings
+    Logger.configure("CRITICAL")
+    results = {
+        "benchmarks": measure(args.only, args.repeats),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeats": args.repeats,
+        },
+    }
+    report(results)
+    return finish(results, args, compare, "operations")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Performance regression gate
+
+Shared baseline comparison for the benchmark suites, and a runner that
+reruns them and fails on regressions:
+- Baselines are the JSON results of a suite, stored in benchmarks/baselines/
+- Metrics with raw samples on both sides are compared by bootstrapping the
+  relative change of a statistic (median by default); a metric regresses
+  when the change exceeds the tolerance and the lower bound of its
+  confidence interval is above zero, so noise alone does not fail the gate
+- Metrics without samples fall back to the relative change of the stored
+  values; counts (upstream requests per call) regress on any increase
+  beyond an allowance
+- Changes below an absolute floor per metric are ignored as noise
+- Regressions are confirmed by rerunning only the affected benchmarks:
+  samples of one run share its machine state, so slow drift (thermal,
+  noisy neighbours) can shift a whole run without being in its intervals
+
+Usage:
+    python benchmarks/regression.py                       # rerun every suite against its baseline
+    python benchmarks/regression.py --suites primitives tool_calls
+    python benchmarks/regression.py --save-baseline       # rerun and store new baselines
+    python benchmarks/regression.py --output gate.json    # also write every comparison as JSON
+"""
+
+import argparse
+import json
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+BENCHMARKS = Path(__file__).resolve().parent
+
+# Suites with a stored baseline, in the order the gate runs them, and the
+# arguments that rerun only the benchmarks behind a set of metrics
+SUITES: Dict[str, Callable[[Sequence[str]], List[str]]] = {
+    "primitives": lambda metrics: ["--only", *sorted({metric.split("[")[0] for metric in metrics})],
+    "startup": lambda metrics: [],
+    "tool_calls": lambda metrics: ["--tools", *sorted({metric.split(".")[0] for metric in metrics})],
+}
+
+Statistic = Callable[[Sequence[float]], float]
+
+
+def bootstrap_change(before: Sequence[float], after: Sequence[float], statistic: Statistic = statistics.median,
+                     resamples: int = 2000, confidence: float = 0.95, seed: int = 0) -> Tuple[float, float]:
+    """Confidence interval of the relative change of ``statistic`` from ``before`` to ``after``"""
+    rng = random.Random(seed)
+    changes = []
+    for _ in range(resamples):
+        old = statistic(rng.choices(before, k=len(before)))
+        new = statistic(rng.choices(after, k=len(after)))
+        if old:
+            changes.append(new / old - 1)
+    if not changes:
+        return 0.0, 0.0
+    changes.sort()
+    tail = (1 - confidence) / 2
+    low = changes[min(len(changes) - 1, int(tail * len(changes)))]
+    high = changes[min(len(changes) - 1, int((1 - tail) * len(changes)))]
+    return low, high
+
+
+class Comparison:
+    """Metric comparisons of one suite against its baseline"""
+
+    def __init__(self, tolerance: float, confidence: float = 0.95, resamples: int = 2000, show_all: bool = True):
+        self.tolerance = tolerance
+        self.confidence = confidence
+        self.resamples = resamples
+        self.show_all = show_all
+        self.rows: List[Dict[str, Any]] = []
+
+    @property
+    def regressions(self) -> List[str]:
+        return [row["metric"] for row in self.rows if row["regressed"]]
+
+    def _add(self, row: Dict[str, Any]):
+        self.rows.append(row)
+        if not (self.show_all or row["regressed"]):
+            return
+        interval = ""
+        if "low" in row:
+            interval = f"[{row['low']:+7.1%}, {row['high']:+7.1%}]"
+        marker = "REGRESSED" if row["regressed"] else ""
+        print(f"  {row['metric']:<60} {row['before']:>12.4g} -> {row['after']:>12.4g} "
+              f"{row['change']:+7.1%} {interval:>20} {marker}")
+
+    def check(self, metric: str, before: Optional[float], after: Optional[float], floor: float,
+              before_samples: Optional[Sequence[float]] = None, after_samples: Optional[Sequence[float]] = None,
+              statistic: Statistic = statistics.median):
+        """Compare a lower-is-better measurement, statistically when both sides have samples"""
+        if not before or after is None:
+            return
+        change = after / before - 1
+        row = {"metric": metric, "before": before, "after": after, "change": round(change, 4)}
+        regressed = change > self.tolerance and after - before > floor
+        if before_samples and after_samples and len(before_samples) > 2 and len(after_samples) > 2:
+            low, high = bootstrap_change(before_samples, after_samples, statistic, self.resamples, self.confidence)
+            row.update(low=round(low, 4), high=round(high, 4))
+            regressed = regressed and low > 0
+        row["regressed"] = regressed
+        self._add(row)
+
+    def count(self, metric: str, before: Optional[float], after: Optional[float], allowance: float):
+        """Compare a deterministic count, which regresses on any increase beyond ``allowance``"""
+        if before is None or after is None:
+            return
+        change = after / before - 1 if before else (1.0 if after else 0.0)
+        self._add({"metric": metric, "before": before, "after": after, "change": round(change, 4),
+                   "regressed": after - before > allowance})
+
+
+def add_arguments(parser: argparse.ArgumentParser, baseline: Path):
+    """Baseline and comparison options shared by the suites"""
+    parser.add_argument("--baseline", type=Path, default=baseline, help="baseline file")
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed regression against the baseline as a fraction (default 0.25)")
+    parser.add_argument("--confidence", type=float, default=0.95,
+                        help="confidence level of the bootstrap intervals (default 0.95)")
+    parser.add_argument("--resamples", type=int, default=2000, help="bootstrap resamples per metric")
+    parser.add_argument("--output", type=Path, help="also write the results as JSON to this file")
+
+
+def finish(results: Dict[str, Any], args, compare: Callable[[Dict[str, Any], Dict[str, Any], Comparison], None],
+           what: str, show_all: bool = True) -> int:
+    """Store or compare a suite's results; returns the suite's exit code
+
+    ``show_all`` prints every compared metric rather than only regressions.
+    """
+    code = 0
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}")
+    elif not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+    else:
+        print(f"Against baseline {args.baseline}:")
+        comparison = Comparison(args.tolerance, args.confidence, args.resamples, show_all)
+        compare(results, json.loads(args.baseline.read_text()), comparison)
+        results = {**results, "comparison": comparison.rows}
+        if comparison.regressions:
+            print(f"{len(comparison.regressions)} {what} regressed by more than {args.tolerance:.0%}")
+            code = 1
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    return code
+
+
+def run_suite(suite: str, args, output: Path, selection: Sequence[str] = ()) -> Tuple[int, Dict[str, Any]]:
+    """Run a suite in a fresh interpreter; returns its exit code and results"""
+    command = [sys.executable, str(BENCHMARKS / f"{suite}.py"), "--output", str(output),
+               "--confidence", str(args.confidence), "--resamples", str(args.resamples), *selection]
+    if args.tolerance is not None:
+        command += ["--tolerance", str(args.tolerance)]
+    if args.save_baseline:
+        command.append("--save-baseline")
+    code = subprocess.run(command).returncode
+    results = json.loads(output.read_text()) if output.exists() else {}
+    return code, results
+
+
+def regressed_metrics(results: Dict[str, Any]) -> List[str]:
+    return [row["metric"] for row in results.get("comparison", []) if row["regressed"]]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--suites", nargs="*", choices=SUITES, default=list(SUITES), help="suites to run")
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as new baselines")
+    parser.add_argument("--tolerance", type=float, help="allowed regression as a fraction (default: each suite's)")
+    parser.add_argument("--confidence", type=float, default=0.95, help="confidence level of the bootstrap intervals")
+    parser.add_argument("--resamples", type=int, default=2000, help="bootstrap resamples per metric")
+    parser.add_argument("--confirm", type=int, default=1,
+                        help="reruns of the regressed metrics a regression must reproduce in (default 1)")
+    parser.add_argument("--output", type=Path, help="write every suite's results and comparison to this file")
+    args = parser.parse_args(argv)
+
+    outcomes: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for suite in args.suites:
+            print(f"== {suite}", flush=True)
+            code, results = run_suite(suite, args, Path(directory) / f"{suite}.json")
+            regressed = regressed_metrics(results)
+            for attempt in range(args.confirm):
+                if not regressed or code not in (0, 1):
+                    break
+                print(f"== {suite}: rerunning {len(regressed)} regressed metrics", flush=True)
+                code, rerun = run_suite(suite, args, Path(directory) / f"{suite}-{attempt}.json",
+                                        SUITES[suite](regressed))
+                reproduced = set(regressed_metrics(rerun))
+                regressed = [metric for metric in regressed if metric in reproduced]
+            outcomes[suite] = {
+                "status": "failed" if code not in (0, 1) or not results
+                else "regressed" if regressed else "ok",
+                "regressions": [row for row in results.get("comparison", []) if row["metric"] in regressed],
+                "results": results,
+            }
+
+    print("== summary")
+    for suite, outcome in outcomes.items():
+        print(f"  {suite:<12} {outcome['status']}")
+        for row in outcome["regressions"]:
+            print(f"    {row['metric']}: {row['before']:.4g} -> {row['after']:.4g} ({row['change']:+.1%})")
+    if args.output:
+        args.output.write_text(json.dumps(outcomes, indent=2) + "\n")
+    return 0 if all(outcome["status"] == "ok" for outcome in outcomes.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
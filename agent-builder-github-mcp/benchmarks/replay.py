@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Captured workload replayer
+
+Re-issues tool calls captured by the server (AGENT_BUILDER_GITHUB_WORKLOAD_CAPTURE_PATH)
+against a server over its HTTP transport:
+- Calls start at their captured offsets, divided by --speed (1 original,
+  10 ten times faster), or back to back with --speed 0
+- Open loop: a slow server does not slow the schedule down, up to
+  --max-in-flight outstanding calls; the schedule lag is reported
+- Each call carries its original caller in the request _meta, over a pool
+  of MCP sessions
+- Truncated arguments are restored as filler of their original length
+- Reports throughput, latency percentiles and errors overall and per
+  tool, next to the captured latencies
+
+Without --url the server is started against the local mock GitHub API,
+which serves any owner and repository.
+
+Usage:
+    python benchmarks/replay.py captures/                      # original rate
+    python benchmarks/replay.py captures/ --speed 10 --output replay.json
+    python benchmarks/replay.py captures/workload-*.ndjson.gz --tools "*issue*" --limit 1000
+    python benchmarks/replay.py captures/ --speed 0 --max-in-flight 32 --url http://127.0.0.1:8000
+"""
+
+import argparse
+import asyncio
+import fnmatch
+import json
+import os
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+BENCHMARKS = Path(__file__).resolve().parent
+sys.path.insert(0, str(PACKAGE_ROOT))
+sys.path.insert(0, str(BENCHMARKS))
+
+from load import Recorder, start_server, summarize  # noqa: E402
+from tool_calls import percentile, start_mock  # noqa: E402
+
+from src.agent_builder_github_mcp.utils.workload import read_workload, restore_arguments  # noqa: E402
+
+
+def select(calls: List[Dict[str, Any]], tools: List[str], limit: Optional[int]) -> List[Dict[str, Any]]:
+    if tools:
+        calls = [call for call in calls if any(fnmatch.fnmatch(call["tool"], pattern) for pattern in tools)]
+    return calls[:limit] if limit else calls
+
+
+async def replay_call(client, call: Dict[str, Any], recorder: Recorder, timeout: float):
+    tool = call["tool"]
+    started = time.perf_counter()
+    try:
+        result = await asyncio.wait_for(
+            client.call_tool(tool, restore_arguments(call["arguments"]), raise_on_error=False,
+                             meta={"caller": call["caller"]}),
+            timeout,
+        )
+    except asyncio.TimeoutError:
+        recorder.record(time.perf_counter() - started, call["caller"], tool, "timeout", f"no result after {timeout}s")
+        return
+    except Exception as e:
+        recorder.record(time.perf_counter() - started, call["caller"], tool, "transport", repr(e))
+        return
+    seconds = time.perf_counter() - started
+    payload = result.structured_content or {}
+    if result.is_error:
+        recorder.record(seconds, call["caller"], tool, "tool_error", str(result.content)[:200])
+    elif payload.get("success", True) is False:
+        recorder.record(seconds, call["caller"], tool, "failed", str(payload.get("error") or payload.get("message")))
+    else:
+        recorder.record(seconds, call["caller"], tool)
+
+
+async def run(args, url: str, calls: List[Dict[str, Any]]) -> Dict[str, Any]:
+    from contextlib import AsyncExitStack
+
+    from fastmcp import Client
+
+    recorder = Recorder()
+    in_flight = asyncio.Semaphore(args.max_in_flight)
+    lags: List[float] = []
+    tasks = []
+
+    async def issue(client, call):
+        try:
+            await replay_call(client, call, recorder, args.timeout)
+        finally:
+            in_flight.release()
+
+    async with AsyncExitStack() as stack:
+        sessions = [await stack.enter_async_context(Client(f"{url}/mcp")) for _ in range(args.sessions)]
+        first = calls[0]["ts"]
+        started = time.monotonic()
+        for i, call in enumerate(calls):
+            due = (call["ts"] - first) / args.speed if args.speed > 0 else 0.0
+            delay = due - (time.monotonic() - started)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await in_flight.acquire()
+            lags.append(max(0.0, time.monotonic() - started - due))
+            tasks.append(asyncio.create_task(issue(sessions[i % len(sessions)], call)))
+            if (i + 1) % 1000 == 0:
+                print(f"  {i + 1}/{len(calls)} calls issued", file=sys.stderr)
+        await asyncio.gather(*tasks)
+        elapsed = time.monotonic() - started
+
+    span = calls[-1]["ts"] - first
+    results = {
+        "calls": len(calls),
+        "captured_seconds": round(span, 3),
+        "captured_rate": round(len(calls) / span, 2) if span else None,
+        "replay_seconds": round(elapsed, 3),
+        "speed": args.speed,
+        "schedule_lag_p50_ms": round(percentile(lags, 50) * 1000, 2),
+        "schedule_lag_p99_ms": round(percentile(lags, 99) * 1000, 2),
+        "overall": summarize(recorder.calls, elapsed),
+        "tools": {},
+        "error_examples": recorder.error_examples,
+    }
+    captured: Dict[str, List[float]] = {}
+    for call in calls:
+        captured.setdefault(call["tool"], []).append(call["duration_ms"] / 1000)
+    for tool in sorted(captured):
+        summary = summarize([row for row in recorder.calls if row[3] == tool], elapsed)
+        summary["captured_p50_ms"] = round(percentile(captured[tool], 50) * 1000, 2)
+        summary["captured_p99_ms"] = round(percentile(captured[tool], 99) * 1000, 2)
+        summary["captured_failures"] = sum(1 for call in calls if call["tool"] == tool and not call["success"])
+        results["tools"][tool] = summary
+    return results
+
+
+def report(results: Dict[str, Any]):
+    overall = results["overall"]
+    captured_rate = results["captured_rate"]
+    print(f"Replayed {results['calls']} calls captured over {results['captured_seconds']:.1f}s "
+          f"({captured_rate or 0:.1f} calls/s) in {results['replay_seconds']:.1f}s "
+          f"({overall['throughput']:.1f} calls/s)")
+    print(f"  p50 {overall.get('p50_ms', 0):.1f} ms  p99 {overall.get('p99_ms', 0):.1f} ms  "
+          f"errors {overall['error_rate']:.1%} {overall['errors'] or ''}")
+    print(f"  schedule lag p50 {results['schedule_lag_p50_ms']:.1f} ms  p99 {results['schedule_lag_p99_ms']:.1f} ms")
+    if results["speed"] > 0 and results["schedule_lag_p99_ms"] > 1000:
+        print("The replay fell behind its schedule (server too slow or --max-in-flight too low); "
+              "the offered rate was lower than requested")
+    print(f"{'tool':<36} {'calls':>6} {'p50 ms':>9} {'p99 ms':>9} {'captured p50':>13} {'captured p99':>13} "
+          f"{'errors':>7} {'captured':>8}")
+    for tool, summary in results["tools"].items():
+        print(f"{tool:<36} {summary['calls']:>6} {summary.get('p50_ms', 0):>9.1f} {summary.get('p99_ms', 0):>9.1f} "
+              f"{summary['captured_p50_ms']:>13.1f} {summary['captured_p99_ms']:>13.1f} "
+              f"{summary['error_rate']:>7.1%} {summary['captured_failures']:>8}")
+    for kind, example in results["error_examples"].items():
+        print(f"  {kind}: {example}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("paths", nargs="+", help="capture files or capture directories")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="replay rate relative to the capture (default 1; 0 issues calls back to back)")
+    parser.add_argument("--max-in-flight", type=int, default=64, help="outstanding calls before the schedule waits")
+    parser.add_argument("--sessions", type=int, default=8, help="MCP sessions the calls are spread over")
+    parser.add_argument("--tools", nargs="*", default=[], help="replay only tools matching these glob patterns")
+    parser.add_argument("--limit", type=int, help="replay at most this many calls")
+    parser.add_argument("--timeout", type=float, default=30.0, help="seconds before a call counts as timed out")
+    parser.add_argument("--workers", type=int, default=1, help="server worker processes")
+    parser.add_argument("--cache", action="store_true", help="enable the GitHub response cache")
+    parser.add_argument("--latency", default="none", help="mock GitHub latency spec (see mock_github.py)")
+    parser.add_argument("--rate-limit", type=int, default=1_000_000,
+                        help="GitHub requests per hour, for both the mock and the server's limiter")
+    parser.add_argument("--url", help="replay against an already running server instead of starting one with the mock")
+    parser.add_argument("--output", type=Path, help="also write the results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    calls = select(read_workload(args.paths), args.tools, args.limit)
+    if not calls:
+        print("No captured calls to replay")
+        return 1
+
+    mock = server = None
+    try:
+        if args.url:
+            url = args.url.rstrip("/")
+        else:
+            mock, github_url = start_mock("--latency", args.latency, "--rate-limit", str(args.rate_limit))
+            server, url = start_server(github_url, args)
+        results = asyncio.run(run(args, url, calls))
+    finally:
+        for process in (server, mock):
+            if process is not None:
+                process.terminate()
+                process.wait()
+
+    results["environment"] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "workers": args.workers,
+        "cache": args.cache,
+        "latency": args.latency if not args.url else None,
+        "max_in_flight": args.max_in_flight,
+        "sessions": args.sessions,
+    }
+    report(results)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
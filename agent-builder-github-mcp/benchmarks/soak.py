@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Memory soak test
+
+Drives an in-process server with hours of simulated traffic against the
+local mock GitHub API and watches for unbounded in-memory state:
+- A steady mix of GitHub reads and writes, automated deployments,
+  real-time collaboration sessions and file sync, across a pool of
+  repositories that keeps growing (as a long-running server sees new
+  repositories) unless capped with --repos
+- Periodic samples, after a full garbage collection, of RSS, live object
+  counts by type and the item counts and deep sizes of the server's
+  registered in-memory structures
+- Trend analysis after a warmup: a series is flagged when it grows
+  monotonically (Kendall's tau) by more than a relative and an absolute
+  threshold, with its growth rate per hour and, for RSS, the time until
+  it would reach a container memory limit
+
+Exits 1 when any series is flagged.
+
+Usage:
+    python benchmarks/soak.py --duration 2h
+    python benchmarks/soak.py --duration 10m --interval 10 --repos 50
+    python benchmarks/soak.py --duration 4h --memory-limit 512 --output soak.json
+"""
+
+import argparse
+import asyncio
+import gc
+import itertools
+import json
+import platform
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+BENCHMARKS = Path(__file__).resolve().parent
+sys.path.insert(0, str(PACKAGE_ROOT))
+sys.path.insert(0, str(BENCHMARKS))
+
+from tool_calls import OWNER, percentile, required_arguments, start_mock  # noqa: E402
+
+# Object types with fewer live instances than this are not tracked
+MIN_TYPE_COUNT = 200
+# Growth below these is noise, whatever its trend
+MIN_GROWTH = {"rss_bytes": 4 * 2**20, "objects": 1000, "items": 50, "bytes": 256 * 1024}
+ENVIRONMENTS = ("production", "staging", "preview")
+
+
+class Traffic:
+    """Calls of one simulated client; repositories come from a shared, growing pool"""
+
+    def __init__(self, tools: Dict[str, Any], rng: random.Random, repos: int, counter: Callable[[], int]):
+        self.tools = tools
+        self.rng = rng
+        self.repos = repos
+        self.counter = counter
+        self.calls: List[tuple] = [
+            (6, "get_issue", lambda repo: {"repo": "widgets", "issue_number": self.rng.randint(1, 120)}),
+            (4, "list_issues", lambda repo: {"repo": "widgets"}),
+            (4, "get_repository", lambda repo: {"repo": repo}),
+            (2, "create_issue", lambda repo: {"repo": "widgets", "title": "Soak", "body": "Soak test issue"}),
+            (2, "add_issue_comment", lambda repo: {"repo": "widgets", "issue_number": self.rng.randint(1, 120),
+                                                   "body": "Soak comment"}),
+            (3, "trigger_automated_deployment", lambda repo: {"repo": repo,
+                                                              "environment": self.rng.choice(ENVIRONMENTS)}),
+            (2, "monitor_deployment", lambda repo: {
+                "deployment_id": f"deploy_{OWNER}_{repo}_{self.rng.choice(ENVIRONMENTS)}"}),
+            (1, "setup_continuous_integration", lambda repo: {"repo": repo}),
+            (3, "enable_realtime_collaboration", lambda repo: {"repo": repo, "collaborators": ["octocat"]}),
+            (2, "get_collaboration_status", lambda repo: {"session_id": f"collab_{OWNER}_{repo}"}),
+            (3, "sync_repository_to_cloud", lambda repo: {"repo": repo, "local_path": f"/workspace/{repo}"}),
+            (2, "sync_cloud_to_repository", lambda repo: {"repo": repo, "local_path": f"/workspace/{repo}"}),
+            (1, "get_sync_status", lambda repo: {"sync_id": f"sync_{repo}"}),
+        ]
+        self.calls = [call for call in self.calls if call[1] in tools]
+        self.weights = [call[0] for call in self.calls]
+
+    def repo(self) -> str:
+        # Without a cap a new repository appears every 20 calls
+        count = self.repos or 1 + self.counter() // 20
+        return f"soak-{self.rng.randrange(count)}"
+
+    def next(self) -> tuple:
+        _, tool, arguments = self.rng.choices(self.calls, self.weights)[0]
+        defaults = required_arguments(self.tools[tool])
+        if "owner" in self.tools[tool].inputSchema["properties"]:
+            defaults["owner"] = OWNER
+        return tool, {**defaults, **arguments(self.repo())}
+
+
+class Stats:
+    """Call counts and latencies per sampling interval (bounded, so the driver does not grow)"""
+
+    def __init__(self):
+        self.total = 0
+        self.errors = 0
+        self.latencies: List[float] = []
+        self.interval_errors = 0
+        self.examples: Dict[str, str] = {}
+
+    def record(self, tool: str, seconds: float, error: Optional[str]):
+        self.total += 1
+        self.latencies.append(seconds)
+        if error:
+            self.errors += 1
+            self.interval_errors += 1
+            if tool not in self.examples and len(self.examples) < 20:
+                self.examples[tool] = error[:200]
+
+    def drain(self) -> Dict[str, Any]:
+        latencies, self.latencies = self.latencies, []
+        errors, self.interval_errors = self.interval_errors, 0
+        summary = {"calls": len(latencies), "errors": errors}
+        if latencies:
+            summary["p50_ms"] = round(percentile(latencies, 50) * 1000, 2)
+            summary["p99_ms"] = round(percentile(latencies, 99) * 1000, 2)
+        return summary
+
+
+async def run_client(client, traffic: Traffic, stats: Stats, deadline: float, think: float):
+    while time.monotonic() < deadline:
+        tool, arguments = traffic.next()
+        started = time.perf_counter()
+        error = None
+        try:
+            result = await client.call_tool(tool, arguments, raise_on_error=False)
+            payload = result.structured_content or {}
+            if result.is_error:
+                error = str(result.content)
+            elif payload.get("success", True) is False:
+                error = str(payload.get("error") or payload.get("message"))
+        except Exception as e:
+            error = repr(e)
+        stats.record(tool, time.perf_counter() - started, error)
+        if think:
+            await asyncio.sleep(traffic.rng.expovariate(1 / think))
+        else:
+            # In-memory calls without upstream I/O never yield; let the sampler run
+            await asyncio.sleep(0)
+
+
+def object_counts() -> Dict[str, int]:
+    counts = Counter(type(obj).__qualname__ for obj in gc.get_objects())
+    return {name: count for name, count in counts.items() if count >= MIN_TYPE_COUNT}
+
+
+def take_sample(started: float, memory, stats: Stats) -> Dict[str, Any]:
+    from src.agent_builder_github_mcp.utils.memory import rss_bytes
+
+    gc.collect()
+    return {
+        "t": round(time.monotonic() - started, 1),
+        "calls_total": stats.total,
+        **stats.drain(),
+        "rss_bytes": rss_bytes(),
+        "gc_garbage": len(gc.garbage),
+        "objects": object_counts(),
+        "structures": {name: {"items": size["items"], "bytes": size["bytes"]}
+                       for name, size in memory.structure_sizes().items()},
+    }
+
+
+def kendall_tau(values: Sequence[float]) -> float:
+    """Rank correlation of a series with time: 1 when it only ever grows"""
+    concordant = discordant = 0
+    for i, j in itertools.combinations(range(len(values)), 2):
+        if values[j] > values[i]:
+            concordant += 1
+        elif values[j] < values[i]:
+            discordant += 1
+    pairs = len(values) * (len(values) - 1) / 2
+    return (concordant - discordant) / pairs if pairs else 0.0
+
+
+def trend(times: Sequence[float], values: Sequence[float]) -> Dict[str, float]:
+    """Monotonicity, least-squares slope per hour and growth between the first and last tenth"""
+    n = len(values)
+    mean_t, mean_v = sum(times) / n, sum(values) / n
+    variance = sum((t - mean_t) ** 2 for t in times)
+    slope = sum((t - mean_t) * (v - mean_v) for t, v in zip(times, values)) / variance if variance else 0.0
+    window = max(1, n // 10)
+    first, last = sum(values[:window]) / window, sum(values[-window:]) / window
+    return {
+        "tau": round(kendall_tau(values), 3),
+        "per_hour": round(slope * 3600, 1),
+        "start": round(first, 1),
+        "end": round(last, 1),
+        "growth": round(last - first, 1),
+        "relative_growth": round((last - first) / first, 4) if first else None,
+    }
+
+
+def analyze(samples: List[Dict[str, Any]], args) -> Dict[str, Any]:
+    """Trends of every sampled series after the warmup, and the ones that grow without bound"""
+    measured = samples[int(len(samples) * args.warmup_fraction):]
+    if len(measured) < 4:
+        return {"series": {}, "flagged": [], "note": "too few samples after warmup for trend analysis"}
+    times = [sample["t"] for sample in measured]
+    series: Dict[str, tuple] = {}
+    if all(sample["rss_bytes"] is not None for sample in measured):
+        series["rss_bytes"] = ([sample["rss_bytes"] for sample in measured], MIN_GROWTH["rss_bytes"])
+    for name in sorted({name for sample in measured for name in sample["objects"]}):
+        series[f"objects.{name}"] = ([sample["objects"].get(name, 0) for sample in measured], MIN_GROWTH["objects"])
+    for name in measured[-1]["structures"]:
+        for field in ("items", "bytes"):
+            values = [sample["structures"].get(name, {}).get(field) or 0 for sample in measured]
+            series[f"structures.{name}.{field}"] = (values, MIN_GROWTH[field])
+
+    trends, flagged = {}, []
+    for name, (values, floor) in series.items():
+        result = trend(times, values)
+        trends[name] = result
+        relative = result["relative_growth"]
+        if (result["tau"] >= args.min_tau and result["growth"] > floor
+                and (relative is None or relative > args.min_relative_growth)):
+            flagged.append(name)
+    analysis: Dict[str, Any] = {"series": trends, "flagged": flagged}
+    rss = trends.get("rss_bytes")
+    if rss and args.memory_limit and rss["per_hour"] > 0:
+        remaining = args.memory_limit * 2**20 - measured[-1]["rss_bytes"]
+        analysis["hours_to_memory_limit"] = round(max(0, remaining) / rss["per_hour"], 1)
+    return analysis
+
+
+def parse_duration(value: str) -> float:
+    """Seconds from ``90``, ``90s``, ``30m`` or ``2h``"""
+    units = {"s": 1, "m": 60, "h": 3600}
+    try:
+        if value[-1] in units:
+            return float(value[:-1]) * units[value[-1]]
+        return float(value)
+    except (ValueError, IndexError):
+        raise argparse.ArgumentTypeError(f"invalid duration {value!r}")
+
+
+async def soak(args, github_url: str) -> Dict[str, Any]:
+    from fastmcp import Client
+
+    import server
+    from src.agent_builder_github_mcp.utils import GitHubMCPConfig
+
+    config = GitHubMCPConfig(
+        github_token="soak",
+        github_api_base_url=github_url,
+        github_rate_limit=1_000_000,
+        enable_response_cache=not args.no_cache,
+        log_level="CRITICAL",
+    )
+    instance = server.AgentBuilderGitHubMCP(config)
+    memory = instance.diagnostics_tools.memory_tracker
+    stats = Stats()
+    samples: List[Dict[str, Any]] = []
+    started = time.monotonic()
+    deadline = started + args.duration
+
+    async with Client(instance.get_mcp_instance()) as client:
+        tools = {tool.name: tool for tool in await client.list_tools()}
+        clients = [
+            asyncio.create_task(run_client(
+                client, Traffic(tools, random.Random(args.seed * 7919 + n), args.repos, lambda: stats.total),
+                stats, deadline, args.think))
+            for n in range(args.clients)
+        ]
+        while time.monotonic() < deadline:
+            sample = take_sample(started, memory, stats)
+            samples.append(sample)
+            rss = sample["rss_bytes"] or 0
+            print(f"  {sample['t']:>8.0f}s  calls {sample['calls_total']:>9}  errors {sample['errors']:>5}  "
+                  f"rss {rss / 2**20:>8.1f} MiB  objects {sum(sample['objects'].values()):>9}", file=sys.stderr)
+            await asyncio.sleep(min(args.interval, max(0.0, deadline - time.monotonic())))
+        await asyncio.gather(*clients)
+        samples.append(take_sample(started, memory, stats))
+
+    return {
+        "samples": samples,
+        "analysis": analyze(samples, args),
+        "calls": stats.total,
+        "errors": stats.errors,
+        "error_examples": stats.examples,
+    }
+
+
+def report(results: Dict[str, Any]):
+    analysis = results["analysis"]
+    print(f"{results['calls']} calls, {results['errors']} errors over {results['samples'][-1]['t']:.0f}s "
+          f"({len(results['samples'])} samples)")
+    for tool, error in results["error_examples"].items():
+        print(f"  {tool}: {error}")
+    if "note" in analysis:
+        print(analysis["note"])
+        return
+    shown = ["rss_bytes", *[name for name in analysis["series"] if name.startswith("structures.")]]
+    print(f"{'series':<60} {'tau':>6} {'start':>14} {'end':>14} {'per hour':>14}")
+    for name in dict.fromkeys(shown + analysis["flagged"]):
+        row = analysis["series"].get(name)
+        if row is None:
+            continue
+        marker = "GROWING" if name in analysis["flagged"] else ""
+        print(f"{name:<60} {row['tau']:>6.2f} {row['start']:>14.1f} {row['end']:>14.1f} "
+              f"{row['per_hour']:>14.1f} {marker}")
+    if "hours_to_memory_limit" in analysis:
+        print(f"RSS would reach the memory limit in {analysis['hours_to_memory_limit']} hours at this rate")
+    if analysis["flagged"]:
+        print(f"{len(analysis['flagged'])} series grew monotonically")
+    else:
+        print("No monotonic growth detected")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--duration", type=parse_duration, default="1h", help="how long to run (e.g. 90s, 30m, 2h)")
+    parser.add_argument("--interval", type=float, default=30.0, help="seconds between memory samples")
+    parser.add_argument("--clients", type=int, default=4, help="concurrent simulated clients")
+    parser.add_argument("--think", type=float, default=0.0, help="mean seconds each client waits between calls")
+    parser.add_argument("--repos", type=int, default=0,
+                        help="distinct repositories to spread calls over (default: a pool that keeps growing)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the call sequence")
+    parser.add_argument("--no-cache", action="store_true", help="disable the GitHub response cache")
+    parser.add_argument("--warmup-fraction", type=float, default=0.1,
+                        help="share of the samples left out of trend analysis (default 0.1)")
+    parser.add_argument("--min-tau", type=float, default=0.7,
+                        help="Kendall's tau above which a series counts as monotonic (default 0.7)")
+    parser.add_argument("--min-relative-growth", type=float, default=0.05,
+                        help="growth over the run, as a fraction, below which a series is not flagged")
+    parser.add_argument("--memory-limit", type=float, help="container memory limit in MiB, for the RSS projection")
+    parser.add_argument("--output", type=Path, help="also write samples and analysis as JSON to this file")
+    args = parser.parse_args(argv)
+
+    mock, github_url = start_mock()
+    try:
+        results = asyncio.run(soak(args, github_url))
+    finally:
+        mock.terminate()
+        mock.wait()
+    results["environment"] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "duration": args.duration,
+        "clients": args.clients,
+        "repos": args.repos,
+        "cache": not args.no_cache,
+    }
+    report(results)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    return 1 if results["analysis"]["flagged"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark
+
+Measures the cold-start cost of the server in fresh interpreters:
+- Cold import time of server.py with a per-module breakdown (-X importtime)
+- Import time of each tool and integration module once server.py is
+  loaded (what lazily loading a group adds to its first call)
+- Server construction and in-process tools/list time, and RSS after boot
+- Time from spawning the stdio server to a tools/list response
+
+Results are compared against a stored baseline to catch new dependencies
+or eager initialisation regressing cold start.
+
+Usage:
+    python benchmarks/startup.py                   # measure and compare
+    python benchmarks/startup.py --save-baseline   # measure and store baseline
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baselines" / "startup.json"
+sys.path.insert(0, str(PACKAGE_ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from regression import Comparison, add_arguments, finish  # noqa: E402
+
+# Environment for child processes: a placeholder token passes configuration
+# validation and no integration is configured, so nothing reaches the network
+CHILD_ENV = {
+    "AGENT_BUILDER_GITHUB_GITHUB_TOKEN": "startup-benchmark",
+    "AGENT_BUILDER_GITHUB_LOG_LEVEL": "WARNING",
+    "PYTHONPATH": str(PACKAGE_ROOT),
+}
+
+BOOT_SCRIPT = """
+import asyncio, json, time
+started = time.perf_counter()
+import server
+imported = time.perf_counter()
+from src.agent_builder_github_mcp.utils import GitHubMCPConfig
+from src.agent_builder_github_mcp.utils.memory import rss_bytes
+instance = server.AgentBuilderGitHubMCP(GitHubMCPConfig())
+constructed = time.perf_counter()
+tools = asyncio.run(instance.mcp.list_tools())
+listed = time.perf_counter()
+print(json.dumps({
+    "import_seconds": imported - started,
+    "construct_seconds": constructed - imported,
+    "list_tools_seconds": listed - constructed,
+    "boot_seconds": listed - started,
+    "rss_bytes": rss_bytes(),
+    "tools": len(tools),
+}))
+"""
+
+
+def child_env() -> Dict[str, str]:
+    env = {key: value for key, value in os.environ.items()
+           if not key.startswith("AGENT_BUILDER_GITHUB_")}
+    env.update(CHILD_ENV)
+    return env
+
+
+def run_python(args: List[str]) -> subprocess.CompletedProcess:
+    """Run a fresh interpreter in the package root"""
+    return subprocess.run([sys.executable, *args], cwd=PACKAGE_ROOT, env=child_env(),
+                          capture_output=True, text=True, check=True)
+
+
+def parse_importtime(stderr: str) -> Dict[str, Dict[str, float]]:
+    """Parse -X importtime output into self and cumulative seconds per module"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = {
+            "self": int(self_us) / 1e6,
+            "cumulative": int(cumulative_us) / 1e6,
+        }
+    return modules
+
+
+def top_level_breakdown(modules: Dict[str, Dict[str, float]], limit: int) -> Dict[str, float]:
+    """Self time aggregated by top-level package (src.* by subpackage)"""
+    totals: Dict[str, float] = {}
+    for name, times in modules.items():
+        parts = name.split(".")
+        key = ".".join(parts[:3]) if parts[0] == "src" else parts[0]
+        totals[key] = totals.get(key, 0.0) + times["self"]
+    ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+    return {name: round(seconds, 4) for name, seconds in ranked[:limit]}
+
+
+# Imported first when timing a tool module, as it is in the running server
+TOOL_PRELOAD = ("server",)
+
+# Changes smaller than these are noise, whatever their relative size
+MIN_DELTA_SECONDS = 0.005
+MIN_DELTA_BYTES = 2 * 2**20
+
+
+def import_seconds(module: str, repeats: int, preload: tuple = ()) -> Dict[str, Any]:
+    """Median cold import time of a module, and the per-module times of the last run"""
+    runs = []
+    for _ in range(repeats):
+        code = "".join(f"import {name}; " for name in (*preload, module))
+        result = run_python(["-X", "importtime", "-c", code])
+        runs.append(parse_importtime(result.stderr))
+    samples = [round(run[module]["cumulative"], 4) for run in runs]
+    return {"seconds": round(statistics.median(samples), 4), "samples": samples, "modules": runs[-1]}
+
+
+def measure_imports(repeats: int, breakdown: int) -> Dict[str, Any]:
+    from src.agent_builder_github_mcp.tool_registry import TOOL_GROUPS
+
+    server = import_seconds("server", repeats)
+    modules = {group.module: import_seconds(group.module, repeats, TOOL_PRELOAD) for group in TOOL_GROUPS}
+    return {
+        "server_import_seconds": server["seconds"],
+        "server_import_breakdown": top_level_breakdown(server["modules"], breakdown),
+        "module_import_seconds": {module: result["seconds"] for module, result in modules.items()},
+        "samples": {
+            "server_import_seconds": server["samples"],
+            **{f"import {module}": result["samples"] for module, result in modules.items()},
+        },
+    }
+
+
+def measure_boot(repeats: int) -> List[Dict[str, Any]]:
+    return [json.loads(run_python(["-c", BOOT_SCRIPT]).stdout.splitlines()[-1]) for _ in range(repeats)]
+
+
+def summarize_boot(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        key: round(statistics.median(run[key] for run in runs), 4)
+        if key.endswith("_seconds") else max(run[key] for run in runs)
+        for key in runs[0]
+    }
+
+
+async def stdio_ready_seconds() -> float:
+    from fastmcp import Client
+    from fastmcp.client.transports import StdioTransport
+
+    with open(os.devnull, "w") as server_stderr:
+        transport = StdioTransport(sys.executable, ["server.py"], env=child_env(),
+                                   cwd=str(PACKAGE_ROOT), keep_alive=False, log_file=server_stderr)
+        started = time.perf_counter()
+        async with Client(transport) as client:
+            await client.list_tools()
+            return time.perf_counter() - started
+
+
+def measure_stdio(repeats: int) -> List[float]:
+    return [round(asyncio.run(stdio_ready_seconds()), 4) for _ in range(repeats)]
+
+
+def measure(repeats: int, breakdown: int) -> Dict[str, Any]:
+    results = measure_imports(repeats, breakdown)
+    boot = measure_boot(repeats)
+    results["boot"] = summarize_boot(boot)
+    stdio = measure_stdio(repeats)
+    results["stdio_tools_list_seconds"] = round(statistics.median(stdio), 4)
+    results["samples"].update({f"boot.{key}": [round(run[key], 4) for run in boot]
+                               for key in ("construct_seconds", "list_tools_seconds", "boot_seconds", "rss_bytes")})
+    results["samples"]["stdio_tools_list_seconds"] = stdio
+    results["environment"] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeats": repeats,
+    }
+    return results
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], comparison: Comparison):
+    """Compare import, boot and readiness times and RSS against the baseline"""
+    metrics = {
+        "server_import_seconds": lambda r: r["server_import_seconds"],
+        "boot.construct_seconds": lambda r: r["boot"]["construct_seconds"],
+        "boot.list_tools_seconds": lambda r: r["boot"]["list_tools_seconds"],
+        "boot.boot_seconds": lambda r: r["boot"]["boot_seconds"],
+        "boot.rss_bytes": lambda r: r["boot"]["rss_bytes"],
+        "stdio_tools_list_seconds": lambda r: r["stdio_tools_list_seconds"],
+    }
+    for module in baseline.get("module_import_seconds", {}):
+        metrics[f"import {module}"] = lambda r, m=module: r["module_import_seconds"].get(m)
+
+    for name, value in metrics.items():
+        try:
+            before, after = value(baseline), value(current)
+        except KeyError:
+            continue
+        bytes_metric = name.endswith("_bytes")
+        comparison.check(name, before, after, MIN_DELTA_BYTES if bytes_metric else MIN_DELTA_SECONDS,
+                         baseline.get("samples", {}).get(name), current.get("samples", {}).get(name),
+                         # RSS is reported as the largest of the runs
+                         statistic=max if bytes_metric else statistics.median)
+
+
+def report(results: Dict[str, Any]):
+    boot = results["boot"]
+    print(f"server.py cold import: {results['server_import_seconds'] * 1000:.1f} ms")
+    print("  self time by package:")
+    for name, seconds in results["server_import_breakdown"].items():
+        print(f"    {name:<50} {seconds * 1000:8.1f} ms")
+    print("tool module imports (after server.py):")
+    for module, seconds in results["module_import_seconds"].items():
+        print(f"  {module:<60} {seconds * 1000:8.1f} ms")
+    print(f"construct: {boot['construct_seconds'] * 1000:.1f} ms, "
+          f"tools/list: {boot['list_tools_seconds'] * 1000:.1f} ms ({boot['tools']} tools), "
+          f"boot: {boot['boot_seconds'] * 1000:.1f} ms, RSS: {boot['rss_bytes'] / 2**20:.1f} MiB")
+    print(f"stdio spawn to tools/list: {results['stdio_tools_list_seconds'] * 1000:.1f} ms")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--repeats", type=int, default=5, help="cold runs per measurement (median is kept)")
+    parser.add_argument("--breakdown", type=int, default=15, help="packages listed in the import breakdown")
+    add_arguments(parser, DEFAULT_BASELINE)
+    args = parser.parse_args(argv)
+
+    results = measure(args.repeats, args.breakdown)
+    report(results)
+    return finish(results, args, compare, "startup metrics")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+Per-tool benchmark
+
+Calls every registered tool end to end (MCP client, middleware, tool, GitHub
+client) against the local mock GitHub API and measures per call:
+- Latency percentiles (p50, p90, p99) over timed iterations
+- Upstream GitHub requests, cache lookups and response bytes, from the
+  slow-call recorder
+- Python allocations (peak and retained bytes, net blocks) with tracemalloc,
+  in separate untimed iterations
+- Success rate, with a sample error for failing tools
+
+Tools that mutate state get unmeasured setup calls (a branch to delete, a
+pull request to merge) and fresh names per iteration. Diagnostics tools
+that sleep or toggle tracemalloc are skipped. Results are compared against
+a stored baseline tool by tool.
+
+Usage:
+    python benchmarks/tool_calls.py                          # measure and compare
+    python benchmarks/tool_calls.py --tools "*issue*" --iterations 50
+    python benchmarks/tool_calls.py --latency fixed:20       # mock GitHub latency
+    python benchmarks/tool_calls.py --save-baseline
+"""
+
+import argparse
+import asyncio
+import fnmatch
+import gc
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+BENCHMARKS = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCHMARKS / "baselines" / "tool_calls.json"
+sys.path.insert(0, str(PACKAGE_ROOT))
+sys.path.insert(0, str(BENCHMARKS))
+
+from regression import Comparison, add_arguments, finish  # noqa: E402
+
+OWNER, REPO = "acme", "widgets"
+
+# Values for required parameters, by parameter name
+DEFAULT_ARGUMENTS = {
+    "owner": OWNER,
+    "repo": REPO,
+    "org": OWNER,
+    "username": "octocat",
+    "issue_number": 1,
+    "pull_number": 1,
+    "run_id": 1,
+    "workflow_id": "1",
+    "workflow_file": "ci.yml",
+    "deployment_id": 1,
+    "hook_id": 1,
+    "sha": "main",
+    "ref": "main",
+    "branch_name": "main",
+    "path": "README.md",
+    "title": "Benchmark",
+    "body": "Benchmark body",
+    "message": "Benchmark commit",
+    "content": "benchmark\n",
+    "state": "success",
+    "labels": ["bug"],
+    "assignees": ["octocat"],
+    "reviewers": ["bench-reviewer"],
+    "collaborators": ["octocat"],
+    "members": ["octocat"],
+    "share_with": ["octocat"],
+    "repositories": [f"{OWNER}/{REPO}"],
+    "events": ["push"],
+    "local_path": "/tmp/benchmark",
+}
+
+TYPE_DEFAULTS = {"string": "benchmark", "integer": 1, "number": 1, "boolean": True, "array": [], "object": {}}
+
+# Tools whose calls would distort the run rather than measure a tool
+SKIPPED = {
+    "profile_event_loop": "samples the event loop for its duration",
+    "take_memory_snapshot": "starts tracemalloc",
+    "compare_memory_snapshots": "needs tracemalloc snapshots",
+    "stop_memory_tracing": "stops tracemalloc",
+}
+
+
+class Bench:
+    """Benchmark context passed to setup functions"""
+
+    def __init__(self, client, github_url: str):
+        self.client = client
+        self.github_url = github_url
+
+    async def call(self, tool: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        result = await self.client.call_tool(tool, arguments, raise_on_error=False)
+        return result.structured_content or {}
+
+    async def github(self, method: str, path: str, **kwargs) -> Any:
+        import httpx
+
+        async with httpx.AsyncClient(base_url=self.github_url,
+                                     headers={"Authorization": "token benchmark"}) as client:
+            response = await client.request(method, path, **kwargs)
+            return response.json() if response.content else None
+
+
+Setup = Callable[[Bench, int], Awaitable[Dict[str, Any]]]
+
+
+async def new_branch(bench: Bench, i: int, prefix: str) -> Dict[str, Any]:
+    name = f"bench/{prefix}-{i}"
+    await bench.call("create_branch", {"owner": OWNER, "repo": REPO, "branch_name": name})
+    return {"branch_name": name}
+
+
+async def new_file(bench: Bench, i: int, prefix: str) -> Dict[str, Any]:
+    path = f"bench/{prefix}-{i}.txt"
+    await bench.call("create_or_update_file", {"owner": OWNER, "repo": REPO, "path": path,
+                                               "content": "benchmark\n", "message": "Benchmark setup"})
+    return {"path": path}
+
+
+async def new_head(bench: Bench, i: int, prefix: str = "pr") -> Dict[str, Any]:
+    return {"head": (await new_branch(bench, i, prefix))["branch_name"], "base": "main"}
+
+
+async def new_pull(bench: Bench, i: int, prefix: str) -> Dict[str, Any]:
+    result = await bench.call("create_pull_request", {"owner": OWNER, "repo": REPO, "title": "Benchmark",
+                                                      **await new_head(bench, i, prefix)})
+    return {"pull_number": result["pull_request"]["number"]}
+
+
+async def new_run(bench: Bench, i: int) -> Dict[str, Any]:
+    base = f"/repos/{OWNER}/{REPO}/actions"
+    await bench.github("POST", f"{base}/workflows/1/dispatches", json={"ref": "main"})
+    runs = await bench.github("GET", f"{base}/runs", params={"status": "queued", "per_page": 1})
+    return {"run_id": runs["workflow_runs"][0]["id"]}
+
+
+async def new_repository(bench: Bench, i: int) -> Dict[str, Any]:
+    name = f"bench-delete-{i}"
+    result = await bench.call("create_repository", {"name": name})
+    return {"owner": result["repository"]["owner"]["login"], "repo": name, "confirm": True}
+
+
+async def new_deployment(bench: Bench, i: int) -> Dict[str, Any]:
+    result = await bench.call("create_deployment", {"owner": OWNER, "repo": REPO, "ref": "main"})
+    return {"deployment_id": result["deployment"]["id"]}
+
+
+async def new_webhook(bench: Bench, i: int) -> Dict[str, Any]:
+    result = await bench.call("create_webhook", {"owner": OWNER, "repo": REPO,
+                                                 "config": {"url": f"https://hooks.example.com/delete-{i}"}})
+    return {"hook_id": result["webhook"]["id"]}
+
+
+# Per-tool arguments (by iteration) and setup, on top of DEFAULT_ARGUMENTS
+CASES: Dict[str, Dict[str, Any]] = {
+    "create_repository": {"arguments": lambda i: {"name": f"bench-repo-{i}"}},
+    "delete_repository": {"setup": new_repository},
+    "update_repository": {"arguments": lambda i: {"description": f"Benchmark {i}"}},
+    "create_or_update_file": {"arguments": lambda i: {"path": f"bench/create-{i}.txt"}},
+    "delete_file": {"setup": lambda bench, i: new_file(bench, i, "delete")},
+    "move_file": {"setup": lambda bench, i: new_file(bench, i, "move"),
+                  "arguments": lambda i: {"new_path": f"bench/moved-{i}.txt"}},
+    "create_branch": {"arguments": lambda i: {"branch_name": f"bench/create-{i}"}},
+    "delete_branch": {"setup": lambda bench, i: new_branch(bench, i, "delete")},
+    "create_pull_request": {"setup": lambda bench, i: new_head(bench, i)},
+    "merge_pull_request": {"setup": lambda bench, i: new_pull(bench, i, "merge")},
+    "close_pull_request": {"setup": lambda bench, i: new_pull(bench, i, "close")},
+    "cancel_workflow_run": {"setup": new_run},
+    "create_deployment_status": {"arguments": lambda i: {"state": "success"}},
+    "delete_deployment": {"setup": new_deployment},
+    "create_webhook": {"arguments": lambda i: {"config": {"url": f"https://hooks.example.com/create-{i}"}}},
+    "delete_webhook": {"setup": new_webhook},
+    "purge_cache": {"arguments": lambda i: {"owner": OWNER, "repo": REPO}},
+    "create_organization_webhook": {"arguments": lambda i: {"name": "web",
+                                                            "config": {"url": f"https://hooks.example.com/org-{i}"}}},
+}
+
+
+def percentile(samples: List[float], percent: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(samples)
+    rank = max(1, min(len(ordered), round(len(ordered) * percent / 100 + 0.5)))
+    return ordered[rank - 1]
+
+
+def required_arguments(tool) -> Dict[str, Any]:
+    """Arguments for the required parameters of a tool's input schema"""
+    schema = tool.inputSchema
+    arguments = {}
+    for name in schema.get("required", []):
+        kind = schema["properties"][name].get("type", "string")
+        value = DEFAULT_ARGUMENTS.get(name, TYPE_DEFAULTS.get(kind, "benchmark"))
+        # Identifiers are strings in some tools and integers in others
+        arguments[name] = str(value) if kind == "string" and isinstance(value, int) else value
+    return arguments
+
+
+class ToolBenchmark:
+    """Measure one tool"""
+
+    def __init__(self, bench: Bench, recorder, tool, iterations: int, alloc_iterations: int, warmup: int):
+        self.bench = bench
+        self.recorder = recorder
+        self.tool = tool
+        self.iterations = iterations
+        self.alloc_iterations = alloc_iterations
+        self.warmup = warmup
+        self.case = CASES.get(tool.name, {})
+        self.iteration = 0
+
+    async def _prepare(self) -> Dict[str, Any]:
+        i = self.iteration
+        self.iteration += 1
+        arguments = required_arguments(self.tool)
+        if "arguments" in self.case:
+            arguments.update(self.case["arguments"](i))
+        if "setup" in self.case:
+            arguments.update(await self.case["setup"](self.bench, i))
+        return arguments
+
+    async def _call(self, arguments: Dict[str, Any]):
+        return await self.bench.client.call_tool(self.tool.name, arguments, raise_on_error=False)
+
+    def _upstream(self) -> Dict[str, Any]:
+        call = self.recorder.calls[-1] if self.recorder.calls else {"upstream": []}
+        github = [item for item in call["upstream"] if item["kind"] == "github"]
+        cache = [item for item in call["upstream"] if item["kind"] == "cache"]
+        return {
+            "requests": len(github),
+            "bytes": sum(item.get("response_bytes", 0) for item in github),
+            "cache_lookups": len(cache),
+            "cache_hits": sum(item.get("status") == "hit" for item in cache),
+        }
+
+    async def run(self) -> Dict[str, Any]:
+        for _ in range(self.warmup):
+            await self._call(await self._prepare())
+
+        latencies, upstream, result_bytes = [], [], []
+        successes, errors = 0, []
+        for _ in range(self.iterations):
+            arguments = await self._prepare()
+            started = time.perf_counter()
+            result = await self._call(arguments)
+            latencies.append(time.perf_counter() - started)
+            upstream.append(self._upstream())
+            payload = result.structured_content or {}
+            result_bytes.append(sum(len(getattr(block, "text", "") or "") for block in result.content))
+            if not result.is_error and payload.get("success", True) is not False:
+                successes += 1
+            elif len(errors) < 1:
+                errors.append(str(payload.get("error") or payload.get("message") or result.content)[:200])
+
+        peaks, retained, blocks = [], [], []
+        tracemalloc.start()
+        try:
+            for _ in range(self.alloc_iterations):
+                arguments = await self._prepare()
+                gc.collect()
+                tracemalloc.reset_peak()
+                before, _ = tracemalloc.get_traced_memory()
+                before_blocks = sys.getallocatedblocks()
+                await self._call(arguments)
+                after, peak = tracemalloc.get_traced_memory()
+                blocks.append(sys.getallocatedblocks() - before_blocks)
+                peaks.append(peak - before)
+                retained.append(after - before)
+        finally:
+            tracemalloc.stop()
+
+        def median(values):
+            return percentile(values, 50) if values else 0
+
+        return {
+            "calls": self.iterations,
+            "success_rate": round(successes / self.iterations, 3) if self.iterations else None,
+            "error": errors[0] if errors else None,
+            "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+            "p90_ms": round(percentile(latencies, 90) * 1000, 3),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+            "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3),
+            "upstream_requests": round(sum(item["requests"] for item in upstream) / len(upstream), 2),
+            "upstream_bytes": round(sum(item["bytes"] for item in upstream) / len(upstream)),
+            "cache_lookups": round(sum(item["cache_lookups"] for item in upstream) / len(upstream), 2),
+            "cache_hits": round(sum(item["cache_hits"] for item in upstream) / len(upstream), 2),
+            "result_bytes": round(sum(result_bytes) / len(result_bytes)),
+            "alloc_peak_bytes": median(peaks),
+            "alloc_retained_bytes": median(retained),
+            "alloc_net_blocks": median(blocks),
+            "latency_samples_ms": [round(seconds * 1000, 3) for seconds in latencies],
+            "alloc_peak_samples": peaks,
+        }
+
+
+def start_mock(*options: str) -> Tuple[subprocess.Popen, str]:
+    """Run the mock GitHub API in its own process so it does not share the GIL or tracemalloc
+
+    ``options`` are extra mock_github.py arguments; later ones override the defaults.
+    """
+    command = [sys.executable, str(BENCHMARKS / "mock_github.py"), "--port", "0",
+               "--rate-limit", "1000000", *options]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    if not line.startswith("Mock GitHub API on "):
+        process.kill()
+        raise RuntimeError("Mock GitHub API did not start")
+    return process, line.rsplit(" ", 1)[-1].strip()
+
+
+async def measure(args, github_url: str) -> Dict[str, Any]:
+    from fastmcp import Client
+
+    import server
+    from src.agent_builder_github_mcp.utils import GitHubMCPConfig
+
+    config = GitHubMCPConfig(
+        github_token="benchmark",
+        github_api_base_url=github_url,
+        github_rate_limit=1_000_000,
+        enable_response_cache=args.cache,
+        log_level="CRITICAL",
+        # Keep every call in the slow-call recorder to read its upstream activity
+        slow_call_threshold=1e-9,
+        slow_call_buffer_size=16,
+    )
+    instance = server.AgentBuilderGitHubMCP(config)
+    recorder = instance.diagnostics_tools.slow_call_recorder
+
+    results: Dict[str, Any] = {}
+    skipped: Dict[str, str] = {}
+    async with Client(instance.get_mcp_instance()) as client:
+        bench = Bench(client, github_url)
+        tools = sorted(await client.list_tools(), key=lambda tool: tool.name)
+        for tool in tools:
+            if args.tools and not any(fnmatch.fnmatchcase(tool.name, pattern) for pattern in args.tools):
+                continue
+            if tool.name in SKIPPED:
+                skipped[tool.name] = SKIPPED[tool.name]
+                continue
+            results[tool.name] = await ToolBenchmark(bench, recorder, tool, args.iterations,
+                                                     args.alloc_iterations, args.warmup).run()
+            print(f"  {tool.name:<34} p50 {results[tool.name]['p50_ms']:8.2f} ms", file=sys.stderr)
+    return {"tools": results, "skipped": skipped}
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], comparison: Comparison, args):
+    """Compare latency, upstream requests, allocations and success rate tool by tool"""
+    for tool, before in baseline.get("tools", {}).items():
+        after = current["tools"].get(tool)
+        if after is None:
+            continue
+        latencies = before.get("latency_samples_ms"), after.get("latency_samples_ms")
+        comparison.check(f"{tool}.p50_ms", before.get("p50_ms"), after.get("p50_ms"), args.min_delta_ms,
+                         *latencies, statistic=lambda samples: percentile(samples, 50))
+        comparison.check(f"{tool}.p99_ms", before.get("p99_ms"), after.get("p99_ms"), args.min_delta_ms,
+                         *latencies, statistic=lambda samples: percentile(samples, 99))
+        comparison.count(f"{tool}.upstream_requests", before.get("upstream_requests"),
+                         after.get("upstream_requests"), args.min_delta_requests)
+        comparison.check(f"{tool}.alloc_peak_bytes", before.get("alloc_peak_bytes"), after.get("alloc_peak_bytes"),
+                         args.min_delta_bytes, before.get("alloc_peak_samples"), after.get("alloc_peak_samples"),
+                         statistic=lambda samples: percentile(samples, 50))
+        # Any drop in success rate is a regression
+        comparison.count(f"{tool}.failure_rate", 1 - before.get("success_rate", 0),
+                         1 - after.get("success_rate", 0), 0)
+
+
+def report(results: Dict[str, Any]):
+    print(f"{'tool':<34} {'p50 ms':>9} {'p99 ms':>9} {'reqs':>5} {'up KiB':>8} "
+          f"{'peak KiB':>9} {'kept KiB':>9} {'ok':>5}")
+    for name, row in results["tools"].items():
+        print(f"{name:<34} {row['p50_ms']:>9.2f} {row['p99_ms']:>9.2f} {row['upstream_requests']:>5.1f} "
+              f"{row['upstream_bytes'] / 1024:>8.1f} {row['alloc_peak_bytes'] / 1024:>9.1f} "
+              f"{row['alloc_retained_bytes'] / 1024:>9.1f} {row['success_rate']:>5.0%}")
+    failing = {name: row["error"] for name, row in results["tools"].items() if row["success_rate"] < 1}
+    if failing:
+        print(f"{len(failing)} tools did not succeed on every call:")
+        for name, error in failing.items():
+            print(f"  {name}: {error}")
+    for name, reason in results["skipped"].items():
+        print(f"skipped {name}: {reason}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--tools", nargs="*", help="only tools matching these patterns")
+    parser.add_argument("--iterations", type=int, default=20, help="timed calls per tool")
+    parser.add_argument("--alloc-iterations", type=int, default=5, help="calls per tool traced for allocations")
+    parser.add_argument("--warmup", type=int, default=2, help="untimed calls per tool before measuring")
+    parser.add_argument("--latency", default="none", help="mock GitHub latency spec (see mock_github.py)")
+    parser.add_argument("--cache", action="store_true", help="enable the GitHub response cache")
+    add_arguments(parser, DEFAULT_BASELINE)
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="latency changes below this are noise")
+    parser.add_argument("--min-delta-bytes", type=int, default=64 * 1024,
+                        help="allocation changes below this are noise")
+    parser.add_argument("--min-delta-requests", type=float, default=0.1,
+                        help="increases in upstream requests per call below this are tolerated")
+    args = parser.parse_args(argv)
+
+    mock, github_url = start_mock("--latency", args.latency)
+    try:
+        results = asyncio.run(measure(args, github_url))
+    finally:
+        mock.terminate()
+        mock.wait()
+    results["environment"] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "iterations": args.iterations,
+        "alloc_iterations": args.alloc_iterations,
+        "latency": args.latency,
+        "cache": args.cache,
+    }
+    report(results)
+    return finish(results, args, lambda current, baseline, comparison: compare(current, baseline, comparison, args),
+                  "tool metrics", show_all=False)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,56 +21,95 @@ Features:
 import asyncio
 import logging
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 
 import httpx
 from fastmcp import FastMCP
 from pydantic import BaseModel, Field
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
 
 # Import our custom modules
-from src.agent_builder_github_mcp.tools.repository import RepositoryTools
-from src.agent_builder_github_mcp.tools.issue import IssueTools
-from src.agent_builder_github_mcp.tools.pull_request import PullRequestTools
-from src.agent_builder_github_mcp.tools.branch import BranchTools
-from src.agent_builder_github_mcp.tools.commit import CommitTools
-from src.agent_builder_github_mcp.tools.action import ActionTools
-from src.agent_builder_github_mcp.tools.security import SecurityTools
-from src.agent_builder_github_mcp.tools.user import UserTools
-from src.agent_builder_github_mcp.tools.organization import OrganizationTools
-from src.agent_builder_github_mcp.tools.deployment import DeploymentTools
-from src.agent_builder_github_mcp.tools.file_sync import FileSyncTools
-from src.agent_builder_github_mcp.tools.collaboration import CollaborationTools
-from src.agent_builder_github_mcp.tools.analytics import AnalyticsTools
-from src.agent_builder_github_mcp.tools.webhook import WebhookTools
-from src.agent_builder_github_mcp.integrations.neon_db import NeonDBTools
-from src.agent_builder_github_mcp.integrations.openrouter import OpenRouterTools
-from src.agent_builder_github_mcp.integrations.claude_code import ClaudeCodeTools
-from src.agent_builder_github_mcp.integrations.integration import IntegrationTools
+from src.agent_builder_github_mcp.middleware import (
+    CacheInvalidationMiddleware,
+    CallAttributionMiddleware,
+    MetricsMiddleware,
+    ReadinessMiddleware,
+    SlowCallMiddleware,
+    TracingMiddleware,
+    WorkloadCaptureMiddleware,
+)
+from src.agent_builder_github_mcp.tool_manifest import ToolManifest
+from src.agent_builder_github_mcp.tool_registry import ToolGroupRegistry
+from src.agent_builder_github_mcp.workers import WorkerSupervisor
 from src.agent_builder_github_mcp.utils import (
+    CacheManager,
     GitHubMCPConfig,
     Logger,
+    MetricsCollector,
     RateLimiter,
     ErrorHandler,
     AuthManager,
     ValidationHelper,
 )
 
-# Configure logging
-logger = Logger.get_logger(__name__)
+from src.agent_builder_github_mcp.utils.cassette import cassette_transport, close_cassettes
+from src.agent_builder_github_mcp.utils.distributed_quota import (
+    DistributedRateLimiter,
+    PostgresQuotaLedger,
+    quota_key_for_token,
+)
+from src.agent_builder_github_mcp.utils.loop_monitor import EventLoopMonitor
+from src.agent_builder_github_mcp.utils.openmetrics import (
+    CONTENT_TYPE as OPENMETRICS_CONTENT_TYPE,
+    MetricsServer,
+    render_openmetrics,
+)
+from src.agent_builder_github_mcp.utils.readiness import IntegrationReadiness
+from src.agent_builder_github_mcp.utils.shared_state import SharedState
+from src.agent_builder_github_mcp.utils.tracing import SpanExporter, tracer
+from src.agent_builder_github_mcp.utils.workload import WorkloadCapture
+
+# Configure logging; named explicitly since run as a script __name__ is "__main__"
+logger = Logger.get_logger("server")
+
+# Integrations initialised at startup: name -> tool group whose calls wait for it
+INTEGRATION_GROUPS = {
+    "neon_db": "neon_db_tools",
+    "openrouter": "openrouter_tools",
+    "claude_code": "claude_code_tools",
+    "file_sync": "file_sync_tools",
+}
 
 class AgentBuilderGitHubMCP:
     """Main GitHub MCP Server for Agent Builder Platform"""
     
-    def __init__(self, config: GitHubMCPConfig):
-        """Initialize the GitHub MCP Server"""
+    def __init__(self, config: GitHubMCPConfig, shared_state: Optional[SharedState] = None):
+        """Initialize the GitHub MCP Server
+        
+        Args:
+            config: Server configuration
+            shared_state: State shared with other worker processes, if any
+        """
         self.config = config
-        self.mcp = FastMCP("Agent Builder GitHub Integration")
+        self.shared_state = shared_state
+        Logger.configure(
+            config.log_level, config.log_levels, config.log_format != "text",
+            config.log_info_rate, config.log_info_sample_ratio
+        )
+        self.mcp = FastMCP("Agent Builder GitHub Integration", lifespan=self._lifespan)
         
         # Initialize components
-        self.rate_limiter = RateLimiter(config.github_rate_limit)
+        self.rate_limiter = self._create_rate_limiter()
         self.auth_manager = AuthManager(config.github_token)
         self.error_handler = ErrorHandler(self.auth_manager)
+        self.readiness = IntegrationReadiness(init_timeout=config.integration_init_timeout)
+        self.loop_monitor: Optional[EventLoopMonitor] = None
+        self.metrics_server: Optional[MetricsServer] = None
+        self._background_tasks: List[asyncio.Task] = []
+        self._started = False
         
         # Initialize tool modules
         self._initialize_tools()
@@ -78,235 +117,171 @@ class AgentBuilderGitHubMCP:
         # Register tools
         self._register_tools()
         
+        # Register middleware
+        self._register_middleware()
+        
+        # Register HTTP routes
+        self._register_routes()
+        
         logger.info("GitHub MCP Server initialized successfully")
     
+    def _create_rate_limiter(self) -> RateLimiter:
+        """Rate limiter for the GitHub quota: fleet-wide, shared by workers, or local"""
+        if self.config.distributed_quota:
+            dsn = self.config.quota_database_url or self.config.neon_db_url
+            if dsn:
+                ledger = PostgresQuotaLedger(dsn, quota_key_for_token(self.config.github_token),
+                                             self.config.github_rate_limit)
+                logger.info("GitHub quota shared through the Postgres ledger (key %s)", ledger.quota_key)
+                return DistributedRateLimiter(ledger, self.config.quota_lease_size,
+                                              self.config.quota_fallback_limit)
+            logger.warning("Distributed quota enabled without a database URL; limiting locally")
+        if self.shared_state is not None:
+            return self.shared_state.rate_limiter
+        return RateLimiter(self.config.github_rate_limit)
+    
     def _initialize_tools(self):
-        """Initialize all tool modules"""
+        """Declare tool modules; groups are imported and created on first use"""
         try:
-            # Core GitHub tools
-            self.repository_tools = RepositoryTools(
-                self.config, self.rate_limiter, self.error_handler
-            )
-            self.issue_tools = IssueTools(
-                self.config, self.rate_limiter, self.error_handler
-            )
-            self.pr_tools = PullRequestTools(
-                self.config, self.rate_limiter, self.error_handler
-            )
-            self.branch_tools = BranchTools(
-                self.config, self.rate_limiter, self.error_handler
-            )
-            self.commit_tools = CommitTools(
-                self.config, self.rate_limiter, self.error_handler
-            )
-            self.action_tools = ActionTools(
-                self.config, self.rate_limiter, self.error_handler
-            )
-            self.security_tools = SecurityTools(
-                self.config, self.rate_limiter, self.error_handler
-            )
-            self.user_tools = UserTools(
-                self.config, self.rate_limiter, self.error_handler
-            )
-            self.org_tools = OrganizationTools(
-                self.config, self.rate_limiter, self.error_handler
-            )
-            self.deployment_tools = DeploymentTools(
-                self.config, self.rate_limiter, self.error_handler
-            )
+            self.tool_groups = ToolGroupRegistry(self.config, self.rate_limiter, self.error_handler)
+            self.tool_groups.load_eager()
+            self.cache_manager = CacheManager.for_config(self.config)
+            if self.shared_state is not None:
+                self.cache_manager.shared_generations = self.shared_state.cache_generations
             
-            # Enhanced tools
-            self.file_sync_tools = FileSyncTools(
-                self.config, self.rate_limiter, self.error_handler
-            )
-            self.collaboration_tools = CollaborationTools(
-                self.config, self.rate_limiter, self.error_handler
-            )
-            self.analytics_tools = AnalyticsTools(
-                self.config, self.rate_limiter, self.error_handler
-            )
-            self.webhook_tools = WebhookTools(
-                self.config, self.rate_limiter, self.error_handler
-            )
+            # Account for in-memory server state of the groups that are loaded
+            def state(group: str, attribute: str):
+                return lambda: getattr(self.tool_groups.peek(group), attribute, {})
             
-            # Integration tools
-            self.neon_db_tools = NeonDBTools(
-                self.config, self.rate_limiter, self.error_handler
-            )
-            self.openrouter_tools = OpenRouterTools(
-                self.config, self.rate_limiter, self.error_handler
-            )
-            self.claude_code_tools = ClaudeCodeTools(
-                self.config, self.rate_limiter, self.error_handler
-            )
-            self.integration_tools = IntegrationTools(
-                self.config, self.rate_limiter, self.error_handler
-            )
+            memory = self.diagnostics_tools.memory_tracker
+            memory.register("integration.deployment_status", state("integration_tools", "deployment_status"))
+            memory.register("integration.ci_cd_pipelines", state("integration_tools", "ci_cd_pipelines"))
+            memory.register("collaboration.active_sessions", state("collaboration_tools", "active_sessions"))
+            memory.register("file_sync.sync_status", state("file_sync_tools", "sync_status"))
+            memory.register("cache.github", lambda: self.cache_manager.cache)
+            memory.register("metrics.histograms", lambda: self.diagnostics_tools.metrics.histograms)
             
             logger.info("All tool modules initialized successfully")
             
         except Exception as e:
-            logger.error(f"Failed to initialize tool modules: {e}")
+            logger.error("Failed to initialize tool modules: %s", e)
             raise
     
+    def __getattr__(self, name: str) -> Any:
+        """Resolve tool group attributes (e.g. self.issue_tools), loading them on first use"""
+        tool_groups = self.__dict__.get("tool_groups")
+        if tool_groups is not None and name in tool_groups:
+            return tool_groups.get(name)
+        raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}")
+    
     def _register_tools(self):
         """Register all MCP tools"""
         try:
-            # Repository Management Tools
-            self.mcp.tool(self.repository_tools.create_repository)
-            self.mcp.tool(self.repository_tools.fork_repository)
-            self.mcp.tool(self.repository_tools.delete_repository)
-            self.mcp.tool(self.repository_tools.get_repository)
-            self.mcp.tool(self.repository_tools.list_repositories)
-            self.mcp.tool(self.repository_tools.update_repository)
-            self.mcp.tool(self.repository_tools.get_repository_contents)
-            self.mcp.tool(self.repository_tools.create_or_update_file)
-            self.mcp.tool(self.repository_tools.delete_file)
-            self.mcp.tool(self.repository_tools.move_file)
-            
-            # Branch Management Tools
-            self.mcp.tool(self.branch_tools.create_branch)
-            self.mcp.tool(self.branch_tools.delete_branch)
-            self.mcp.tool(self.branch_tools.get_branch)
-            self.mcp.tool(self.branch_tools.list_branches)
-            self.mcp.tool(self.branch_tools.update_branch_protection)
-            
-            # Commit Tools
-            self.mcp.tool(self.commit_tools.get_commit)
-            self.mcp.tool(self.commit_tools.list_commits)
-            self.mcp.tool(self.commit_tools.get_commit_diff)
-            self.mcp.tool(self.commit_tools.create_commit_status)
-            self.mcp.tool(self.commit_tools.get_file_history)
-            
-            # Issue Management Tools
-            self.mcp.tool(self.issue_tools.create_issue)
-            self.mcp.tool(self.issue_tools.get_issue)
-            self.mcp.tool(self.issue_tools.update_issue)
-            self.mcp.tool(self.issue_tools.list_issues)
-            self.mcp.tool(self.issue_tools.close_issue)
-            self.mcp.tool(self.issue_tools.add_issue_comment)
-            self.mcp.tool(self.issue_tools.get_issue_comments)
-            self.mcp.tool(self.issue_tools.label_issue)
-            self.mcp.tool(self.issue_tools.assign_issue)
-            self.mcp.tool(self.issue_tools.create_issue_template)
-            
-            # Pull Request Tools
-            self.mcp.tool(self.pr_tools.create_pull_request)
-            self.mcp.tool(self.pr_tools.get_pull_request)
-            self.mcp.tool(self.pr_tools.update_pull_request)
-            self.mcp.tool(self.pr_tools.list_pull_requests)
-            self.mcp.tool(self.pr_tools.merge_pull_request)
-            self.mcp.tool(self.pr_tools.close_pull_request)
-            self.mcp.tool(self.pr_tools.add_pr_comment)
-            self.mcp.tool(self.pr_tools.request_pr_review)
-            self.mcp.tool(self.pr_tools.get_pr_diff)
-            self.mcp.tool(self.pr_tools.get_pr_files)
-            
-            # GitHub Actions Tools
-            self.mcp.tool(self.action_tools.list_workflows)
-            self.mcp.tool(self.action_tools.get_workflow)
-            self.mcp.tool(self.action_tools.run_workflow)
-            self.mcp.tool(self.action_tools.list_workflow_runs)
-            self.mcp.tool(self.action_tools.get_workflow_run)
-            self.mcp.tool(self.action_tools.cancel_workflow_run)
-            self.mcp.tool(self.action_tools.get_workflow_run_logs)
-            self.mcp.tool(self.action_tools.create_workflow_dispatch)
-            
-            # Security Tools
-            self.mcp.tool(self.security_tools.get_code_scanning_alerts)
-            self.mcp.tool(self.security_tools.get_secret_scanning_alerts)
-            self.mcp.tool(self.security_tools.get_dependabot_alerts)
-            self.mcp.tool(self.security_tools.create_security_advisory)
-            self.mcp.tool(self.security_tools.enable_code_scanning)
-            
-            # User and Organization Tools
-            self.mcp.tool(self.user_tools.get_user_profile)
-            self.mcp.tool(self.user_tools.update_user_profile)
-            self.mcp.tool(self.user_tools.get_user_repositories)
-            self.mcp.tool(self.user_tools.get_user_gists)
-            self.mcp.tool(self.org_tools.get_organization)
-            self.mcp.tool(self.org_tools.list_organization_repos)
-            self.mcp.tool(self.org_tools.get_organization_members)
-            self.mcp.tool(self.org_tools.create_organization_webhook)
-            
-            # Deployment Tools
-            self.mcp.tool(self.deployment_tools.create_deployment)
-            self.mcp.tool(self.deployment_tools.get_deployment_status)
-            self.mcp.tool(self.deployment_tools.create_deployment_status)
-            self.mcp.tool(self.deployment_tools.get_deployments)
-            self.mcp.tool(self.deployment_tools.delete_deployment)
-            
-            # File Synchronization Tools
-            self.mcp.tool(self.file_sync_tools.sync_repository_to_cloud)
-            self.mcp.tool(self.file_sync_tools.sync_cloud_to_repository)
-            self.mcp.tool(self.file_sync_tools.get_sync_status)
-            self.mcp.tool(self.file_sync_tools.conflict_resolution)
-            
-            # Collaboration Tools
-            self.mcp.tool(self.collaboration_tools.enable_realtime_collaboration)
-            self.mcp.tool(self.collaboration_tools.get_collaboration_status)
-            self.mcp.tool(self.collaboration_tools.share_repository)
-            self.mcp.tool(self.collaboration_tools.create_shared_workspace)
-            
-            # Analytics Tools
-            self.mcp.tool(self.analytics_tools.get_repository_analytics)
-            self.mcp.tool(self.analytics_tools.get_commit_analytics)
-            self.mcp.tool(self.analytics_tools.get_contributor_analytics)
-            self.mcp.tool(self.analytics_tools.get_project_health_metrics)
-            
-            # Webhook Tools
-            self.mcp.tool(self.webhook_tools.create_webhook)
-            self.mcp.tool(self.webhook_tools.list_webhooks)
-            self.mcp.tool(self.webhook_tools.update_webhook)
-            self.mcp.tool(self.webhook_tools.delete_webhook)
-            self.mcp.tool(self.webhook_tools.get_webhook_events)
-            
-            # Integration Tools
-            self.mcp.tool(self.neon_db_tools.store_repository_metadata)
-            self.mcp.tool(self.neon_db_tools.get_repository_metadata)
-            self.mcp.tool(self.neon_db_tools.sync_repository_to_db)
-            
-            self.mcp.tool(self.openrouter_tools.generate_code_review)
-            self.mcp.tool(self.openrouter_tools.analyze_repository)
-            self.mcp.tool(self.openrouter_tools.generate_pr_description)
-            
-            self.mcp.tool(self.claude_code_tools.analyze_codebase)
-            self.mcp.tool(self.claude_code_tools.refactor_code)
-            self.mcp.tool(self.claude_code_tools.generate_tests)
-            
-            self.mcp.tool(self.integration_tools.trigger_automated_deployment)
-            self.mcp.tool(self.integration_tools.monitor_deployment)
-            self.mcp.tool(self.integration_tools.rollback_deployment)
-            self.mcp.tool(self.integration_tools.setup_continuous_integration)
+            manifest = None
+            if self.config.enable_tool_manifest:
+                manifest = ToolManifest(self.config.tool_manifest_path)
+            self.tool_groups.register(self.mcp, manifest)
             
             logger.info("All MCP tools registered successfully")
             
         except Exception as e:
-            logger.error(f"Failed to register MCP tools: {e}")
+            logger.error("Failed to register MCP tools: %s", e)
             raise
     
+    def _register_middleware(self):
+        """Register MCP middleware applied to every tool call"""
+        self.metrics = MetricsCollector.get_collector()
+        
+        # Tracing runs outermost so the tool span covers the other middleware
+        tracer.configure(
+            SpanExporter(file_path=self.config.trace_export_path,
+                         otlp_endpoint=self.config.trace_otlp_endpoint),
+            self.config.trace_sample_ratio,
+        )
+        self.mcp.add_middleware(TracingMiddleware())
+        self.mcp.add_middleware(CallAttributionMiddleware())
+        # Capture ahead of readiness gating so rejected calls are replayed too
+        self.workload_capture = WorkloadCapture(self.config.workload_capture_path,
+                                                self.config.workload_capture_max_bytes,
+                                                self.config.workload_capture_max_files)
+        if self.workload_capture.enabled:
+            self.mcp.add_middleware(WorkloadCaptureMiddleware(self.workload_capture))
+        self.mcp.add_middleware(MetricsMiddleware(self.metrics, self.tool_groups.tool_names()))
+        self.mcp.add_middleware(ReadinessMiddleware(
+            self.readiness, self._integration_tools(), self.config.integration_wait_timeout
+        ))
+        
+        if self.diagnostics_tools.slow_call_recorder.enabled:
+            self.mcp.add_middleware(SlowCallMiddleware(self.diagnostics_tools.slow_call_recorder))
+        
+        if self.config.enable_response_cache:
+            self.mcp.add_middleware(CacheInvalidationMiddleware(self.cache_manager))
+            logger.info("Response cache enabled with write invalidation")
+    
+    def _register_routes(self):
+        """Register custom HTTP routes served alongside the MCP HTTP transport"""
+        @self.mcp.custom_route("/metrics", methods=["GET"])
+        async def metrics_endpoint(request: Request) -> Response:
+            if self.config.worker_index is not None:
+                # A scrape of the shared socket would reach an arbitrary worker
+                return Response("Scrape each worker's metrics port (METRICS_PORT + worker index)\n",
+                                status_code=404, media_type="text/plain")
+            return Response(self.render_metrics(), media_type=OPENMETRICS_CONTENT_TYPE)
+        
+        @self.mcp.custom_route("/ready", methods=["GET"])
+        async def ready_endpoint(request: Request) -> JSONResponse:
+            return JSONResponse(
+                {"ready": self.readiness.all_ready, "integrations": self.readiness.status()},
+                status_code=200 if self.readiness.all_ready else 503,
+            )
+    
+    def render_metrics(self) -> str:
+        """Render server metrics in the OpenMetrics text format"""
+        cache_manager = self.cache_manager if self.config.enable_response_cache else None
+        labels = {"worker": str(self.config.worker_index)} if self.config.worker_index is not None else None
+        return render_openmetrics(self.metrics, cache_manager, self.rate_limiter, labels)
+    
     def get_mcp_instance(self) -> FastMCP:
         """Get the FastMCP instance"""
         return self.mcp
     
+    @asynccontextmanager
+    async def _lifespan(self, mcp: FastMCP):
+        """Run background services for as long as the MCP server is running"""
+        # Services started explicitly before serving are left to their caller
+        owner = not self._started
+        await self.start()
+        try:
+            yield {}
+        finally:
+            if owner:
+                await self.stop()
+    
     async def start(self):
-        """Start the GitHub MCP Server"""
+        """Start the GitHub MCP Server
+        
+        Runs in the FastMCP lifespan, so serving the MCP instance on any
+        transport starts the background services; calling it again is a no-op.
+        """
+        if self._started:
+            return
         try:
             logger.info("Starting Agent Builder GitHub MCP Server...")
             
             # Validate configuration
             await self._validate_configuration()
             
-            # Initialize integrations
-            await self._initialize_integrations()
+            # Initialize integrations concurrently; their tools wait until ready
+            self._background_tasks.append(self.readiness.start(self._integration_initializers()))
             
             # Start background services
             await self._start_background_services()
+            self._started = True
             
             logger.info("GitHub MCP Server started successfully")
             
         except Exception as e:
-            logger.error(f"Failed to start GitHub MCP Server: {e}")
+            logger.error("Failed to start GitHub MCP Server: %s", e)
             raise
     
     async def _validate_configuration(self):
@@ -325,46 +300,129 @@ class AgentBuilderGitHubMCP:
         if self.config.claude_code_path:
             logger.info("Claude Code CLI integration enabled")
         
+        if self.config.github_cassette_mode:
+            # Opens the recording or loads the replay now, so a bad mode or path fails startup
+            cassette_transport(self.config.github_cassette_mode, self.config.github_cassette_path,
+                               self.config.github_cassette_timing, self.config.workers > 1)
+            logger.info("GitHub cassette %s mode: %s", self.config.github_cassette_mode,
+                        self.config.github_cassette_path)
+        
         logger.info("Configuration validation completed")
     
-    async def _initialize_integrations(self):
-        """Initialize external integrations"""
-        # Initialize Neon DB
+    def _integration_initializers(self) -> Dict[str, Callable[[], Awaitable[Any]]]:
+        """Initializers of the configured external integrations"""
+        initializers = {}
         if self.config.neon_db_url and self.config.neon_db_token:
-            await self.neon_db_tools.initialize()
-            logger.info("Neon DB integration initialized")
-        
-        # Initialize OpenRouter
+            initializers["neon_db"] = lambda: self.neon_db_tools.initialize()
         if self.config.openrouter_api_key:
-            await self.openrouter_tools.initialize()
-            logger.info("OpenRouter API integration initialized")
-        
-        # Initialize Claude Code
+            initializers["openrouter"] = lambda: self.openrouter_tools.initialize()
         if self.config.claude_code_path:
-            await self.claude_code_tools.initialize()
-            logger.info("Claude Code CLI integration initialized")
-        
-        # Initialize file sync
+            initializers["claude_code"] = lambda: self.claude_code_tools.initialize()
         if self.config.cloud_ide_sync_path:
-            await self.file_sync_tools.initialize()
-            logger.info("Cloud IDE file sync integration initialized")
+            initializers["file_sync"] = lambda: self.file_sync_tools.initialize()
+        return initializers
+    
+    def _integration_tools(self) -> Dict[str, str]:
+        """Map tool names to the integration they depend on"""
+        return {
+            tool: integration
+            for integration, attribute in INTEGRATION_GROUPS.items()
+            if attribute in self.tool_groups
+            for tool in self.tool_groups.groups[attribute].tools
+        }
     
     async def _start_background_services(self):
         """Start background services"""
-        if self.config.enable_real_time_sync:
-            # Start real-time synchronization service
-            asyncio.create_task(self.file_sync_tools.start_realtime_sync())
-            logger.info("Real-time synchronization service started")
+        # Group services start with their tool group, on its first call
+        for attribute, service in self._group_services().items():
+            self.tool_groups.on_load(attribute, self._group_service_starter(service))
         
-        if self.config.enable_analytics:
-            # Start analytics collection service
-            asyncio.create_task(self.analytics_tools.start_analytics_collection())
-            logger.info("Analytics collection service started")
+        if self.config.loop_lag_interval > 0:
+            # Start event loop lag sampling
+            self.loop_monitor = EventLoopMonitor(
+                self.metrics, self.config.loop_lag_interval, self.config.loop_block_threshold
+            )
+            self.loop_monitor.start()
+            logger.info("Event loop lag monitor started")
+        
+        if self.config.memory_sample_interval > 0:
+            # Start periodic RSS and structure size sampling
+            self.diagnostics_tools.memory_tracker.start(self.config.memory_sample_interval,
+                                                        self.config.memory_sample_structure_bytes)
+            logger.info("Memory sampling started")
+        
+        if tracer.exporter.enabled:
+            # Start batched span export
+            tracer.exporter.start()
+            logger.info("Trace export started")
+        
+        if self.workload_capture.enabled:
+            # Start the background writer of captured tool calls
+            self.workload_capture.start()
+            logger.info("Workload capture to %s started", self.config.workload_capture_path)
         
+        if self.config.metrics_port:
+            # Start OpenMetrics sidecar for transports without an HTTP server
+            self.metrics_server = MetricsServer(
+                self.render_metrics, self.config.metrics_host, self.config.metrics_port
+            )
+            await self.metrics_server.start()
+            logger.info("Metrics endpoint listening on %s:%s/metrics", self.config.metrics_host, self.config.metrics_port)
+        
+    def _group_services(self) -> Dict[str, Callable[[Any], Awaitable[Any]]]:
+        """Enabled background services of tool groups, by group attribute"""
+        services = {}
+        if self.config.enable_real_time_sync:
+            # Real-time synchronization service
+            services["file_sync_tools"] = lambda tools: tools.start_realtime_sync()
+        if self.config.enable_analytics:
+            # Analytics collection service
+            services["analytics_tools"] = lambda tools: tools.start_analytics_collection()
         if self.config.enable_collaboration:
-            # Start collaboration service
-            asyncio.create_task(self.collaboration_tools.start_collaboration_service())
-            logger.info("Real-time collaboration service started")
+            # Real-time collaboration service
+            services["collaboration_tools"] = lambda tools: tools.start_collaboration_service()
+        return services
+    
+    def _group_service_starter(self, service: Callable[[Any], Awaitable[Any]]) -> Callable[[Any], None]:
+        """Load hook starting a group's service; stop() drops hooks not yet called"""
+        def start(tools: Any):
+            self._background_tasks.append(asyncio.get_running_loop().create_task(service(tools)))
+        return start
+    
+    async def stop(self):
+        """Stop background services started by start()"""
+        if not self._started:
+            return
+        self._started = False
+        self.tool_groups.load_hooks.clear()
+        for task in self._background_tasks:
+            task.cancel()
+        await asyncio.gather(*self._background_tasks, return_exceptions=True)
+        self._background_tasks.clear()
+        
+        if self.loop_monitor is not None:
+            await self.loop_monitor.stop()
+            self.loop_monitor = None
+        
+        await self.diagnostics_tools.memory_tracker.stop()
+        
+        if isinstance(self.rate_limiter, DistributedRateLimiter):
+            # Return unused leased quota to the fleet
+            await self.rate_limiter.close()
+        
+        if self.metrics_server is not None:
+            await self.metrics_server.stop()
+            self.metrics_server = None
+        
+        if tracer.exporter.enabled:
+            await tracer.exporter.shutdown()
+        
+        if self.workload_capture.enabled:
+            await self.workload_capture.shutdown()
+        
+        close_cassettes()
+        
+        logger.info("GitHub MCP Server stopped")
 
 def main():
     """Main entry point"""
@@ -372,17 +430,24 @@ def main():
         # Load configuration from environment variables
         config = GitHubMCPConfig()
         
+        if config.transport == "http" and config.workers > 1:
+            # Pre-fork workers; each builds its own server sharing quota state
+            sys.exit(WorkerSupervisor(config, AgentBuilderGitHubMCP).run())
+        
         # Create and start the GitHub MCP server
         server = AgentBuilderGitHubMCP(config)
         
-        # Run the server
-        server.get_mcp_instance().run()
+        # Run the server; start() and stop() run in its lifespan
+        if config.transport == "http":
+            server.get_mcp_instance().run(transport="http", host=config.http_host, port=config.http_port)
+        else:
+            server.get_mcp_instance().run()
         
     except KeyboardInterrupt:
         logger.info("Shutting down GitHub MCP Server...")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Fatal error: {e}")
+        logger.error("Fatal error: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -20,7 +20,8 @@ Usage:
     
     config = GitHubMCPConfig(github_token="your_token")
     server = AgentBuilderGitHubMCP(config)
-    server.start()
+    # Background services (metrics, tracing, sampling) start in the lifespan
+    server.get_mcp_instance().run()
 """
 
 __version__ = "1.0.0"
@@ -28,9 +29,14 @@ __author__ = "Agent Builder Team"
 __description__ = "Comprehensive GitHub MCP Server for Agent Builder Platform"
 
 from .tools import *
-from .integrations import *
 from .utils import *
 
+
+def __getattr__(name):
+    # Integration classes resolve lazily, see integrations/__init__.py
+    from . import integrations
+    return getattr(integrations, name)
+
 __all__ = [
     "GitHubMCPConfig",
 ]
\ No newline at end of file
@@ -8,10 +8,22 @@ This package provides integration capabilities for external services including:
 - Deployment and CI/CD automation
 """
 
-from .neon_db import NeonDBTools
-from .openrouter import OpenRouterTools
-from .claude_code import ClaudeCodeTools
-from .integration import IntegrationTools
+import importlib
+
+# Integration modules are imported on first access so that unconfigured
+# integrations (and their dependencies, e.g. asyncpg) are never loaded
+_MODULES = {
+    "NeonDBTools": ".neon_db",
+    "OpenRouterTools": ".openrouter",
+    "ClaudeCodeTools": ".claude_code",
+    "IntegrationTools": ".integration",
+}
+
+
+def __getattr__(name):
+    if name in _MODULES:
+        return getattr(importlib.import_module(_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "NeonDBTools",
@@ -10,6 +10,7 @@ This module provides Claude Code CLI integration capabilities including:
 
 from typing import Any, Dict, List, Optional
 from src.agent_builder_github_mcp.tools import BaseGitHubTool
+import asyncio
 import subprocess
 import tempfile
 import os
@@ -22,14 +23,43 @@ class ClaudeCodeTools(BaseGitHubTool):
         super().__init__(config, rate_limiter, error_handler)
         self.claude_path = config.claude_code_path or "claude"
     
+    async def _run_cli(self, args: List[str], timeout: float) -> subprocess.CompletedProcess:
+        """Run the Claude CLI without blocking the event loop"""
+        process = await asyncio.create_subprocess_exec(
+            self.claude_path, *args,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            await self._kill(process)
+            raise subprocess.TimeoutExpired([self.claude_path, *args], timeout)
+        except asyncio.CancelledError:
+            # A cancelled tool call must not leave the CLI running
+            await self._kill(process)
+            raise
+        return subprocess.CompletedProcess(
+            [self.claude_path, *args], process.returncode,
+            stdout.decode(errors="replace"), stderr.decode(errors="replace")
+        )
+    
+    @staticmethod
+    async def _kill(process: asyncio.subprocess.Process):
+        """Kill and reap a CLI process"""
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+        await process.wait()
+    
     async def initialize(self):
         """Initialize Claude Code CLI"""
         try:
             # Check if Claude CLI is available
-            result = subprocess.run([self.claude_path, "--version"], 
-                                  capture_output=True, text=True, timeout=10)
+            result = await self._run_cli(["--version"], timeout=10)
             if result.returncode == 0:
-                self.logger.info(f"Claude Code CLI initialized: {result.stdout.strip()}")
+                self.logger.info("Claude Code CLI initialized: %s", result.stdout.strip())
             else:
                 self.logger.warning("Claude Code CLI not found or not working")
         except Exception as e:
@@ -58,8 +88,8 @@ class ClaudeCodeTools(BaseGitHubTool):
                 prompt_file = f.name
             
             try:
-                result = subprocess.run([self.claude_code_path, prompt_file, codebase_path], 
-                                      capture_output=True, text=True, timeout=60)
+                with self.track_integration("claude_code", "analyze_codebase"):
+                    result = await self._run_cli([prompt_file, codebase_path], timeout=60)
                 
                 if result.returncode == 0:
                     return {
@@ -108,8 +138,8 @@ class ClaudeCodeTools(BaseGitHubTool):
                 prompt_file = f.name
             
             try:
-                result = subprocess.run([self.claude_code_path, prompt_file, code_path], 
-                                      capture_output=True, text=True, timeout=120)
+                with self.track_integration("claude_code", "refactor_code"):
+                    result = await self._run_cli([prompt_file, code_path], timeout=120)
                 
                 if result.returncode == 0:
                     return {
@@ -160,8 +190,8 @@ class ClaudeCodeTools(BaseGitHubTool):
                 prompt_file = f.name
             
             try:
-                result = subprocess.run([self.claude_code_path, prompt_file, code_path], 
-                                      capture_output=True, text=True, timeout=120)
+                with self.track_integration("claude_code", "generate_tests"):
+                    result = await self._run_cli([prompt_file, code_path], timeout=120)
                 
                 if result.returncode == 0:
                     return {
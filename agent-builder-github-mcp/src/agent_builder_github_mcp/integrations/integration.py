@@ -10,9 +10,6 @@ This module provides unified integration capabilities including:
 
 from typing import Any, Dict, List, Optional
 from src.agent_builder_github_mcp.tools import BaseGitHubTool
-from src.agent_builder_github_mcp.integrations.neon_db import NeonDBTools
-from src.agent_builder_github_mcp.integrations.openrouter import OpenRouterTools
-from src.agent_builder_github_mcp.integrations.claude_code import ClaudeCodeTools
 
 
 class IntegrationTools(BaseGitHubTool):
@@ -47,7 +44,7 @@ class IntegrationTools(BaseGitHubTool):
             
             self.deployment_status[deployment_id] = deployment_result
             
-            self.logger.info(f"Automated deployment initiated: {owner}/{repo} -> {environment}")
+            self.logger.info("Automated deployment initiated: %s/%s -> %s", owner, repo, environment)
             
             return {
                 "success": True,
@@ -120,7 +117,7 @@ class IntegrationTools(BaseGitHubTool):
             
             self.deployment_status[deployment_id] = rollback_result
             
-            self.logger.warning(f"Deployment rollback initiated: {deployment_id} - Reason: {reason}")
+            self.logger.warning("Deployment rollback initiated: %s - Reason: %s", deployment_id, reason)
             
             return {
                 "success": True,
@@ -166,7 +163,7 @@ class IntegrationTools(BaseGitHubTool):
             
             self.ci_cd_pipelines[pipeline_id] = pipeline_result
             
-            self.logger.info(f"CI/CD pipeline setup completed: {owner}/{repo}")
+            self.logger.info("CI/CD pipeline setup completed: %s/%s", owner, repo)
             
             return {
                 "success": True,
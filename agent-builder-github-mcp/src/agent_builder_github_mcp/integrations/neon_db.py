@@ -10,7 +10,6 @@ This module provides Neon DB integration capabilities including:
 
 from typing import Any, Dict, List, Optional
 from src.agent_builder_github_mcp.tools import BaseGitHubTool
-import asyncpg
 import json
 
 
@@ -25,6 +24,8 @@ class NeonDBTools(BaseGitHubTool):
         """Initialize Neon DB connection"""
         try:
             if self.config.neon_db_url:
+                # Imported here so servers without Neon never load asyncpg
+                import asyncpg
                 self.db_connection = await asyncpg.connect(self.config.neon_db_url)
                 self.logger.info("Neon DB connection initialized")
             else:
@@ -39,26 +40,27 @@ class NeonDBTools(BaseGitHubTool):
             if not self.db_connection:
                 return {"success": False, "error": "Neon DB not initialized", "message": "Database connection not available"}
             
-            # Create table if it doesn't exist
-            await self.db_connection.execute("""
-                CREATE TABLE IF NOT EXISTS repository_metadata (
-                    id SERIAL PRIMARY KEY,
-                    owner TEXT NOT NULL,
-                    repo_name TEXT NOT NULL,
-                    metadata JSONB NOT NULL,
-                    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-                    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
-                    UNIQUE(owner, repo_name)
-                )
-            """)
+            with self.track_integration("neon_db", "store_repository_metadata"):
+                # Create table if it doesn't exist
+                await self.db_connection.execute("""
+                    CREATE TABLE IF NOT EXISTS repository_metadata (
+                        id SERIAL PRIMARY KEY,
+                        owner TEXT NOT NULL,
+                        repo_name TEXT NOT NULL,
+                        metadata JSONB NOT NULL,
+                        created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+                        updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+                        UNIQUE(owner, repo_name)
+                    )
+                """)
             
-            # Insert or update metadata
-            await self.db_connection.execute("""
-                INSERT INTO repository_metadata (owner, repo_name, metadata)
-                VALUES ($1, $2, $3)
-                ON CONFLICT (owner, repo_name)
-                DO UPDATE SET metadata = $3, updated_at = NOW()
-            """, owner, repo, json.dumps(metadata))
+                # Insert or update metadata
+                await self.db_connection.execute("""
+                    INSERT INTO repository_metadata (owner, repo_name, metadata)
+                    VALUES ($1, $2, $3)
+                    ON CONFLICT (owner, repo_name)
+                    DO UPDATE SET metadata = $3, updated_at = NOW()
+                """, owner, repo, json.dumps(metadata))
             
             return {
                 "success": True,
@@ -75,10 +77,11 @@ class NeonDBTools(BaseGitHubTool):
             if not self.db_connection:
                 return {"success": False, "error": "Neon DB not initialized", "message": "Database connection not available"}
             
-            row = await self.db_connection.fetchrow(
-                "SELECT metadata, created_at, updated_at FROM repository_metadata WHERE owner = $1 AND repo_name = $2",
-                owner, repo
-            )
+            with self.track_integration("neon_db", "get_repository_metadata"):
+                row = await self.db_connection.fetchrow(
+                    "SELECT metadata, created_at, updated_at FROM repository_metadata WHERE owner = $1 AND repo_name = $2",
+                    owner, repo
+                )
             
             if row:
                 return {
@@ -118,7 +121,7 @@ class NeonDBTools(BaseGitHubTool):
             result = await self.store_repository_metadata(owner, repo, metadata)
             
             if result["success"]:
-                self.logger.info(f"Synced repository to Neon DB: {owner}/{repo}")
+                self.logger.info("Synced repository to Neon DB: %s/%s", owner, repo)
             
             return result
             
@@ -132,7 +135,8 @@ class NeonDBTools(BaseGitHubTool):
             if not self.db_connection:
                 return {"success": False, "error": "Neon DB not initialized", "message": "Database connection not available"}
             
-            rows = await self.db_connection.fetch(query, *(params or []))
+            with self.track_integration("neon_db", "query_repository_analytics"):
+                rows = await self.db_connection.fetch(query, *(params or []))
             
             return {
                 "success": True,
@@ -69,8 +69,9 @@ class OpenRouterTools(BaseGitHubTool):
             }
             
             async with httpx.AsyncClient() as client:
-                response = await client.post(f"{self.base_url}/chat/completions", 
-                                           headers=headers, json=data, timeout=30)
+                with self.track_integration("openrouter", "chat_completions"):
+                    response = await client.post(f"{self.base_url}/chat/completions", 
+                                               headers=headers, json=data, timeout=30)
                 response.raise_for_status()
                 
                 result = response.json()
@@ -126,8 +127,9 @@ class OpenRouterTools(BaseGitHubTool):
             }
             
             async with httpx.AsyncClient() as client:
-                response = await client.post(f"{self.base_url}/chat/completions", 
-                                           headers=headers, json=data, timeout=30)
+                with self.track_integration("openrouter", "chat_completions"):
+                    response = await client.post(f"{self.base_url}/chat/completions", 
+                                               headers=headers, json=data, timeout=30)
                 response.raise_for_status()
                 
                 result = response.json()
@@ -183,8 +185,9 @@ class OpenRouterTools(BaseGitHubTool):
             }
             
             async with httpx.AsyncClient() as client:
-                response = await client.post(f"{self.base_url}/chat/completions", 
-                                           headers=headers, json=data, timeout=30)
+                with self.track_integration("openrouter", "chat_completions"):
+                    response = await client.post(f"{self.base_url}/chat/completions", 
+                                               headers=headers, json=data, timeout=30)
                 response.raise_for_status()
                 
                 result = response.json()
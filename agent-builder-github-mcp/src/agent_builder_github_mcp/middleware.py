@@ -0,0 +1,211 @@
+"""
+MCP Middleware
+
+This module provides FastMCP middleware applied to every registered tool call:
+- Read-your-writes cache invalidation for mutating tools
+- Per-tool latency histograms and call/error counters
+- Root tracing spans continuing the caller's W3C trace context
+- Tool and caller attribution for GitHub quota accounting
+- Slow-call capture with upstream call timelines
+- Workload capture of every call for traffic replay
+- Readiness gating of tools backed by integrations that are warming up
+"""
+
+import time
+from typing import Any, Dict, Optional, Set
+
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from fastmcp.tools import ToolResult
+
+from src.agent_builder_github_mcp.utils import CacheManager, Logger, MetricsCollector
+from src.agent_builder_github_mcp.utils.cache_keys import resolve_mutation_keys
+from src.agent_builder_github_mcp.utils.quota import ANONYMOUS_CALLER, CallAttribution, current_call
+from src.agent_builder_github_mcp.utils.readiness import INITIALIZING, PENDING, IntegrationReadiness
+from src.agent_builder_github_mcp.utils.slow_calls import SlowCallRecorder
+from src.agent_builder_github_mcp.utils.tracing import SPAN_KIND_SERVER, tracer
+from src.agent_builder_github_mcp.utils.workload import WorkloadCapture
+
+# Metrics label of calls to tool names that are not registered
+UNKNOWN_TOOL = "unknown"
+
+
+def tool_succeeded(result: Any) -> bool:
+    """Whether a tool result reports success (tools return {"success": ...})"""
+    structured = getattr(result, "structured_content", None)
+    if isinstance(structured, dict):
+        return structured.get("success", True) is not False
+    return not getattr(result, "is_error", False)
+
+
+def resolve_caller(context: MiddlewareContext) -> str:
+    """Identify the caller of a tool call
+    
+    Uses a "caller" or "tenant" entry in the request _meta, then the MCP
+    client id, falling back to "anonymous".
+    """
+    meta = getattr(context.message, "meta", None) or {}
+    if isinstance(meta, dict):
+        for key in ("caller", "tenant"):
+            if meta.get(key):
+                return str(meta[key])
+    fastmcp_context = context.fastmcp_context
+    if fastmcp_context is not None:
+        try:
+            if fastmcp_context.client_id:
+                return fastmcp_context.client_id
+        except Exception:
+            pass
+    return ANONYMOUS_CALLER
+
+
+class CallAttributionMiddleware(Middleware):
+    """Attribute GitHub requests made during a tool call to the tool and caller"""
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next) -> Any:
+        """Expose the tool name and caller to the API client for the call"""
+        token = current_call.set(CallAttribution(context.message.name, resolve_caller(context)))
+        try:
+            return await call_next(context)
+        finally:
+            current_call.reset(token)
+
+
+class SlowCallMiddleware(Middleware):
+    """Capture tool calls exceeding the slow-call threshold"""
+
+    def __init__(self, recorder: SlowCallRecorder):
+        self.recorder = recorder
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next) -> Any:
+        """Record upstream calls made by the tool and keep the call if it was slow"""
+        token = self.recorder.begin(context.message.name, context.message.arguments or {})
+        try:
+            result = await call_next(context)
+        except Exception as e:
+            self.recorder.finish(token, False, error=str(e))
+            raise
+        error = None
+        if not tool_succeeded(result):
+            error = str(result.structured_content.get("error", "tool reported failure"))
+        self.recorder.finish(token, error is None, result, error)
+        return result
+
+
+class WorkloadCaptureMiddleware(Middleware):
+    """Capture every tool call for replaying the workload"""
+
+    def __init__(self, capture: WorkloadCapture):
+        self.capture = capture
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next) -> Any:
+        """Queue the call with its caller, arguments, duration and outcome"""
+        started_at = time.time()
+        started = time.perf_counter()
+        success, error = False, None
+        try:
+            result = await call_next(context)
+            success = tool_succeeded(result)
+            if not success:
+                error = str(result.structured_content.get("error", "tool reported failure"))
+            return result
+        except Exception as e:
+            error = str(e)
+            raise
+        finally:
+            self.capture.record(context.message.name, resolve_caller(context), context.message.arguments or {},
+                                started_at, time.perf_counter() - started, success, error)
+
+
+class TracingMiddleware(Middleware):
+    """Open the root span of a trace for every tool call"""
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next) -> Any:
+        """Trace the tool call, continuing a traceparent passed in request _meta"""
+        meta = getattr(context.message, "meta", None) or {}
+        traceparent = meta.get("traceparent") if isinstance(meta, dict) else None
+        with tracer.start_root_span(
+            f"tool/{context.message.name}", SPAN_KIND_SERVER,
+            {"mcp.tool.name": context.message.name}, traceparent
+        ) as span:
+            result = await call_next(context)
+            if not tool_succeeded(result):
+                span.set_error(str(result.structured_content.get("error", "tool reported failure")))
+            return result
+
+
+class MetricsMiddleware(Middleware):
+    """Record latency histograms and call counters for every tool call
+    
+    Calls to names outside ``tools`` share one "unknown" label, so clients
+    cannot create series by calling tools that do not exist.
+    """
+
+    def __init__(self, metrics: MetricsCollector, tools: Optional[Set[str]] = None):
+        self.metrics = metrics
+        self.tools = tools
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next) -> Any:
+        """Time the tool call and count failures"""
+        name = context.message.name
+        labels = {"tool": name if self.tools is None or name in self.tools else UNKNOWN_TOOL}
+        self.metrics.increment("tool_calls_total", labels=labels)
+        with self.metrics.timer("tool_duration_seconds", labels):
+            try:
+                result = await call_next(context)
+            except Exception:
+                self.metrics.increment("tool_errors_total", labels=labels)
+                raise
+        if not tool_succeeded(result):
+            self.metrics.increment("tool_errors_total", labels=labels)
+        return result
+
+
+class ReadinessMiddleware(Middleware):
+    """Hold or reject calls to tools whose integration is not ready"""
+
+    def __init__(self, readiness: IntegrationReadiness, tool_integrations: Dict[str, str],
+                 wait_timeout: float = 2.0):
+        self.readiness = readiness
+        self.tool_integrations = tool_integrations
+        self.wait_timeout = wait_timeout
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next) -> Any:
+        """Wait briefly for a warming integration, fail fast if it is unavailable"""
+        integration = self.tool_integrations.get(context.message.name)
+        if integration is None or integration not in self.readiness:
+            return await call_next(context)
+
+        state = await self.readiness.wait_ready(integration, self.wait_timeout)
+        if state.ready:
+            return await call_next(context)
+
+        if state.status in (PENDING, INITIALIZING):
+            error = f"{integration} integration is still initializing"
+        else:
+            error = f"{integration} integration is unavailable ({state.status}): {state.error}"
+        return ToolResult(structured_content={
+            "success": False,
+            "error": error,
+            "message": f"{context.message.name} is not available",
+        })
+
+
+class CacheInvalidationMiddleware(Middleware):
+    """Invalidate cached GitHub reads affected by mutating tool calls"""
+
+    def __init__(self, cache_manager: CacheManager):
+        self.cache_manager = cache_manager
+        self.logger = Logger.get_logger(self.__class__.__name__)
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next) -> Any:
+        """Run the tool, then drop the cache entries its write affected"""
+        keys = resolve_mutation_keys(context.message.name, context.message.arguments or {})
+        if not keys:
+            return await call_next(context)
+
+        try:
+            return await call_next(context)
+        finally:
+            # Invalidate even when the tool reports failure: a timed out
+            # request may still have been applied upstream.
+            self.cache_manager.invalidate(keys)
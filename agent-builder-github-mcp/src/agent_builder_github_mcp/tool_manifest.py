@@ -0,0 +1,142 @@
+"""
+Tool Schema Manifest
+
+This module caches the MCP tool schemas FastMCP derives from tool signatures:
+- Per-group manifest entries (name, description, input and output schema)
+- Invalidation by a hash of the group's source, the base tool class and
+  the FastMCP version
+- Build-time generation (``python -m src.agent_builder_github_mcp.tool_manifest``)
+  or generation on first boot
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import fastmcp
+from fastmcp.tools import FunctionTool
+
+from src.agent_builder_github_mcp.utils import Logger
+
+MANIFEST_VERSION = 1
+DEFAULT_MANIFEST_PATH = Path(__file__).parent / "tool_manifest.json"
+BASE_TOOL_MODULE = "src.agent_builder_github_mcp.tools"
+
+logger = Logger.get_logger(__name__)
+
+
+def _source_bytes(module: str) -> bytes:
+    """Read a module's source without importing it"""
+    spec = importlib.util.find_spec(module)
+    if spec is None or not spec.origin:
+        raise ImportError(f"Cannot locate module {module}")
+    return Path(spec.origin).read_bytes()
+
+
+def group_source_hash(group) -> str:
+    """Hash everything a group's schemas are derived from"""
+    digest = hashlib.sha256()
+    digest.update(f"{MANIFEST_VERSION}:{fastmcp.__version__}:{group.class_name}:{','.join(group.tools)}".encode())
+    digest.update(_source_bytes(BASE_TOOL_MODULE))
+    digest.update(_source_bytes(group.module))
+    return digest.hexdigest()
+
+
+def build_group_entries(registry, attribute: str) -> List[Dict[str, Any]]:
+    """Introspect a group's tool methods and return their schemas"""
+    group = registry.groups[attribute]
+    tool_class = registry.load_class(attribute)
+    entries = []
+    for name in group.tools:
+        tool = FunctionTool.from_function(registry.deferred_function(attribute, getattr(tool_class, name)))
+        entries.append({
+            "name": tool.name,
+            "description": tool.description,
+            "parameters": tool.parameters,
+            "output_schema": tool.output_schema,
+        })
+    return entries
+
+
+class ToolManifest:
+    """Load, refresh and persist the tool schema manifest"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else DEFAULT_MANIFEST_PATH
+        self.groups: Dict[str, Dict[str, Any]] = {}
+        self.rebuilt: List[str] = []
+
+    def load(self):
+        """Read the manifest file, ignoring a missing or unreadable one"""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") == MANIFEST_VERSION:
+                self.groups = data.get("groups", {})
+        except (OSError, ValueError):
+            self.groups = {}
+
+    def save(self) -> bool:
+        """Write the manifest atomically; returns False on read-only filesystems"""
+        payload = json.dumps({"version": MANIFEST_VERSION, "groups": self.groups},
+                             sort_keys=True, separators=(",", ":"))
+        temporary = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            temporary.write_text(payload, encoding="utf-8")
+            os.replace(temporary, self.path)
+            return True
+        except OSError as e:
+            logger.warning("Could not write tool manifest %s: %s", self.path, e)
+            try:
+                temporary.unlink()
+            except OSError:
+                pass
+            return False
+
+    def entries(self, registry) -> Dict[str, List[Dict[str, Any]]]:
+        """Schemas for every group in the registry, rebuilding stale groups
+
+        Args:
+            registry: ToolGroupRegistry whose groups are needed
+
+        Returns:
+            Tool entries per group attribute
+        """
+        self.load()
+        self.rebuilt = []
+        for attribute, group in registry.groups.items():
+            source_hash = group_source_hash(group)
+            cached = self.groups.get(attribute)
+            if cached is None or cached.get("hash") != source_hash:
+                self.groups[attribute] = {"hash": source_hash, "tools": build_group_entries(registry, attribute)}
+                self.rebuilt.append(attribute)
+        if self.rebuilt:
+            logger.info("Rebuilt tool schemas for %s", ", ".join(self.rebuilt))
+            self.save()
+        return {attribute: self.groups[attribute]["tools"] for attribute in registry.groups}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Build the manifest for every tool group, including unconfigured integrations"""
+    from src.agent_builder_github_mcp.tool_registry import TOOL_GROUPS, ToolGroup, ToolGroupRegistry
+    from src.agent_builder_github_mcp.utils import ErrorHandler, GitHubMCPConfig, RateLimiter
+
+    argv = sys.argv[1:] if argv is None else argv
+    config = GitHubMCPConfig()
+    groups = tuple(
+        ToolGroup(group.attribute, group.module, group.class_name, group.tools)
+        for group in TOOL_GROUPS
+    )
+    registry = ToolGroupRegistry(config, RateLimiter(config.github_rate_limit), ErrorHandler(), groups)
+    manifest = ToolManifest(Path(argv[0]) if argv else None)
+    manifest.entries(registry)
+    tools = sum(len(group["tools"]) for group in manifest.groups.values())
+    print(f"Wrote {tools} tool schemas for {len(manifest.groups)} groups to {manifest.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,255 @@
+"""
+Tool Group Registry
+
+This module declares every MCP tool group and loads groups on demand:
+- Tool groups with their module, class and exposed tool methods
+- Integration groups skipped when their configuration is absent
+- Lazy import and instantiation of a group on the first call to one of its tools
+- Registration from cached schemas with pre-built tools/list entries
+"""
+
+import functools
+import importlib
+import inspect
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from fastmcp.tools import FunctionTool
+from pydantic import PrivateAttr
+
+from src.agent_builder_github_mcp.utils import ErrorHandler, Logger, MetricsCollector, RateLimiter
+
+
+def _always(config) -> bool:
+    return True
+
+
+@dataclass(frozen=True)
+class ToolGroup:
+    """A tool class and the tool methods it exposes"""
+    attribute: str
+    module: str
+    class_name: str
+    tools: Tuple[str, ...]
+    enabled: Callable[[Any], bool] = _always
+    eager: bool = False
+
+
+TOOLS_PACKAGE = "src.agent_builder_github_mcp.tools"
+INTEGRATIONS_PACKAGE = "src.agent_builder_github_mcp.integrations"
+
+# Registration order is the order tools are listed to clients
+TOOL_GROUPS: Tuple[ToolGroup, ...] = (
+    ToolGroup("repository_tools", f"{TOOLS_PACKAGE}.repository", "RepositoryTools", (
+        "create_repository", "fork_repository", "delete_repository", "get_repository",
+        "list_repositories", "update_repository", "get_repository_contents",
+        "create_or_update_file", "delete_file", "move_file",
+    )),
+    ToolGroup("branch_tools", f"{TOOLS_PACKAGE}.branch", "BranchTools", (
+        "create_branch", "delete_branch", "get_branch", "list_branches", "update_branch_protection",
+    )),
+    ToolGroup("commit_tools", f"{TOOLS_PACKAGE}.commit", "CommitTools", (
+        "get_commit", "list_commits", "get_commit_diff", "create_commit_status", "get_file_history",
+    )),
+    ToolGroup("issue_tools", f"{TOOLS_PACKAGE}.issue", "IssueTools", (
+        "create_issue", "get_issue", "update_issue", "list_issues", "close_issue",
+        "add_issue_comment", "get_issue_comments", "label_issue", "assign_issue",
+        "create_issue_template",
+    )),
+    ToolGroup("pr_tools", f"{TOOLS_PACKAGE}.pull_request", "PullRequestTools", (
+        "create_pull_request", "get_pull_request", "update_pull_request", "list_pull_requests",
+        "merge_pull_request", "close_pull_request", "add_pr_comment", "request_pr_review",
+        "get_pr_diff", "get_pr_files",
+    )),
+    ToolGroup("action_tools", f"{TOOLS_PACKAGE}.action", "ActionTools", (
+        "list_workflows", "get_workflow", "run_workflow", "list_workflow_runs",
+        "get_workflow_run", "cancel_workflow_run", "get_workflow_run_logs",
+        "create_workflow_dispatch",
+    )),
+    ToolGroup("security_tools", f"{TOOLS_PACKAGE}.security", "SecurityTools", (
+        "get_code_scanning_alerts", "get_secret_scanning_alerts", "get_dependabot_alerts",
+        "create_security_advisory", "enable_code_scanning",
+    )),
+    ToolGroup("user_tools", f"{TOOLS_PACKAGE}.user", "UserTools", (
+        "get_user_profile", "update_user_profile", "get_user_repositories", "get_user_gists",
+    )),
+    ToolGroup("org_tools", f"{TOOLS_PACKAGE}.organization", "OrganizationTools", (
+        "get_organization", "list_organization_repos", "get_organization_members",
+        "create_organization_webhook",
+    )),
+    ToolGroup("deployment_tools", f"{TOOLS_PACKAGE}.deployment", "DeploymentTools", (
+        "create_deployment", "get_deployment_status", "create_deployment_status",
+        "get_deployments", "delete_deployment",
+    )),
+    ToolGroup("file_sync_tools", f"{TOOLS_PACKAGE}.file_sync", "FileSyncTools", (
+        "sync_repository_to_cloud", "sync_cloud_to_repository", "get_sync_status",
+        "conflict_resolution",
+    )),
+    ToolGroup("collaboration_tools", f"{TOOLS_PACKAGE}.collaboration", "CollaborationTools", (
+        "enable_realtime_collaboration", "get_collaboration_status", "share_repository",
+        "create_shared_workspace",
+    )),
+    ToolGroup("analytics_tools", f"{TOOLS_PACKAGE}.analytics", "AnalyticsTools", (
+        "get_repository_analytics", "get_commit_analytics", "get_contributor_analytics",
+        "get_project_health_metrics",
+    )),
+    ToolGroup("webhook_tools", f"{TOOLS_PACKAGE}.webhook", "WebhookTools", (
+        "create_webhook", "list_webhooks", "update_webhook", "delete_webhook", "get_webhook_events",
+    )),
+    ToolGroup("cache_tools", f"{TOOLS_PACKAGE}.cache", "CacheTools", (
+        "get_cache_stats", "purge_cache",
+    )),
+    # Diagnostics state (slow calls, memory, profiler) must exist before the first call
+    ToolGroup("diagnostics_tools", f"{TOOLS_PACKAGE}.diagnostics", "DiagnosticsTools", (
+        "get_latency_metrics", "profile_event_loop", "get_memory_usage", "take_memory_snapshot",
+        "compare_memory_snapshots", "stop_memory_tracing", "get_quota_usage", "get_slow_calls",
+    ), eager=True),
+    ToolGroup("neon_db_tools", f"{INTEGRATIONS_PACKAGE}.neon_db", "NeonDBTools", (
+        "store_repository_metadata", "get_repository_metadata", "sync_repository_to_db",
+    ), enabled=lambda config: bool(config.neon_db_url and config.neon_db_token)),
+    ToolGroup("openrouter_tools", f"{INTEGRATIONS_PACKAGE}.openrouter", "OpenRouterTools", (
+        "generate_code_review", "analyze_repository", "generate_pr_description",
+    ), enabled=lambda config: bool(config.openrouter_api_key)),
+    ToolGroup("claude_code_tools", f"{INTEGRATIONS_PACKAGE}.claude_code", "ClaudeCodeTools", (
+        "analyze_codebase", "refactor_code", "generate_tests",
+    ), enabled=lambda config: bool(config.claude_code_path)),
+    ToolGroup("integration_tools", f"{INTEGRATIONS_PACKAGE}.integration", "IntegrationTools", (
+        "trigger_automated_deployment", "monitor_deployment", "rollback_deployment",
+        "setup_continuous_integration",
+    )),
+)
+
+
+async def _unresolved(**kwargs):
+    raise RuntimeError("Deferred tool was not resolved")
+
+
+class DeferredTool(FunctionTool):
+    """Tool registered from a cached schema
+    
+    The tool's module is imported and its group created on the first call;
+    the MCP representation used for tools/list is built once and reused.
+    """
+    
+    _resolve: Callable[[], Callable] = PrivateAttr()
+    _mcp_tool: Any = PrivateAttr(default=None)
+    
+    @classmethod
+    def from_entry(cls, entry: Dict[str, Any], resolve: Callable[[], Callable]) -> "DeferredTool":
+        tool = cls(fn=_unresolved, name=entry["name"], description=entry["description"],
+                   parameters=entry["parameters"], output_schema=entry["output_schema"])
+        tool._resolve = resolve
+        return tool
+    
+    async def run(self, arguments: Dict[str, Any]):
+        if self.fn is _unresolved:
+            self.fn = self._resolve()
+        return await super().run(arguments)
+    
+    def to_mcp_tool(self, **overrides: Any):
+        if overrides and overrides != {"name": self.name}:
+            return super().to_mcp_tool(**overrides)
+        if self._mcp_tool is None:
+            self._mcp_tool = super().to_mcp_tool()
+        return self._mcp_tool
+
+
+class ToolGroupRegistry:
+    """Register tool groups with FastMCP and instantiate them on first use"""
+
+    def __init__(self, config, rate_limiter: RateLimiter, error_handler: ErrorHandler,
+                 groups: Tuple[ToolGroup, ...] = TOOL_GROUPS):
+        self.config = config
+        self.rate_limiter = rate_limiter
+        self.error_handler = error_handler
+        self.groups: Dict[str, ToolGroup] = {
+            group.attribute: group for group in groups if group.enabled(config)
+        }
+        self.skipped = [group.attribute for group in groups if not group.enabled(config)]
+        self.instances: Dict[str, Any] = {}
+        self.load_hooks: Dict[str, Callable[[Any], None]] = {}
+        self.metrics = MetricsCollector.get_collector()
+        self.logger = Logger.get_logger(self.__class__.__name__)
+
+    def __contains__(self, attribute: str) -> bool:
+        return attribute in self.groups
+
+    def load_class(self, attribute: str) -> type:
+        """Import a group's module and return its tool class"""
+        group = self.groups[attribute]
+        return getattr(importlib.import_module(group.module), group.class_name)
+
+    def get(self, attribute: str) -> Any:
+        """Get a group's tool instance, creating it on first use"""
+        instance = self.instances.get(attribute)
+        if instance is None:
+            started = time.perf_counter()
+            instance = self.load_class(attribute)(self.config, self.rate_limiter, self.error_handler)
+            self.instances[attribute] = instance
+            self.metrics.observe("tool_group_load_seconds", time.perf_counter() - started,
+                                 {"group": attribute})
+            self.logger.info("Loaded tool group %s", attribute)
+            hook = self.load_hooks.pop(attribute, None)
+            if hook is not None:
+                hook(instance)
+        return instance
+
+    def on_load(self, attribute: str, hook: Callable[[Any], None]):
+        """Call hook with a group's instance once it is created (now if it already is)"""
+        instance = self.instances.get(attribute)
+        if instance is not None:
+            hook(instance)
+        else:
+            self.load_hooks[attribute] = hook
+
+    def tool_names(self) -> Set[str]:
+        """Names of the tools of every enabled group"""
+        return {name for group in self.groups.values() for name in group.tools}
+
+    def peek(self, attribute: str) -> Optional[Any]:
+        """Get a group's tool instance only if it has been created"""
+        return self.instances.get(attribute)
+
+    def load_eager(self):
+        """Instantiate groups that must exist before their first call"""
+        for attribute, group in self.groups.items():
+            if group.eager:
+                self.get(attribute)
+
+    def register(self, mcp, manifest=None):
+        """Register every enabled group's tools without instantiating the groups
+        
+        Args:
+            mcp: FastMCP server
+            manifest: Optional ToolManifest; when given, tools are registered
+                from cached schemas and their modules are imported on first call
+        """
+        if manifest is not None:
+            for attribute, entries in manifest.entries(self).items():
+                for entry in entries:
+                    mcp.add_tool(DeferredTool.from_entry(entry, self._resolver(attribute, entry["name"])))
+        else:
+            for attribute, group in self.groups.items():
+                tool_class = self.load_class(attribute)
+                for name in group.tools:
+                    mcp.tool(self.deferred_function(attribute, getattr(tool_class, name)))
+        if self.skipped:
+            self.logger.info("Skipped unconfigured tool groups: %s", ", ".join(self.skipped))
+    
+    def _resolver(self, attribute: str, name: str) -> Callable[[], Callable]:
+        return lambda: self.deferred_function(attribute, getattr(self.load_class(attribute), name))
+    
+    def deferred_function(self, attribute: str, method: Callable) -> Callable:
+        """Wrap an unbound tool method so the group is created on the first call"""
+        name = method.__name__
+        
+        @functools.wraps(method)
+        async def tool(*args, **kwargs):
+            return await getattr(self.get(attribute), name)(*args, **kwargs)
+        
+        # Expose the bound signature (without self) for schema generation
+        del tool.__wrapped__
+        signature = inspect.signature(method)
+        tool.__signature__ = signature.replace(parameters=list(signature.parameters.values())[1:])
+        return tool
@@ -3,8 +3,12 @@ Base tool class for all GitHub MCP tools
 """
 
 from abc import ABC, abstractmethod
+import time
+from contextlib import contextmanager
 from typing import Any, Dict, Optional
-from src.agent_builder_github_mcp.utils import Logger, RateLimiter, ErrorHandler
+from src.agent_builder_github_mcp.utils import Logger, MetricsCollector, RateLimiter, ErrorHandler
+from src.agent_builder_github_mcp.utils.slow_calls import record_upstream
+from src.agent_builder_github_mcp.utils.tracing import SPAN_KIND_CLIENT, tracer
 
 
 class BaseGitHubTool(ABC):
@@ -15,6 +19,22 @@ class BaseGitHubTool(ABC):
         self.rate_limiter = rate_limiter
         self.error_handler = error_handler
         self.logger = Logger.get_logger(self.__class__.__name__)
+        self.metrics = MetricsCollector.get_collector()
+    
+    @contextmanager
+    def track_integration(self, integration: str, operation: str):
+        """Time, trace and record a call to an external integration"""
+        labels = {"integration": integration, "operation": operation}
+        started = time.perf_counter()
+        try:
+            with self.metrics.timer("integration_duration_seconds", labels), \
+                    tracer.start_span(f"{integration}.{operation}", SPAN_KIND_CLIENT,
+                                      {"integration.name": integration}) as span:
+                yield span
+        except Exception as e:
+            record_upstream("integration", f"{integration}.{operation}", started, error=str(e))
+            raise
+        record_upstream("integration", f"{integration}.{operation}", started, "ok")
     
     async def execute(self, **kwargs) -> Dict[str, Any]:
         """Execute the tool operation (default implementation)"""
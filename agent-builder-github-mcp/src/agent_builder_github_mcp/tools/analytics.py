@@ -38,7 +38,7 @@ class AnalyticsTools(BaseGitHubTool):
                 "message": f"Repository analytics retrieved for {owner}/{repo}"
             }
             
-            self.logger.info(f"Generated repository analytics: {owner}/{repo}")
+            self.logger.info("Generated repository analytics: %s/%s", owner, repo)
             return result
             
         except Exception as e:
@@ -75,7 +75,7 @@ class AnalyticsTools(BaseGitHubTool):
                 "message": "Commit analytics retrieved successfully"
             }
             
-            self.logger.info(f"Generated commit analytics for {owner}/{repo}")
+            self.logger.info("Generated commit analytics for %s/%s", owner, repo)
             return result
             
         except Exception as e:
@@ -102,7 +102,7 @@ class AnalyticsTools(BaseGitHubTool):
                 "message": "Contributor analytics retrieved successfully"
             }
             
-            self.logger.info(f"Generated contributor analytics for {owner}/{repo}")
+            self.logger.info("Generated contributor analytics for %s/%s", owner, repo)
             return result
             
         except Exception as e:
@@ -142,7 +142,7 @@ class AnalyticsTools(BaseGitHubTool):
                 "message": "Project health metrics retrieved successfully"
             }
             
-            self.logger.info(f"Generated project health metrics for {owner}/{repo}")
+            self.logger.info("Generated project health metrics for %s/%s", owner, repo)
             return result
             
         except Exception as e:
@@ -39,7 +39,7 @@ class BranchTools(BaseGitHubTool):
             endpoint = f"repos/{owner}/{repo}/git/refs"
             
             result = await client.post(endpoint, data)
-            self.logger.info(f"Created branch: {branch_name}")
+            self.logger.info("Created branch: %s", branch_name)
             return {"success": True, "branch": result, "message": "Branch created successfully"}
             
         except Exception as e:
@@ -53,7 +53,7 @@ class BranchTools(BaseGitHubTool):
             async with GitHubAPIClient(self.config, self.error_handler.auth_manager, 
                                       self.rate_limiter, self.error_handler) as client:
                 success = await client.delete(endpoint)
-                self.logger.warning(f"Deleted branch: {branch_name}")
+                self.logger.warning("Deleted branch: %s", branch_name)
                 return {"success": True, "message": "Branch deleted successfully"}
                 
         except Exception as e:
@@ -0,0 +1,90 @@
+"""
+Cache Introspection Tools
+
+This module provides response cache visibility and control including:
+- Per-endpoint hit, miss and revalidation ratios
+- Memory held and largest cached entries
+- GitHub quota saved by the cache
+- Targeted purges by repository or key pattern
+"""
+
+from typing import Any, Dict, Optional
+from src.agent_builder_github_mcp.tools import BaseGitHubTool
+from src.agent_builder_github_mcp.utils import CacheManager, ValidationHelper
+
+
+class CacheTools(BaseGitHubTool):
+    """Response cache introspection and control tools"""
+    
+    def __init__(self, config, rate_limiter, error_handler):
+        super().__init__(config, rate_limiter, error_handler)
+        self.cache_manager = CacheManager.for_config(config)
+    
+    async def get_cache_stats(self, top_n: int = 10, endpoint: Optional[str] = None) -> Dict[str, Any]:
+        """Get response cache statistics
+        
+        Args:
+            top_n: Number of largest cache keys to report
+            endpoint: Only report endpoint families containing this substring
+        
+        Returns:
+            Hit/miss/revalidation ratios, bytes held, top keys and quota saved
+        """
+        try:
+            stats = self.cache_manager.get_stats(top_n=top_n)
+            if endpoint:
+                stats["endpoints"] = {
+                    family: family_stats for family, family_stats in stats["endpoints"].items()
+                    if endpoint in family
+                }
+            
+            return {
+                "success": True,
+                "enabled": self.config.enable_response_cache,
+                "ttl": self.cache_manager.default_ttl,
+                "stats": stats,
+                "message": "Cache statistics retrieved successfully"
+            }
+            
+        except Exception as e:
+            self.error_handler.log_error(e, "get_cache_stats")
+            return {"success": False, "error": str(e), "message": "Failed to get cache statistics"}
+    
+    async def purge_cache(self, owner: Optional[str] = None, repo: Optional[str] = None,
+                        pattern: Optional[str] = None, reset_stats: bool = False) -> Dict[str, Any]:
+        """Purge cached responses
+        
+        Args:
+            owner: Repository owner (with repo, purges that repository)
+            repo: Repository name
+            pattern: Shell-style pattern matched against cache keys (request URLs)
+            reset_stats: Also reset hit/miss counters
+        
+        Returns:
+            Number of purged entries
+        """
+        try:
+            if not (owner and repo) and not pattern:
+                raise ValueError("Provide owner and repo, or a key pattern")
+            
+            purged = 0
+            if owner and repo:
+                if not ValidationHelper.validate_owner_repo(owner, repo):
+                    raise ValueError("Invalid owner/repo format")
+                purged += self.cache_manager.invalidate({f"repo:{owner}/{repo}"})
+            if pattern:
+                purged += self.cache_manager.purge(pattern)
+            if reset_stats:
+                self.cache_manager.reset_stats()
+            
+            self.logger.info("Purged %s cache entries", purged)
+            return {
+                "success": True,
+                "purged": purged,
+                "remaining": len(self.cache_manager.cache),
+                "message": f"Purged {purged} cache entries"
+            }
+            
+        except Exception as e:
+            self.error_handler.log_error(e, "purge_cache")
+            return {"success": False, "error": str(e), "message": "Failed to purge cache"}
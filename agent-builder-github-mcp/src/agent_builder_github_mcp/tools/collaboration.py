@@ -39,7 +39,7 @@ class CollaborationTools(BaseGitHubTool):
                 "status": "active"
             }
             
-            self.logger.info(f"Enabled real-time collaboration: {owner}/{repo}")
+            self.logger.info("Enabled real-time collaboration: %s/%s", owner, repo)
             return result
             
         except Exception as e:
@@ -76,7 +76,7 @@ class CollaborationTools(BaseGitHubTool):
                 "message": f"Repository shared with {len(share_with)} users"
             }
             
-            self.logger.info(f"Shared repository: {owner}/{repo} with {share_with}")
+            self.logger.info("Shared repository: %s/%s with %s", owner, repo, share_with)
             return result
             
         except Exception as e:
@@ -98,7 +98,7 @@ class CollaborationTools(BaseGitHubTool):
                 "message": f"Shared workspace '{name}' created successfully"
             }
             
-            self.logger.info(f"Created shared workspace: {name}")
+            self.logger.info("Created shared workspace: %s", name)
             return result
             
         except Exception as e:
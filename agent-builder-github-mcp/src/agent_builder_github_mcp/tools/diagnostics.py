@@ -0,0 +1,293 @@
+"""
+Diagnostics Tools
+
+This module provides server diagnostics capabilities including:
+- Latency percentiles per tool, GitHub endpoint family and integration
+- Call, error and request counters
+- On-demand sampling profiler for the event loop
+- Memory accounting and tracemalloc snapshot diffs
+- GitHub quota consumption per tool and caller
+- Slow-call capture with upstream call timelines
+"""
+
+import asyncio
+import threading
+from typing import Any, Dict, Optional
+from src.agent_builder_github_mcp.tools import BaseGitHubTool
+from src.agent_builder_github_mcp.utils.memory import MemoryTracker
+from src.agent_builder_github_mcp.utils.profiler import SamplingProfiler
+from src.agent_builder_github_mcp.utils.quota import QuotaLedger
+from src.agent_builder_github_mcp.utils.slow_calls import SlowCallRecorder
+
+
+class DiagnosticsTools(BaseGitHubTool):
+    """Server diagnostics tools"""
+    
+    def __init__(self, config, rate_limiter, error_handler):
+        super().__init__(config, rate_limiter, error_handler)
+        self._profile_lock = asyncio.Lock()
+        self.memory_tracker = MemoryTracker(self.metrics)
+        self.quota_ledger = QuotaLedger.get_ledger()
+        self.slow_call_recorder = SlowCallRecorder(config.slow_call_threshold, config.slow_call_buffer_size)
+    
+    async def get_latency_metrics(self, prefix: str = "", sort_by: str = "p99",
+                                limit: int = 50) -> Dict[str, Any]:
+        """Get latency histograms with percentiles
+        
+        Args:
+            prefix: Only include metrics starting with this prefix
+                (tool_duration_seconds, github_request_duration_seconds,
+                integration_duration_seconds)
+            sort_by: Field to sort by, highest first (p50, p90, p99, max, count, sum)
+            limit: Maximum number of histograms to return
+        
+        Returns:
+            Percentile summaries and counters
+        """
+        try:
+            histograms = self.metrics.get_histograms(prefix)
+            if sort_by not in ("p50", "p90", "p99", "max", "count", "sum"):
+                raise ValueError(f"Invalid sort field: {sort_by}")
+            
+            ranked = sorted(histograms.items(), key=lambda item: item[1][sort_by], reverse=True)[:limit]
+            return {
+                "success": True,
+                "histograms": dict(ranked),
+                "counters": self.metrics.get_metrics(),
+                "total_histograms": len(histograms),
+                "message": f"Retrieved {len(ranked)} latency histograms"
+            }
+            
+        except Exception as e:
+            self.error_handler.log_error(e, "get_latency_metrics")
+            return {"success": False, "error": str(e), "message": "Failed to get latency metrics"}
+    
+    async def profile_event_loop(self, duration: float = 5.0, interval: float = 0.005,
+                               max_stacks: int = 200) -> Dict[str, Any]:
+        """Profile the live server with a statistical stack sampler
+        
+        Samples the event loop thread while other tool calls keep running, so
+        hot paths can be diagnosed under real load.
+        
+        Args:
+            duration: Seconds to sample for (at most 60)
+            interval: Seconds between samples (at least 0.001)
+            max_stacks: Maximum number of collapsed stacks to return
+        
+        Returns:
+            Collapsed stacks (flamegraph input) and per-coroutine wall time
+        """
+        try:
+            if not 0 < duration <= 60:
+                raise ValueError("duration must be between 0 and 60 seconds")
+            if interval < 0.001:
+                raise ValueError("interval must be at least 0.001 seconds")
+            if self._profile_lock.locked():
+                return {"success": False, "error": "A profile is already running", "message": "Failed to profile event loop"}
+            
+            async with self._profile_lock:
+                profiler = SamplingProfiler(threading.get_ident(), interval)
+                await profiler.run_for(duration)
+            
+            report = profiler.report(max_stacks)
+            return {
+                "success": True,
+                **report,
+                "message": f"Collected {report['samples']} samples over {report['duration_seconds']}s"
+            }
+            
+        except Exception as e:
+            self.error_handler.log_error(e, "profile_event_loop")
+            return {"success": False, "error": str(e), "message": "Failed to profile event loop"}
+    
+    async def get_memory_usage(self) -> Dict[str, Any]:
+        """Get process memory and the estimated size of in-memory server state
+        
+        Returns:
+            RSS, RSS growth since start, per-structure item counts and byte
+            estimates, and tracemalloc status
+        """
+        try:
+            usage = self.memory_tracker.sample()
+            return {
+                "success": True,
+                **usage,
+                "message": f"Memory usage for {len(usage['structures'])} structures"
+            }
+            
+        except Exception as e:
+            self.error_handler.log_error(e, "get_memory_usage")
+            return {"success": False, "error": str(e), "message": "Failed to get memory usage"}
+    
+    async def take_memory_snapshot(self, label: Optional[str] = None, frames: int = 1,
+                                 limit: int = 10) -> Dict[str, Any]:
+        """Take a tracemalloc snapshot for later comparison
+        
+        Starts tracemalloc on first use; allocations made before that are not
+        traced. Only the most recent snapshots are retained.
+        
+        Args:
+            label: Snapshot name (defaults to snapshot-N)
+            frames: Traceback depth when tracing is started by this call
+            limit: Number of top allocation sites to return
+        
+        Returns:
+            Snapshot id, traced totals and top allocation sites
+        """
+        try:
+            if not 1 <= frames <= 50:
+                raise ValueError("frames must be between 1 and 50")
+            
+            snapshot_id, snapshot = self.memory_tracker.take_snapshot(label, frames)
+            stats = snapshot.statistics("traceback" if frames > 1 else "lineno")
+            return {
+                "success": True,
+                "snapshot_id": snapshot_id,
+                "traced_bytes": sum(stat.size for stat in stats),
+                "top_allocations": MemoryTracker.format_stats(stats, limit),
+                "tracemalloc": self.memory_tracker.tracing_status(),
+                "message": f"Snapshot {snapshot_id} taken"
+            }
+            
+        except Exception as e:
+            self.error_handler.log_error(e, "take_memory_snapshot")
+            return {"success": False, "error": str(e), "message": "Failed to take memory snapshot"}
+    
+    async def compare_memory_snapshots(self, base_snapshot: Optional[str] = None,
+                                     compare_snapshot: Optional[str] = None,
+                                     group_by: str = "lineno", limit: int = 20) -> Dict[str, Any]:
+        """Diff two tracemalloc snapshots to find growing allocation sites
+        
+        Args:
+            base_snapshot: Earlier snapshot id (defaults to the oldest retained)
+            compare_snapshot: Later snapshot id (defaults to a new snapshot)
+            group_by: Grouping key (lineno, filename, traceback)
+            limit: Number of allocation sites to return
+        
+        Returns:
+            Allocation sites ordered by growth
+        """
+        try:
+            if group_by not in ("lineno", "filename", "traceback"):
+                raise ValueError(f"Invalid group_by: {group_by}")
+            
+            snapshots = self.memory_tracker.snapshots
+            if base_snapshot is None:
+                if not snapshots:
+                    raise ValueError("No snapshots taken yet; call take_memory_snapshot first")
+                base_snapshot = next(iter(snapshots))
+            if base_snapshot not in snapshots:
+                raise ValueError(f"Unknown snapshot: {base_snapshot}")
+            if compare_snapshot is None:
+                compare_snapshot, _ = self.memory_tracker.take_snapshot()
+            if compare_snapshot not in snapshots:
+                raise ValueError(f"Unknown snapshot: {compare_snapshot}")
+            
+            base_time, base = snapshots[base_snapshot]
+            compare_time, compare = snapshots[compare_snapshot]
+            diff = compare.compare_to(base, group_by)
+            return {
+                "success": True,
+                "base_snapshot": base_snapshot,
+                "compare_snapshot": compare_snapshot,
+                "interval_seconds": round(compare_time - base_time, 1),
+                "total_size_diff_bytes": sum(stat.size_diff for stat in diff),
+                "top_differences": MemoryTracker.format_stats(diff, limit),
+                "message": f"Compared {base_snapshot} with {compare_snapshot}"
+            }
+            
+        except Exception as e:
+            self.error_handler.log_error(e, "compare_memory_snapshots")
+            return {"success": False, "error": str(e), "message": "Failed to compare memory snapshots"}
+    
+    async def stop_memory_tracing(self, clear_snapshots: bool = True) -> Dict[str, Any]:
+        """Stop tracemalloc to remove its allocation overhead
+        
+        Args:
+            clear_snapshots: Also drop retained snapshots
+        
+        Returns:
+            Tracing status
+        """
+        try:
+            self.memory_tracker.stop_tracing(clear_snapshots)
+            return {
+                "success": True,
+                "tracemalloc": self.memory_tracker.tracing_status(),
+                "message": "Memory tracing stopped"
+            }
+            
+        except Exception as e:
+            self.error_handler.log_error(e, "stop_memory_tracing")
+            return {"success": False, "error": str(e), "message": "Failed to stop memory tracing"}
+    
+    async def get_quota_usage(self, window_seconds: Optional[int] = 3600, group_by: str = "tool",
+                            limit: int = 25) -> Dict[str, Any]:
+        """Get GitHub API quota spent per tool and caller
+        
+        Args:
+            window_seconds: Rolling window in seconds (at most 3600); null for
+                totals since the server started
+            group_by: Comma separated grouping fields (tool, caller, resource),
+                e.g. "tool,caller"
+            limit: Maximum number of groups to return
+        
+        Returns:
+            Quota cost and request counts per group, highest cost first, and
+            the remaining quota reported by GitHub per resource
+        """
+        try:
+            fields = tuple(field.strip() for field in group_by.split(",") if field.strip())
+            usage = self.quota_ledger.usage(window_seconds, fields)
+            
+            remaining = {}
+            for key, value in self.metrics.get_metrics().items():
+                if key.startswith("github_ratelimit_remaining{"):
+                    resource = key.split('resource="', 1)[1].rstrip('"}')
+                    remaining[resource] = value
+            
+            return {
+                "success": True,
+                **usage,
+                "groups": usage["groups"][:limit],
+                "total_groups": len(usage["groups"]),
+                "remaining": remaining,
+                "message": f"Quota usage for {len(usage['groups'])} groups"
+            }
+            
+        except Exception as e:
+            self.error_handler.log_error(e, "get_quota_usage")
+            return {"success": False, "error": str(e), "message": "Failed to get quota usage"}
+    
+    async def get_slow_calls(self, tool: Optional[str] = None, limit: int = 20,
+                           clear: bool = False) -> Dict[str, Any]:
+        """Get recent tool calls that exceeded the slow-call threshold
+        
+        Each call includes its redacted arguments, response size and the
+        timeline of upstream GitHub, cache and integration calls it made.
+        
+        Args:
+            tool: Only return calls of this tool
+            limit: Maximum number of calls to return, most recent first
+            clear: Empty the buffer after reading
+        
+        Returns:
+            Slow calls with upstream call timelines
+        """
+        try:
+            recorder = self.slow_call_recorder
+            calls = recorder.get_calls(tool, limit)
+            if clear:
+                recorder.clear()
+            return {
+                "success": True,
+                "slow_calls": calls,
+                "threshold_seconds": recorder.threshold,
+                "buffered": len(recorder.calls),
+                "total_slow_calls": recorder.total_slow,
+                "message": f"Retrieved {len(calls)} slow calls"
+            }
+            
+        except Exception as e:
+            self.error_handler.log_error(e, "get_slow_calls")
+            return {"success": False, "error": str(e), "message": "Failed to get slow calls"}
@@ -37,7 +37,7 @@ class FileSyncTools(BaseGitHubTool):
                 "message": f"Repository {owner}/{repo} synced to {local_path}"
             }
             
-            self.logger.info(f"Synced repository to cloud: {owner}/{repo}")
+            self.logger.info("Synced repository to cloud: %s/%s", owner, repo)
             return result
             
         except Exception as e:
@@ -56,7 +56,7 @@ class FileSyncTools(BaseGitHubTool):
                 "message": f"Changes synced from {local_path} to {owner}/{repo}"
             }
             
-            self.logger.info(f"Synced cloud changes to repository: {owner}/{repo}")
+            self.logger.info("Synced cloud changes to repository: %s/%s", owner, repo)
             return result
             
         except Exception as e:
@@ -89,7 +89,7 @@ class FileSyncTools(BaseGitHubTool):
                 "message": f"Conflicts resolved using {resolution_strategy} strategy"
             }
             
-            self.logger.info(f"Resolved conflicts: {conflict_id}")
+            self.logger.info("Resolved conflicts: %s", conflict_id)
             return result
             
         except Exception as e:
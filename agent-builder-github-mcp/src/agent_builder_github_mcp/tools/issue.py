@@ -65,7 +65,7 @@ class IssueTools(BaseGitHubTool):
                                       self.rate_limiter, self.error_handler) as client:
                 result = await client.post(endpoint, data)
                 
-                self.logger.info(f"Created issue: {title} in {owner}/{repo}")
+                self.logger.info("Created issue: %s in %s/%s", title, owner, repo)
                 return {
                     "success": True,
                     "issue": result,
@@ -166,7 +166,7 @@ class IssueTools(BaseGitHubTool):
                                       self.rate_limiter, self.error_handler) as client:
                 result = await client.patch(endpoint, data)
                 
-                self.logger.info(f"Updated issue #{issue_number}")
+                self.logger.info("Updated issue #%s", issue_number)
                 return {
                     "success": True,
                     "issue": result,
@@ -306,7 +306,7 @@ class IssueTools(BaseGitHubTool):
                                       self.rate_limiter, self.error_handler) as client:
                 result = await client.post(endpoint, data)
                 
-                self.logger.info(f"Added comment to issue #{issue_number}")
+                self.logger.info("Added comment to issue #%s", issue_number)
                 return {
                     "success": True,
                     "comment": result,
@@ -483,7 +483,7 @@ assignees: {', '.join(assignees) if assignees else ''}
             )
             
             if result["success"]:
-                self.logger.info(f"Created issue template: {template_name}")
+                self.logger.info("Created issue template: %s", template_name)
             
             return result
             
@@ -47,7 +47,7 @@ class PullRequestTools(BaseGitHubTool):
                                       self.rate_limiter, self.error_handler) as client:
                 result = await client.post(endpoint, data)
                 
-                self.logger.info(f"Created PR: {title}")
+                self.logger.info("Created PR: %s", title)
                 return {"success": True, "pull_request": result, "message": "PR created successfully"}
                 
         except Exception as e:
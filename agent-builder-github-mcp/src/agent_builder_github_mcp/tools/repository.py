@@ -113,7 +113,7 @@ class RepositoryTools(BaseGitHubTool):
                                       self.rate_limiter, self.error_handler) as client:
                 result = await client.post(endpoint, data)
                 
-                self.logger.info(f"Created repository: {name}")
+                self.logger.info("Created repository: %s", name)
                 return {
                     "success": True,
                     "repository": result,
@@ -170,7 +170,7 @@ class RepositoryTools(BaseGitHubTool):
                 result = await client.post(endpoint, data)
                 
                 fork_name = result.get("name", name or repo)
-                self.logger.info(f"Forked repository {owner}/{repo} as {fork_name}")
+                self.logger.info("Forked repository %s/%s as %s", owner, repo, fork_name)
                 return {
                     "success": True,
                     "repository": result,
@@ -218,7 +218,7 @@ class RepositoryTools(BaseGitHubTool):
                                       self.rate_limiter, self.error_handler) as client:
                 success = await client.delete(endpoint)
                 
-                self.logger.warning(f"Deleted repository: {owner}/{repo}")
+                self.logger.warning("Deleted repository: %s/%s", owner, repo)
                 return {
                     "success": True,
                     "message": f"Repository {owner}/{repo} deleted successfully"
@@ -453,7 +453,7 @@ class RepositoryTools(BaseGitHubTool):
                                       self.rate_limiter, self.error_handler) as client:
                 result = await client.patch(endpoint, data)
                 
-                self.logger.info(f"Updated repository: {owner}/{repo}")
+                self.logger.info("Updated repository: %s/%s", owner, repo)
                 return {
                     "success": True,
                     "repository": result,
@@ -584,7 +584,7 @@ class RepositoryTools(BaseGitHubTool):
                 result = await client.put(endpoint, data)
                 
                 action = "updated" if sha else "created"
-                self.logger.info(f"{action.title()} file: {owner}/{repo}/{path}")
+                self.logger.info("%s file: %s/%s/%s", action.title(), owner, repo, path)
                 return {
                     "success": True,
                     "file": result,
@@ -662,7 +662,7 @@ class RepositoryTools(BaseGitHubTool):
                                       self.rate_limiter, self.error_handler) as client:
                 result = await client.delete(endpoint, json=data)
                 
-                self.logger.warning(f"Deleted file: {owner}/{repo}/{path}")
+                self.logger.warning("Deleted file: %s/%s/%s", owner, repo, path)
                 return {
                     "success": True,
                     "commit": result,
@@ -755,7 +755,7 @@ class RepositoryTools(BaseGitHubTool):
                 author=author
             )
             
-            self.logger.info(f"Moved file: {owner}/{repo}/{path} -> {new_path}")
+            self.logger.info("Moved file: %s/%s/%s -> %s", owner, repo, path, new_path)
             return {
                 "success": True,
                 "new_file": create_result.get("file"),
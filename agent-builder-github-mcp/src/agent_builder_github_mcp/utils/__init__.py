@@ -11,14 +11,16 @@ This module provides essential utilities for:
 """
 
 import asyncio
+import atexit
 import logging
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import wraps
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
 import json
 import os
 from urllib.parse import urljoin
@@ -27,27 +29,105 @@ import httpx
 from pydantic import BaseModel, Field, validator
 from pydantic_settings import BaseSettings
 
+from src.agent_builder_github_mcp.utils.cache_keys import endpoint_family, resource_keys
+from src.agent_builder_github_mcp.utils.cassette import cassette_transport
+from src.agent_builder_github_mcp.utils.openmetrics import escape_label_value
+from src.agent_builder_github_mcp.utils.quota import (
+    ANONYMOUS_CALLER,
+    UNATTRIBUTED_TOOL,
+    QuotaLedger,
+    current_call,
+    rate_limit_resource,
+    request_cost,
+)
+from src.agent_builder_github_mcp.utils.slow_calls import record_upstream
+from src.agent_builder_github_mcp.utils.structured_logging import LoggingPipeline, parse_levels
+from src.agent_builder_github_mcp.utils.tracing import SPAN_KIND_CLIENT, tracer
+
 
 class Logger:
-    """Enhanced logging configuration"""
+    """Enhanced logging configuration
+    
+    All loggers share one non-blocking queue handler; a listener thread
+    formats records (JSON lines by default) and writes them to stderr.
+    """
     
     _loggers = {}
+    _pipeline: Optional[LoggingPipeline] = None
+    _level = logging.INFO
+    _levels: Dict[str, int] = {}
     
     @classmethod
     def get_logger(cls, name: str) -> logging.Logger:
         """Get a logger instance"""
         if name not in cls._loggers:
             logger = logging.getLogger(name)
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-            logger.setLevel(logging.INFO)
+            logger.addHandler(cls._get_pipeline().handler)
+            logger.setLevel(cls._level_for(name))
             cls._loggers[name] = logger
         
         return cls._loggers[name]
+    
+    @classmethod
+    def configure(cls, level: str = "INFO", levels: Optional[str] = None, json_output: bool = True,
+                  info_rate: float = 50.0, info_sample_ratio: float = 1.0):
+        """Configure levels and output for all loggers
+        
+        Args:
+            level: Default level
+            levels: Per-logger levels, e.g. "GitHubAPIClient=DEBUG,server=WARNING";
+                loggers are named after their class (module loggers after
+                their module), and a name also applies to its dotted children
+            json_output: Emit JSON lines instead of plain text
+            info_rate: INFO/DEBUG records per second allowed per logger (0 disables)
+            info_sample_ratio: Fraction of INFO/DEBUG records kept before rate limiting
+        """
+        cls._level = parse_levels(f"*={level}")["*"]
+        cls._levels = parse_levels(levels)
+        
+        previous = cls._pipeline
+        cls._pipeline = LoggingPipeline(json_output=json_output, info_rate=info_rate,
+                                        info_sample_ratio=info_sample_ratio)
+        cls._pipeline.start()
+        for name, logger in cls._loggers.items():
+            if previous is not None:
+                logger.removeHandler(previous.handler)
+            logger.addHandler(cls._pipeline.handler)
+            logger.setLevel(cls._level_for(name))
+        if previous is not None:
+            previous.stop()
+    
+    @classmethod
+    def after_fork(cls):
+        """Give a forked child process its own pipeline
+        
+        The parent's listener thread does not exist in the child, so its
+        queue would never be drained.
+        """
+        previous, cls._pipeline = cls._pipeline, None
+        for logger in cls._loggers.values():
+            if previous is not None:
+                logger.removeHandler(previous.handler)
+            logger.addHandler(cls._get_pipeline().handler)
+    
+    @classmethod
+    def _get_pipeline(cls) -> LoggingPipeline:
+        if cls._pipeline is None:
+            cls._pipeline = LoggingPipeline()
+            cls._pipeline.start()
+            atexit.register(cls.shutdown)
+        return cls._pipeline
+    
+    @classmethod
+    def _level_for(cls, name: str) -> int:
+        matches = [key for key in cls._levels if name == key or name.startswith(key + ".")]
+        return cls._levels[max(matches, key=len)] if matches else cls._level
+    
+    @classmethod
+    def shutdown(cls):
+        """Flush queued records and stop the listener thread"""
+        if cls._pipeline is not None:
+            cls._pipeline.stop()
 
 
 class Config(BaseModel):
@@ -81,6 +161,8 @@ class RateLimiter:
         self.max_requests = max_requests
         self.time_window = time_window
         self.requests = []
+        self.waits = 0
+        self.wait_seconds = 0.0
     
     async def acquire(self) -> bool:
         """Acquire a rate limit token"""
@@ -98,23 +180,29 @@ class RateLimiter:
         self.requests.append(now)
         return True
     
+    def _oldest_request(self) -> Optional[float]:
+        """Time of the oldest request in the window"""
+        return min(self.requests) if self.requests else None
+    
     async def wait_for_slot(self):
         """Wait for an available rate limit slot"""
         while not await self.acquire():
             # Wait for the oldest request to expire
-            if self.requests:
-                oldest_request = min(self.requests)
+            oldest_request = self._oldest_request()
+            if oldest_request is not None:
                 wait_time = self.time_window - (time.time() - oldest_request) + 1
-                await asyncio.sleep(wait_time)
             else:
-                await asyncio.sleep(1)
+                wait_time = 1
+            self.waits += 1
+            self.wait_seconds += wait_time
+            await asyncio.sleep(wait_time)
 
 
 class ErrorHandler:
     """Centralized error handling"""
     
     def __init__(self, auth_manager = None):  # Will be AuthManager but avoid forward reference
-        self.logger = Logger.get_logger(__name__)
+        self.logger = Logger.get_logger(self.__class__.__name__)
         self.auth_manager = auth_manager
     
     def handle_github_error(self, response: httpx.Response) -> Exception:
@@ -142,7 +230,7 @@ class ErrorHandler:
     
     def log_error(self, error: Exception, context: str = ""):
         """Log an error with context"""
-        self.logger.error(f"Error in {context}: {error}")
+        self.logger.error("Error in %s: %s", context, error)
     
     def handle_async_error(self, context: str = ""):
         """Decorator for handling async function errors"""
@@ -164,7 +252,7 @@ class AuthManager:
     def __init__(self, token: str):
         """Initialize authentication manager"""
         self.token = token
-        self.logger = Logger.get_logger(__name__)
+        self.logger = Logger.get_logger(self.__class__.__name__)
     
     def get_headers(self) -> Dict[str, str]:
         """Get authentication headers"""
@@ -177,7 +265,7 @@ class AuthManager:
     async def make_request(self, client: httpx.AsyncClient, method: str, 
                           url: str, **kwargs) -> httpx.Response:
         """Make authenticated request to GitHub API"""
-        headers = self.get_headers()
+        headers = {**self.get_headers(), **(kwargs.pop("headers", None) or {})}
         
         response = await client.request(
             method=method,
@@ -187,7 +275,10 @@ class AuthManager:
         )
         
         if response.status_code >= 400:
-            raise ErrorHandler().handle_github_error(response)
+            error = ErrorHandler().handle_github_error(response)
+            # Keep the response so callers can account for the failed request
+            error.response = response
+            raise error
         
         return response
 
@@ -234,139 +325,575 @@ class GitHubAPIClient:
         self.auth_manager = auth_manager
         self.rate_limiter = rate_limiter
         self.error_handler = error_handler
-        self.logger = Logger.get_logger(__name__)
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self.cache_manager = CacheManager.for_config(config) if config.enable_response_cache else None
+        self.metrics = MetricsCollector.get_collector()
+        self.quota_ledger = QuotaLedger.get_ledger()
     
     async def __aenter__(self):
         self.client = httpx.AsyncClient(
             base_url=self.config.github_api_base_url,
-            timeout=self.config.github_timeout
+            timeout=self.config.github_timeout,
+            event_hooks={"response": [self._record_rate_limit]},
+            transport=cassette_transport(self.config.github_cassette_mode, self.config.github_cassette_path,
+                                         self.config.github_cassette_timing, self.config.workers > 1),
         )
         return self
     
+    async def _record_rate_limit(self, response: httpx.Response):
+        """Track GitHub quota remaining per rate limit resource"""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        labels = {"resource": response.headers.get("X-RateLimit-Resource", "core")}
+        self.metrics.gauge("github_ratelimit_remaining", int(remaining), labels)
+        if "X-RateLimit-Limit" in response.headers:
+            self.metrics.gauge("github_ratelimit_limit", int(response.headers["X-RateLimit-Limit"]), labels)
+        if "X-RateLimit-Reset" in response.headers:
+            self.metrics.gauge("github_ratelimit_reset_timestamp", int(response.headers["X-RateLimit-Reset"]), labels)
+    
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if hasattr(self, 'client'):
             await self.client.aclose()
     
     async def get(self, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Make GET request to GitHub API"""
-        await self.rate_limiter.wait_for_slot()
+        if self.cache_manager is None:
+            response = await self._send("GET", endpoint, **kwargs)
+            return self._decode(response)
+        
+        return await self._cached_get(endpoint, **kwargs)
+    
+    async def _cached_get(self, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """Serve a GET from the response cache, revalidating stale entries by ETag"""
         url = urljoin(self.config.github_api_base_url + "/", endpoint)
+        cache_key = self._cache_key(url, kwargs)
+        family = endpoint_family(endpoint)
+        started = time.perf_counter()
+        with tracer.start_span("cache.lookup", attributes={"cache.endpoint": family}) as span:
+            entry = self.cache_manager.get_entry(cache_key, include_expired=True)
+            fresh = entry is not None and datetime.now() < entry.expiry
+            outcome = "hit" if fresh else "stale" if entry else "miss"
+            span.set_attribute("cache.outcome", outcome)
+        record_upstream("cache", f"GET {endpoint}", started, outcome)
+        if fresh:
+            self.cache_manager.record(family, "hits")
+            return entry.value
         
-        async with GitHubAPIClient(self.config, self.auth_manager, 
-                                  self.rate_limiter, self.error_handler) as client:
-            response = await client.auth_manager.make_request(
-                client.client, "GET", url, **kwargs
-            )
-            return response.json()
+        keys = resource_keys(endpoint)
+        generation = self.cache_manager.generation(keys)
+        if entry is not None and entry.etag:
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), "If-None-Match": entry.etag}
+        
+        response = await self._send("GET", endpoint, **kwargs)
+        
+        if response.status_code == 304 and entry is not None:
+            self.cache_manager.record(family, "revalidations")
+            self.cache_manager.touch(cache_key)
+            return entry.value
+        
+        self.cache_manager.record(family, "misses")
+        result = self._decode(response)
+        if self.cache_manager.generation(keys) == generation:
+            self.cache_manager.set(cache_key, result, etag=response.headers.get("ETag"),
+                                   resource_keys=keys, family=family,
+                                   size=len(response.content))
+        return result
     
-    async def post(self, endpoint: str, data: Dict[str, Any], **kwargs) -> Dict[str, Any]:
-        """Make POST request to GitHub API"""
-        await self.rate_limiter.wait_for_slot()
+    @staticmethod
+    def _cache_key(url: str, kwargs: Dict[str, Any]) -> str:
+        """Build a cache key from the URL, query parameters and Accept header"""
+        params = json.dumps(kwargs.get("params") or {}, sort_keys=True, default=str)
+        accept = (kwargs.get("headers") or {}).get("Accept", "")
+        return f"{url}|{params}|{accept}"
+    
+    async def _send(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """Send a rate limited request to GitHub API and record its latency"""
+        with tracer.start_span("rate_limiter.wait_for_slot"):
+            await self.rate_limiter.wait_for_slot()
         url = urljoin(self.config.github_api_base_url + "/", endpoint)
+        labels = {"method": method, "endpoint": endpoint_family(endpoint)}
         
-        async with GitHubAPIClient(self.config, self.auth_manager, 
-                                  self.rate_limiter, self.error_handler) as client:
-            response = await client.auth_manager.make_request(
-                client.client, "POST", url, json=data, **kwargs
-            )
+        with tracer.start_span("http.client.setup"):
+            client = await GitHubAPIClient(self.config, self.auth_manager, 
+                                           self.rate_limiter, self.error_handler).__aenter__()
+        try:
+            self.metrics.increment("github_requests_in_flight")
+            with self.metrics.timer("github_request_duration_seconds", labels), \
+                    tracer.start_span(f"GitHub {method} {labels['endpoint']}", SPAN_KIND_CLIENT,
+                                      {"http.request.method": method, "url.template": labels["endpoint"]}) as span:
+                started = time.perf_counter()
+                try:
+                    response = await client.auth_manager.make_request(
+                        client.client, method, url, **kwargs
+                    )
+                    span.set_attribute("http.response.status_code", response.status_code)
+                    self._record_quota(endpoint, response)
+                    record_upstream("github", f"{method} {endpoint}", started,
+                                    response.status_code, len(response.content))
+                    return response
+                except Exception as e:
+                    self.metrics.increment("github_request_errors_total", labels=labels)
+                    error_response = getattr(e, "response", None)
+                    if error_response is not None:
+                        # GitHub charges failed requests too, rate limit replies included
+                        span.set_attribute("http.response.status_code", error_response.status_code)
+                        self._record_quota(endpoint, error_response)
+                    record_upstream("github", f"{method} {endpoint}", started,
+                                    error_response.status_code if error_response is not None
+                                    else getattr(e, "status_code", None), error=str(e))
+                    raise
+                finally:
+                    self.metrics.increment("github_requests_in_flight", -1)
+        finally:
+            await client.__aexit__(None, None, None)
+    
+    def _record_quota(self, endpoint: str, response: httpx.Response):
+        """Charge the request's quota cost to the tool call that made it"""
+        call = current_call.get()
+        tool = call.tool if call else UNATTRIBUTED_TOOL
+        caller = self.quota_ledger.caller_label(call.caller if call else ANONYMOUS_CALLER)
+        resource = rate_limit_resource(endpoint, response)
+        cost = request_cost(endpoint, response)
+        self.quota_ledger.record(tool, caller, resource, cost)
+        self.metrics.increment("github_quota_cost_total", cost,
+                               {"tool": tool, "caller": caller, "resource": resource})
+    
+    @staticmethod
+    def _decode(response: httpx.Response) -> Any:
+        """Decode a JSON response body"""
+        with tracer.start_span("json.decode", attributes={"http.response.body.size": len(response.content)}):
             return response.json()
     
+    async def post(self, endpoint: str, data: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        """Make POST request to GitHub API"""
+        response = await self._send("POST", endpoint, json=data, **kwargs)
+        return self._decode(response)
+    
     async def put(self, endpoint: str, data: Dict[str, Any] = None, **kwargs) -> Dict[str, Any]:
         """Make PUT request to GitHub API"""
-        await self.rate_limiter.wait_for_slot()
-        url = urljoin(self.config.github_api_base_url + "/", endpoint)
-        
-        async with GitHubAPIClient(self.config, self.auth_manager, 
-                                  self.rate_limiter, self.error_handler) as client:
-            response = await client.auth_manager.make_request(
-                client.client, "PUT", url, json=data, **kwargs
-            )
-            return response.json()
+        response = await self._send("PUT", endpoint, json=data, **kwargs)
+        return self._decode(response)
+    
+    async def patch(self, endpoint: str, data: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        """Make PATCH request to GitHub API"""
+        response = await self._send("PATCH", endpoint, json=data, **kwargs)
+        return self._decode(response)
     
     async def delete(self, endpoint: str, **kwargs) -> bool:
         """Make DELETE request to GitHub API"""
-        await self.rate_limiter.wait_for_slot()
-        url = urljoin(self.config.github_api_base_url + "/", endpoint)
-        
-        async with GitHubAPIClient(self.config, self.auth_manager, 
-                                  self.rate_limiter, self.error_handler) as client:
-            response = await client.auth_manager.make_request(
-                client.client, "DELETE", url, **kwargs
-            )
-            return response.status_code == 204
+        response = await self._send("DELETE", endpoint, **kwargs)
+        return response.status_code == 204
+
+
+@dataclass
+class CacheEntry:
+    """Cached API response"""
+    
+    value: Any
+    expiry: datetime
+    etag: Optional[str] = None
+    resource_keys: frozenset = frozenset()
+    family: str = ""
+    size: int = 0
+    generation: int = 0
 
 
 class CacheManager:
-    """Simple cache manager for API responses"""
+    """Simple cache manager for API responses
+    
+    Entries are kept in least recently used order and evicted beyond
+    ``max_entries`` or ``max_bytes``. Expired entries with an ETag are kept
+    for revalidation for at most ``stale_ttl`` seconds past their expiry;
+    a periodic sweep drops them, along with invalidation generations old
+    enough that no request can still depend on them.
+    """
+    
+    _caches = {}
     
-    def __init__(self, default_ttl: int = 300):
-        self.cache = {}
+    # Seconds between sweeps of stale entries
+    SWEEP_INTERVAL = 60
+    
+    def __init__(self, default_ttl: int = 300, max_entries: int = 10000,
+                 max_bytes: int = 64 * 1024 * 1024, stale_ttl: int = 3600):
+        self.cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
         self.default_ttl = default_ttl
-        self.logger = Logger.get_logger(__name__)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stale_ttl = stale_ttl
+        self.bytes_held = 0
+        self.evictions = 0
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self.key_index: Dict[str, Set[str]] = {}
+        self.key_generations: Dict[str, int] = {}
+        # When each resource key's generation was last bumped
+        self.generation_bumped: Dict[str, float] = {}
+        # Generations shared with other worker processes (see utils.shared_state)
+        self.shared_generations = None
+        self.stats: Dict[str, Dict[str, int]] = {}
+        self._last_sweep = time.monotonic()
+    
+    @classmethod
+    def get_cache(cls, name: str, default_ttl: int = 300, max_entries: int = 10000,
+                  max_bytes: int = 64 * 1024 * 1024, stale_ttl: int = 3600) -> 'CacheManager':
+        """Get a shared cache instance"""
+        if name not in cls._caches:
+            cls._caches[name] = cls(default_ttl, max_entries, max_bytes, stale_ttl)
+        
+        return cls._caches[name]
+    
+    @classmethod
+    def for_config(cls, config: 'GitHubMCPConfig') -> 'CacheManager':
+        """Get the shared GitHub response cache with the configured bounds"""
+        return cls.get_cache("github", config.cache_ttl, config.cache_max_entries,
+                             config.cache_max_bytes, config.cache_stale_ttl)
     
     def get(self, key: str) -> Optional[Any]:
         """Get cached value"""
-        if key in self.cache:
-            value, expiry = self.cache[key]
-            if datetime.now() < expiry:
-                return value
-            else:
-                del self.cache[key]
+        entry = self.get_entry(key)
+        return entry.value if entry else None
+    
+    def get_entry(self, key: str, include_expired: bool = False) -> Optional['CacheEntry']:
+        """Get cached entry, optionally keeping expired entries for revalidation"""
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        if self.shared_generations is not None and entry.generation != self.generation(entry.resource_keys):
+            # Invalidated by a write in another worker
+            self._remove(key)
+            return None
+        now = datetime.now()
+        if now < entry.expiry:
+            self.cache.move_to_end(key)
+            return entry
+        if entry.etag is None or now >= entry.expiry + timedelta(seconds=self.stale_ttl):
+            self._remove(key)
+            return None
+        if include_expired:
+            self.cache.move_to_end(key)
+            return entry
         return None
     
-    def set(self, key: str, value: Any, ttl: int = None):
+    def set(self, key: str, value: Any, ttl: int = None, etag: Optional[str] = None,
+            resource_keys: Optional[Set[str]] = None, family: str = "", size: int = 0):
         """Set cached value"""
         ttl = ttl or self.default_ttl
         expiry = datetime.now() + timedelta(seconds=ttl)
-        self.cache[key] = (value, expiry)
+        self._remove(key)
+        resource_keys = frozenset(resource_keys or ())
+        self.cache[key] = CacheEntry(value, expiry, etag, resource_keys, family, size,
+                                     self.generation(resource_keys))
+        self.bytes_held += size
+        for resource_key in self.cache[key].resource_keys:
+            self.key_index.setdefault(resource_key, set()).add(key)
+        self._evict()
+        if time.monotonic() - self._last_sweep >= self.SWEEP_INTERVAL:
+            self.sweep()
+    
+    def _evict(self):
+        """Drop least recently used entries beyond the entry and byte bounds"""
+        while self.cache and (len(self.cache) > self.max_entries or self.bytes_held > self.max_bytes):
+            self._remove(next(iter(self.cache)))
+            self.evictions += 1
+    
+    def sweep(self) -> int:
+        """Drop entries past stale retention and generations no request can still depend on"""
+        self._last_sweep = time.monotonic()
+        now = datetime.now()
+        cutoff = now - timedelta(seconds=self.stale_ttl)
+        expired = [key for key, entry in self.cache.items()
+                   if entry.expiry <= cutoff or (entry.etag is None and entry.expiry <= now)]
+        for key in expired:
+            self._remove(key)
+        # A generation only guards fetches that started before its bump; after
+        # stale_ttl none are in flight, and unindexed keys have no entries left
+        oldest = time.time() - self.stale_ttl
+        for resource_key in [resource_key for resource_key, bumped in self.generation_bumped.items()
+                             if bumped < oldest and resource_key not in self.key_index]:
+            del self.key_generations[resource_key]
+            del self.generation_bumped[resource_key]
+        return len(expired)
+    
+    def touch(self, key: str, ttl: int = None):
+        """Extend the expiry of a revalidated entry"""
+        entry = self.cache.get(key)
+        if entry is not None:
+            entry.expiry = datetime.now() + timedelta(seconds=ttl or self.default_ttl)
+            self.cache.move_to_end(key)
+    
+    def generation(self, resource_keys: Set[str]) -> int:
+        """Get the combined invalidation generation of resource keys
+        
+        Readers capture this before a fetch and skip storing the response when
+        it changed, so a write that lands mid-fetch is never masked.
+        """
+        generation = sum(self.key_generations.get(resource_key, 0) for resource_key in resource_keys)
+        if self.shared_generations is not None:
+            generation += self.shared_generations.generation(resource_keys)
+        return generation
+    
+    def invalidate(self, resource_keys: Set[str]) -> int:
+        """Drop every entry that depends on any of the given resource keys"""
+        removed = 0
+        if self.shared_generations is not None:
+            self.shared_generations.bump(resource_keys)
+        now = time.time()
+        for resource_key in resource_keys:
+            self.key_generations[resource_key] = self.key_generations.get(resource_key, 0) + 1
+            self.generation_bumped[resource_key] = now
+            for key in list(self.key_index.get(resource_key, ())):
+                if key in self.cache:
+                    self._remove(key)
+                    removed += 1
+        if removed:
+            self.logger.debug("Invalidated %s cache entries for %s", removed, sorted(resource_keys))
+        return removed
+    
+    def purge(self, pattern: str) -> int:
+        """Drop every entry whose key matches a shell-style pattern"""
+        import fnmatch
+        keys = [key for key in self.cache if fnmatch.fnmatchcase(key, pattern)]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+    
+    def record(self, family: str, outcome: str):
+        """Record a cache lookup outcome (hits, misses or revalidations)"""
+        counts = self.stats.setdefault(family, {"hits": 0, "misses": 0, "revalidations": 0})
+        counts[outcome] += 1
+    
+    def get_stats(self, top_n: int = 10) -> Dict[str, Any]:
+        """Get hit ratios, memory held and largest entries"""
+        def summarize(counts: Dict[str, int]) -> Dict[str, Any]:
+            lookups = counts["hits"] + counts["misses"] + counts["revalidations"]
+            return {
+                **counts,
+                "lookups": lookups,
+                "hit_ratio": round(counts["hits"] / lookups, 4) if lookups else 0.0,
+                "revalidation_ratio": round(counts["revalidations"] / lookups, 4) if lookups else 0.0,
+                "miss_ratio": round(counts["misses"] / lookups, 4) if lookups else 0.0,
+                # Fresh hits skip the request and 304s are not charged by GitHub
+                "quota_saved": counts["hits"] + counts["revalidations"],
+            }
+        
+        totals = {"hits": 0, "misses": 0, "revalidations": 0}
+        endpoints = {}
+        for family, counts in self.stats.items():
+            endpoints[family] = summarize(counts)
+            for outcome, count in counts.items():
+                totals[outcome] += count
+        for entry in self.cache.values():
+            family_stats = endpoints.setdefault(entry.family, summarize({"hits": 0, "misses": 0, "revalidations": 0}))
+            family_stats["entries"] = family_stats.get("entries", 0) + 1
+            family_stats["bytes"] = family_stats.get("bytes", 0) + entry.size
+        
+        largest = sorted(self.cache.items(), key=lambda item: item[1].size, reverse=True)[:top_n]
+        return {
+            **summarize(totals),
+            "entries": len(self.cache),
+            "bytes_held": self.bytes_held,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+            "endpoints": endpoints,
+            "top_keys": [
+                {"key": key, "bytes": entry.size, "endpoint": entry.family,
+                 "expires_at": entry.expiry.isoformat()}
+                for key, entry in largest
+            ],
+        }
+    
+    def reset_stats(self):
+        """Reset hit/miss counters"""
+        self.stats.clear()
+    
+    def _remove(self, key: str):
+        """Remove an entry and its resource key index references"""
+        entry = self.cache.pop(key, None)
+        if entry is None:
+            return
+        self.bytes_held -= entry.size
+        for resource_key in entry.resource_keys:
+            keys = self.key_index.get(resource_key)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.key_index[resource_key]
     
     def clear(self):
         """Clear all cached values"""
         self.cache.clear()
+        self.key_index.clear()
+        self.bytes_held = 0
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram (HDR-style)
+    
+    Values are tracked in microseconds. Each power of two is split into
+    16 linear sub-buckets, bounding the relative error of any reported
+    percentile to about 6% while keeping memory proportional to the number
+    of distinct buckets hit.
+    """
+    
+    SUB_BUCKET_BITS = 4
+    
+    def __init__(self, name: str, labels: Optional[Dict[str, str]] = None):
+        self.name = name
+        self.labels = labels or {}
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+    
+    def record(self, seconds: float):
+        """Record a duration in seconds"""
+        index = self._bucket_index(max(1, int(seconds * 1_000_000)))
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+    
+    @classmethod
+    def _bucket_index(cls, micros: int) -> int:
+        """Map a value in microseconds to its bucket index"""
+        sub_buckets = 1 << cls.SUB_BUCKET_BITS
+        exponent = micros.bit_length() - 1
+        if exponent < cls.SUB_BUCKET_BITS:
+            return micros
+        shift = exponent - cls.SUB_BUCKET_BITS
+        return sub_buckets + shift * sub_buckets + ((micros >> shift) & (sub_buckets - 1))
+    
+    @classmethod
+    def bucket_upper_bound(cls, index: int) -> float:
+        """Highest value in seconds that maps to a bucket"""
+        sub_buckets = 1 << cls.SUB_BUCKET_BITS
+        if index < sub_buckets:
+            return index / 1_000_000
+        shift, sub_bucket = divmod(index - sub_buckets, sub_buckets)
+        lower = (sub_buckets + sub_bucket) << shift
+        return (lower + (1 << shift) - 1) / 1_000_000
+    
+    def percentile(self, percentile: float) -> float:
+        """Get the value at a percentile (0-100) in seconds"""
+        if not self.count:
+            return 0.0
+        threshold = max(1, int(round(self.count * percentile / 100)))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= threshold:
+                return min(self.bucket_upper_bound(index), self.max)
+        return self.max
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Get count, mean and percentile summary"""
+        return {
+            "count": self.count,
+            "sum": round(self.total, 6),
+            "mean": round(self.total / self.count, 6) if self.count else 0.0,
+            "min": round(self.min or 0.0, 6),
+            "p50": round(self.percentile(50), 6),
+            "p90": round(self.percentile(90), 6),
+            "p99": round(self.percentile(99), 6),
+            "max": round(self.max or 0.0, 6),
+        }
 
 
 class MetricsCollector:
     """Collect and track metrics"""
     
+    _collectors = {}
+    _keys = {}
+    _series = {}
+    
     def __init__(self):
+        # Updated only from the event loop thread, so plain dict updates need
+        # no locking; scrapes read a copy.
         self.metrics = {}
-        self.logger = Logger.get_logger(__name__)
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.logger = Logger.get_logger(self.__class__.__name__)
+    
+    @classmethod
+    def get_collector(cls, name: str = "default") -> 'MetricsCollector':
+        """Get a shared metrics collector"""
+        if name not in cls._collectors:
+            cls._collectors[name] = cls()
+        
+        return cls._collectors[name]
+    
+    @staticmethod
+    def metric_key(metric_name: str, labels: Optional[Dict[str, str]] = None) -> str:
+        """Build a metric key such as name{label="value"}"""
+        if not labels:
+            return metric_name
+        cache_key = (metric_name, tuple(labels.items()))
+        key = MetricsCollector._keys.get(cache_key)
+        if key is None:
+            rendered = ",".join(f'{key}="{escape_label_value(value)}"' for key, value in sorted(labels.items()))
+            key = MetricsCollector._keys[cache_key] = f"{metric_name}{{{rendered}}}"
+            MetricsCollector._series[key] = (metric_name, dict(sorted(labels.items())))
+        return key
+    
+    @staticmethod
+    def series(key: str) -> Tuple[str, Dict[str, str]]:
+        """Metric name and labels of a key built by metric_key"""
+        return MetricsCollector._series.get(key, (key, {}))
     
-    def increment(self, metric_name: str, value: int = 1):
+    def increment(self, metric_name: str, value: int = 1, labels: Optional[Dict[str, str]] = None):
         """Increment a metric"""
-        if metric_name not in self.metrics:
-            self.metrics[metric_name] = 0
-        self.metrics[metric_name] += value
+        key = self.metric_key(metric_name, labels)
+        self.metrics[key] = self.metrics.get(key, 0) + value
     
-    def gauge(self, metric_name: str, value: float):
+    def gauge(self, metric_name: str, value: float, labels: Optional[Dict[str, str]] = None):
         """Set a gauge metric"""
-        self.metrics[metric_name] = value
-    
-    def timer(self, metric_name: str):
-        """Timer context manager"""
+        self.metrics[self.metric_key(metric_name, labels)] = value
+    
+    def observe(self, metric_name: str, seconds: float, labels: Optional[Dict[str, str]] = None):
+        """Record a duration in a latency histogram"""
+        key = self.metric_key(metric_name, labels)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = LatencyHistogram(metric_name, labels)
+        histogram.record(seconds)
+    
+    def timer(self, metric_name: str, labels: Optional[Dict[str, str]] = None):
+        """Timer context manager recording into a latency histogram"""
         class TimerContext:
-            def __init__(self, collector, name):
+            def __init__(self, collector, name, labels):
                 self.collector = collector
                 self.name = name
+                self.labels = labels
                 self.start_time = None
             
             def __enter__(self):
-                self.start_time = time.time()
+                self.start_time = time.perf_counter()
                 return self
             
             def __exit__(self, exc_type, exc_val, exc_tb):
-                duration = time.time() - self.start_time
-                self.collector.gauge(f"{self.name}_duration", duration)
+                duration = time.perf_counter() - self.start_time
+                self.collector.observe(self.name, duration, self.labels)
         
-        return TimerContext(self, metric_name)
+        return TimerContext(self, metric_name, labels)
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get all metrics"""
         return self.metrics.copy()
     
+    def get_histograms(self, prefix: str = "") -> Dict[str, Dict[str, Any]]:
+        """Get percentile summaries of all histograms whose key starts with prefix"""
+        return {
+            key: histogram.snapshot()
+            for key, histogram in sorted(self.histograms.items())
+            if key.startswith(prefix)
+        }
+    
     def reset(self):
         """Reset all metrics"""
         self.metrics.clear()
+        self.histograms.clear()
 
 
 class GitHubMCPConfig(BaseSettings):
@@ -377,6 +904,9 @@ class GitHubMCPConfig(BaseSettings):
     github_api_base_url: str = Field(default="https://api.github.com", description="GitHub API base URL")
     github_timeout: int = Field(default=30, description="GitHub API timeout in seconds")
     github_rate_limit: int = Field(default=5000, description="GitHub API rate limit per hour")
+    github_cassette_mode: Optional[str] = Field(default=None, description="Record GitHub traffic to a cassette or replay it offline (record or replay)", env="GITHUB_CASSETTE_MODE")
+    github_cassette_path: Optional[str] = Field(default=None, description="Cassette file (gzip-compressed NDJSON) to record to or replay from", env="GITHUB_CASSETTE_PATH")
+    github_cassette_timing: float = Field(default=1.0, description="Scale of recorded response times in replay (1.0 original, 0 no delay)", env="GITHUB_CASSETTE_TIMING")
     
     # Agent Builder Platform Configuration
     neon_db_url: Optional[str] = Field(default=None, description="Neon DB connection URL", env="NEON_DB_URL")
@@ -395,6 +925,42 @@ class GitHubMCPConfig(BaseSettings):
     enable_analytics: bool = Field(default=True, description="Enable repository analytics", env="ENABLE_ANALYTICS")
     enable_collaboration: bool = Field(default=True, description="Enable real-time collaboration features", env="ENABLE_COLLABORATION")
     cache_ttl: int = Field(default=300, description="Cache TTL in seconds", env="CACHE_TTL")
+    cache_max_entries: int = Field(default=10000, description="Response cache entries kept before the least recently used are evicted", env="CACHE_MAX_ENTRIES")
+    cache_max_bytes: int = Field(default=64 * 1024 * 1024, description="Response body bytes the cache holds before the least recently used entries are evicted", env="CACHE_MAX_BYTES")
+    cache_stale_ttl: int = Field(default=3600, description="Seconds an expired entry with an ETag is kept for revalidation", env="CACHE_STALE_TTL")
+    metrics_port: Optional[int] = Field(default=None, description="Port for the OpenMetrics HTTP sidecar (disabled when unset)", env="METRICS_PORT")
+    metrics_host: str = Field(default="0.0.0.0", description="Bind address for the OpenMetrics HTTP sidecar", env="METRICS_HOST")
+    loop_lag_interval: float = Field(default=0.5, description="Event loop lag sampling interval in seconds (0 disables)", env="LOOP_LAG_INTERVAL")
+    loop_block_threshold: float = Field(default=0.0, description="Debug: log the stack of coroutine steps blocking the event loop longer than this many seconds (0 disables)", env="LOOP_BLOCK_THRESHOLD")
+    memory_sample_interval: float = Field(default=60.0, description="Interval in seconds for RSS and structure size gauges (0 disables)", env="MEMORY_SAMPLE_INTERVAL")
+    memory_sample_structure_bytes: bool = Field(default=False, description="Also walk registered structures for byte estimates on every periodic sample (blocks the event loop during the walk)", env="MEMORY_SAMPLE_STRUCTURE_BYTES")
+    log_level: str = Field(default="INFO", description="Default log level", env="LOG_LEVEL")
+    log_levels: Optional[str] = Field(default=None, description="Per-logger levels, e.g. GitHubAPIClient=DEBUG,server=WARNING", env="LOG_LEVELS")
+    log_format: str = Field(default="json", description="Log output format (json or text)", env="LOG_FORMAT")
+    log_info_rate: float = Field(default=50.0, description="INFO/DEBUG log records per second allowed per logger (0 disables)", env="LOG_INFO_RATE")
+    log_info_sample_ratio: float = Field(default=1.0, description="Fraction of INFO/DEBUG log records kept", env="LOG_INFO_SAMPLE_RATIO")
+    slow_call_threshold: float = Field(default=2.0, description="Record tool calls slower than this many seconds (0 disables)", env="SLOW_CALL_THRESHOLD")
+    slow_call_buffer_size: int = Field(default=100, description="Number of slow calls kept for inspection", env="SLOW_CALL_BUFFER_SIZE")
+    workload_capture_path: Optional[str] = Field(default=None, description="Directory to capture every tool call to as rotating compressed NDJSON (disabled when unset)", env="WORKLOAD_CAPTURE_PATH")
+    workload_capture_max_bytes: int = Field(default=64 * 1024 * 1024, description="Compressed size at which a workload capture file is rotated", env="WORKLOAD_CAPTURE_MAX_BYTES")
+    workload_capture_max_files: int = Field(default=20, description="Workload capture files kept per process", env="WORKLOAD_CAPTURE_MAX_FILES")
+    trace_export_path: Optional[str] = Field(default=None, description="File to append OTLP/JSON trace batches to", env="TRACE_EXPORT_PATH")
+    trace_otlp_endpoint: Optional[str] = Field(default=None, description="OTLP/HTTP traces endpoint, e.g. http://localhost:4318/v1/traces", env="TRACE_OTLP_ENDPOINT")
+    trace_sample_ratio: float = Field(default=1.0, description="Fraction of tool calls to trace when an exporter is configured", env="TRACE_SAMPLE_RATIO")
+    enable_response_cache: bool = Field(default=False, description="Cache GitHub GET responses with ETag revalidation", env="ENABLE_RESPONSE_CACHE")
+    enable_tool_manifest: bool = Field(default=True, description="Register tools from the cached schema manifest", env="ENABLE_TOOL_MANIFEST")
+    tool_manifest_path: Optional[str] = Field(default=None, description="Tool schema manifest file (defaults to tool_manifest.json in the package)", env="TOOL_MANIFEST_PATH")
+    integration_init_timeout: float = Field(default=15.0, description="Timeout in seconds for initialising each integration", env="INTEGRATION_INIT_TIMEOUT")
+    integration_wait_timeout: float = Field(default=2.0, description="Seconds a tool call waits for its integration to finish initialising", env="INTEGRATION_WAIT_TIMEOUT")
+    transport: str = Field(default="stdio", description="MCP transport (stdio or http)", env="TRANSPORT")
+    http_host: str = Field(default="0.0.0.0", description="Bind address for the HTTP transport", env="HTTP_HOST")
+    http_port: int = Field(default=8000, description="Port for the HTTP transport", env="HTTP_PORT")
+    workers: int = Field(default=1, description="Worker processes serving the HTTP transport", env="WORKERS")
+    worker_index: Optional[int] = Field(default=None, description="Index of this HTTP worker process (set by the worker supervisor)", env="WORKER_INDEX")
+    distributed_quota: bool = Field(default=False, description="Share the GitHub quota across instances through a Postgres ledger", env="DISTRIBUTED_QUOTA")
+    quota_database_url: Optional[str] = Field(default=None, description="Postgres URL of the quota ledger (defaults to the Neon DB URL)", env="QUOTA_DATABASE_URL")
+    quota_lease_size: int = Field(default=50, description="GitHub requests reserved from the quota ledger per lease", env="QUOTA_LEASE_SIZE")
+    quota_fallback_limit: int = Field(default=500, description="Per-instance hourly limit while the quota ledger is unreachable", env="QUOTA_FALLBACK_LIMIT")
     
     class Config:
         env_prefix = "AGENT_BUILDER_GITHUB_"
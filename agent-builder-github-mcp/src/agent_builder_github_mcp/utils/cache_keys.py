@@ -0,0 +1,232 @@
+"""
+Cache resource keys
+
+This module maps GitHub API endpoints and mutating MCP tools onto a shared
+vocabulary of resource keys so that writes can precisely invalidate the
+cached reads they affect:
+- Resource key derivation for cached GET endpoints
+- Dependency map from mutating tools to the resource keys they touch
+- Endpoint family normalisation for per-endpoint statistics
+"""
+
+import re
+from typing import Any, Dict, Iterable, Set, Tuple
+
+# Resource keys come in three granularities, all scoped to one repository:
+#   "<family>:<owner>/<repo>"          every cached entry of the family
+#   "<family>:<owner>/<repo>:list"     collection endpoints of the family
+#   "<family>:<owner>/<repo>#<id>"     a single item (issue/PR number, SHA)
+#   "<family>:<owner>/<repo>@<ref>"    a single branch
+# plus "repo:<owner>/<repo>" which covers everything cached for a repository.
+
+# Mutating tool -> resource key templates, formatted with the tool arguments.
+# An item template whose argument was not supplied falls back to its family
+# key; any other template with a missing argument is skipped.
+MUTATION_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    # Repository management
+    "create_repository": ("repos:@me", "repos:{organization}"),
+    "fork_repository": ("repos:@me", "repos:{organization}", "repo:{owner}/{repo}:self"),
+    "delete_repository": ("repo:{owner}/{repo}", "repos:@me", "repos:{owner}"),
+    "update_repository": ("repo:{owner}/{repo}:self", "repos:@me", "repos:{owner}"),
+    "create_or_update_file": (
+        "contents:{owner}/{repo}",
+        "commits:{owner}/{repo}:list",
+        "refs:{owner}/{repo}:list",
+        "refs:{owner}/{repo}@{branch}",
+    ),
+    "delete_file": (
+        "contents:{owner}/{repo}",
+        "commits:{owner}/{repo}:list",
+        "refs:{owner}/{repo}:list",
+        "refs:{owner}/{repo}@{branch}",
+    ),
+    "move_file": (
+        "contents:{owner}/{repo}",
+        "commits:{owner}/{repo}:list",
+        "refs:{owner}/{repo}:list",
+        "refs:{owner}/{repo}@{branch}",
+    ),
+    # Branches
+    "create_branch": ("refs:{owner}/{repo}:list", "refs:{owner}/{repo}@{branch_name}"),
+    "delete_branch": ("refs:{owner}/{repo}:list", "refs:{owner}/{repo}@{branch_name}"),
+    "update_branch_protection": ("refs:{owner}/{repo}:list", "refs:{owner}/{repo}@{branch_name}"),
+    # Commits
+    "create_commit_status": ("commits:{owner}/{repo}#{sha}",),
+    # Issues (pull requests share the issue number space)
+    "create_issue": ("issues:{owner}/{repo}:list",),
+    "update_issue": ("issues:{owner}/{repo}:list", "issues:{owner}/{repo}#{issue_number}", "pulls:{owner}/{repo}#{issue_number}"),
+    "close_issue": ("issues:{owner}/{repo}:list", "issues:{owner}/{repo}#{issue_number}", "pulls:{owner}/{repo}#{issue_number}"),
+    "label_issue": ("issues:{owner}/{repo}:list", "issues:{owner}/{repo}#{issue_number}", "pulls:{owner}/{repo}#{issue_number}"),
+    "assign_issue": ("issues:{owner}/{repo}:list", "issues:{owner}/{repo}#{issue_number}", "pulls:{owner}/{repo}#{issue_number}"),
+    "add_issue_comment": ("issues:{owner}/{repo}#{issue_number}",),
+    "create_issue_template": (
+        "contents:{owner}/{repo}",
+        "commits:{owner}/{repo}:list",
+        "refs:{owner}/{repo}",
+    ),
+    # Pull requests
+    "create_pull_request": ("pulls:{owner}/{repo}:list", "issues:{owner}/{repo}:list"),
+    "update_pull_request": (
+        "pulls:{owner}/{repo}:list",
+        "pulls:{owner}/{repo}#{pull_number}",
+        "issues:{owner}/{repo}:list",
+        "issues:{owner}/{repo}#{pull_number}",
+    ),
+    "close_pull_request": (
+        "pulls:{owner}/{repo}:list",
+        "pulls:{owner}/{repo}#{pull_number}",
+        "issues:{owner}/{repo}:list",
+        "issues:{owner}/{repo}#{pull_number}",
+    ),
+    "merge_pull_request": (
+        "pulls:{owner}/{repo}:list",
+        "pulls:{owner}/{repo}#{pull_number}",
+        "issues:{owner}/{repo}:list",
+        "issues:{owner}/{repo}#{pull_number}",
+        "contents:{owner}/{repo}",
+        "commits:{owner}/{repo}:list",
+        "refs:{owner}/{repo}",
+    ),
+    "add_pr_comment": ("pulls:{owner}/{repo}#{pull_number}",),
+    "request_pr_review": ("pulls:{owner}/{repo}#{pull_number}",),
+    # GitHub Actions
+    "run_workflow": ("actions:{owner}/{repo}",),
+    "cancel_workflow_run": ("actions:{owner}/{repo}",),
+    "create_workflow_dispatch": ("actions:{owner}/{repo}",),
+    # Security
+    "enable_code_scanning": ("code-scanning:{owner}/{repo}",),
+    # Users and organizations
+    "update_user_profile": ("users:@me",),
+    "create_organization_webhook": ("orgs:{org}",),
+    # Deployments
+    "create_deployment": ("deployments:{owner}/{repo}",),
+    "create_deployment_status": ("deployments:{owner}/{repo}",),
+    "delete_deployment": ("deployments:{owner}/{repo}",),
+    # Webhooks
+    "create_webhook": ("hooks:{owner}/{repo}",),
+    "update_webhook": ("hooks:{owner}/{repo}",),
+    "delete_webhook": ("hooks:{owner}/{repo}",),
+}
+
+_ITEM_SUFFIX = re.compile(r"[#@]\{[^}]+\}$")
+
+
+def resolve_mutation_keys(tool_name: str, arguments: Dict[str, Any]) -> Set[str]:
+    """Resolve the resource keys a mutating tool invalidates
+
+    Args:
+        tool_name: Registered MCP tool name
+        arguments: Arguments the tool was called with
+
+    Returns:
+        Resource keys to invalidate (empty for read-only tools)
+    """
+    keys = set()
+    for template in MUTATION_DEPENDENCIES.get(tool_name, ()):
+        try:
+            keys.add(template.format(**arguments))
+        except KeyError:
+            family = _ITEM_SUFFIX.sub("", template)
+            if family != template:
+                try:
+                    keys.add(family.format(**arguments))
+                except KeyError:
+                    pass
+    return keys
+
+
+def resource_keys(endpoint: str) -> Set[str]:
+    """Derive the resource keys a cached GET endpoint depends on
+
+    Args:
+        endpoint: API endpoint relative to the GitHub API base URL
+
+    Returns:
+        Resource keys for the endpoint
+    """
+    segments = [s for s in endpoint.split("?", 1)[0].strip("/").split("/") if s]
+    if not segments:
+        return set()
+
+    head = segments[0]
+    if head == "repos" and len(segments) >= 3:
+        return _repository_keys(f"{segments[1]}/{segments[2]}", segments[3:])
+    if head == "user":
+        if segments[1:2] == ["repos"]:
+            return {"repos:@me"}
+        return {"users:@me"}
+    if head == "users" and len(segments) >= 2:
+        if segments[2:3] == ["repos"]:
+            return {f"repos:{segments[1]}"}
+        return {f"users:{segments[1]}"}
+    if head == "orgs" and len(segments) >= 2:
+        if segments[2:3] == ["repos"]:
+            return {f"repos:{segments[1]}"}
+        return {f"orgs:{segments[1]}"}
+    return {head}
+
+
+def _repository_keys(full_name: str, rest: Iterable[str]) -> Set[str]:
+    """Resource keys for an endpoint under repos/{owner}/{repo}"""
+    rest = list(rest)
+    keys = {f"repo:{full_name}"}
+    if not rest:
+        keys.add(f"repo:{full_name}:self")
+        return keys
+
+    family = rest[0]
+    if family in ("issues", "pulls", "commits"):
+        keys.add(f"{family}:{full_name}")
+        if len(rest) == 1:
+            keys.add(f"{family}:{full_name}:list")
+        else:
+            keys.add(f"{family}:{full_name}#{rest[1]}")
+    elif family == "branches" or rest[:2] == ["git", "refs"]:
+        keys.add(f"refs:{full_name}")
+        branch = rest[1:] if family == "branches" else rest[3:] if rest[2:3] == ["heads"] else []
+        if branch and branch[-1] == "protection":
+            branch = branch[:-1]
+        if branch:
+            keys.add(f"refs:{full_name}@{'/'.join(branch)}")
+        else:
+            keys.add(f"refs:{full_name}:list")
+    else:
+        keys.add(f"{family}:{full_name}")
+    return keys
+
+
+_SHA = re.compile(r"^[0-9a-f]{40}$")
+
+
+def endpoint_family(endpoint: str) -> str:
+    """Normalise an endpoint into its family for per-endpoint statistics
+
+    Identifiers are replaced with placeholders, so
+    "repos/octo/hello/issues/42/comments" becomes
+    "repos/{owner}/{repo}/issues/{id}/comments".
+
+    Args:
+        endpoint: API endpoint relative to the GitHub API base URL
+
+    Returns:
+        Endpoint family
+    """
+    segments = [s for s in endpoint.split("?", 1)[0].strip("/").split("/") if s]
+    if segments[:1] == ["repos"] and len(segments) >= 3:
+        family = ["repos", "{owner}", "{repo}"]
+        rest = segments[3:]
+        if rest[:1] == ["contents"]:
+            return "/".join(family + ["contents", "{path}"])
+        if rest[:1] == ["branches"] and len(rest) > 1:
+            suffix = ["protection"] if rest[-1] == "protection" else []
+            return "/".join(family + ["branches", "{branch}"] + suffix)
+        if rest[:3] == ["git", "refs", "heads"] and len(rest) > 3:
+            return "/".join(family + ["git", "refs", "heads", "{branch}"])
+        segments = family + rest
+    elif segments[:1] in (["users"], ["orgs"]) and len(segments) >= 2:
+        segments = [segments[0], "{name}"] + segments[2:]
+
+    return "/".join(
+        "{id}" if segment.isdigit() else "{sha}" if _SHA.match(segment) else segment
+        for segment in segments
+    )
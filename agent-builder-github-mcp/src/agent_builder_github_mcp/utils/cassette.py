@@ -0,0 +1,261 @@
+"""
+GitHub traffic cassettes
+
+This module records and replays GitHub API traffic at the httpx transport:
+- Record mode appends every request/response pair (headers, body, timing)
+  to a gzip-compressed NDJSON cassette, with credentials redacted; a writer
+  thread does the encoding and compression off the event loop
+- With several worker processes each records to its own cassette, named
+  after the process id; replay loads them all
+- Replay mode serves recorded responses offline, matched by method, path,
+  query and request body, in recorded order per match
+- Replayed responses are delayed by their recorded duration, scaled by a
+  timing factor (1.0 original, 0.5 twice as fast, 0 no delay)
+- Requests missing from the cassette get a GitHub-shaped 404
+"""
+
+import asyncio
+import base64
+import glob
+import gzip
+import hashlib
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+import httpx
+
+RECORD = "record"
+REPLAY = "replay"
+CASSETTE_VERSION = 1
+REDACTED_HEADERS = ("authorization", "cookie", "set-cookie", "proxy-authorization")
+
+
+def _match_key(method: str, path: str, query: str, body: bytes) -> str:
+    """Identify a request independently of host, header order and query order"""
+    query = urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+    digest = hashlib.sha256(body).hexdigest()[:16] if body else ""
+    return f"{method.upper()} {path}?{query} {digest}"
+
+
+def _request_key(request: httpx.Request) -> str:
+    return _match_key(request.method, request.url.path, request.url.query.decode("ascii"), request.content)
+
+
+def _headers(headers: httpx.Headers) -> List[List[str]]:
+    return [[name, "[redacted]" if name.lower() in REDACTED_HEADERS else value]
+            for name, value in headers.multi_items()]
+
+
+def _encode_body(body: bytes) -> Dict[str, str]:
+    """Store text bodies as is and anything else as base64"""
+    try:
+        return {"body": body.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"body_b64": base64.b64encode(body).decode("ascii")}
+
+
+def _decode_body(entry: Dict[str, Any]) -> bytes:
+    if "body_b64" in entry:
+        return base64.b64decode(entry["body_b64"])
+    return entry.get("body", "").encode("utf-8")
+
+
+def process_path(path: str, pid: Optional[int] = None) -> str:
+    """Cassette path of one worker process: incident.ndjson.gz -> incident-<pid>.ndjson.gz"""
+    directory, name = os.path.split(path)
+    stem, dot, extension = name.partition(".")
+    return os.path.join(directory, f"{stem}-{pid or os.getpid()}{dot}{extension}")
+
+
+def cassette_files(path: str) -> List[str]:
+    """A cassette and the per-process cassettes recorded alongside it"""
+    directory, name = os.path.split(path)
+    stem, dot, extension = name.partition(".")
+    pattern = os.path.join(glob.escape(directory), f"{glob.escape(stem)}-[0-9]*{dot}{glob.escape(extension)}")
+    files = ([path] if os.path.exists(path) else []) + sorted(glob.glob(pattern))
+    if not files:
+        raise FileNotFoundError(f"No cassette at {path}")
+    return files
+
+
+class CassetteRecorder:
+    """Append interactions to a cassette file
+
+    One recorder is shared per path, since every GitHub request builds its
+    own client. ``record`` only queues the exchange; a writer thread encodes
+    it as one line of a gzip stream. Appending to an existing cassette adds
+    a gzip member, which readers concatenate transparently.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.started = time.time()
+        self.recorded = 0
+        self.logger = logging.getLogger(__name__)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = gzip.open(path, "at", encoding="utf-8")
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._queue.put({"cassette": CASSETTE_VERSION, "recorded_at": self.started})
+        self._thread = threading.Thread(target=self._write, name="cassette-writer", daemon=True)
+        self._thread.start()
+
+    def _write(self):
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                break
+            if "request" in entry:
+                entry["request"].update(_encode_body(entry["request"].pop("content")))
+                entry["response"].update(_encode_body(entry["response"].pop("content")))
+            self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            if self._queue.empty():
+                # Keep the cassette readable if the process dies mid-session
+                self._file.flush()
+        self._file.close()
+
+    def record(self, request: httpx.Request, response: httpx.Response, body: bytes,
+               started: float, elapsed: float):
+        """Queue one request/response pair for the writer thread"""
+        self._queue.put({
+            "at": round(started - self.started, 6),
+            "elapsed": round(elapsed, 6),
+            "key": _request_key(request),
+            "request": {
+                "method": request.method,
+                "url": str(request.url),
+                "headers": _headers(request.headers),
+                "content": request.content,
+            },
+            "response": {
+                "status": response.status_code,
+                "headers": _headers(response.headers),
+                "content": body,
+            },
+        })
+        self.recorded += 1
+
+    def close(self):
+        """Write the queued exchanges and close the cassette"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+            self.logger.info("Recorded %d GitHub interactions to %s", self.recorded, self.path)
+
+
+class CassettePlayer:
+    """Serve interactions from a recorded cassette"""
+
+    def __init__(self, path: str, timing: float = 1.0):
+        self.path = path
+        self.timing = timing
+        self.logger = logging.getLogger(__name__)
+        self.interactions: Dict[str, List[Dict[str, Any]]] = {}
+        self.positions: Dict[str, int] = {}
+        self.served = 0
+        self.missed = 0
+        files = cassette_files(path)
+        for file in files:
+            with gzip.open(file, "rt", encoding="utf-8") as f:
+                for line in f:
+                    entry = json.loads(line)
+                    if "key" in entry:
+                        self.interactions.setdefault(entry["key"], []).append(entry)
+        self.logger.info("Loaded %d GitHub interactions from %s",
+                         sum(len(entries) for entries in self.interactions.values()), ", ".join(files))
+
+    def next(self, request: httpx.Request) -> Optional[Dict[str, Any]]:
+        """Take the next recorded interaction for a request, repeating the last once exhausted"""
+        key = _request_key(request)
+        entries = self.interactions.get(key)
+        if not entries:
+            self.missed += 1
+            return None
+        position = self.positions.get(key, 0)
+        self.positions[key] = position + 1
+        self.served += 1
+        return entries[min(position, len(entries) - 1)]
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Forward requests upstream and record each exchange"""
+
+    def __init__(self, recorder: CassetteRecorder, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.recorder = recorder
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.time()
+        clock = time.perf_counter()
+        response = await self.transport.handle_async_request(request)
+        # The raw (still content-encoded) body, replayed byte for byte
+        body = b"".join([chunk async for chunk in response.stream])
+        await response.aclose()
+        self.recorder.record(request, response, body, started, time.perf_counter() - clock)
+        return httpx.Response(response.status_code, headers=response.headers, content=body,
+                              extensions=response.extensions)
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Answer requests from a cassette without touching the network"""
+
+    def __init__(self, player: CassettePlayer):
+        self.player = player
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        entry = self.player.next(request)
+        if entry is None:
+            self.player.logger.warning("No recorded interaction for %s %s", request.method, request.url)
+            return httpx.Response(404, json={
+                "message": "Not recorded in cassette",
+                "documentation_url": "https://docs.github.com/rest",
+            })
+        if self.player.timing > 0 and entry["elapsed"] > 0:
+            await asyncio.sleep(entry["elapsed"] * self.player.timing)
+        recorded = entry["response"]
+        return httpx.Response(recorded["status"], headers=recorded["headers"], content=_decode_body(recorded))
+
+
+_recorders: Dict[str, CassetteRecorder] = {}
+_players: Dict[Tuple[str, float], CassettePlayer] = {}
+
+
+def cassette_transport(mode: Optional[str], path: Optional[str], timing: float = 1.0,
+                       per_process: bool = False) -> Optional[httpx.AsyncBaseTransport]:
+    """Transport for the configured cassette mode, or None to use the network directly
+
+    ``per_process`` records to a cassette of this process's own (see
+    process_path), for servers running several worker processes.
+    """
+    if not mode:
+        return None
+    if not path:
+        raise ValueError("A cassette path is required in record and replay mode")
+    if mode == RECORD:
+        if per_process:
+            path = process_path(path)
+        if path not in _recorders:
+            _recorders[path] = CassetteRecorder(path)
+        return RecordingTransport(_recorders[path])
+    if mode == REPLAY:
+        if (path, timing) not in _players:
+            _players[(path, timing)] = CassettePlayer(path, timing)
+        return ReplayTransport(_players[(path, timing)])
+    raise ValueError(f"Unknown cassette mode {mode!r} (expected {RECORD!r} or {REPLAY!r})")
+
+
+def close_cassettes():
+    """Flush and close open recordings"""
+    for recorder in _recorders.values():
+        recorder.close()
+    _recorders.clear()
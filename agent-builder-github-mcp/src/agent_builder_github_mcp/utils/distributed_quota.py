@@ -0,0 +1,231 @@
+"""
+Distributed GitHub quota
+
+This module keeps a fleet of server instances sharing one GitHub token
+under the token's hourly limit, using Postgres (Neon or any local
+instance) as the ledger:
+- Fixed quota windows per token in a ``github_quota_windows`` table
+- Batched leases: instances reserve quota in chunks and spend it locally,
+  refilling in the background before the local balance runs out
+- Unused leased quota is returned on shutdown; an instance that found the
+  window exhausted re-queries the ledger periodically to pick it up
+- Fallback to a local per-instance limit while the database is unreachable
+"""
+
+import asyncio
+import hashlib
+import time
+from typing import Optional
+
+from src.agent_builder_github_mcp.utils import Logger, MetricsCollector, RateLimiter
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS github_quota_windows (
+    quota_key TEXT NOT NULL,
+    window_start BIGINT NOT NULL,
+    used INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (quota_key, window_start)
+)
+"""
+
+# Windows older than this are deleted when the ledger connects
+RETENTION_SECONDS = 86400
+# While the ledger is unreachable it is retried at most this often
+LEDGER_RETRY_SECONDS = 30.0
+# A lease (including connecting) taking longer than this counts as unreachable
+LEDGER_TIMEOUT_SECONDS = 5.0
+# While the window's quota is exhausted the ledger is re-queried this often
+EXHAUSTED_RECHECK_SECONDS = 30.0
+
+
+def quota_key_for_token(token: Optional[str]) -> str:
+    """Ledger key shared by every instance using the same token"""
+    return "github:" + hashlib.sha256((token or "").encode()).hexdigest()[:16]
+
+
+class PostgresQuotaLedger:
+    """Quota windows stored in Postgres"""
+
+    def __init__(self, dsn: str, quota_key: str, limit: int, window: int = 3600):
+        self.dsn = dsn
+        self.quota_key = quota_key
+        self.limit = limit
+        self.window = window
+        self.pool = None
+        self._connect_lock = asyncio.Lock()
+
+    def window_start(self, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        return int(now // self.window) * self.window
+
+    async def connect(self):
+        """Create the connection pool and schema on first use"""
+        async with self._connect_lock:
+            if self.pool is not None:
+                return
+            # Imported here so servers without a distributed ledger never load asyncpg
+            import asyncpg
+            pool = await asyncpg.create_pool(self.dsn, min_size=1, max_size=2, timeout=LEDGER_TIMEOUT_SECONDS,
+                                             command_timeout=LEDGER_TIMEOUT_SECONDS)
+            async with pool.acquire() as connection:
+                await connection.execute(SCHEMA)
+                await connection.execute(
+                    "DELETE FROM github_quota_windows WHERE window_start < $1",
+                    self.window_start() - RETENTION_SECONDS,
+                )
+            self.pool = pool
+
+    async def lease(self, window_start: int, requested: int) -> int:
+        """Reserve up to ``requested`` requests in a window; returns the number granted
+
+        Grants shrink as the window drains so the remaining quota is spread
+        across instances rather than taken by the first to ask.
+        """
+        await self.connect()
+        async with self.pool.acquire() as connection:
+            async with connection.transaction():
+                await connection.execute(
+                    "INSERT INTO github_quota_windows (quota_key, window_start, used) "
+                    "VALUES ($1, $2, 0) ON CONFLICT DO NOTHING",
+                    self.quota_key, window_start,
+                )
+                used = await connection.fetchval(
+                    "SELECT used FROM github_quota_windows "
+                    "WHERE quota_key = $1 AND window_start = $2 FOR UPDATE",
+                    self.quota_key, window_start,
+                )
+                remaining = self.limit - used
+                granted = max(0, min(requested, remaining, max(1, remaining // 10)))
+                if granted:
+                    await connection.execute(
+                        "UPDATE github_quota_windows SET used = used + $3 "
+                        "WHERE quota_key = $1 AND window_start = $2",
+                        self.quota_key, window_start, granted,
+                    )
+                return granted
+
+    async def release(self, window_start: int, unused: int):
+        """Return unused leased requests to a window"""
+        if unused <= 0 or self.pool is None:
+            return
+        async with self.pool.acquire() as connection:
+            await connection.execute(
+                "UPDATE github_quota_windows SET used = GREATEST(0, used - $3) "
+                "WHERE quota_key = $1 AND window_start = $2",
+                self.quota_key, window_start, unused,
+            )
+
+    async def usage(self, window_start: int) -> int:
+        """Requests reserved by the fleet in a window"""
+        await self.connect()
+        async with self.pool.acquire() as connection:
+            used = await connection.fetchval(
+                "SELECT used FROM github_quota_windows WHERE quota_key = $1 AND window_start = $2",
+                self.quota_key, window_start,
+            )
+        return used or 0
+
+    async def close(self):
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+
+
+class DistributedRateLimiter(RateLimiter):
+    """Rate limiter spending quota leased from a shared Postgres ledger
+
+    Requests are granted from a local balance; the ledger is only touched
+    to lease the next batch, which starts in the background when the
+    balance falls below a quarter of the batch size (at least one request).
+    """
+
+    def __init__(self, ledger: PostgresQuotaLedger, lease_size: int = 50, fallback_limit: int = 500):
+        super().__init__(fallback_limit, ledger.window)
+        self.ledger = ledger
+        self.lease_size = lease_size
+        self.refill_below = max(1, lease_size // 4)
+        self.balance = 0
+        self.lease_window: Optional[int] = None
+        self.leases = 0
+        # Window found exhausted and when to ask the ledger again
+        self.exhausted_window: Optional[int] = None
+        self.exhausted_retry_at = 0.0
+        self.degraded = False
+        self.retry_at = 0.0
+        self.metrics = MetricsCollector.get_collector()
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self._lease_lock = asyncio.Lock()
+        self._refill: Optional[asyncio.Task] = None
+
+    async def acquire(self) -> bool:
+        """Acquire a rate limit token"""
+        window_start = self.ledger.window_start()
+        if self.lease_window != window_start:
+            # Leftover balance belongs to the previous window, where it was already counted
+            self.balance = 0
+            self.lease_window = window_start
+        if self.balance <= 0:
+            if self.exhausted_window == window_start and time.monotonic() < self.exhausted_retry_at:
+                return False
+            if not self.degraded or time.monotonic() >= self.retry_at:
+                await self._lease(window_start)
+            if self.degraded:
+                return await super().acquire()
+            if self.balance <= 0:
+                self.exhausted_window = window_start
+                self.exhausted_retry_at = time.monotonic() + EXHAUSTED_RECHECK_SECONDS
+                return False
+
+        self.balance -= 1
+        if self.balance < self.refill_below and (self._refill is None or self._refill.done()):
+            self._refill = asyncio.get_running_loop().create_task(self._lease(window_start))
+        return True
+
+    async def _lease(self, window_start: int):
+        async with self._lease_lock:
+            if self.lease_window == window_start and self.balance >= self.refill_below:
+                return
+            # Calls queued behind a failed lease fall back without trying again
+            if self.degraded and time.monotonic() < self.retry_at:
+                return
+            try:
+                with self.metrics.timer("quota_lease_seconds"):
+                    granted = await asyncio.wait_for(self.ledger.lease(window_start, self.lease_size),
+                                                     LEDGER_TIMEOUT_SECONDS)
+            except Exception as e:
+                if not self.degraded:
+                    self.logger.warning("Quota ledger unavailable, limiting locally to %s/window: %s",
+                                        self.max_requests, e)
+                self.degraded = True
+                self.retry_at = time.monotonic() + LEDGER_RETRY_SECONDS
+                return
+            if self.degraded:
+                self.logger.info("Quota ledger reachable again")
+                self.degraded = False
+            if self.lease_window == window_start:
+                self.balance += granted
+            self.leases += 1
+            self.metrics.increment("quota_leases_total")
+            self.metrics.gauge("quota_lease_balance", self.balance)
+
+    def _oldest_request(self) -> Optional[float]:
+        if self.degraded:
+            return super()._oldest_request()
+        # The base class waits for oldest + window: wait until the ledger is
+        # re-queried or the next window starts, whichever comes first
+        now = time.time()
+        delay = min(self.ledger.window_start() + self.time_window - now,
+                    max(0.0, self.exhausted_retry_at - time.monotonic()))
+        return now - self.time_window + delay
+
+    async def close(self):
+        """Return the unused balance and close the ledger"""
+        if self._refill is not None:
+            self._refill.cancel()
+        if self.lease_window is not None and not self.degraded:
+            try:
+                await self.ledger.release(self.lease_window, self.balance)
+            except Exception as e:
+                self.logger.warning("Could not return %s leased requests: %s", self.balance, e)
+        self.balance = 0
+        await self.ledger.close()
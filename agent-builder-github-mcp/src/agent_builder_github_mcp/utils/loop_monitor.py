@@ -0,0 +1,148 @@
+"""
+Event loop monitoring
+
+This module samples event loop responsiveness:
+- Scheduling lag histogram and last/max lag gauges
+- Blocking-call detector reporting the stack of the stalled loop thread
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+from src.agent_builder_github_mcp.utils import Logger, MetricsCollector
+
+
+class EventLoopMonitor:
+    """Background sampler measuring how late the event loop wakes up"""
+
+    def __init__(self, metrics: MetricsCollector, interval: float = 0.5,
+                 block_threshold: float = 0.0):
+        self.metrics = metrics
+        self.interval = interval
+        self.max_lag = 0.0
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self._task: Optional[asyncio.Task] = None
+        self.detector: Optional[BlockingCallDetector] = None
+        if block_threshold > 0:
+            self.detector = BlockingCallDetector(metrics, block_threshold)
+
+    def start(self):
+        """Start sampling on the running event loop"""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._sample())
+        if self.detector is not None:
+            self.detector.start()
+
+    async def stop(self):
+        """Stop sampling"""
+        if self.detector is not None:
+            self.detector.stop()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _sample(self):
+        """Sleep for the interval and record how much later than requested we woke"""
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - started - self.interval)
+            self.max_lag = max(self.max_lag, lag)
+            self.metrics.observe("event_loop_lag_seconds", lag)
+            self.metrics.gauge("event_loop_lag_last_seconds", round(lag, 6))
+            self.metrics.gauge("event_loop_lag_max_seconds", round(self.max_lag, 6))
+
+
+class BlockingCallDetector:
+    """Watchdog thread reporting coroutine steps that block the event loop
+
+    The loop schedules a heartbeat every ``threshold / 2`` seconds. When the
+    watchdog sees no heartbeat for longer than ``threshold``, the loop thread
+    is stuck inside a single callback or coroutine step; its current stack is
+    captured while it is still blocked and logged once per stall. The stall
+    duration is recorded when the loop recovers. Metrics are only updated
+    from the loop thread, so the watchdog hands them to the loop.
+    """
+
+    def __init__(self, metrics: MetricsCollector, threshold: float = 0.1, max_frames: int = 30):
+        self.metrics = metrics
+        self.threshold = threshold
+        self.max_frames = max_frames
+        self.stalls = 0
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat = time.monotonic()
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the heartbeat on the running loop and the watchdog thread"""
+        if self._thread is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stop.clear()
+        self._beat()
+        self._thread = threading.Thread(target=self._watch, name="loop-block-detector", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the watchdog"""
+        self._stop.set()
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._thread is not None:
+            self._thread.join(timeout=self.threshold * 2)
+            self._thread = None
+
+    def _beat(self):
+        self._heartbeat = time.monotonic()
+        self._handle = self._loop.call_later(self.threshold / 2, self._beat)
+
+    def _watch(self):
+        """Poll the heartbeat and capture the loop thread's stack on a stall"""
+        poll = self.threshold / 4
+        stalled_since = None
+        while not self._stop.wait(poll):
+            heartbeat = self._heartbeat
+            silent = time.monotonic() - heartbeat
+            if stalled_since is None:
+                if silent > self.threshold:
+                    stalled_since = heartbeat
+                    self._report(silent)
+            elif heartbeat != stalled_since:
+                # The loop recovered; heartbeat was rescheduled threshold/2 late at most
+                blocked = heartbeat - stalled_since - self.threshold / 2
+                self._on_loop(self.metrics.observe, "event_loop_blocking_seconds", max(blocked, 0.0))
+                self.logger.warning("Event loop unblocked after %.3fs", blocked)
+                stalled_since = None
+
+    def _on_loop(self, callback, *args):
+        """Run a metrics update on the loop thread"""
+        try:
+            self._loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            # The loop closed while the watchdog was stopping
+            pass
+
+    def _report(self, silent: float):
+        """Log the stack of the blocked loop thread and count the stall"""
+        self.stalls += 1
+        # Runs once the loop unblocks
+        self._on_loop(self.metrics.increment, "event_loop_blocked_total")
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = "".join(traceback.format_stack(frame, limit=self.max_frames)) if frame else "<unavailable>\n"
+        self.logger.warning(
+            f"Event loop blocked for more than {silent:.3f}s; loop thread stack:\n{stack}"
+        )
@@ -0,0 +1,242 @@
+"""
+Memory accounting
+
+This module provides memory instrumentation for long-running servers:
+- Deep size estimates of registered in-memory structures, on demand
+- Resident set size and structure item count tracking with periodic gauges
+- tracemalloc snapshots and snapshot diffs for leak hunting
+"""
+
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+import types
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.agent_builder_github_mcp.utils import Logger, MetricsCollector
+
+
+def deep_sizeof(obj: Any, max_objects: int = 200000) -> Tuple[int, bool]:
+    """Estimate the memory held by an object graph
+
+    Containers, instance dicts and slots are followed; shared objects are
+    counted once.
+
+    Args:
+        obj: Root object
+        max_objects: Stop after visiting this many objects
+
+    Returns:
+        Estimated bytes and whether the walk was truncated
+    """
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        if len(seen) >= max_objects:
+            return total, True
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current, 0)
+
+        if isinstance(current, (str, bytes, bytearray, int, float, bool, type(None),
+                                type, types.ModuleType, types.FunctionType, types.MethodType)):
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        else:
+            attributes = getattr(current, "__dict__", None)
+            if attributes is not None:
+                stack.append(attributes)
+            for slot in getattr(type(current), "__slots__", ()):
+                if hasattr(current, slot):
+                    stack.append(getattr(current, slot))
+    return total, False
+
+
+def rss_bytes() -> Optional[int]:
+    """Current resident set size of the process (None if unavailable)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is kilobytes on Linux and bytes on macOS; this is a peak fallback
+        return peak if sys.platform == "darwin" else peak * 1024
+    except (ImportError, OSError):
+        return None
+
+
+class MemoryTracker:
+    """Track process memory and the size of registered structures"""
+
+    def __init__(self, metrics: MetricsCollector, max_snapshots: int = 5):
+        self.metrics = metrics
+        self.max_snapshots = max_snapshots
+        self.structures: Dict[str, Callable[[], Any]] = {}
+        self.snapshots: "OrderedDict[str, Tuple[float, tracemalloc.Snapshot]]" = OrderedDict()
+        self.started_at = time.time()
+        self.initial_rss = rss_bytes()
+        self.peak_rss = self.initial_rss or 0
+        self.logger = Logger.get_logger(self.__class__.__name__)
+        self._snapshot_seq = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def register(self, name: str, getter: Callable[[], Any]):
+        """Register a structure to account for
+
+        Args:
+            name: Structure name used in reports and metric labels
+            getter: Callable returning the current structure
+        """
+        self.structures[name] = getter
+
+    def structure_sizes(self, deep: bool = True) -> Dict[str, Dict[str, Any]]:
+        """Count items and, when ``deep``, estimate bytes held by every registered structure
+
+        The deep walk visits up to 200k objects per structure and blocks the
+        event loop while it runs; item counts are cheap.
+        """
+        sizes = {}
+        for name, getter in self.structures.items():
+            structure = getter()
+            sizes[name] = {"items": len(structure) if hasattr(structure, "__len__") else None}
+            if deep:
+                size, truncated = deep_sizeof(structure)
+                sizes[name].update(bytes=size, truncated=truncated)
+        return sizes
+
+    def sample(self, deep: bool = True) -> Dict[str, Any]:
+        """Record RSS and structure sizes as gauges and return them"""
+        rss = rss_bytes()
+        if rss is not None:
+            self.peak_rss = max(self.peak_rss, rss)
+            self.metrics.gauge("process_resident_memory_bytes", rss)
+            self.metrics.gauge("process_resident_memory_peak_bytes", self.peak_rss)
+
+        structures = self.structure_sizes(deep)
+        for name, size in structures.items():
+            if "bytes" in size:
+                self.metrics.gauge("memory_structure_bytes", size["bytes"], {"structure": name})
+            if size["items"] is not None:
+                self.metrics.gauge("memory_structure_items", size["items"], {"structure": name})
+
+        uptime = time.time() - self.started_at
+        growth = rss - self.initial_rss if rss is not None and self.initial_rss is not None else None
+        return {
+            "rss_bytes": rss,
+            "peak_rss_bytes": self.peak_rss or None,
+            "initial_rss_bytes": self.initial_rss,
+            "rss_growth_bytes": growth,
+            "rss_growth_bytes_per_hour": round(growth / uptime * 3600) if growth is not None and uptime >= 60 else None,
+            "uptime_seconds": round(uptime, 1),
+            "structures": structures,
+            "tracemalloc": self.tracing_status(),
+        }
+
+    def start(self, interval: float = 60.0, deep: bool = False):
+        """Sample memory periodically on the running event loop
+
+        Args:
+            interval: Seconds between samples
+            deep: Also estimate structure bytes on every sample, which stalls
+                the loop for the duration of the walk
+        """
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run(interval, deep))
+
+    async def stop(self):
+        """Stop periodic sampling"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self, interval: float, deep: bool):
+        while True:
+            try:
+                self.sample(deep)
+            except Exception as e:
+                self.logger.warning("Memory sampling failed: %s", e)
+            await asyncio.sleep(interval)
+
+    def tracing_status(self) -> Dict[str, Any]:
+        """tracemalloc state and retained snapshots"""
+        status = {"tracing": tracemalloc.is_tracing(), "snapshots": list(self.snapshots.keys())}
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            status.update({
+                "frames": tracemalloc.get_traceback_limit(),
+                "traced_bytes": current,
+                "traced_peak_bytes": peak,
+                "overhead_bytes": tracemalloc.get_tracemalloc_memory(),
+            })
+        return status
+
+    def take_snapshot(self, label: Optional[str] = None, frames: int = 1) -> Tuple[str, tracemalloc.Snapshot]:
+        """Take a tracemalloc snapshot, starting tracing if needed
+
+        Allocations made before tracing started are invisible, so the first
+        snapshot of a session is only a baseline for later diffs.
+
+        Args:
+            label: Snapshot name (defaults to a sequence number)
+            frames: Traceback depth to record when tracing is started here
+
+        Returns:
+            Snapshot id and the filtered snapshot
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+            self.logger.info("tracemalloc started with %s frame(s)", frames)
+
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ))
+        self._snapshot_seq += 1
+        snapshot_id = label or f"snapshot-{self._snapshot_seq}"
+        self.snapshots.pop(snapshot_id, None)
+        self.snapshots[snapshot_id] = (time.time(), snapshot)
+        while len(self.snapshots) > self.max_snapshots:
+            self.snapshots.popitem(last=False)
+        return snapshot_id, snapshot
+
+    def stop_tracing(self, clear_snapshots: bool = False):
+        """Stop tracemalloc, optionally dropping retained snapshots"""
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        if clear_snapshots:
+            self.snapshots.clear()
+
+    @staticmethod
+    def format_stats(stats, limit: int) -> list:
+        """Render tracemalloc statistics or statistic diffs as dicts"""
+        rendered = []
+        for stat in stats[:limit]:
+            entry = {
+                "location": [f"{frame.filename}:{frame.lineno}" for frame in stat.traceback],
+                "size_bytes": stat.size,
+                "count": stat.count,
+            }
+            if hasattr(stat, "size_diff"):
+                entry["size_diff_bytes"] = stat.size_diff
+                entry["count_diff"] = stat.count_diff
+            rendered.append(entry)
+        return rendered
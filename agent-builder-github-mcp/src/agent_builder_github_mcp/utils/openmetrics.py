@@ -0,0 +1,174 @@
+"""
+OpenMetrics exposition
+
+This module renders server metrics in the OpenMetrics text format for
+Prometheus scraping and serves them from a small HTTP sidecar:
+- Latency histograms (tools, GitHub endpoints, integrations, event loop)
+- Counters and gauges from the shared MetricsCollector
+- Response cache statistics
+- Rate limiter utilisation
+- Optional constant labels on every series (e.g. the worker process)
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Cumulative histogram bucket bounds in seconds
+BUCKET_BOUNDS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def escape_label_value(value: Any) -> str:
+    """Escape a label value (backslash, double quote and newline)"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: Dict[str, Any], **extra: Any) -> str:
+    """Render a label set"""
+    merged = {**labels, **extra}
+    if not merged:
+        return ""
+    rendered = ",".join('{}="{}"'.format(key, escape_label_value(value)) for key, value in merged.items())
+    return "{" + rendered + "}"
+
+
+def render_openmetrics(metrics, cache_manager=None, rate_limiter=None,
+                       labels: Optional[Dict[str, str]] = None) -> str:
+    """Render metrics in the OpenMetrics text format
+
+    Collector keys ending in ``_total`` are exposed as counters, every other
+    scalar as a gauge.
+
+    Args:
+        metrics: MetricsCollector to export
+        cache_manager: Optional CacheManager whose statistics are exported
+        rate_limiter: Optional RateLimiter whose utilisation is exported
+        labels: Optional labels added to every series
+
+    Returns:
+        OpenMetrics exposition text
+    """
+    common = labels or {}
+    lines: List[str] = []
+
+    families: Dict[str, List[str]] = {}
+    for key, value in sorted(metrics.get_metrics().items()):
+        name, series_labels = metrics.series(key)
+        families.setdefault(name, []).append(f"{name}{_labels(series_labels, **common)} {value}")
+    for name, samples in families.items():
+        if name.endswith("_total"):
+            lines.append(f"# TYPE {name[:-len('_total')]} counter")
+        else:
+            lines.append(f"# TYPE {name} gauge")
+        lines.extend(samples)
+
+    histograms: Dict[str, List[Any]] = {}
+    for histogram in list(metrics.histograms.values()):
+        histograms.setdefault(histogram.name, []).append(histogram)
+    for name, series in sorted(histograms.items()):
+        lines.append(f"# TYPE {name} histogram")
+        lines.append(f"# UNIT {name} seconds")
+        for histogram in series:
+            lines.extend(_histogram_samples(histogram, common))
+
+    if cache_manager is not None:
+        lines.extend(_cache_samples(cache_manager, common))
+
+    if rate_limiter is not None:
+        lines.append("# TYPE rate_limiter_window_requests gauge")
+        lines.append(f"rate_limiter_window_requests{_labels(common)} {len(rate_limiter.requests)}")
+        lines.append("# TYPE rate_limiter_window_limit gauge")
+        lines.append(f"rate_limiter_window_limit{_labels(common)} {rate_limiter.max_requests}")
+        lines.append("# TYPE rate_limiter_waits counter")
+        lines.append(f"rate_limiter_waits_total{_labels(common)} {rate_limiter.waits}")
+        lines.append("# TYPE rate_limiter_wait_seconds counter")
+        lines.append(f"rate_limiter_wait_seconds_total{_labels(common)} {round(rate_limiter.wait_seconds, 6)}")
+
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def _histogram_samples(histogram, common: Dict[str, str]) -> List[str]:
+    """Render cumulative buckets, count and sum for one histogram series"""
+    # Sparse log buckets are folded into the fixed bounds by their upper edge
+    upper_bounds = sorted(
+        (histogram.bucket_upper_bound(index), count) for index, count in histogram.counts.items()
+    )
+    samples = []
+    cumulative = 0
+    position = 0
+    labels = {**histogram.labels, **common}
+    for bound in BUCKET_BOUNDS:
+        while position < len(upper_bounds) and upper_bounds[position][0] <= bound:
+            cumulative += upper_bounds[position][1]
+            position += 1
+        samples.append(f"{histogram.name}_bucket{_labels(labels, le=bound)} {cumulative}")
+    samples.append(f"{histogram.name}_bucket{_labels(labels, le='+Inf')} {histogram.count}")
+    samples.append(f"{histogram.name}_count{_labels(labels)} {histogram.count}")
+    samples.append(f"{histogram.name}_sum{_labels(labels)} {round(histogram.total, 6)}")
+    return samples
+
+
+def _cache_samples(cache_manager, common: Dict[str, str]) -> List[str]:
+    """Render response cache lookups, entries and bytes per endpoint family"""
+    stats = cache_manager.get_stats(top_n=0)
+    lines = ["# TYPE github_cache_lookups counter"]
+    for family, family_stats in sorted(stats["endpoints"].items()):
+        for outcome in ("hits", "misses", "revalidations"):
+            lines.append(
+                f"github_cache_lookups_total{_labels({'endpoint': family, 'outcome': outcome}, **common)} "
+                f"{family_stats[outcome]}"
+            )
+    lines.append("# TYPE github_cache_quota_saved counter")
+    lines.append(f"github_cache_quota_saved_total{_labels(common)} {stats['quota_saved']}")
+    lines.append("# TYPE github_cache_entries gauge")
+    lines.append(f"github_cache_entries{_labels(common)} {stats['entries']}")
+    lines.append("# TYPE github_cache_bytes gauge")
+    lines.append("# UNIT github_cache_bytes bytes")
+    lines.append(f"github_cache_bytes{_labels(common)} {stats['bytes_held']}")
+    return lines
+
+
+class MetricsServer:
+    """Minimal HTTP sidecar serving GET /metrics for stdio deployments"""
+
+    def __init__(self, render, host: str = "0.0.0.0", port: int = 9464):
+        self.render = render
+        self.host = host
+        self.port = port
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self):
+        """Start listening"""
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+
+    async def stop(self):
+        """Stop listening"""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Answer a single HTTP request"""
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+            while (await asyncio.wait_for(reader.readline(), timeout=5)) not in (b"\r\n", b"\n", b""):
+                pass
+
+            parts = request_line.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1].split("?")[0] == "/metrics":
+                status, content_type, body = "200 OK", CONTENT_TYPE, self.render().encode()
+            else:
+                status, content_type, body = "404 Not Found", "text/plain", b"not found\n"
+
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
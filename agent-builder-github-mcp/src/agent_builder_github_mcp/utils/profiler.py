@@ -0,0 +1,143 @@
+"""
+Sampling profiler
+
+This module provides a low-overhead statistical profiler for the live server:
+- Stack sampling of the event loop thread from a background thread
+- Collapsed stacks ready for flamegraph.pl / speedscope
+- Per-coroutine wall time on the event loop
+"""
+
+import asyncio
+import inspect
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Optional, Tuple
+
+IDLE_FRAME = "<idle>"
+
+
+class SamplingProfiler:
+    """Sample the stack of one thread at a fixed interval
+
+    Sampling happens on a daemon thread reading ``sys._current_frames()``, so
+    the profiled thread is never interrupted and no signal handlers are
+    installed. The cost on the profiled thread is limited to the GIL hand-offs
+    of the sampler.
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.005, max_depth: int = 128):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.max_depth = max_depth
+        self.stacks: Counter = Counter()
+        self.coroutines: Counter = Counter()
+        self.coroutines_self: Counter = Counter()
+        self.samples = 0
+        self.idle_samples = 0
+        self.elapsed = 0.0
+        self._labels: Dict[Any, Tuple[str, bool]] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start sampling"""
+        self._stop.clear()
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling and wait for the sampler thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.elapsed = time.perf_counter() - self._started
+
+    async def run_for(self, duration: float):
+        """Profile for the given number of seconds without blocking the loop"""
+        self.start()
+        try:
+            await asyncio.sleep(duration)
+        finally:
+            self.stop()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self._sample(frame)
+
+    def _label(self, code) -> Tuple[str, bool]:
+        """Collapsed-stack label for a code object and whether it is a coroutine"""
+        label = self._labels.get(code)
+        if label is None:
+            name = getattr(code, "co_qualname", code.co_name)
+            label = (
+                f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})",
+                bool(code.co_flags & inspect.CO_COROUTINE),
+            )
+            self._labels[code] = label
+        return label
+
+    def _sample(self, frame):
+        """Record one stack, root first"""
+        labels = []
+        idle = False
+        while frame is not None and len(labels) < self.max_depth:
+            code = frame.f_code
+            if code.co_name == "select" and code.co_filename.endswith("selectors.py"):
+                idle = True
+            labels.append(self._label(code))
+            frame = frame.f_back
+        labels.reverse()
+
+        self.samples += 1
+        if idle:
+            self.idle_samples += 1
+            self.stacks[IDLE_FRAME] += 1
+            return
+
+        self.stacks[";".join(label for label, _ in labels)] += 1
+        coroutines = [label for label, is_coroutine in labels if is_coroutine]
+        for label in set(coroutines):
+            self.coroutines[label] += 1
+        if coroutines:
+            self.coroutines_self[coroutines[-1]] += 1
+
+    def report(self, max_stacks: int = 200, max_coroutines: int = 50) -> Dict[str, Any]:
+        """Summarise the collected samples
+
+        Args:
+            max_stacks: Maximum number of collapsed stacks to return
+            max_coroutines: Maximum number of coroutines to return
+
+        Returns:
+            Collapsed stacks, per-coroutine wall time and sample counts
+        """
+        # Use the measured sampling period so timings stay honest under load
+        period = self.elapsed / self.samples if self.samples else self.interval
+        busy = self.samples - self.idle_samples
+        coroutines = {
+            label: {
+                "wall_seconds": round(count * period, 6),
+                "self_seconds": round(self.coroutines_self.get(label, 0) * period, 6),
+                "share_of_busy": round(count / busy, 4) if busy else 0.0,
+            }
+            for label, count in self.coroutines.most_common(max_coroutines)
+        }
+        return {
+            "samples": self.samples,
+            "idle_samples": self.idle_samples,
+            "duration_seconds": round(self.elapsed, 3),
+            "sample_period_seconds": round(period, 6),
+            "loop_busy_ratio": round(busy / self.samples, 4) if self.samples else 0.0,
+            "collapsed_stacks": [
+                f"{stack} {count}" for stack, count in self.stacks.most_common(max_stacks)
+            ],
+            "coroutines": coroutines,
+            "distinct_stacks": len(self.stacks),
+        }
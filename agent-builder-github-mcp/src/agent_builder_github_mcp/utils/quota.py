@@ -0,0 +1,183 @@
+"""
+GitHub quota accounting
+
+This module attributes GitHub API quota consumption to the MCP tool and the
+caller that spent it:
+- Call attribution (tool name and caller) carried through contextvars
+- Per-request quota cost by rate limit resource (core, search, graphql)
+- Rolling per-minute aggregation over the GitHub hourly quota window
+- Bounded caller cardinality: callers beyond the first ``max_callers`` are
+  grouped as "other", and caller names are restricted to a safe character set
+"""
+
+import contextvars
+import re
+import time
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+UNATTRIBUTED_TOOL = "<none>"
+ANONYMOUS_CALLER = "anonymous"
+OTHER_CALLER = "other"
+MAX_CALLER_LENGTH = 64
+# Characters outside this set are replaced in caller labels
+UNSAFE_CALLER_CHARACTERS = re.compile(r"[^A-Za-z0-9_.:@-]")
+
+
+@dataclass(frozen=True)
+class CallAttribution:
+    """Tool call on whose behalf GitHub requests are made"""
+    tool: str
+    caller: str
+
+
+current_call: contextvars.ContextVar[Optional[CallAttribution]] = contextvars.ContextVar(
+    "current_call", default=None
+)
+
+
+def rate_limit_resource(endpoint: str, response: Optional[httpx.Response] = None) -> str:
+    """Rate limit resource a request is charged to
+
+    GitHub names the resource in the X-RateLimit-Resource header; the
+    endpoint path is used when the header is absent.
+    """
+    if response is not None and "X-RateLimit-Resource" in response.headers:
+        return response.headers["X-RateLimit-Resource"]
+    path = endpoint.split("?", 1)[0].strip("/")
+    if path == "search/code":
+        return "code_search"
+    if path.startswith("search/"):
+        return "search"
+    if path == "graphql":
+        return "graphql"
+    return "core"
+
+
+def request_cost(endpoint: str, response: httpx.Response) -> int:
+    """Quota points spent by a request
+
+    REST requests cost one point of their resource and authenticated
+    conditional requests answered with 304 are free. GraphQL requests cost
+    the points reported in ``data.rateLimit.cost`` when the query selects it
+    and one point otherwise.
+    """
+    if response.status_code == 304:
+        return 0
+    if endpoint.split("?", 1)[0].strip("/") == "graphql":
+        try:
+            cost = response.json()["data"]["rateLimit"]["cost"]
+            return int(cost)
+        except (ValueError, KeyError, TypeError):
+            return 1
+    return 1
+
+
+class QuotaLedger:
+    """Aggregate quota cost per tool, caller and resource in rolling windows"""
+
+    _ledgers: Dict[str, "QuotaLedger"] = {}
+
+    @classmethod
+    def get_ledger(cls, name: str = "default") -> "QuotaLedger":
+        """Get a shared ledger instance"""
+        if name not in cls._ledgers:
+            cls._ledgers[name] = QuotaLedger()
+        return cls._ledgers[name]
+
+    def __init__(self, bucket_seconds: int = 60, retention_seconds: int = 3600, max_callers: int = 100):
+        self.bucket_seconds = bucket_seconds
+        self.retention_seconds = retention_seconds
+        self.max_callers = max_callers
+        self.callers: set = set()
+        # (bucket start, {(tool, caller, resource): [cost, requests]})
+        self.buckets: deque = deque()
+        self.totals: Dict[Tuple[str, str, str], list] = {}
+        self.started_at = time.time()
+
+    def caller_label(self, caller: str) -> str:
+        """Bound client-supplied caller names for ledger keys and metric labels
+
+        Characters outside ``[A-Za-z0-9_.:@-]`` become "_". Callers are
+        tracked in the order they are first seen; once ``max_callers`` are
+        known, new ones are grouped as "other".
+        """
+        caller = UNSAFE_CALLER_CHARACTERS.sub("_", caller[:MAX_CALLER_LENGTH]) or ANONYMOUS_CALLER
+        if caller in self.callers:
+            return caller
+        if len(self.callers) >= self.max_callers:
+            return OTHER_CALLER
+        self.callers.add(caller)
+        return caller
+
+    def record(self, tool: str, caller: str, resource: str, cost: int, now: Optional[float] = None):
+        """Record one GitHub request"""
+        now = time.time() if now is None else now
+        start = int(now // self.bucket_seconds) * self.bucket_seconds
+        if not self.buckets or self.buckets[-1][0] != start:
+            self.buckets.append((start, {}))
+            self._expire(now)
+
+        key = (tool, caller, resource)
+        for store in (self.buckets[-1][1], self.totals):
+            entry = store.setdefault(key, [0, 0])
+            entry[0] += cost
+            entry[1] += 1
+
+    def _expire(self, now: float):
+        while self.buckets and self.buckets[0][0] + self.bucket_seconds <= now - self.retention_seconds:
+            self.buckets.popleft()
+
+    def usage(self, window_seconds: Optional[int] = 3600, group_by: Tuple[str, ...] = ("tool",),
+              now: Optional[float] = None) -> Dict[str, Any]:
+        """Aggregate cost over a rolling window
+
+        Args:
+            window_seconds: Window length; None for totals since start
+            group_by: Fields to group by (tool, caller, resource)
+            now: Reference time (defaults to the current time)
+
+        Returns:
+            Cost and request counts per group, highest cost first
+        """
+        fields = ("tool", "caller", "resource")
+        if not group_by or any(field not in fields for field in group_by):
+            raise ValueError(f"group_by must be a combination of {', '.join(fields)}")
+
+        now = time.time() if now is None else now
+        if window_seconds is None:
+            sources = [self.totals]
+        else:
+            window_seconds = min(window_seconds, self.retention_seconds)
+            self._expire(now)
+            # Whole buckets overlapping the window, so the window is up to one bucket longer
+            sources = [entries for start, entries in self.buckets
+                       if start + self.bucket_seconds > now - window_seconds]
+
+        groups: Counter = Counter()
+        requests: Counter = Counter()
+        for entries in sources:
+            for key, (cost, count) in entries.items():
+                group = tuple(key[fields.index(field)] for field in group_by)
+                groups[group] += cost
+                requests[group] += count
+
+        return {
+            "window_seconds": window_seconds,
+            "total_cost": sum(groups.values()),
+            "total_requests": sum(requests.values()),
+            "groups": [
+                {**dict(zip(group_by, group)), "cost": cost, "requests": requests[group]}
+                for group, cost in groups.most_common()
+            ],
+        }
+
+    def reset(self):
+        """Drop all recorded usage"""
+        self.buckets.clear()
+        self.totals.clear()
+        self.callers.clear()
+        self.started_at = time.time()
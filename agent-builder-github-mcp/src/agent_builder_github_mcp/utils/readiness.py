@@ -0,0 +1,122 @@
+"""
+Integration readiness
+
+This module initialises external integrations concurrently and gates tool
+calls on their readiness:
+- Per-integration state (pending, initializing, ready, failed, timed_out)
+- Concurrent initialisation with a timeout per integration
+- Bounded waits for callers of an integration that is still warming up
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from src.agent_builder_github_mcp.utils import Logger, MetricsCollector
+
+PENDING = "pending"
+INITIALIZING = "initializing"
+READY = "ready"
+FAILED = "failed"
+TIMED_OUT = "timed_out"
+
+
+class IntegrationState:
+    """Readiness of one integration"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.status = PENDING
+        self.error: Optional[str] = None
+        self.duration: Optional[float] = None
+        self.settled = asyncio.Event()
+
+    @property
+    def ready(self) -> bool:
+        return self.status == READY
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "error": self.error,
+            "init_seconds": round(self.duration, 3) if self.duration is not None else None,
+        }
+
+
+class IntegrationReadiness:
+    """Initialise integrations concurrently and track when each becomes usable"""
+
+    def __init__(self, metrics: Optional[MetricsCollector] = None, init_timeout: float = 15.0):
+        self.metrics = metrics or MetricsCollector.get_collector()
+        self.init_timeout = init_timeout
+        self.states: Dict[str, IntegrationState] = {}
+        self.logger = Logger.get_logger(self.__class__.__name__)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.states
+
+    def start(self, initializers: Dict[str, Callable[[], Awaitable[Any]]]) -> asyncio.Task:
+        """Start initialising integrations concurrently in the background
+
+        Integrations are registered (and so gated) immediately.
+
+        Args:
+            initializers: Integration name to a coroutine function that
+                initialises it
+
+        Returns:
+            Task that completes when every integration has settled
+        """
+        for name in initializers:
+            self.states[name] = IntegrationState(name)
+        return asyncio.get_running_loop().create_task(self._initialize_all(initializers))
+
+    async def _initialize_all(self, initializers: Dict[str, Callable[[], Awaitable[Any]]]):
+        started = time.perf_counter()
+        await asyncio.gather(*(self._initialize(name, initialize)
+                               for name, initialize in initializers.items()))
+        self.logger.info("Integrations settled in %.3fs: %s", time.perf_counter() - started,
+                         ", ".join(f"{name}={state.status}" for name, state in self.states.items()))
+
+    async def _initialize(self, name: str, initialize: Callable[[], Awaitable[Any]]):
+        state = self.states[name]
+        state.status = INITIALIZING
+        self.metrics.gauge("integration_ready", 0, {"integration": name})
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(initialize(), self.init_timeout)
+            state.status = READY
+        except asyncio.TimeoutError:
+            state.status = TIMED_OUT
+            state.error = f"Initialisation timed out after {self.init_timeout}s"
+        except Exception as e:
+            state.status = FAILED
+            state.error = str(e)
+        finally:
+            state.duration = time.perf_counter() - started
+            state.settled.set()
+            self.metrics.observe("integration_init_seconds", state.duration, {"integration": name})
+
+        self.metrics.gauge("integration_ready", 1 if state.ready else 0, {"integration": name})
+        if state.ready:
+            self.logger.info("Integration %s ready in %.3fs", name, state.duration)
+        else:
+            self.logger.warning("Integration %s %s: %s", name, state.status, state.error)
+
+    async def wait_ready(self, name: str, timeout: float) -> IntegrationState:
+        """Wait up to ``timeout`` seconds for an integration to settle"""
+        state = self.states[name]
+        if not state.settled.is_set() and timeout > 0:
+            try:
+                await asyncio.wait_for(state.settled.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return state
+
+    @property
+    def all_ready(self) -> bool:
+        return all(state.ready for state in self.states.values())
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Readiness of every registered integration"""
+        return {name: state.to_dict() for name, state in self.states.items()}
@@ -0,0 +1,92 @@
+"""
+Shared worker state
+
+This module holds the state that forked HTTP workers must agree on, in
+shared memory created by the supervisor before it forks:
+- GitHub rate limit window, so workers share one hourly quota
+- Response cache invalidation generations, so a write in one worker
+  invalidates cached reads in every worker
+"""
+
+import multiprocessing
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+from src.agent_builder_github_mcp.utils import RateLimiter
+
+
+class SharedRateLimiter(RateLimiter):
+    """Sliding-window rate limiter whose window is shared across processes
+
+    The window is a ring buffer of the last ``max_requests`` request times;
+    a request is allowed when the slot it would overwrite is older than the
+    window.
+    """
+
+    def __init__(self, max_requests: int = 5000, time_window: int = 3600):
+        self.max_requests = max_requests
+        self.time_window = time_window
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self._lock = multiprocessing.Lock()
+        self._times = multiprocessing.RawArray("d", max_requests)
+        self._head = multiprocessing.RawValue("L", 0)
+
+    @property
+    def requests(self) -> List[float]:
+        """Request times in the current window (all workers)"""
+        now = time.time()
+        return [request for request in self._times if now - request < self.time_window]
+
+    async def acquire(self) -> bool:
+        """Acquire a rate limit token"""
+        now = time.time()
+        with self._lock:
+            head = self._head.value
+            if now - self._times[head] < self.time_window:
+                return False
+            self._times[head] = now
+            self._head.value = (head + 1) % self.max_requests
+        return True
+
+    def _oldest_request(self) -> Optional[float]:
+        with self._lock:
+            return self._times[self._head.value] or None
+
+
+class SharedGenerations:
+    """Cache invalidation generations shared across processes
+
+    Resource keys hash into a fixed number of counters; a collision only
+    causes a spurious cache miss.
+    """
+
+    def __init__(self, slots: int = 4096):
+        self._lock = multiprocessing.Lock()
+        self._counters = multiprocessing.RawArray("Q", slots)
+
+    def _slot(self, resource_key: str) -> int:
+        return zlib.crc32(resource_key.encode()) % len(self._counters)
+
+    def bump(self, resource_keys: Iterable[str]):
+        """Advance the generation of resource keys"""
+        with self._lock:
+            for resource_key in resource_keys:
+                self._counters[self._slot(resource_key)] += 1
+
+    def generation(self, resource_keys: Iterable[str]) -> int:
+        """Combined generation of resource keys"""
+        return sum(self._counters[self._slot(resource_key)] for resource_key in resource_keys)
+
+
+@dataclass
+class SharedState:
+    """State created by the supervisor and inherited by every worker"""
+    rate_limiter: SharedRateLimiter
+    cache_generations: SharedGenerations
+
+    @classmethod
+    def create(cls, config) -> "SharedState":
+        return cls(SharedRateLimiter(config.github_rate_limit), SharedGenerations())
@@ -0,0 +1,163 @@
+"""
+Slow-call recorder
+
+This module captures the anatomy of slow tool calls for p99 debugging:
+- Per-call recording of upstream GitHub, cache and integration calls
+- Redacted, truncated tool arguments and response sizes
+- Bounded ring buffer of calls exceeding a latency threshold
+"""
+
+import contextvars
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+# Upstream calls kept per recording; the rest are only counted
+MAX_UPSTREAM_CALLS = 200
+MAX_ARGUMENT_LENGTH = 200
+SENSITIVE_ARGUMENTS = ("token", "secret", "password", "key", "credential")
+# Stands in for a string argument longer than a sanitizing limit
+TRUNCATED = "$truncated"
+
+
+class CallRecording:
+    """Upstream activity of one in-flight tool call"""
+
+    __slots__ = ("tool", "arguments", "started_at", "started", "upstream", "dropped_upstream")
+
+    def __init__(self, tool: str, arguments: Dict[str, Any]):
+        self.tool = tool
+        self.arguments = arguments
+        self.started_at = time.time()
+        self.started = time.perf_counter()
+        self.upstream: List[Dict[str, Any]] = []
+        self.dropped_upstream = 0
+
+    def add(self, call: Dict[str, Any]):
+        if len(self.upstream) < MAX_UPSTREAM_CALLS:
+            self.upstream.append(call)
+        else:
+            self.dropped_upstream += 1
+
+
+_current_recording: contextvars.ContextVar[Optional[CallRecording]] = contextvars.ContextVar(
+    "current_recording", default=None
+)
+
+
+def record_upstream(kind: str, target: str, started: float, status: Optional[Any] = None,
+                    response_bytes: Optional[int] = None, error: Optional[str] = None):
+    """Add an upstream call to the active recording, if any
+
+    Args:
+        kind: Upstream kind (github, cache, integration)
+        target: What was called, e.g. "GET repos/o/r/issues/1"
+        started: time.perf_counter() value when the call started
+        status: Status code or outcome
+        response_bytes: Size of the response body
+        error: Error message when the call failed
+    """
+    recording = _current_recording.get()
+    if recording is None:
+        return
+    now = time.perf_counter()
+    call = {
+        "kind": kind,
+        "target": target,
+        "offset_ms": round((started - recording.started) * 1000, 3),
+        "duration_ms": round((now - started) * 1000, 3),
+    }
+    if status is not None:
+        call["status"] = status
+    if response_bytes is not None:
+        call["response_bytes"] = response_bytes
+    if error is not None:
+        call["error"] = error
+    recording.add(call)
+
+
+def sanitize_arguments(value: Any, max_length: Optional[int] = None) -> Any:
+    """Redact secrets at any depth of tool arguments
+
+    With ``max_length``, longer strings are also replaced by their length.
+    """
+    if isinstance(value, dict):
+        return {
+            name: "***" if any(marker in str(name).lower() for marker in SENSITIVE_ARGUMENTS)
+            else sanitize_arguments(item, max_length)
+            for name, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [sanitize_arguments(item, max_length) for item in value]
+    if max_length is not None and isinstance(value, str) and len(value) > max_length:
+        return {TRUNCATED: len(value)}
+    return value
+
+
+def summarize_arguments(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Redact secrets and truncate large values in tool arguments"""
+    summary = {}
+    for name, value in sanitize_arguments(arguments or {}).items():
+        if isinstance(value, str) and len(value) > MAX_ARGUMENT_LENGTH:
+            summary[name] = f"{value[:MAX_ARGUMENT_LENGTH]}... ({len(value)} chars)"
+        elif isinstance(value, (dict, list)) and len(repr(value)) > MAX_ARGUMENT_LENGTH:
+            summary[name] = f"{repr(value)[:MAX_ARGUMENT_LENGTH]}... ({type(value).__name__} of {len(value)})"
+        else:
+            summary[name] = value
+    return summary
+
+
+class SlowCallRecorder:
+    """Keep the most recent tool calls slower than a threshold"""
+
+    def __init__(self, threshold: float = 2.0, capacity: int = 100):
+        self.threshold = threshold
+        self.calls: deque = deque(maxlen=capacity)
+        self.total_slow = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold > 0
+
+    def begin(self, tool: str, arguments: Dict[str, Any]):
+        """Start recording a tool call; returns a token for finish()"""
+        return _current_recording.set(CallRecording(tool, arguments))
+
+    def finish(self, token, success: bool, result: Any = None, error: Optional[str] = None):
+        """Stop recording and keep the call if it exceeded the threshold"""
+        recording = _current_recording.get()
+        _current_recording.reset(token)
+        duration = time.perf_counter() - recording.started
+        if duration < self.threshold:
+            return
+
+        self.total_slow += 1
+        self.calls.append({
+            "tool": recording.tool,
+            "started_at": recording.started_at,
+            "duration_ms": round(duration * 1000, 3),
+            "success": success,
+            "error": error,
+            "arguments": summarize_arguments(recording.arguments),
+            "response_bytes": _response_size(result),
+            "upstream": recording.upstream,
+            "upstream_dropped": recording.dropped_upstream,
+            "upstream_ms": round(sum(call["duration_ms"] for call in recording.upstream), 3),
+        })
+
+    def get_calls(self, tool: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """Most recent slow calls first"""
+        calls = [call for call in reversed(self.calls) if tool is None or call["tool"] == tool]
+        return calls[:limit]
+
+    def clear(self):
+        """Drop all recorded calls"""
+        self.calls.clear()
+
+
+def _response_size(result: Any) -> Optional[int]:
+    """Approximate serialised size of a tool result"""
+    if result is None:
+        return None
+    content = getattr(result, "content", None) or []
+    return sum(len(getattr(block, "text", "") or "") for block in content)
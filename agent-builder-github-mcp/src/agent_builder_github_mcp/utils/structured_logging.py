@@ -0,0 +1,187 @@
+"""
+Structured logging pipeline
+
+This module keeps logging off the event loop's critical path:
+- Queue-based handler; a listener thread formats and writes records
+- Lazy formatting: %-style messages are only rendered for records that
+  pass level and rate filters, then travel to the listener as plain text
+- JSON lines with trace context and structured extra fields
+- Per-logger levels and rate-limited/sampled INFO and DEBUG records
+"""
+
+import copy
+import json
+import logging
+import queue
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+from src.agent_builder_github_mcp.utils.tracing import TraceContextFilter
+
+# Attributes every LogRecord has; anything else came in through ``extra``
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {
+    "message", "asctime", "trace_id", "span_id", "suppressed",
+}
+
+TEXT_FORMAT = (
+    '%(asctime)s - %(name)s - %(levelname)s - '
+    '[trace=%(trace_id)s span=%(span_id)s] - %(message)s'
+)
+
+
+class JsonFormatter(logging.Formatter):
+    """Render a record as one JSON object per line"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "trace_id": getattr(record, "trace_id", "-"),
+            "span_id": getattr(record, "span_id", "-"),
+        }
+        if getattr(record, "suppressed", 0):
+            entry["suppressed"] = record.suppressed
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str, separators=(",", ":"))
+
+
+class RateLimitFilter(logging.Filter):
+    """Rate limit and sample records below WARNING per logger
+
+    Each logger may emit ``rate`` records per second (with bursts up to
+    ``burst``) after sampling; the rest are dropped and the count of dropped
+    records is attached to the next record that gets through. WARNING and
+    above always pass.
+    """
+
+    def __init__(self, rate: float = 50.0, burst: int = 100, sample_ratio: float = 1.0):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.sample_ratio = sample_ratio
+        self.dropped = 0
+        self._buckets: Dict[str, list] = {}
+        self._suppressed: Dict[str, int] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        if self.sample_ratio < 1.0 and random.random() >= self.sample_ratio:
+            return self._drop(record.name)
+        if self.rate > 0:
+            now = time.monotonic()
+            bucket = self._buckets.get(record.name)
+            if bucket is None:
+                bucket = self._buckets[record.name] = [float(self.burst), now]
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if bucket[0] < 1:
+                return self._drop(record.name)
+            bucket[0] -= 1
+        suppressed = self._suppressed.pop(record.name, 0)
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+    def _drop(self, name: str) -> bool:
+        self.dropped += 1
+        self._suppressed[name] = self._suppressed.get(name, 0) + 1
+        return False
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """Queue handler that never blocks and leaves encoding to the listener thread"""
+
+    _exception_formatter = logging.Formatter()
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Filters have run, so only kept records are rendered. The message
+        # and traceback are rendered here, as QueueHandler.prepare does, so
+        # the listener never reads arguments the caller may since have
+        # changed; JSON encoding and writing stay on the listener thread.
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = record.exc_text or self._exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LoggingPipeline:
+    """Shared queue, listener thread and output handler for all loggers"""
+
+    def __init__(self, json_output: bool = True, max_queue: int = 10000,
+                 info_rate: float = 50.0, info_burst: int = 100, info_sample_ratio: float = 1.0,
+                 stream=None):
+        self.queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self.handler = NonBlockingQueueHandler(self.queue)
+        self.handler.addFilter(TraceContextFilter())
+        self.rate_filter = RateLimitFilter(info_rate, info_burst, info_sample_ratio)
+        self.handler.addFilter(self.rate_filter)
+
+        self.output = logging.StreamHandler(stream or sys.stderr)
+        self.output.setFormatter(JsonFormatter() if json_output else logging.Formatter(TEXT_FORMAT))
+        self.listener = QueueListener(self.queue, self.output, respect_handler_level=False)
+        self._lock = threading.Lock()
+        self._running = False
+
+    def start(self):
+        """Start the listener thread"""
+        with self._lock:
+            if not self._running:
+                self.listener.start()
+                self._running = True
+
+    def stop(self):
+        """Flush queued records and stop the listener thread"""
+        with self._lock:
+            if self._running:
+                self.listener.stop()
+                self._running = False
+
+    def stats(self) -> Dict[str, int]:
+        """Queue depth and dropped record counts"""
+        return {
+            "queued": self.queue.qsize(),
+            "dropped_queue_full": self.handler.dropped,
+            "dropped_rate_limited": self.rate_filter.dropped,
+        }
+
+
+def parse_levels(spec: Optional[str]) -> Dict[str, int]:
+    """Parse per-logger levels such as "GitHubAPIClient=DEBUG,server=WARNING" """
+    levels = {}
+    for item in (spec or "").split(","):
+        if not item.strip():
+            continue
+        name, _, level = item.partition("=")
+        value = logging.getLevelName(level.strip().upper())
+        if not isinstance(value, int):
+            raise ValueError(f"Invalid log level for {name.strip()}: {level.strip()}")
+        levels[name.strip()] = value
+    return levels
@@ -0,0 +1,303 @@
+"""
+Span-based tracing
+
+This module provides lightweight, OpenTelemetry-compatible tracing:
+- Spans with W3C trace/span identifiers propagated through contextvars
+- Parent sampling decided once per tool call, children follow the root
+- Batched export as OTLP/JSON to a local file or an OTLP/HTTP collector
+- Trace context for log records
+"""
+
+import asyncio
+import contextvars
+import json
+import logging
+import os
+import random
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+
+class Span:
+    """A timed operation within a trace"""
+
+    __slots__ = ("tracer", "name", "kind", "trace_id", "span_id", "parent_span_id",
+                 "attributes", "start_ns", "end_ns", "status", "status_message", "_token")
+
+    def __init__(self, tracer: "Tracer", name: str, trace_id: str, parent_span_id: Optional[str],
+                 kind: int = SPAN_KIND_INTERNAL, attributes: Optional[Dict[str, Any]] = None):
+        self.tracer = tracer
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_span_id = parent_span_id
+        self.attributes = dict(attributes or {})
+        self.start_ns = 0
+        self.end_ns = 0
+        self.status = STATUS_UNSET
+        self.status_message = ""
+        self._token = None
+
+    @property
+    def recording(self) -> bool:
+        return True
+
+    def set_attribute(self, key: str, value: Any):
+        """Attach an attribute to the span"""
+        self.attributes[key] = value
+
+    def set_error(self, message: str):
+        """Mark the span as failed"""
+        self.status = STATUS_ERROR
+        self.status_message = message
+
+    def __enter__(self) -> "Span":
+        self.start_ns = time.time_ns()
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.end_ns = time.time_ns()
+        _current_span.reset(self._token)
+        if exc_type is not None and self.status != STATUS_ERROR:
+            self.set_error(f"{exc_type.__name__}: {exc_val}")
+        self.tracer.exporter.enqueue(self)
+        return False
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Serialise the span in OTLP/JSON form"""
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_otlp_attribute(key, value) for key, value in self.attributes.items()],
+            "status": {"code": self.status, "message": self.status_message},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        return span
+
+
+class _NonRecordingSpan:
+    """Span returned when the current call is not sampled"""
+
+    recording = False
+    trace_id = ""
+    span_id = ""
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def set_error(self, message: str):
+        pass
+
+    def __enter__(self) -> "_NonRecordingSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+NON_RECORDING_SPAN = _NonRecordingSpan()
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    """Encode an attribute as an OTLP AnyValue"""
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+class SpanExporter:
+    """Batch spans and export them as OTLP/JSON
+
+    Spans are buffered in a bounded queue and flushed by a background task,
+    so exporting never blocks the request path. File output is one
+    ExportTraceServiceRequest document per line; collector output is POSTed
+    to an OTLP/HTTP endpoint such as http://localhost:4318/v1/traces.
+    """
+
+    def __init__(self, service_name: str = "agent-builder-github-mcp", file_path: Optional[str] = None,
+                 otlp_endpoint: Optional[str] = None, max_queue: int = 10000,
+                 batch_size: int = 512, flush_interval: float = 2.0):
+        self.service_name = service_name
+        self.file_path = file_path
+        self.otlp_endpoint = otlp_endpoint
+        self.queue: deque = deque(maxlen=max_queue)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.exported = 0
+        self.logger = logging.getLogger(__name__)
+        self._task: Optional[asyncio.Task] = None
+        self._write_lock = asyncio.Lock()
+        self._write: Optional[asyncio.Future] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.file_path or self.otlp_endpoint)
+
+    def enqueue(self, span: Span):
+        """Queue a finished span for export"""
+        if len(self.queue) == self.queue.maxlen:
+            self.dropped += 1
+        self.queue.append(span)
+
+    def start(self):
+        """Start the background flush task on the running loop"""
+        if self._task is None and self.enabled:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def shutdown(self):
+        """Stop the flush task and export whatever is still queued"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self):
+        """Export all queued spans"""
+        while self.queue:
+            batch = [self.queue.popleft() for _ in range(min(self.batch_size, len(self.queue)))]
+            payload = self._payload(batch)
+            try:
+                if self.file_path:
+                    await self._append_in_thread(json.dumps(payload, separators=(",", ":")))
+                if self.otlp_endpoint:
+                    import httpx
+                    async with httpx.AsyncClient(timeout=5) as client:
+                        await client.post(self.otlp_endpoint, json=payload)
+                self.exported += len(batch)
+            except Exception as e:
+                self.dropped += len(batch)
+                self.logger.warning("Failed to export %d spans: %s", len(batch), e)
+
+    async def _append_in_thread(self, line: str):
+        """Append in a worker thread, one write at a time
+
+        A cancelled flush (shutdown cancels the flush task) leaves its write
+        running in the thread; the next write waits for it rather than
+        appending to the file concurrently.
+        """
+        async with self._write_lock:
+            if self._write is not None and not self._write.done():
+                await asyncio.wait([self._write])
+            self._write = asyncio.ensure_future(asyncio.to_thread(self._append, line))
+            await asyncio.shield(self._write)
+
+    def _append(self, line: str):
+        directory = os.path.dirname(self.file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.file_path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+    def _payload(self, spans: List[Span]) -> Dict[str, Any]:
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", self.service_name)]},
+                "scopeSpans": [{
+                    "scope": {"name": "agent_builder_github_mcp"},
+                    "spans": [span.to_otlp() for span in spans],
+                }],
+            }]
+        }
+
+
+class Tracer:
+    """Create spans and decide sampling"""
+
+    def __init__(self, exporter: Optional[SpanExporter] = None, sample_ratio: float = 1.0):
+        self.exporter = exporter or SpanExporter()
+        self.sample_ratio = sample_ratio
+
+    def configure(self, exporter: SpanExporter, sample_ratio: float = 1.0):
+        """Install an exporter and sampling ratio"""
+        self.exporter = exporter
+        self.sample_ratio = sample_ratio
+
+    def start_span(self, name: str, kind: int = SPAN_KIND_INTERNAL,
+                   attributes: Optional[Dict[str, Any]] = None):
+        """Start a child of the current span (no-op outside a sampled trace)"""
+        parent = _current_span.get()
+        if parent is None:
+            return NON_RECORDING_SPAN
+        return Span(self, name, parent.trace_id, parent.span_id, kind, attributes)
+
+    def start_root_span(self, name: str, kind: int = SPAN_KIND_SERVER,
+                        attributes: Optional[Dict[str, Any]] = None,
+                        traceparent: Optional[str] = None):
+        """Start a new trace, continuing a W3C traceparent when one is supplied"""
+        if not self.exporter.enabled:
+            return NON_RECORDING_SPAN
+
+        parent = parse_traceparent(traceparent) if traceparent else None
+        if parent is not None:
+            trace_id, parent_span_id, sampled = parent
+            if not sampled:
+                return NON_RECORDING_SPAN
+        else:
+            if random.random() >= self.sample_ratio:
+                return NON_RECORDING_SPAN
+            trace_id, parent_span_id = f"{random.getrandbits(128):032x}", None
+        return Span(self, name, trace_id, parent_span_id, kind, attributes)
+
+
+def parse_traceparent(value: str):
+    """Parse a W3C traceparent header into (trace_id, span_id, sampled)"""
+    parts = value.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    try:
+        sampled = bool(int(parts[3], 16) & 1)
+    except ValueError:
+        return None
+    return parts[1], parts[2], sampled
+
+
+def current_span():
+    """Get the active span, if any"""
+    return _current_span.get()
+
+
+class TraceContextFilter(logging.Filter):
+    """Attach trace_id and span_id of the active span to log records"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        span = _current_span.get()
+        record.trace_id = span.trace_id if span is not None else "-"
+        record.span_id = span.span_id if span is not None else "-"
+        return True
+
+
+tracer = Tracer()
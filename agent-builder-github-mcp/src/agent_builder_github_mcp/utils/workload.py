@@ -0,0 +1,185 @@
+"""
+Workload capture
+
+This module records incoming MCP tool calls for later traffic replay:
+- One record per tool call: start time, tool, caller, sanitized
+  arguments, duration and outcome
+- Secrets are redacted and oversized strings are replaced by their length,
+  so a replayer can send a payload of the same size
+- Records are queued in memory and appended by a background task, so
+  capture never blocks a tool call; records beyond the queue are dropped
+- Output is gzip-compressed NDJSON in size-rotated files, one series per
+  process, keeping the newest files
+"""
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from src.agent_builder_github_mcp.utils.slow_calls import TRUNCATED, sanitize_arguments
+
+FILE_PREFIX = "workload-"
+FILE_SUFFIX = ".ndjson.gz"
+
+
+def restore_arguments(value: Any) -> Any:
+    """Replace truncated strings with filler of their original length"""
+    if isinstance(value, dict):
+        if set(value) == {TRUNCATED}:
+            return "x" * value[TRUNCATED]
+        return {name: restore_arguments(item) for name, item in value.items()}
+    if isinstance(value, list):
+        return [restore_arguments(item) for item in value]
+    return value
+
+
+def read_workload(paths: List[str]) -> List[Dict[str, Any]]:
+    """Load captured calls from files or capture directories, oldest first"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(os.path.join(path, name) for name in sorted(os.listdir(path))
+                         if name.startswith(FILE_PREFIX) and name.endswith(FILE_SUFFIX))
+        else:
+            files.append(path)
+    calls = []
+    for path in files:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            try:
+                for line in f:
+                    if line.strip():
+                        calls.append(json.loads(line))
+            except (EOFError, json.JSONDecodeError):
+                # The file still being written ends mid-stream; keep what is complete
+                pass
+    calls.sort(key=lambda call: call["ts"])
+    return calls
+
+
+class WorkloadCapture:
+    """Append tool calls to rotating compressed NDJSON files"""
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = 64 * 1024 * 1024,
+                 max_files: int = 20, max_argument_length: int = 4096, max_queue: int = 10000,
+                 flush_interval: float = 1.0):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        self.max_argument_length = max_argument_length
+        self.queue: deque = deque(maxlen=max_queue)
+        self.flush_interval = flush_interval
+        self.captured = 0
+        self.dropped = 0
+        self.logger = logging.getLogger(__name__)
+        self._task: Optional[asyncio.Task] = None
+        self._file = None
+        self._path: Optional[str] = None
+        self._sequence = 0
+        self._write_lock = asyncio.Lock()
+        self._in_flight: Optional[asyncio.Future] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.directory)
+
+    def record(self, tool: str, caller: str, arguments: Dict[str, Any], started_at: float,
+               duration: float, success: bool, error: Optional[str] = None):
+        """Queue a finished tool call; arguments are sanitized when written"""
+        if len(self.queue) == self.queue.maxlen:
+            self.dropped += 1
+        entry = {
+            "ts": round(started_at, 6),
+            "tool": tool,
+            "caller": caller,
+            "arguments": arguments,
+            "duration_ms": round(duration * 1000, 3),
+            "success": success,
+        }
+        if error is not None:
+            entry["error"] = error[:200]
+        self.queue.append(entry)
+
+    def start(self):
+        """Start the background writer on the running loop"""
+        if self._task is None and self.enabled:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def shutdown(self):
+        """Stop the writer, write whatever is still queued and close the file"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+        await self._in_thread(self._close)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self):
+        """Write all queued calls"""
+        if not self.queue:
+            return
+        entries = [self.queue.popleft() for _ in range(len(self.queue))]
+        try:
+            await self._in_thread(self._write, entries)
+            self.captured += len(entries)
+        except Exception as e:
+            self.dropped += len(entries)
+            self.logger.warning("Failed to capture %d tool calls: %s", len(entries), e)
+
+    async def _in_thread(self, function, *args):
+        """Run a file operation in a worker thread, one at a time
+
+        Cancelling the writer task leaves its write running in the thread;
+        the final flush and close wait for it instead of touching the gzip
+        file concurrently.
+        """
+        async with self._write_lock:
+            if self._in_flight is not None and not self._in_flight.done():
+                await asyncio.wait([self._in_flight])
+            self._in_flight = asyncio.ensure_future(asyncio.to_thread(function, *args))
+            await asyncio.shield(self._in_flight)
+
+    def _write(self, entries: List[Dict[str, Any]]):
+        if self._file is None:
+            self._open()
+        for entry in entries:
+            entry["arguments"] = sanitize_arguments(entry["arguments"], self.max_argument_length)
+            self._file.write(json.dumps(entry, separators=(",", ":"), default=str) + "\n")
+        # Complete the compressed block so readers see every flushed call
+        self._file.flush()
+        if os.path.getsize(self._path) >= self.max_bytes:
+            self._close()
+
+    def _open(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self._sequence += 1
+        stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+        name = f"{FILE_PREFIX}{stamp}-{os.getpid()}-{self._sequence:04d}{FILE_SUFFIX}"
+        self._path = os.path.join(self.directory, name)
+        self._file = gzip.open(self._path, "at", encoding="utf-8")
+        self._prune()
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _prune(self):
+        """Delete this process's oldest files beyond max_files"""
+        marker = f"-{os.getpid()}-"
+        own = sorted(name for name in os.listdir(self.directory)
+                     if name.startswith(FILE_PREFIX) and name.endswith(FILE_SUFFIX) and marker in name)
+        for name in own[:max(0, len(own) - self.max_files)]:
+            os.remove(os.path.join(self.directory, name))
@@ -0,0 +1,153 @@
+"""
+Multi-worker HTTP serving
+
+This module serves the MCP HTTP transport from several pre-forked worker
+processes:
+- One listening socket bound by the supervisor and inherited by every
+  worker; the kernel spreads connections across them
+- Rate limit and cache invalidation state shared through shared memory
+- Supervision: crashed workers are restarted with backoff and signals
+  shut every worker down gracefully
+- Per-worker metrics: worker N serves /metrics on METRICS_PORT + N with a
+  worker label, since a scrape of the shared socket reaches an arbitrary
+  worker
+
+Workers serve stateless HTTP (no MCP session affinity), since consecutive
+requests of one client may reach different workers.
+"""
+
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from multiprocessing.connection import wait
+from typing import Any, Callable, Dict
+
+from src.agent_builder_github_mcp.utils import Logger
+from src.agent_builder_github_mcp.utils.shared_state import SharedState
+
+# A worker exiting sooner than this after starting counts as a crash loop
+MIN_WORKER_UPTIME = 5.0
+MAX_RESTART_BACKOFF = 30.0
+SHUTDOWN_TIMEOUT = 30.0
+
+logger = Logger.get_logger(__name__)
+
+
+def bind_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    """Bind the listening socket shared by all workers"""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(index: int, sock: socket.socket, config, shared: SharedState,
+                create_server: Callable[[Any, SharedState], Any]):
+    """Worker process entry point"""
+    import uvicorn
+
+    # uvicorn handles SIGINT/SIGTERM while serving and re-raises them after a
+    # graceful shutdown; ignore them then so the worker can exit cleanly
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    Logger.after_fork()
+
+    # Counters are per process, so each worker serves its own sidecar port
+    metrics_port = config.metrics_port + index if config.metrics_port else None
+    config = config.model_copy(update={"metrics_port": metrics_port, "worker_index": index})
+    server = create_server(config, shared)
+    app = server.get_mcp_instance().http_app(stateless_http=True)
+    logger.info("Worker %s (pid %s) serving on %s:%s", index, os.getpid(),
+                config.http_host, config.http_port)
+    uvicorn.Server(uvicorn.Config(app, log_config=None, lifespan="on")).run(sockets=[sock])
+    Logger.shutdown()
+
+
+class WorkerSupervisor:
+    """Fork and supervise HTTP worker processes"""
+
+    def __init__(self, config, create_server: Callable[[Any, SharedState], Any]):
+        self.config = config
+        self.create_server = create_server
+        self.context = multiprocessing.get_context("fork")
+        self.processes: Dict[int, multiprocessing.Process] = {}
+        self.started_at: Dict[int, float] = {}
+        self.backoff: Dict[int, float] = {}
+        self.stopping = False
+
+    def _spawn(self, index: int):
+        process = self.context.Process(
+            target=_run_worker, name=f"mcp-worker-{index}",
+            args=(index, self.sock, self.config, self.shared, self.create_server),
+        )
+        process.start()
+        self.processes[index] = process
+        self.started_at[index] = time.monotonic()
+
+    def _handle_signal(self, signum, frame):
+        self.stopping = True
+
+    def run(self) -> int:
+        """Serve until SIGINT or SIGTERM; returns the process exit code"""
+        Logger.configure(
+            self.config.log_level, self.config.log_levels, self.config.log_format != "text",
+            self.config.log_info_rate, self.config.log_info_sample_ratio
+        )
+        self.sock = bind_socket(self.config.http_host, self.config.http_port)
+        self.shared = SharedState.create(self.config)
+        signal.signal(signal.SIGINT, self._handle_signal)
+        signal.signal(signal.SIGTERM, self._handle_signal)
+
+        for index in range(self.config.workers):
+            self._spawn(index)
+        logger.info("Serving HTTP on %s:%s with %s workers", self.config.http_host,
+                    self.config.http_port, self.config.workers)
+        if self.config.metrics_port:
+            logger.info("Worker metrics on %s:%s-%s/metrics", self.config.metrics_host, self.config.metrics_port,
+                        self.config.metrics_port + self.config.workers - 1)
+        else:
+            logger.warning("Set METRICS_PORT to scrape worker metrics; /metrics is not served on the shared port")
+
+        restart_at: Dict[int, float] = {}
+        while not self.stopping:
+            wait([process.sentinel for index, process in self.processes.items()
+                  if index not in restart_at], timeout=0.5)
+            now = time.monotonic()
+            for index, process in list(self.processes.items()):
+                if process.is_alive() or self.stopping:
+                    continue
+                if index not in restart_at:
+                    uptime = now - self.started_at[index]
+                    delay = 0.0
+                    if uptime < MIN_WORKER_UPTIME:
+                        delay = min(MAX_RESTART_BACKOFF, max(1.0, self.backoff.get(index, 0.5) * 2))
+                    self.backoff[index] = delay
+                    restart_at[index] = now + delay
+                    logger.warning("Worker %s exited with code %s after %.1fs; restarting in %.1fs",
+                                   index, process.exitcode, uptime, delay)
+                if now >= restart_at[index]:
+                    del restart_at[index]
+                    self._spawn(index)
+
+        self.shutdown()
+        return 0
+
+    def shutdown(self):
+        """Stop every worker, waiting for graceful shutdown before killing"""
+        logger.info("Stopping %s workers", len(self.processes))
+        for process in self.processes.values():
+            if process.is_alive():
+                process.terminate()
+        deadline = time.monotonic() + SHUTDOWN_TIMEOUT
+        for process in self.processes.values():
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.warning("Worker %s did not stop in time; killing it", process.name)
+                process.kill()
+                process.join()
+        self.sock.close()